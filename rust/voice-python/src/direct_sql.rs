@@ -0,0 +1,280 @@
+//! Direct SQL against the main database for queries voicecore has no
+//! method for.
+//!
+//! voicecore owns the schema and its own connections; this module opens
+//! separate connections to the same file. They are opened read-only, so
+//! they never take the write lock, and are pooled so that concurrent
+//! callers each get one. Writes always go through voicecore, which stamps
+//! them for sync. In-memory databases cannot be shared between
+//! connections, so callers fall back to voicecore methods for them.
+//!
+//! The schema, indexes included, belongs to voicecore's migrations; this
+//! module never changes it. The queries are written so that indexes on
+//! the columns they filter by (conflict note_id, sync_received_at) serve
+//! them, and still work by scanning where those indexes do not exist.
+
+use std::collections::HashMap;
+use std::sync::Mutex;
+use std::time::Duration;
+
+use rusqlite::types::Value;
+use rusqlite::{params, params_from_iter, Connection, OpenFlags};
+
+/// How long a statement waits for a lock held by another connection.
+pub const BUSY_TIMEOUT: Duration = Duration::from_secs(5);
+
+/// Pool of read-only connections to a database file.
+pub struct SqlPool {
+    path: String,
+    idle: Mutex<Vec<Connection>>,
+}
+
+impl SqlPool {
+    pub fn new(path: &str) -> Self {
+        Self { path: path.to_string(), idle: Mutex::new(Vec::new()) }
+    }
+
+    /// Run `f` on an idle read-only connection, opening one if none is idle.
+    pub fn read<T, F>(&self, f: F) -> rusqlite::Result<T>
+    where
+        F: FnOnce(&Connection) -> rusqlite::Result<T>,
+    {
+        let idle = self.idle.lock().ok().and_then(|mut idle| idle.pop());
+        let conn = match idle {
+            Some(conn) => conn,
+            None => open_read_only(&self.path)?,
+        };
+        let result = f(&conn);
+        if let Ok(mut idle) = self.idle.lock() {
+            idle.push(conn);
+        }
+        result
+    }
+}
+
+/// Open a read-write connection to a database file.
+fn open_read_write(path: &str) -> rusqlite::Result<Connection> {
+    let conn = Connection::open(path)?;
+    conn.busy_timeout(BUSY_TIMEOUT)?;
+    Ok(conn)
+}
+
+/// Switch a database file to WAL journaling and check that it took.
+///
+/// The journal mode is stored in the file, so this holds for every
+/// connection to it, voicecore's writer included, and for later opens.
+/// WAL lets read connections read while the writer writes. Only called
+/// when a read pool is opened. Returns false if the file stays in another
+/// mode (e.g. on file systems without shared memory).
+pub fn ensure_wal(path: &str) -> rusqlite::Result<bool> {
+    let conn = open_read_write(path)?;
+    let mode: String = conn.pragma_update_and_check(None, "journal_mode", "WAL", |row| row.get(0))?;
+    Ok(mode.eq_ignore_ascii_case("wal"))
+}
+
+/// Open a read-only connection to a database file.
+pub fn open_read_only(path: &str) -> rusqlite::Result<Connection> {
+    let conn = Connection::open_with_flags(
+        path,
+        OpenFlags::SQLITE_OPEN_READ_ONLY | OpenFlags::SQLITE_OPEN_NO_MUTEX,
+    )?;
+    conn.busy_timeout(BUSY_TIMEOUT)?;
+    Ok(conn)
+}
+
+/// SQLite's data_version of a connection: it changes whenever another
+/// connection commits to the database.
+pub fn data_version(conn: &Connection) -> rusqlite::Result<i64> {
+    conn.pragma_query_value(None, "data_version", |row| row.get(0))
+}
+
+/// Number of live notes per live tag, in one grouped query.
+///
+/// With `include_descendants` each count covers the tag's whole subtree,
+/// counting a note tagged at several levels once. The subtree is walked
+/// by a recursive CTE (UNION, so a parent cycle cannot recurse forever).
+/// Tags without notes are included with a count of 0.
+pub fn tag_note_counts(conn: &Connection, include_descendants: bool) -> rusqlite::Result<HashMap<String, usize>> {
+    let mut counts = HashMap::new();
+    let mut tags = conn.prepare_cached("SELECT lower(hex(id)) FROM tags WHERE deleted_at IS NULL")?;
+    for tag_id in tags.query_map([], |row| row.get::<_, String>(0))? {
+        counts.insert(tag_id?, 0);
+    }
+
+    let sql = if include_descendants {
+        "WITH RECURSIVE subtree(ancestor_id, tag_id) AS (
+             SELECT id, id FROM tags WHERE deleted_at IS NULL
+             UNION
+             SELECT s.ancestor_id, t.id FROM subtree s
+             JOIN tags t ON t.parent_id = s.tag_id AND t.deleted_at IS NULL
+         )
+         SELECT lower(hex(s.ancestor_id)), COUNT(DISTINCT nt.note_id)
+         FROM subtree s
+         JOIN note_tags nt ON nt.tag_id = s.tag_id AND nt.deleted_at IS NULL
+         JOIN notes n ON n.id = nt.note_id AND n.deleted_at IS NULL
+         GROUP BY s.ancestor_id"
+    } else {
+        "SELECT lower(hex(nt.tag_id)), COUNT(DISTINCT nt.note_id)
+         FROM note_tags nt
+         JOIN notes n ON n.id = nt.note_id AND n.deleted_at IS NULL
+         WHERE nt.deleted_at IS NULL
+         GROUP BY nt.tag_id"
+    };
+    let mut grouped = conn.prepare_cached(sql)?;
+    let rows = grouped.query_map([], |row| Ok((row.get::<_, String>(0)?, row.get::<_, i64>(1)?)))?;
+    for row in rows {
+        let (tag_id, count) = row?;
+        // Rows of deleted tags are left out, as voicecore does
+        if let Some(slot) = counts.get_mut(&tag_id) {
+            *slot = count as usize;
+        }
+    }
+    Ok(counts)
+}
+
+/// IDs of one keyset page of live notes, newest first (created_at, then id,
+/// descending), plus whether further notes follow.
+///
+/// The cursor is compared in SQL, so a page costs an index range scan of
+/// `limit + 1` rows however deep it is. `after` holds the created_at and
+/// hex ID of the last note of the previous page.
+pub fn note_page_ids(
+    conn: &Connection,
+    limit: usize,
+    after: Option<&(i64, String)>,
+) -> rusqlite::Result<(Vec<String>, bool)> {
+    let fetch = limit as i64 + 1;
+    let mut ids = match after {
+        Some((created_at, id)) => {
+            let mut stmt = conn.prepare_cached(
+                "SELECT lower(hex(id)) FROM notes
+                 WHERE deleted_at IS NULL AND (created_at, id) < (?1, unhex(?2, '-'))
+                 ORDER BY created_at DESC, id DESC LIMIT ?3",
+            )?;
+            let rows = stmt.query_map(params![created_at, id, fetch], |row| row.get::<_, String>(0))?;
+            rows.collect::<rusqlite::Result<Vec<_>>>()?
+        }
+        None => {
+            let mut stmt = conn.prepare_cached(
+                "SELECT lower(hex(id)) FROM notes
+                 WHERE deleted_at IS NULL
+                 ORDER BY created_at DESC, id DESC LIMIT ?1",
+            )?;
+            let rows = stmt.query_map(params![fetch], |row| row.get::<_, String>(0))?;
+            rows.collect::<rusqlite::Result<Vec<_>>>()?
+        }
+    };
+    let has_more = ids.len() > limit;
+    ids.truncate(limit);
+    Ok((ids, has_more))
+}
+
+/// Columns of a transcription row, as voicecore returns them.
+const TRANSCRIPTION_COLUMNS: &[&str] = &[
+    "id",
+    "audio_file_id",
+    "content",
+    "content_segments",
+    "service",
+    "service_arguments",
+    "service_response",
+    "state",
+    "device_id",
+    "created_at",
+    "modified_at",
+    "deleted_at",
+];
+
+/// JSON form of a column value; blobs (IDs) become lowercase hex.
+fn json_value(value: Value) -> serde_json::Value {
+    match value {
+        Value::Null => serde_json::Value::Null,
+        Value::Integer(i) => i.into(),
+        Value::Real(f) => f.into(),
+        Value::Text(s) => s.into(),
+        Value::Blob(bytes) => bytes.iter().map(|byte| format!("{:02x}", byte)).collect::<String>().into(),
+    }
+}
+
+/// Audio file IDs bound per transcription query, well below the lowest
+/// SQLITE_MAX_VARIABLE_NUMBER (999) SQLite has shipped with.
+const AUDIO_FILE_CHUNK: usize = 500;
+
+/// Live transcriptions of the given audio files, one query per chunk of
+/// `AUDIO_FILE_CHUNK` IDs.
+///
+/// Keyed by hex audio file ID; every requested ID is present, with an
+/// empty list if it has no transcriptions. Each list is in creation order.
+pub fn transcriptions_by_audio_file(
+    conn: &Connection,
+    audio_file_ids: &[String],
+) -> rusqlite::Result<HashMap<String, Vec<HashMap<String, serde_json::Value>>>> {
+    let mut by_audio_file: HashMap<String, Vec<HashMap<String, serde_json::Value>>> =
+        audio_file_ids.iter().map(|id| (id.to_lowercase(), Vec::new())).collect();
+    for chunk in audio_file_ids.chunks(AUDIO_FILE_CHUNK) {
+        let mut stmt = conn.prepare_cached(&format!(
+            "SELECT {} FROM transcriptions
+             WHERE deleted_at IS NULL AND audio_file_id IN ({})
+             ORDER BY created_at, id",
+            TRANSCRIPTION_COLUMNS.join(", "),
+            vec!["unhex(?, '-')"; chunk.len()].join(", ")
+        ))?;
+        let mut rows = stmt.query(params_from_iter(chunk))?;
+        while let Some(row) = rows.next()? {
+            let mut transcription = HashMap::with_capacity(TRANSCRIPTION_COLUMNS.len());
+            for (i, column) in TRANSCRIPTION_COLUMNS.iter().enumerate() {
+                transcription.insert(column.to_string(), json_value(row.get(i)?));
+            }
+            let Some(serde_json::Value::String(audio_file_id)) = transcription.get("audio_file_id").cloned() else {
+                continue;
+            };
+            if let Some(list) = by_audio_file.get_mut(&audio_file_id) {
+                list.push(transcription);
+            }
+        }
+    }
+    Ok(by_audio_file)
+}
+
+/// Blob range `[low, high)` of the IDs whose lowercase hex form starts with
+/// `prefix`, or None if `prefix` is not hex.
+fn hex_prefix_range(prefix: &str) -> Option<(Vec<u8>, Vec<u8>)> {
+    let pack = |nibbles: &[u8]| -> Vec<u8> {
+        nibbles.chunks(2).map(|pair| pair[0] << 4 | pair.get(1).copied().unwrap_or(0)).collect()
+    };
+    let mut nibbles = prefix
+        .chars()
+        .map(|c| c.to_digit(16).map(|digit| digit as u8))
+        .collect::<Option<Vec<u8>>>()?;
+    let low = pack(&nibbles);
+    // The prefix plus one, as a hex number; an all-"f" prefix has no
+    // successor, so its range runs past every 16-byte ID
+    let mut high = vec![0xff; 17];
+    while let Some(last) = nibbles.pop() {
+        if last < 0xf {
+            nibbles.push(last + 1);
+            high = pack(&nibbles);
+            break;
+        }
+    }
+    Some((low, high))
+}
+
+/// Whether unresolved (content, delete) conflicts exist for any note whose
+/// hex ID starts with `prefix`.
+///
+/// A prefix is a range on note_id, so with an index on that column the
+/// cost does not depend on how many conflicts are recorded.
+pub fn note_conflicts(conn: &Connection, prefix: &str) -> rusqlite::Result<(bool, bool)> {
+    let Some((low, high)) = hex_prefix_range(&prefix.to_lowercase()) else {
+        return Ok((false, false));
+    };
+    let mut stmt = conn.prepare_cached(
+        "SELECT
+             EXISTS(SELECT 1 FROM conflicts_note_content
+                    WHERE note_id >= ?1 AND note_id < ?2 AND resolved_at IS NULL),
+             EXISTS(SELECT 1 FROM conflicts_note_delete
+                    WHERE note_id >= ?1 AND note_id < ?2 AND resolved_at IS NULL)",
+    )?;
+    stmt.query_row(params![low, high], |row| Ok((row.get(0)?, row.get(1)?)))
+}
@@ -5,11 +5,24 @@
 use pyo3::create_exception;
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList};
-use std::collections::HashMap;
-use std::sync::{Arc, Mutex};
+use std::collections::{HashMap, HashSet};
+use std::ops::{Deref, DerefMut};
+use std::sync::atomic::{AtomicU64, AtomicUsize, Ordering};
+use std::sync::{Arc, Mutex, MutexGuard, TryLockError};
+use std::time::{Duration, Instant};
+
+use futures::stream::{self, StreamExt};
 
 use voicecore_lib::{config, database, error, cloud_storage, merge, models, search, sync_client, sync_server, validation};
 
+mod direct_sql;
+mod search_index;
+mod sync_changes;
+
+use direct_sql::SqlPool;
+use search_index::{Field, IndexError, Scope, SearchIndex};
+use sync_changes::{track_changes, EntityChanges};
+
 // ============================================================================
 // Error types
 // ============================================================================
@@ -34,6 +47,50 @@ fn voice_error_to_pyerr(err: error::VoiceError) -> PyErr {
     }
 }
 
+fn index_error_to_pyerr(err: IndexError) -> PyErr {
+    match err {
+        IndexError::Voice(err) => voice_error_to_pyerr(err),
+        IndexError::Sqlite(err) => DatabaseError::new_err(format!("Search index error: {}", err)),
+    }
+}
+
+fn sql_error_to_pyerr(err: rusqlite::Error) -> PyErr {
+    DatabaseError::new_err(err.to_string())
+}
+
+/// Run a voicecore write, retrying while another connection holds the
+/// write lock.
+///
+/// The busy timeout of voicecore's connections cannot be set from here, so
+/// a "database is locked" error is retried with growing pauses for up to
+/// `direct_sql::BUSY_TIMEOUT`, as a busy timeout would. Other errors, and
+/// the last busy error, are returned as they are.
+fn retry_while_busy<T>(mut write: impl FnMut() -> Result<T, error::VoiceError>) -> Result<T, error::VoiceError> {
+    let deadline = Instant::now() + direct_sql::BUSY_TIMEOUT;
+    let mut pause = Duration::from_millis(5);
+    loop {
+        match write() {
+            Err(err) if is_busy(&err) && Instant::now() < deadline => {
+                std::thread::sleep(pause);
+                pause = (pause * 2).min(Duration::from_millis(200));
+            }
+            result => return result,
+        }
+    }
+}
+
+/// Whether an error is SQLite reporting a lock held by another connection
+/// (SQLITE_BUSY or SQLITE_LOCKED).
+fn is_busy(err: &error::VoiceError) -> bool {
+    match err {
+        error::VoiceError::Database(err) => matches!(
+            err.sqlite_error_code(),
+            Some(rusqlite::ErrorCode::DatabaseBusy | rusqlite::ErrorCode::DatabaseLocked)
+        ),
+        _ => false,
+    }
+}
+
 fn validation_error_to_pyerr(err: error::ValidationError) -> PyErr {
     ValidationError::new_err(err.to_string())
 }
@@ -122,6 +179,85 @@ fn tag_change_result_to_dict<'py>(py: Python<'py>, result: &database::TagChangeR
     Ok(dict)
 }
 
+/// Outcome of adding or removing tags on many notes in one call.
+#[derive(Default)]
+struct TagBatchSummary {
+    /// Note/tag pairs actually added or removed
+    changed: usize,
+    /// Notes that gained or lost at least one tag, in input order
+    note_ids: Vec<String>,
+    list_caches_rebuilt: usize,
+}
+
+/// Add (or remove) every tag on every note.
+///
+/// Notes and tags are resolved once up front, so pairs already in the
+/// wanted state are skipped without a write or a cache rebuild. Every
+/// other pair goes through voicecore's own per-pair add/remove, so it is
+/// stamped and recorded for sync exactly like a single tag change; the
+/// caller holds the writer lock for the whole batch. IDs that do not
+/// resolve are passed through for the per-pair call to resolve or reject
+/// as usual.
+fn apply_tag_batch(
+    db: &mut database::Database,
+    note_ids: &[String],
+    tag_ids: &[String],
+    add: bool,
+) -> Result<TagBatchSummary, error::VoiceError> {
+    let mut tags: Vec<(String, bool)> = Vec::with_capacity(tag_ids.len());
+    for tag_id in tag_ids {
+        let tag = match db.get_tag(tag_id)? {
+            Some(tag) => (tag.id, true),
+            None => (tag_id.clone(), false),
+        };
+        if !tags.contains(&tag) {
+            tags.push(tag);
+        }
+    }
+
+    let mut summary = TagBatchSummary::default();
+    let mut changed_notes: HashSet<String> = HashSet::new();
+    for note_id in note_ids {
+        let (note_id, current) = match db.get_note(note_id)? {
+            Some(note) => {
+                let current: HashSet<String> = db.get_note_tags(&note.id)?.into_iter().map(|tag| tag.id).collect();
+                (note.id, Some(current))
+            }
+            None => (note_id.clone(), None),
+        };
+        for (tag_id, resolved) in &tags {
+            if let Some(current) = &current {
+                if *resolved && current.contains(tag_id) == add {
+                    continue;
+                }
+            }
+            let result = if add {
+                db.add_tag_to_note(&note_id, tag_id)?
+            } else {
+                db.remove_tag_from_note(&note_id, tag_id)?
+            };
+            if result.list_cache_rebuilt {
+                summary.list_caches_rebuilt += 1;
+            }
+            if result.changed {
+                summary.changed += 1;
+                if changed_notes.insert(result.note_id.clone()) {
+                    summary.note_ids.push(result.note_id);
+                }
+            }
+        }
+    }
+    Ok(summary)
+}
+
+fn tag_batch_summary_to_dict<'py>(py: Python<'py>, summary: &TagBatchSummary) -> PyResult<Bound<'py, PyDict>> {
+    let dict = PyDict::new(py);
+    dict.set_item("changed", summary.changed)?;
+    dict.set_item("note_ids", &summary.note_ids)?;
+    dict.set_item("list_caches_rebuilt", summary.list_caches_rebuilt)?;
+    Ok(dict)
+}
+
 fn hashmap_to_pydict<'py>(
     py: Python<'py>,
     map: &HashMap<String, serde_json::Value>,
@@ -164,45 +300,509 @@ fn json_value_to_pyobject(py: Python<'_>, value: &serde_json::Value) -> PyResult
     }
 }
 
+/// Keyset page over search results ordered newest first (created_at, then
+/// id, descending).
+///
+/// Returns at most `limit` rows that sort strictly after the `after` key,
+/// plus whether further rows follow. Paging by key rather than offset keeps
+/// deep pages stable when notes are added or removed between requests.
+/// Unfiltered pages of file databases are cut in SQL instead (see
+/// `direct_sql::note_page_ids`).
+fn keyset_page(
+    mut notes: Vec<database::NoteRow>,
+    limit: usize,
+    after: Option<(i64, String)>,
+) -> (Vec<database::NoteRow>, bool) {
+    notes.sort_unstable_by(|a, b| (b.created_at, &b.id).cmp(&(a.created_at, &a.id)));
+    let start = match &after {
+        Some((created_at, id)) => notes
+            .partition_point(|n| (n.created_at, n.id.as_str()) >= (*created_at, id.as_str())),
+        None => 0,
+    };
+    let has_more = notes.len() > start + limit;
+    let page = notes.into_iter().skip(start).take(limit).collect();
+    (page, has_more)
+}
+
 // ============================================================================
 // Database wrapper
 // ============================================================================
 
-#[pyclass(name = "Database", unsendable)]
+/// Process-wide change counter, bumped after every write made through any
+/// `Database` handle (including sync applies and completed peer syncs).
+/// Lets callers such as the web API validate cached responses without
+/// reading note rows.
+static CHANGE_VERSION: AtomicU64 = AtomicU64::new(0);
+
+fn bump_change_version() {
+    CHANGE_VERSION.fetch_add(1, Ordering::SeqCst);
+}
+
+/// Process-wide counter bumped after peer syncs run through `SyncClient`.
+/// Those write through their own connection with the peer's timestamps, so
+/// the full-text index reconciles against the notes table when it moves.
+static SYNC_GENERATION: AtomicU64 = AtomicU64::new(0);
+
+fn bump_sync_generation() {
+    SYNC_GENERATION.fetch_add(1, Ordering::SeqCst);
+}
+
+/// Writer connection guard that bumps the change version when released,
+/// i.e. once the write has completed.
+struct WriteGuard<'a>(MutexGuard<'a, database::Database>);
+
+impl Deref for WriteGuard<'_> {
+    type Target = database::Database;
+
+    fn deref(&self) -> &Self::Target {
+        &self.0
+    }
+}
+
+impl DerefMut for WriteGuard<'_> {
+    fn deref_mut(&mut self) -> &mut Self::Target {
+        &mut self.0
+    }
+}
+
+impl Drop for WriteGuard<'_> {
+    fn drop(&mut self) {
+        bump_change_version();
+    }
+}
+
+/// Snapshot of what the database looked like when a cache was built: the
+/// process-wide change counter plus SQLite's data_version as seen by a
+/// dedicated connection, which moves on every commit made by any other
+/// connection (this process's voicecore connections or other processes).
+type DataVersion = (u64, Option<i64>);
+
+/// Unresolved conflict kinds recorded for one note.
+#[derive(Clone, Copy, Default)]
+struct NoteConflictFlags {
+    content: bool,
+    delete: bool,
+}
+
+impl NoteConflictFlags {
+    fn merge(&mut self, other: NoteConflictFlags) {
+        self.content |= other.content;
+        self.delete |= other.delete;
+    }
+
+    /// Flags of the notes whose IDs start with each prefix, from voicecore's
+    /// conflict lists (in-memory databases, which direct SQL cannot reach).
+    fn scan(db: &database::Database, prefixes: &[String]) -> Result<Vec<Self>, error::VoiceError> {
+        let prefixes: Vec<String> = prefixes.iter().map(|prefix| prefix.to_lowercase()).collect();
+        let mut result = vec![Self::default(); prefixes.len()];
+        let sources = [
+            (db.get_note_content_conflicts(false)?, NoteConflictFlags { content: true, delete: false }),
+            (db.get_note_delete_conflicts(false)?, NoteConflictFlags { content: false, delete: true }),
+        ];
+        for (rows, flags) in sources {
+            for row in rows {
+                if let Some(serde_json::Value::String(note_id)) = row.get("note_id") {
+                    let note_id = note_id.to_lowercase();
+                    for (slot, prefix) in result.iter_mut().zip(&prefixes) {
+                        if note_id.starts_with(prefix.as_str()) {
+                            slot.merge(flags);
+                        }
+                    }
+                }
+            }
+        }
+        Ok(result)
+    }
+
+    fn types(&self) -> Vec<String> {
+        let mut types = Vec::new();
+        if self.content {
+            types.push("content".to_string());
+        }
+        if self.delete {
+            types.push("delete".to_string());
+        }
+        types
+    }
+}
+
+/// Thread-safe database handle.
+///
+/// All writes go through a single connection. File-backed databases may
+/// additionally open a pool of read connections (SQLite WAL mode lets them
+/// read concurrently with the writer), which the bulk read methods use so
+/// that a threaded web server can serve several readers at once. Pooled
+/// connections are opened by voicecore like the writer, which offers no
+/// read-only open, and are only ever handed read calls.
+#[pyclass(name = "Database")]
 pub struct PyDatabase {
-    inner: Option<database::Database>,
+    // Shared so that long-running calls can move a handle into `allow_threads`
+    inner: Option<Arc<Mutex<database::Database>>>,
+    readers: Vec<Arc<Mutex<database::Database>>>,
+    next_reader: AtomicUsize,
+    db_path: Option<String>,
+    // Read-only connections for direct SQL; None for in-memory databases
+    sql: Option<SqlPool>,
+    // Reads PRAGMA data_version only, so it sees every commit (see
+    // `DataVersion`); None for in-memory databases
+    watch: Option<Mutex<rusqlite::Connection>>,
+    // Opened on first use so that databases never searched get no sidecar
+    search_index: Mutex<Option<SearchIndex>>,
 }
 
 impl PyDatabase {
-    fn inner_ref(&self) -> PyResult<&database::Database> {
+    fn shared(&self) -> PyResult<Arc<Mutex<database::Database>>> {
         self.inner
             .as_ref()
+            .map(Arc::clone)
             .ok_or_else(|| DatabaseError::new_err("Database has been closed"))
     }
+
+    /// Lock the writer connection from a thread holding the GIL.
+    ///
+    /// The writer is also locked by threads that released the GIL
+    /// (`without_gil`, sync), which may need the GIL again before they
+    /// unlock it. Blocking on the mutex with the GIL held could deadlock
+    /// against them, so when the mutex is taken we wait for it with the GIL
+    /// released and then try again.
+    fn inner_ref(&self) -> PyResult<MutexGuard<'_, database::Database>> {
+        let mutex = self
+            .inner
+            .as_deref()
+            .ok_or_else(|| DatabaseError::new_err("Database has been closed"))?;
+        loop {
+            match mutex.try_lock() {
+                Ok(db) => return Ok(db),
+                Err(TryLockError::Poisoned(_)) => return Err(DatabaseError::new_err("Database lock poisoned")),
+                Err(TryLockError::WouldBlock) => {
+                    // The guard cannot leave `allow_threads` (it is not Send),
+                    // so only wait for the holder here
+                    Python::with_gil(|py| py.allow_threads(|| drop(mutex.lock())));
+                }
+            }
+        }
+    }
+
+    fn writer(&self) -> PyResult<WriteGuard<'_>> {
+        self.inner_ref().map(WriteGuard)
+    }
+
+    /// Run a database operation with the GIL released.
+    ///
+    /// Used for calls that can take a noticeable amount of time (full table
+    /// reads, searches, cache rebuilds) so that other Python threads and the
+    /// Qt/Textual event loops keep running. Only plain Rust values may cross
+    /// the boundary; conversion to Python objects happens afterwards.
+    fn without_gil<T, F>(&self, py: Python<'_>, f: F) -> PyResult<T>
+    where
+        T: Send,
+        F: FnOnce(&mut database::Database) -> Result<T, error::VoiceError> + Send,
+    {
+        let shared = self.shared()?;
+        py.allow_threads(move || {
+            let mut db = shared
+                .lock()
+                .map_err(|_| DatabaseError::new_err("Database lock poisoned"))?;
+            let result = f(&mut *db).map_err(voice_error_to_pyerr);
+            bump_change_version();
+            result
+        })
+    }
+
+    /// Pick a connection for a read-only operation.
+    ///
+    /// Prefers an idle pooled reader, then round-robins over the pool, and
+    /// falls back to the writer connection when no pool was opened.
+    fn reader(&self) -> PyResult<Arc<Mutex<database::Database>>> {
+        let writer = self.shared()?;
+        if self.readers.is_empty() {
+            return Ok(writer);
+        }
+        let start = self.next_reader.fetch_add(1, Ordering::Relaxed);
+        let count = self.readers.len();
+        for offset in 0..count {
+            let candidate = &self.readers[(start + offset) % count];
+            if candidate.try_lock().is_ok() {
+                return Ok(Arc::clone(candidate));
+            }
+        }
+        Ok(Arc::clone(&self.readers[start % count]))
+    }
+
+    fn data_version(&self) -> DataVersion {
+        let commits = self
+            .watch
+            .as_ref()
+            .and_then(|watch| watch.lock().ok().and_then(|conn| direct_sql::data_version(&conn).ok()));
+        (CHANGE_VERSION.load(Ordering::SeqCst), commits)
+    }
+
+    /// Unresolved conflict flags of the notes matching each ID prefix.
+    ///
+    /// File databases answer each prefix with a range lookup on the
+    /// conflict tables' note_id index; in-memory ones scan the conflicts.
+    fn note_conflict_flags(&self, py: Python<'_>, prefixes: &[String]) -> PyResult<Vec<NoteConflictFlags>> {
+        let direct = self.read_sql(py, |conn| {
+            prefixes
+                .iter()
+                .map(|prefix| {
+                    direct_sql::note_conflicts(conn, prefix)
+                        .map(|(content, delete)| NoteConflictFlags { content, delete })
+                })
+                .collect()
+        })?;
+        match direct {
+            Some(flags) => Ok(flags),
+            None => self.read_without_gil(py, |db| NoteConflictFlags::scan(db, prefixes)),
+        }
+    }
+
+    /// Open the full-text index into `slot` if it is not open yet.
+    fn open_search_index<'a>(
+        slot: &'a mut Option<SearchIndex>,
+        db_path: Option<&str>,
+    ) -> PyResult<&'a mut SearchIndex> {
+        if slot.is_none() {
+            *slot = Some(SearchIndex::open(db_path).map_err(index_error_to_pyerr)?);
+        }
+        Ok(slot.as_mut().expect("search index was just opened"))
+    }
+
+    /// Run an operation against the full-text index, bringing it up to date
+    /// with the database first. Runs with the GIL released.
+    fn with_search_index<T, F>(&self, py: Python<'_>, f: F) -> PyResult<T>
+    where
+        T: Send,
+        F: FnOnce(&mut SearchIndex, &database::Database) -> Result<T, IndexError> + Send,
+    {
+        // Take the version before reading so a concurrent write leaves the
+        // index stale rather than wrongly current
+        let version = self.data_version();
+        let generation = SYNC_GENERATION.load(Ordering::SeqCst);
+        let reader = self.reader()?;
+        py.allow_threads(move || {
+            let mut slot = self
+                .search_index
+                .lock()
+                .map_err(|_| DatabaseError::new_err("Search index lock poisoned"))?;
+            let index = Self::open_search_index(&mut slot, self.db_path.as_deref())?;
+            let db = reader
+                .lock()
+                .map_err(|_| DatabaseError::new_err("Database lock poisoned"))?;
+            index.refresh(&db, version, generation).map_err(index_error_to_pyerr)?;
+            f(index, &db).map_err(index_error_to_pyerr)
+        })
+    }
+
+    /// Queue notes for re-indexing after a write the change log does not
+    /// surface (sync-apply, transcriptions).
+    ///
+    /// Skipped while no index exists: the first query builds it from scratch.
+    fn queue_search_reindex(&self, note_ids: Vec<String>) -> PyResult<()> {
+        if note_ids.is_empty() {
+            return Ok(());
+        }
+        let mut slot = self
+            .search_index
+            .lock()
+            .map_err(|_| DatabaseError::new_err("Search index lock poisoned"))?;
+        if slot.is_none() {
+            let exists = self
+                .db_path
+                .as_deref()
+                .map_or(false, |path| std::path::Path::new(&SearchIndex::sidecar_path(path)).exists());
+            if !exists {
+                return Ok(());
+            }
+        }
+        Self::open_search_index(&mut slot, self.db_path.as_deref())?
+            .mark_pending(note_ids)
+            .map_err(index_error_to_pyerr)
+    }
+
+    /// Content search plus optional transcription matching, as rows.
+    ///
+    /// Without text or tag groups every note is a candidate. The full-text
+    /// index is only consulted when transcriptions are involved.
+    fn search_note_rows(
+        &self,
+        py: Python<'_>,
+        text_query: Option<String>,
+        tag_id_groups: Option<Vec<Vec<String>>>,
+        transcript_query: Option<String>,
+        include_transcriptions: bool,
+    ) -> PyResult<Vec<database::NoteRow>> {
+        let content_notes = |db: &database::Database,
+                             text_query: Option<&str>,
+                             tag_id_groups: Option<&Vec<Vec<String>>>| {
+            if text_query.is_some() || tag_id_groups.is_some() {
+                db.search_notes(text_query, tag_id_groups)
+            } else {
+                db.get_all_notes()
+            }
+        };
+        if transcript_query.is_none() && !(include_transcriptions && text_query.is_some()) {
+            return self.read_without_gil(py, move |db| {
+                content_notes(&*db, text_query.as_deref(), tag_id_groups.as_ref())
+            });
+        }
+        self.with_search_index(py, move |index, db| {
+            let notes = content_notes(db, text_query.as_deref(), tag_id_groups.as_ref())?;
+            let scope = match &tag_id_groups {
+                Some(groups) => Scope::TagGroups(groups),
+                None => Scope::All,
+            };
+            search_index::apply_transcript_search(
+                db,
+                index,
+                notes,
+                text_query.as_deref().filter(|_| include_transcriptions),
+                scope,
+                transcript_query.as_deref(),
+            )
+        })
+    }
+
+    /// Notes whose recordings a transcription belongs to.
+    fn transcription_note_ids(db: &database::Database, transcription_id: &str) -> PyResult<Vec<String>> {
+        match db.get_transcription(transcription_id).map_err(voice_error_to_pyerr)? {
+            Some(t) => db.get_notes_for_audio_file(&t.audio_file_id).map_err(voice_error_to_pyerr),
+            None => Ok(Vec::new()),
+        }
+    }
+
+    /// Run direct SQL (see `direct_sql`) on a read-only connection with the
+    /// GIL released.
+    ///
+    /// Returns None for in-memory databases, which only the voicecore
+    /// connection can reach; callers fall back to voicecore methods.
+    fn read_sql<T, F>(&self, py: Python<'_>, f: F) -> PyResult<Option<T>>
+    where
+        T: Send,
+        F: FnOnce(&rusqlite::Connection) -> rusqlite::Result<T> + Send,
+    {
+        self.shared()?;
+        match &self.sql {
+            Some(pool) => py.allow_threads(move || pool.read(f).map(Some).map_err(sql_error_to_pyerr)),
+            None => Ok(None),
+        }
+    }
+
+    /// Like `without_gil`, but runs on a pooled read connection.
+    fn read_without_gil<T, F>(&self, py: Python<'_>, f: F) -> PyResult<T>
+    where
+        T: Send,
+        F: FnOnce(&mut database::Database) -> Result<T, error::VoiceError> + Send,
+    {
+        let shared = self.reader()?;
+        py.allow_threads(move || {
+            let mut db = shared
+                .lock()
+                .map_err(|_| DatabaseError::new_err("Database lock poisoned"))?;
+            f(&mut *db).map_err(voice_error_to_pyerr)
+        })
+    }
 }
 
 #[pymethods]
 impl PyDatabase {
+    /// Open a database.
+    ///
+    /// `pool_size` extra read connections are opened for file-backed
+    /// databases. In-memory databases cannot share data between
+    /// connections, so they always use the single writer connection.
+    ///
+    /// Opening a pool switches the database file to WAL journaling, which
+    /// lets its readers read while the writer writes. The journal mode is
+    /// stored in the file and SQLite then keeps `-wal`/`-shm` files next to
+    /// it, so this only happens when a pool is asked for (the web server);
+    /// without one the file keeps its journal mode. A pool cannot be
+    /// opened if the switch fails, as its readers would block the writer.
     #[new]
-    #[pyo3(signature = (db_path=None))]
-    fn new(db_path: Option<&str>) -> PyResult<Self> {
+    #[pyo3(signature = (db_path=None, pool_size=0))]
+    fn new(db_path: Option<&str>, pool_size: usize) -> PyResult<Self> {
         let db = match db_path {
             Some(path) => database::Database::new(path),
             None => database::Database::new_in_memory(),
         }
         .map_err(voice_error_to_pyerr)?;
-        Ok(Self { inner: Some(db) })
+
+        let mut readers = Vec::new();
+        if let Some(path) = db_path.filter(|p| *p != ":memory:") {
+            if pool_size > 0 && !direct_sql::ensure_wal(path).unwrap_or(false) {
+                return Err(DatabaseError::new_err(format!(
+                    "Could not switch {} to WAL journaling, which pooled readers need",
+                    path
+                )));
+            }
+            for _ in 0..pool_size {
+                let reader = database::Database::new(path).map_err(voice_error_to_pyerr)?;
+                readers.push(Arc::new(Mutex::new(reader)));
+            }
+        }
+
+        Ok(Self {
+            inner: Some(Arc::new(Mutex::new(db))),
+            readers,
+            next_reader: AtomicUsize::new(0),
+            db_path: db_path.filter(|p| *p != ":memory:").map(String::from),
+            sql: db_path.filter(|p| *p != ":memory:").map(SqlPool::new),
+            watch: db_path
+                .filter(|p| *p != ":memory:")
+                .and_then(|path| direct_sql::open_read_only(path).ok())
+                .map(Mutex::new),
+            search_index: Mutex::new(None),
+        })
+    }
+
+    /// Number of pooled read connections.
+    #[getter]
+    fn pool_size(&self) -> usize {
+        self.readers.len()
+    }
+
+    /// Current value of the process-wide change counter.
+    #[getter]
+    fn change_version(&self) -> u64 {
+        CHANGE_VERSION.load(Ordering::SeqCst)
+    }
+
+    /// This process's view of the database version: the change counter and
+    /// SQLite's data_version (None for in-memory databases).
+    ///
+    /// Moves after every write made through this process and every commit
+    /// made by another connection, so it is exact where file size and
+    /// mtime are not. The values are local to the process.
+    #[getter]
+    fn local_data_version(&self) -> DataVersion {
+        self.data_version()
     }
 
     fn close(&mut self) -> PyResult<()> {
-        if let Some(db) = self.inner.take() {
+        if let Ok(mut slot) = self.search_index.lock() {
+            slot.take();
+        }
+        self.sql = None;
+        self.watch = None;
+        for shared in self.readers.drain(..) {
+            let db = Arc::try_unwrap(shared)
+                .map_err(|_| DatabaseError::new_err("Database is still in use"))?
+                .into_inner()
+                .map_err(|_| DatabaseError::new_err("Database lock poisoned"))?;
+            db.close().map_err(voice_error_to_pyerr)?;
+        }
+        if let Some(shared) = self.inner.take() {
+            let db = Arc::try_unwrap(shared)
+                .map_err(|_| DatabaseError::new_err("Database is still in use"))?
+                .into_inner()
+                .map_err(|_| DatabaseError::new_err("Database lock poisoned"))?;
             db.close().map_err(voice_error_to_pyerr)?;
         }
         Ok(())
     }
 
     fn create_note(&self, content: &str) -> PyResult<String> {
-        self.inner_ref()?.create_note(content).map_err(voice_error_to_pyerr)
+        self.writer()?.create_note(content).map_err(voice_error_to_pyerr)
     }
 
     fn get_note<'py>(&self, py: Python<'py>, note_id: &str) -> PyResult<Option<PyObject>> {
@@ -214,19 +814,19 @@ impl PyDatabase {
     }
 
     fn update_note(&self, note_id: &str, content: &str) -> PyResult<bool> {
-        self.inner_ref()?.update_note(note_id, content).map_err(voice_error_to_pyerr)
+        self.writer()?.update_note(note_id, content).map_err(voice_error_to_pyerr)
     }
 
     fn delete_note(&self, note_id: &str) -> PyResult<bool> {
-        self.inner_ref()?.delete_note(note_id).map_err(voice_error_to_pyerr)
+        self.writer()?.delete_note(note_id).map_err(voice_error_to_pyerr)
     }
 
     fn merge_notes(&self, note_id_1: &str, note_id_2: &str) -> PyResult<String> {
-        self.inner_ref()?.merge_notes(note_id_1, note_id_2).map_err(voice_error_to_pyerr)
+        self.writer()?.merge_notes(note_id_1, note_id_2).map_err(voice_error_to_pyerr)
     }
 
     fn get_all_notes<'py>(&self, py: Python<'py>) -> PyResult<PyObject> {
-        let notes = self.inner_ref()?.get_all_notes().map_err(voice_error_to_pyerr)?;
+        let notes = self.read_without_gil(py, |db| db.get_all_notes())?;
         let list = PyList::empty(py);
         for note in &notes {
             list.append(note_row_to_dict(py, note)?)?;
@@ -236,7 +836,7 @@ impl PyDatabase {
 
     #[pyo3(signature = (name, parent_id=None))]
     fn create_tag(&self, name: &str, parent_id: Option<&str>) -> PyResult<String> {
-        self.inner_ref()?.create_tag(name, parent_id).map_err(voice_error_to_pyerr)
+        self.writer()?.create_tag(name, parent_id).map_err(voice_error_to_pyerr)
     }
 
     fn get_tag<'py>(&self, py: Python<'py>, tag_id: &str) -> PyResult<Option<PyObject>> {
@@ -248,7 +848,7 @@ impl PyDatabase {
     }
 
     fn get_all_tags<'py>(&self, py: Python<'py>) -> PyResult<PyObject> {
-        let tags = self.inner_ref()?.get_all_tags().map_err(voice_error_to_pyerr)?;
+        let tags = self.read_without_gil(py, |db| db.get_all_tags())?;
         let list = PyList::empty(py);
         for tag in &tags {
             list.append(tag_row_to_dict(py, tag)?)?;
@@ -256,6 +856,66 @@ impl PyDatabase {
         Ok(list.into_any().unbind())
     }
 
+    /// Number of notes carrying each tag, keyed by tag ID, in one call.
+    ///
+    /// With `include_descendants`, each count covers the tag and all of its
+    /// descendants, counting a note tagged at several levels only once.
+    ///
+    /// File databases are counted with one grouped query; in-memory
+    /// databases (small, tests) with a note filter per tag.
+    #[pyo3(signature = (include_descendants=false))]
+    fn get_tag_note_counts(
+        &self,
+        py: Python<'_>,
+        include_descendants: bool,
+    ) -> PyResult<HashMap<String, usize>> {
+        if let Some(counts) = self.read_sql(py, move |conn| direct_sql::tag_note_counts(conn, include_descendants))? {
+            return Ok(counts);
+        }
+        self.read_without_gil(py, move |db| {
+            let tags = db.get_all_tags()?;
+            let mut notes_by_tag: HashMap<String, HashSet<String>> = HashMap::with_capacity(tags.len());
+            for tag in &tags {
+                let notes = db.filter_notes(&vec![tag.id.clone()])?;
+                notes_by_tag.insert(tag.id.clone(), notes.into_iter().map(|n| n.id).collect());
+            }
+
+            if !include_descendants {
+                return Ok(notes_by_tag
+                    .into_iter()
+                    .map(|(tag_id, notes)| (tag_id, notes.len()))
+                    .collect());
+            }
+
+            let mut children: HashMap<&str, Vec<&str>> = HashMap::new();
+            for tag in &tags {
+                if let Some(parent_id) = tag.parent_id.as_deref() {
+                    children.entry(parent_id).or_default().push(tag.id.as_str());
+                }
+            }
+
+            let mut counts = HashMap::with_capacity(tags.len());
+            for tag in &tags {
+                let mut subtree_notes: HashSet<&str> = HashSet::new();
+                let mut visited: HashSet<&str> = HashSet::new();
+                let mut stack = vec![tag.id.as_str()];
+                while let Some(tag_id) = stack.pop() {
+                    if !visited.insert(tag_id) {
+                        continue;
+                    }
+                    if let Some(notes) = notes_by_tag.get(tag_id) {
+                        subtree_notes.extend(notes.iter().map(String::as_str));
+                    }
+                    if let Some(child_ids) = children.get(tag_id) {
+                        stack.extend(child_ids.iter().copied());
+                    }
+                }
+                counts.insert(tag.id.clone(), subtree_notes.len());
+            }
+            Ok(counts)
+        })
+    }
+
     fn get_tags_by_name<'py>(&self, py: Python<'py>, name: &str) -> PyResult<PyObject> {
         let tags = self.inner_ref()?.get_tags_by_name(name).map_err(voice_error_to_pyerr)?;
         let list = PyList::empty(py);
@@ -298,31 +958,46 @@ impl PyDatabase {
     }
 
     fn rename_tag(&self, tag_id: &str, new_name: &str) -> PyResult<bool> {
-        self.inner_ref()?.rename_tag(tag_id, new_name).map_err(voice_error_to_pyerr)
+        self.writer()?.rename_tag(tag_id, new_name).map_err(voice_error_to_pyerr)
     }
 
     fn reparent_tag(&self, tag_id: &str, new_parent_id: Option<&str>) -> PyResult<bool> {
-        self.inner_ref()?.reparent_tag(tag_id, new_parent_id).map_err(voice_error_to_pyerr)
+        self.writer()?.reparent_tag(tag_id, new_parent_id).map_err(voice_error_to_pyerr)
     }
 
     fn delete_tag(&self, tag_id: &str) -> PyResult<bool> {
-        self.inner_ref()?.delete_tag(tag_id).map_err(voice_error_to_pyerr)
+        self.writer()?.delete_tag(tag_id).map_err(voice_error_to_pyerr)
     }
 
     fn add_tag_to_note<'py>(&self, py: Python<'py>, note_id: &str, tag_id: &str) -> PyResult<PyObject> {
-        let result = self.inner_ref()?
+        let result = self.writer()?
             .add_tag_to_note(note_id, tag_id)
             .map_err(voice_error_to_pyerr)?;
         Ok(tag_change_result_to_dict(py, &result)?.into_any().unbind())
     }
 
     fn remove_tag_from_note<'py>(&self, py: Python<'py>, note_id: &str, tag_id: &str) -> PyResult<PyObject> {
-        let result = self.inner_ref()?
+        let result = self.writer()?
             .remove_tag_from_note(note_id, tag_id)
             .map_err(voice_error_to_pyerr)?;
         Ok(tag_change_result_to_dict(py, &result)?.into_any().unbind())
     }
 
+    /// Add each tag to each note in one call.
+    ///
+    /// The whole batch runs under one hold of the write lock with the GIL
+    /// released and moves the change counter once.
+    fn add_tags_to_notes<'py>(&self, py: Python<'py>, note_ids: Vec<String>, tag_ids: Vec<String>) -> PyResult<PyObject> {
+        let summary = self.without_gil(py, move |db| apply_tag_batch(db, &note_ids, &tag_ids, true))?;
+        Ok(tag_batch_summary_to_dict(py, &summary)?.into_any().unbind())
+    }
+
+    /// Remove each tag from each note in one call (see `add_tags_to_notes`).
+    fn remove_tags_from_notes<'py>(&self, py: Python<'py>, note_ids: Vec<String>, tag_ids: Vec<String>) -> PyResult<PyObject> {
+        let summary = self.without_gil(py, move |db| apply_tag_batch(db, &note_ids, &tag_ids, false))?;
+        Ok(tag_batch_summary_to_dict(py, &summary)?.into_any().unbind())
+    }
+
     fn get_note_tags<'py>(&self, py: Python<'py>, note_id: &str) -> PyResult<PyObject> {
         let tags = self.inner_ref()?.get_note_tags(note_id).map_err(voice_error_to_pyerr)?;
         let list = PyList::empty(py);
@@ -333,7 +1008,7 @@ impl PyDatabase {
     }
 
     fn filter_notes<'py>(&self, py: Python<'py>, tag_ids: Vec<String>) -> PyResult<PyObject> {
-        let notes = self.inner_ref()?.filter_notes(&tag_ids).map_err(voice_error_to_pyerr)?;
+        let notes = self.read_without_gil(py, move |db| db.filter_notes(&tag_ids))?;
         let list = PyList::empty(py);
         for note in &notes {
             list.append(note_row_to_dict(py, note)?)?;
@@ -341,25 +1016,155 @@ impl PyDatabase {
         Ok(list.into_any().unbind())
     }
 
-    #[pyo3(signature = (text_query=None, tag_id_groups=None))]
+    /// Search notes by content text and tag groups.
+    ///
+    /// `transcript_query` keeps only notes whose transcriptions match it;
+    /// with `include_transcriptions`, `text_query` also matches transcription
+    /// text. Both use the full-text index.
+    #[pyo3(signature = (text_query=None, tag_id_groups=None, transcript_query=None, include_transcriptions=false))]
     fn search_notes<'py>(
         &self,
         py: Python<'py>,
-        text_query: Option<&str>,
+        text_query: Option<String>,
         tag_id_groups: Option<Vec<Vec<String>>>,
+        transcript_query: Option<String>,
+        include_transcriptions: bool,
     ) -> PyResult<PyObject> {
-        let groups_ref = tag_id_groups.as_ref();
-        let notes = self
-            .inner_ref()?
-            .search_notes(text_query, groups_ref)
-            .map_err(voice_error_to_pyerr)?;
+        let notes = if transcript_query.is_none() && !include_transcriptions {
+            self.read_without_gil(py, move |db| {
+                db.search_notes(text_query.as_deref(), tag_id_groups.as_ref())
+            })?
+        } else {
+            self.search_note_rows(py, text_query, tag_id_groups, transcript_query, include_transcriptions)?
+        };
+        let list = PyList::empty(py);
+        for note in &notes {
+            list.append(note_row_to_dict(py, note)?)?;
+        }
+        Ok(list.into_any().unbind())
+    }
+
+    /// Get one keyset page of notes, optionally restricted to a search.
+    ///
+    /// Without `text_query`/`tag_id_groups` this pages over all notes.
+    /// Pass the `created_at` and `id` of the last note of the previous page
+    /// as `after_created_at`/`after_id` to continue. Only the page itself is
+    /// converted to Python objects.
+    ///
+    /// Unfiltered pages of file databases are selected by the cursor in SQL
+    /// and only the page's notes are loaded; searches are paged over their
+    /// results.
+    #[pyo3(signature = (limit, after_created_at=None, after_id=None, text_query=None, tag_id_groups=None, transcript_query=None, include_transcriptions=false))]
+    fn get_notes_page<'py>(
+        &self,
+        py: Python<'py>,
+        limit: usize,
+        after_created_at: Option<i64>,
+        after_id: Option<String>,
+        text_query: Option<String>,
+        tag_id_groups: Option<Vec<Vec<String>>>,
+        transcript_query: Option<String>,
+        include_transcriptions: bool,
+    ) -> PyResult<PyObject> {
+        let after = after_created_at.zip(after_id);
+        let unfiltered = text_query.is_none() && tag_id_groups.is_none() && transcript_query.is_none();
+        let page = if unfiltered {
+            let cursor = after.clone();
+            self.read_sql(py, move |conn| direct_sql::note_page_ids(conn, limit, cursor.as_ref()))?
+        } else {
+            None
+        };
+        let (notes, has_more) = match page {
+            Some((ids, has_more)) => {
+                let notes = self.read_without_gil(py, move |db| {
+                    let mut notes = Vec::with_capacity(ids.len());
+                    for id in &ids {
+                        // Skips a note deleted since the page was selected
+                        if let Some(note) = db.get_note(id)? {
+                            notes.push(note);
+                        }
+                    }
+                    Ok(notes)
+                })?;
+                (notes, has_more)
+            }
+            None => {
+                let notes =
+                    self.search_note_rows(py, text_query, tag_id_groups, transcript_query, include_transcriptions)?;
+                py.allow_threads(move || keyset_page(notes, limit, after))
+            }
+        };
+
         let list = PyList::empty(py);
         for note in &notes {
             list.append(note_row_to_dict(py, note)?)?;
         }
+        let result = PyDict::new(py);
+        result.set_item("notes", list)?;
+        result.set_item("has_more", has_more)?;
+        Ok(result.into_any().unbind())
+    }
+
+    /// Ranked full-text search over note content and transcriptions.
+    ///
+    /// Words are ANDed, `"quoted text"` matches a phrase and `word*` a
+    /// prefix. Results are ordered best match first; each is a dict with
+    /// the note, its `score` (higher is better) and a `snippet` with the
+    /// matched terms wrapped in `highlight_start`/`highlight_end`. The
+    /// index is brought up to date before querying.
+    #[pyo3(signature = (query, limit=50, include_transcriptions=true, highlight_start="[", highlight_end="]"))]
+    fn full_text_search<'py>(
+        &self,
+        py: Python<'py>,
+        query: &str,
+        limit: usize,
+        include_transcriptions: bool,
+        highlight_start: &str,
+        highlight_end: &str,
+    ) -> PyResult<PyObject> {
+        let hits = self.with_search_index(py, |index, db| {
+            let field = if include_transcriptions { Field::Any } else { Field::Content };
+            let hits = index.search(query, field, limit, (highlight_start, highlight_end))?;
+            let mut rows = Vec::with_capacity(hits.len());
+            for hit in hits {
+                if let Some(note) = db.get_note(&hit.note_id)? {
+                    rows.push((note, hit.score, hit.snippet));
+                }
+            }
+            Ok(rows)
+        })?;
+
+        let list = PyList::empty(py);
+        for (note, score, snippet) in &hits {
+            let dict = PyDict::new(py);
+            dict.set_item("note", note_row_to_dict(py, note)?)?;
+            dict.set_item("score", score)?;
+            dict.set_item("snippet", snippet)?;
+            list.append(dict)?;
+        }
         Ok(list.into_any().unbind())
     }
 
+    /// Drop and rebuild the full-text search index.
+    ///
+    /// Returns the number of notes indexed.
+    fn rebuild_search_index(&self, py: Python<'_>) -> PyResult<usize> {
+        let version = self.data_version();
+        let generation = SYNC_GENERATION.load(Ordering::SeqCst);
+        let reader = self.reader()?;
+        py.allow_threads(move || {
+            let mut slot = self
+                .search_index
+                .lock()
+                .map_err(|_| DatabaseError::new_err("Search index lock poisoned"))?;
+            let index = Self::open_search_index(&mut slot, self.db_path.as_deref())?;
+            let db = reader
+                .lock()
+                .map_err(|_| DatabaseError::new_err("Database lock poisoned"))?;
+            index.rebuild(&db, version, generation).map_err(index_error_to_pyerr)
+        })
+    }
+
     // ========================================================================
     // Sync methods
     // ========================================================================
@@ -392,10 +1197,7 @@ impl PyDatabase {
         since: Option<i64>,
         limit: i64,
     ) -> PyResult<PyObject> {
-        let (changes, latest) = self
-            .inner_ref()?
-            .get_changes_since(since, limit)
-            .map_err(voice_error_to_pyerr)?;
+        let (changes, latest) = self.read_without_gil(py, |db| db.get_changes_since(since, limit))?;
 
         let result = PyDict::new(py);
         let changes_list = PyList::empty(py);
@@ -408,7 +1210,7 @@ impl PyDatabase {
     }
 
     fn get_full_dataset<'py>(&self, py: Python<'py>) -> PyResult<PyObject> {
-        let dataset = self.inner_ref()?.get_full_dataset().map_err(voice_error_to_pyerr)?;
+        let dataset = self.read_without_gil(py, |db| db.get_full_dataset())?;
 
         let result = PyDict::new(py);
         for (key, items) in &dataset {
@@ -435,9 +1237,12 @@ impl PyDatabase {
         deleted_at: Option<i64>,
         sync_received_at: Option<i64>,
     ) -> PyResult<bool> {
-        self.inner_ref()?
+        let applied = self
+            .writer()?
             .apply_sync_note(note_id, created_at, content, modified_at, deleted_at, sync_received_at)
-            .map_err(voice_error_to_pyerr)
+            .map_err(voice_error_to_pyerr)?;
+        self.queue_search_reindex(vec![note_id.to_string()])?;
+        Ok(applied)
     }
 
     #[pyo3(signature = (tag_id, name, parent_id, created_at, modified_at=None, sync_received_at=None))]
@@ -450,7 +1255,7 @@ impl PyDatabase {
         modified_at: Option<i64>,
         sync_received_at: Option<i64>,
     ) -> PyResult<bool> {
-        self.inner_ref()?
+        self.writer()?
             .apply_sync_tag(tag_id, name, parent_id, created_at, modified_at, sync_received_at)
             .map_err(voice_error_to_pyerr)
     }
@@ -465,7 +1270,7 @@ impl PyDatabase {
         deleted_at: Option<i64>,
         sync_received_at: Option<i64>,
     ) -> PyResult<bool> {
-        self.inner_ref()?
+        self.writer()?
             .apply_sync_note_tag(note_id, tag_id, created_at, modified_at, deleted_at, sync_received_at)
             .map_err(voice_error_to_pyerr)
     }
@@ -523,7 +1328,7 @@ impl PyDatabase {
         remote_device_id: Option<&str>,
         remote_device_name: Option<&str>,
     ) -> PyResult<String> {
-        self.inner_ref()?
+        self.writer()?
             .create_note_content_conflict(
                 note_id,
                 local_content,
@@ -551,7 +1356,7 @@ impl PyDatabase {
         deleting_device_id: Option<&str>,
         deleting_device_name: Option<&str>,
     ) -> PyResult<String> {
-        self.inner_ref()?
+        self.writer()?
             .create_note_delete_conflict(
                 note_id,
                 surviving_content,
@@ -579,7 +1384,7 @@ impl PyDatabase {
         remote_device_id: Option<&str>,
         remote_device_name: Option<&str>,
     ) -> PyResult<String> {
-        self.inner_ref()?
+        self.writer()?
             .create_tag_rename_conflict(
                 tag_id,
                 local_name,
@@ -610,7 +1415,7 @@ impl PyDatabase {
         remote_device_id: Option<&str>,
         remote_device_name: Option<&str>,
     ) -> PyResult<String> {
-        self.inner_ref()?
+        self.writer()?
             .create_note_tag_conflict(
                 note_id,
                 tag_id,
@@ -641,7 +1446,7 @@ impl PyDatabase {
         remote_device_id: Option<&str>,
         remote_device_name: Option<&str>,
     ) -> PyResult<String> {
-        self.inner_ref()?
+        self.writer()?
             .create_tag_parent_conflict(
                 tag_id,
                 local_parent_id,
@@ -669,7 +1474,7 @@ impl PyDatabase {
         deleting_device_id: Option<&str>,
         deleting_device_name: Option<&str>,
     ) -> PyResult<String> {
-        self.inner_ref()?
+        self.writer()?
             .create_tag_delete_conflict(
                 tag_id,
                 surviving_name,
@@ -688,6 +1493,26 @@ impl PyDatabase {
     // Conflict query methods
     // ========================================================================
 
+    /// Unresolved conflict types ("content", "delete") for a note.
+    ///
+    /// `note_id` may be a prefix; conflicts of every matching note are
+    /// combined.
+    fn get_note_conflict_types(&self, py: Python<'_>, note_id: &str) -> PyResult<Vec<String>> {
+        let flags = self.note_conflict_flags(py, &[note_id.to_string()])?;
+        Ok(flags.first().map(NoteConflictFlags::types).unwrap_or_default())
+    }
+
+    /// Bulk form of `get_note_conflict_types`: maps each given note ID to
+    /// its unresolved conflict types (an empty list if there are none).
+    fn get_conflict_types_for_notes(
+        &self,
+        py: Python<'_>,
+        note_ids: Vec<String>,
+    ) -> PyResult<HashMap<String, Vec<String>>> {
+        let flags = self.note_conflict_flags(py, &note_ids)?;
+        Ok(note_ids.into_iter().zip(flags.iter().map(NoteConflictFlags::types)).collect())
+    }
+
     fn get_unresolved_conflict_counts<'py>(&self, py: Python<'py>) -> PyResult<PyObject> {
         let counts = self
             .inner_ref()?
@@ -790,19 +1615,19 @@ impl PyDatabase {
     // ========================================================================
 
     fn resolve_note_content_conflict(&self, conflict_id: &str, new_content: &str) -> PyResult<bool> {
-        self.inner_ref()?
+        self.writer()?
             .resolve_note_content_conflict(conflict_id, new_content)
             .map_err(voice_error_to_pyerr)
     }
 
     fn resolve_note_delete_conflict(&self, conflict_id: &str, restore_note: bool) -> PyResult<bool> {
-        self.inner_ref()?
+        self.writer()?
             .resolve_note_delete_conflict(conflict_id, restore_note)
             .map_err(voice_error_to_pyerr)
     }
 
     fn resolve_tag_rename_conflict(&self, conflict_id: &str, new_name: &str) -> PyResult<bool> {
-        self.inner_ref()?
+        self.writer()?
             .resolve_tag_rename_conflict(conflict_id, new_name)
             .map_err(voice_error_to_pyerr)
     }
@@ -812,13 +1637,13 @@ impl PyDatabase {
     // ========================================================================
 
     fn attach_to_note(&self, note_id: &str, attachment_id: &str, attachment_type: &str) -> PyResult<String> {
-        self.inner_ref()?
+        self.writer()?
             .attach_to_note(note_id, attachment_id, attachment_type)
             .map_err(voice_error_to_pyerr)
     }
 
     fn detach_from_note(&self, association_id: &str) -> PyResult<bool> {
-        self.inner_ref()?
+        self.writer()?
             .detach_from_note(association_id)
             .map_err(voice_error_to_pyerr)
     }
@@ -834,6 +1659,71 @@ impl PyDatabase {
         Ok(list.into_any().unbind())
     }
 
+    /// Get a note's attachments with their audio file rows in one call.
+    ///
+    /// Audio files for the note are fetched once and matched up in Rust
+    /// instead of one `get_audio_file` round trip per attachment. With
+    /// `include_transcriptions`, each audio file also carries its
+    /// transcriptions. Returns None if the note does not exist.
+    #[pyo3(signature = (note_id, include_transcriptions=false))]
+    fn get_attachments_with_audio_files<'py>(
+        &self,
+        py: Python<'py>,
+        note_id: String,
+        include_transcriptions: bool,
+    ) -> PyResult<Option<PyObject>> {
+        let rows = self.read_without_gil(py, move |db| {
+            if db.get_note(&note_id)?.is_none() {
+                return Ok(None);
+            }
+            let attachments = db.get_attachments_for_note(&note_id)?;
+            let mut audio_files: HashMap<String, database::AudioFileRow> = db
+                .get_audio_files_for_note(&note_id)?
+                .into_iter()
+                .map(|af| (af.id.clone(), af))
+                .collect();
+
+            let mut rows = Vec::with_capacity(attachments.len());
+            for attachment in attachments {
+                let mut audio_file = None;
+                let mut transcriptions = Vec::new();
+                if attachment.attachment_type == "audio_file" {
+                    audio_file = match audio_files.remove(&attachment.attachment_id) {
+                        Some(af) => Some(af),
+                        None => db.get_audio_file(&attachment.attachment_id)?,
+                    };
+                    if include_transcriptions && audio_file.is_some() {
+                        transcriptions = db.get_transcriptions_for_audio_file(&attachment.attachment_id)?;
+                    }
+                }
+                rows.push((attachment, audio_file, transcriptions));
+            }
+            Ok(Some(rows))
+        })?;
+
+        let rows = match rows {
+            Some(rows) => rows,
+            None => return Ok(None),
+        };
+        let list = PyList::empty(py);
+        for (attachment, audio_file, transcriptions) in &rows {
+            let dict = note_attachment_row_to_dict(py, attachment)?;
+            if let Some(af) = audio_file {
+                let af_dict = audio_file_row_to_dict(py, af)?;
+                if include_transcriptions {
+                    let t_list = PyList::empty(py);
+                    for transcription in transcriptions {
+                        t_list.append(transcription_row_to_dict(py, transcription)?)?;
+                    }
+                    af_dict.set_item("transcriptions", t_list)?;
+                }
+                dict.set_item("audio_file", af_dict)?;
+            }
+            list.append(dict)?;
+        }
+        Ok(Some(list.into_any().unbind()))
+    }
+
     fn get_attachment<'py>(&self, py: Python<'py>, association_id: &str) -> PyResult<Option<PyObject>> {
         let attachment = self.inner_ref()?
             .get_attachment(association_id)
@@ -866,9 +1756,10 @@ impl PyDatabase {
         deleted_at: Option<i64>,
         sync_received_at: Option<i64>,
     ) -> PyResult<()> {
-        self.inner_ref()?
+        self.writer()?
             .apply_sync_note_attachment(id, note_id, attachment_id, attachment_type, created_at, modified_at, deleted_at, sync_received_at)
-            .map_err(voice_error_to_pyerr)
+            .map_err(voice_error_to_pyerr)?;
+        self.queue_search_reindex(vec![note_id.to_string()])
     }
 
     // ========================================================================
@@ -877,7 +1768,7 @@ impl PyDatabase {
 
     #[pyo3(signature = (filename, file_created_at=None))]
     fn create_audio_file(&self, filename: &str, file_created_at: Option<i64>) -> PyResult<String> {
-        self.inner_ref()?
+        self.writer()?
             .create_audio_file(filename, file_created_at)
             .map_err(voice_error_to_pyerr)
     }
@@ -904,9 +1795,7 @@ impl PyDatabase {
     }
 
     fn get_all_audio_files<'py>(&self, py: Python<'py>) -> PyResult<PyObject> {
-        let audio_files = self.inner_ref()?
-            .get_all_audio_files()
-            .map_err(voice_error_to_pyerr)?;
+        let audio_files = self.read_without_gil(py, |db| db.get_all_audio_files())?;
         let list = PyList::empty(py);
         for audio_file in &audio_files {
             list.append(audio_file_row_to_dict(py, audio_file)?)?;
@@ -915,13 +1804,13 @@ impl PyDatabase {
     }
 
     fn update_audio_file_summary(&self, audio_file_id: &str, summary: &str) -> PyResult<bool> {
-        self.inner_ref()?
+        self.writer()?
             .update_audio_file_summary(audio_file_id, summary)
             .map_err(voice_error_to_pyerr)
     }
 
     fn delete_audio_file(&self, audio_file_id: &str) -> PyResult<bool> {
-        self.inner_ref()?
+        self.writer()?
             .delete_audio_file(audio_file_id)
             .map_err(voice_error_to_pyerr)
     }
@@ -934,14 +1823,14 @@ impl PyDatabase {
         file_created_at: Option<i64>,
         duration_seconds: Option<i64>,
     ) -> PyResult<String> {
-        self.inner_ref()?
+        self.writer()?
             .create_audio_file_with_duration(filename, file_created_at, duration_seconds)
             .map_err(voice_error_to_pyerr)
     }
 
     /// Update audio file duration
     fn update_audio_file_duration(&self, audio_file_id: &str, duration_seconds: i64) -> PyResult<bool> {
-        self.inner_ref()?
+        self.writer()?
             .update_audio_file_duration(audio_file_id, duration_seconds)
             .map_err(voice_error_to_pyerr)
     }
@@ -983,14 +1872,14 @@ impl PyDatabase {
         storage_provider: &str,
         storage_key: &str,
     ) -> PyResult<bool> {
-        self.inner_ref()?
+        self.writer()?
             .update_audio_file_storage(audio_file_id, storage_provider, storage_key)
             .map_err(voice_error_to_pyerr)
     }
 
     /// Clear an audio file's cloud storage information.
     fn clear_audio_file_storage(&self, audio_file_id: &str) -> PyResult<bool> {
-        self.inner_ref()?
+        self.writer()?
             .clear_audio_file_storage(audio_file_id)
             .map_err(voice_error_to_pyerr)
     }
@@ -1021,9 +1910,12 @@ impl PyDatabase {
         storage_key: Option<&str>,
         storage_uploaded_at: Option<i64>,
     ) -> PyResult<()> {
-        self.inner_ref()?
-            .apply_sync_audio_file(id, imported_at, filename, file_created_at, duration_seconds, summary, modified_at, deleted_at, sync_received_at, storage_provider, storage_key, storage_uploaded_at)
-            .map_err(voice_error_to_pyerr)
+        let mut db = self.writer()?;
+        db.apply_sync_audio_file(id, imported_at, filename, file_created_at, duration_seconds, summary, modified_at, deleted_at, sync_received_at, storage_provider, storage_key, storage_uploaded_at)
+            .map_err(voice_error_to_pyerr)?;
+        let note_ids = db.get_notes_for_audio_file(id).map_err(voice_error_to_pyerr)?;
+        drop(db);
+        self.queue_search_reindex(note_ids)
     }
 
     // ========================================================================
@@ -1085,7 +1977,8 @@ impl PyDatabase {
         service_response: Option<&str>,
         state: Option<&str>,
     ) -> PyResult<String> {
-        self.inner_ref()?
+        let mut db = self.writer()?;
+        let transcription_id = db
             .create_transcription(
                 audio_file_id,
                 content,
@@ -1095,7 +1988,11 @@ impl PyDatabase {
                 service_response,
                 state,
             )
-            .map_err(voice_error_to_pyerr)
+            .map_err(voice_error_to_pyerr)?;
+        let note_ids = db.get_notes_for_audio_file(audio_file_id).map_err(voice_error_to_pyerr)?;
+        drop(db);
+        self.queue_search_reindex(note_ids)?;
+        Ok(transcription_id)
     }
 
     fn get_transcription<'py>(&self, py: Python<'py>, transcription_id: &str) -> PyResult<Option<PyObject>> {
@@ -1119,10 +2016,50 @@ impl PyDatabase {
         Ok(list.into_any().unbind())
     }
 
+    /// Get the live transcriptions of many audio files at once.
+    ///
+    /// One query on file-backed databases (see `direct_sql`); in-memory
+    /// databases read them file by file on one connection. Returns a dict
+    /// of audio file ID to transcription dicts, with every requested ID.
+    fn get_transcriptions_for_audio_files<'py>(&self, py: Python<'py>, audio_file_ids: Vec<String>) -> PyResult<PyObject> {
+        let result = PyDict::new(py);
+        let ids = audio_file_ids.clone();
+        if let Some(by_audio_file) =
+            self.read_sql(py, move |conn| direct_sql::transcriptions_by_audio_file(conn, &ids))?
+        {
+            for (audio_file_id, transcriptions) in &by_audio_file {
+                let list = PyList::empty(py);
+                for transcription in transcriptions {
+                    list.append(hashmap_to_pydict(py, transcription)?)?;
+                }
+                result.set_item(audio_file_id, list)?;
+            }
+            return Ok(result.into_any().unbind());
+        }
+
+        let by_audio_file = self.read_without_gil(py, move |db| {
+            audio_file_ids
+                .into_iter()
+                .map(|id| db.get_transcriptions_for_audio_file(&id).map(|t| (id, t)))
+                .collect::<Result<Vec<_>, _>>()
+        })?;
+        for (audio_file_id, transcriptions) in &by_audio_file {
+            let list = PyList::empty(py);
+            for transcription in transcriptions {
+                list.append(transcription_row_to_dict(py, transcription)?)?;
+            }
+            result.set_item(audio_file_id, list)?;
+        }
+        Ok(result.into_any().unbind())
+    }
+
     fn delete_transcription(&self, transcription_id: &str) -> PyResult<bool> {
-        self.inner_ref()?
-            .delete_transcription(transcription_id)
-            .map_err(voice_error_to_pyerr)
+        let mut db = self.writer()?;
+        let note_ids = Self::transcription_note_ids(&db, transcription_id)?;
+        let deleted = db.delete_transcription(transcription_id).map_err(voice_error_to_pyerr)?;
+        drop(db);
+        self.queue_search_reindex(note_ids)?;
+        Ok(deleted)
     }
 
     #[pyo3(signature = (transcription_id, content, content_segments=None, service_response=None, state=None))]
@@ -1134,9 +2071,14 @@ impl PyDatabase {
         service_response: Option<&str>,
         state: Option<&str>,
     ) -> PyResult<bool> {
-        self.inner_ref()?
+        let mut db = self.writer()?;
+        let note_ids = Self::transcription_note_ids(&db, transcription_id)?;
+        let updated = db
             .update_transcription(transcription_id, content, content_segments, service_response, state)
-            .map_err(voice_error_to_pyerr)
+            .map_err(voice_error_to_pyerr)?;
+        drop(db);
+        self.queue_search_reindex(note_ids)?;
+        Ok(updated)
     }
 
     // ========================================================================
@@ -1148,12 +2090,8 @@ impl PyDatabase {
     /// This runs various normalization passes:
     /// - Timestamp normalization (ISO 8601 -> SQLite format)
     /// - (Future: Unicode normalization, etc.)
-    fn normalize_database(&mut self) -> PyResult<()> {
-        self.inner
-            .as_mut()
-            .ok_or_else(|| DatabaseError::new_err("Database has been closed"))?
-            .normalize_database()
-            .map_err(voice_error_to_pyerr)
+    fn normalize_database(&self, py: Python<'_>) -> PyResult<()> {
+        self.without_gil(py, |db| db.normalize_database())
     }
 
     // ========================================================================
@@ -1165,7 +2103,7 @@ impl PyDatabase {
     /// The cache stores pre-computed data needed for the Note pane display:
     /// tags (with full paths), conflicts, and attachments with audio files and transcriptions.
     fn rebuild_note_cache(&self, note_id: &str) -> PyResult<()> {
-        self.inner_ref()?
+        self.writer()?
             .rebuild_note_cache(note_id)
             .map_err(voice_error_to_pyerr)
     }
@@ -1173,10 +2111,8 @@ impl PyDatabase {
     /// Rebuild the display cache for all notes.
     ///
     /// Returns the number of notes processed.
-    fn rebuild_all_note_caches(&self) -> PyResult<u32> {
-        self.inner_ref()?
-            .rebuild_all_note_caches()
-            .map_err(voice_error_to_pyerr)
+    fn rebuild_all_note_caches(&self, py: Python<'_>) -> PyResult<u32> {
+        self.without_gil(py, |db| db.rebuild_all_note_caches())
     }
 
     /// Rebuild the list pane display cache for a single note.
@@ -1184,7 +2120,7 @@ impl PyDatabase {
     /// The cache stores pre-computed data for the notes list pane:
     /// date, marked status, and content preview (first 100 chars).
     fn rebuild_note_list_cache(&self, note_id: &str) -> PyResult<()> {
-        self.inner_ref()?
+        self.writer()?
             .rebuild_note_list_cache(note_id)
             .map_err(voice_error_to_pyerr)
     }
@@ -1192,10 +2128,8 @@ impl PyDatabase {
     /// Rebuild the list pane display cache for all notes.
     ///
     /// Returns the number of notes processed.
-    fn rebuild_all_note_list_caches(&self) -> PyResult<u32> {
-        self.inner_ref()?
-            .rebuild_all_note_list_caches()
-            .map_err(voice_error_to_pyerr)
+    fn rebuild_all_note_list_caches(&self, py: Python<'_>) -> PyResult<u32> {
+        self.without_gil(py, |db| db.rebuild_all_note_list_caches())
     }
 
     /// Rebuild ALL cache fields for a single note.
@@ -1203,7 +2137,7 @@ impl PyDatabase {
     /// This rebuilds every cache column (note pane display, list pane display)
     /// for the given note.
     fn rebuild_all_caches_for_note(&self, note_id: &str) -> PyResult<()> {
-        self.inner_ref()?
+        self.writer()?
             .rebuild_all_caches_for_note(note_id)
             .map_err(voice_error_to_pyerr)
     }
@@ -1211,13 +2145,81 @@ impl PyDatabase {
     /// Rebuild ALL cache fields for all notes in the database.
     ///
     /// Returns a tuple: (notes_processed, cache_fields_per_note, error_list)
-    fn rebuild_all_database_caches(&self) -> PyResult<(u32, u32, Vec<String>)> {
-        let summary = self.inner_ref()?
-            .rebuild_all_database_caches()
-            .map_err(voice_error_to_pyerr)?;
+    fn rebuild_all_database_caches(&self, py: Python<'_>) -> PyResult<(u32, u32, Vec<String>)> {
+        let summary = self.without_gil(py, |db| db.rebuild_all_database_caches())?;
         Ok((summary.notes_processed, summary.cache_fields_rebuilt, summary.errors))
     }
 
+    /// Rebuild ALL cache fields for the given notes.
+    ///
+    /// With `workers` > 1 on a file-backed database the notes are split
+    /// over that many threads, each on its own connection: reading a note's
+    /// inputs and building its cache JSON run in parallel while SQLite
+    /// serialises the short write transactions. The busy timeout of
+    /// voicecore's connections is not configurable here, so a note whose
+    /// write finds the database locked (by another worker or the writer)
+    /// is retried, see `retry_while_busy`.
+    /// In-memory databases always use the writer connection.
+    /// Runs with the GIL released. A failing note does not stop the others.
+    ///
+    /// Returns a tuple: (rebuilt_note_ids, error_list)
+    #[pyo3(signature = (note_ids, workers=1))]
+    fn rebuild_caches_for_notes(
+        &self,
+        py: Python<'_>,
+        note_ids: Vec<String>,
+        workers: usize,
+    ) -> PyResult<(Vec<String>, Vec<String>)> {
+        fn rebuild(db: &mut database::Database, note_ids: &[String]) -> (Vec<String>, Vec<String>) {
+            let mut rebuilt = Vec::with_capacity(note_ids.len());
+            let mut errors = Vec::new();
+            for note_id in note_ids {
+                match retry_while_busy(|| db.rebuild_all_caches_for_note(note_id)) {
+                    Ok(()) => rebuilt.push(note_id.clone()),
+                    Err(err) => errors.push(format!("{}: {}", note_id, err)),
+                }
+            }
+            (rebuilt, errors)
+        }
+
+        let workers = workers.clamp(1, note_ids.len().max(1));
+        let path = match &self.db_path {
+            Some(path) if workers > 1 => path.clone(),
+            _ => return self.without_gil(py, move |db| Ok(rebuild(db, &note_ids))),
+        };
+
+        let chunk_size = note_ids.len().div_ceil(workers);
+        let outcome = py.allow_threads(move || {
+            std::thread::scope(|scope| {
+                let handles: Vec<_> = note_ids
+                    .chunks(chunk_size)
+                    .map(|chunk| {
+                        let path = path.as_str();
+                        scope.spawn(move || {
+                            database::Database::new(path).map(|mut db| rebuild(&mut db, chunk))
+                        })
+                    })
+                    .collect();
+
+                let mut rebuilt = Vec::new();
+                let mut errors = Vec::new();
+                for handle in handles {
+                    match handle.join() {
+                        Ok(Ok((chunk_rebuilt, chunk_errors))) => {
+                            rebuilt.extend(chunk_rebuilt);
+                            errors.extend(chunk_errors);
+                        }
+                        Ok(Err(err)) => errors.push(format!("Could not open worker connection: {}", err)),
+                        Err(_) => errors.push("Cache rebuild worker panicked".to_string()),
+                    }
+                }
+                (rebuilt, errors)
+            })
+        });
+        bump_change_version();
+        Ok(outcome)
+    }
+
     /// Get information about all registered cache fields.
     ///
     /// Returns a list of (table, column, description) tuples.
@@ -1242,7 +2244,7 @@ impl PyDatabase {
     /// The waveform is an array of amplitude values (0-255) for visualization.
     /// This is called from Python after extracting the waveform with ffmpeg.
     fn update_cache_waveform(&self, note_id: &str, audio_id: &str, waveform: Vec<u8>) -> PyResult<bool> {
-        self.inner_ref()?
+        self.writer()?
             .update_cache_waveform(note_id, audio_id, waveform)
             .map_err(voice_error_to_pyerr)
     }
@@ -1261,7 +2263,7 @@ impl PyDatabase {
     /// Mark a note (add the _system/_marked tag).
     /// Returns true if the note was marked, false if already marked.
     fn mark_note(&self, note_id: &str) -> PyResult<bool> {
-        self.inner_ref()?
+        self.writer()?
             .mark_note(note_id)
             .map_err(voice_error_to_pyerr)
     }
@@ -1269,7 +2271,7 @@ impl PyDatabase {
     /// Unmark a note (remove the _system/_marked tag).
     /// Returns true if the note was unmarked, false if not marked.
     fn unmark_note(&self, note_id: &str) -> PyResult<bool> {
-        self.inner_ref()?
+        self.writer()?
             .unmark_note(note_id)
             .map_err(voice_error_to_pyerr)
     }
@@ -1277,7 +2279,7 @@ impl PyDatabase {
     /// Toggle a note's marked state.
     /// Returns the new marked state (true if now marked, false if now unmarked).
     fn toggle_note_marked(&self, note_id: &str) -> PyResult<bool> {
-        self.inner_ref()?
+        self.writer()?
             .toggle_note_marked(note_id)
             .map_err(voice_error_to_pyerr)
     }
@@ -1303,7 +2305,7 @@ impl PyDatabase {
     /// Tag a note as too-big to sync (add the _system/_nonsynced/_too-big tag).
     /// Returns true if the tag was added, false if already tagged.
     fn tag_note_too_big(&self, note_id: &str) -> PyResult<bool> {
-        self.inner_ref()?
+        self.writer()?
             .tag_note_too_big(note_id)
             .map_err(voice_error_to_pyerr)
     }
@@ -1311,7 +2313,7 @@ impl PyDatabase {
     /// Remove the too-big tag from a note.
     /// Returns true if the tag was removed, false if not tagged.
     fn untag_note_too_big(&self, note_id: &str) -> PyResult<bool> {
-        self.inner_ref()?
+        self.writer()?
             .untag_note_too_big(note_id)
             .map_err(voice_error_to_pyerr)
     }
@@ -1566,6 +2568,7 @@ impl PyConfig {
 
 /// Result of a sync operation
 #[pyclass(name = "SyncResult")]
+#[derive(Clone)]
 pub struct PySyncResult {
     #[pyo3(get)]
     success: bool,
@@ -1577,6 +2580,29 @@ pub struct PySyncResult {
     conflicts: i64,
     #[pyo3(get)]
     errors: Vec<String>,
+    /// Wall-clock time spent on this sync, in milliseconds
+    #[pyo3(get)]
+    duration_ms: u64,
+    /// Whether the id lists below are known. False if the database could
+    /// not be read around the sync, or for a push (which changes nothing
+    /// locally, so the lists are empty but known).
+    #[pyo3(get)]
+    changes_known: bool,
+    /// Ids (hex) of local notes and tags the sync created, updated or
+    /// deleted. With sync_all_peers these cover the whole run, since peers
+    /// are synced concurrently.
+    #[pyo3(get)]
+    created_note_ids: Vec<String>,
+    #[pyo3(get)]
+    updated_note_ids: Vec<String>,
+    #[pyo3(get)]
+    deleted_note_ids: Vec<String>,
+    #[pyo3(get)]
+    created_tag_ids: Vec<String>,
+    #[pyo3(get)]
+    updated_tag_ids: Vec<String>,
+    #[pyo3(get)]
+    deleted_tag_ids: Vec<String>,
 }
 
 impl From<sync_client::SyncResult> for PySyncResult {
@@ -1587,6 +2613,67 @@ impl From<sync_client::SyncResult> for PySyncResult {
             pushed: result.pushed,
             conflicts: result.conflicts,
             errors: result.errors,
+            duration_ms: 0,
+            changes_known: true,
+            created_note_ids: Vec::new(),
+            updated_note_ids: Vec::new(),
+            deleted_note_ids: Vec::new(),
+            created_tag_ids: Vec::new(),
+            updated_tag_ids: Vec::new(),
+            deleted_tag_ids: Vec::new(),
+        }
+    }
+}
+
+impl PySyncResult {
+    fn with_duration(mut self, elapsed: Duration) -> Self {
+        self.duration_ms = elapsed.as_millis() as u64;
+        self
+    }
+
+    fn with_changes(mut self, changes: Option<&EntityChanges>) -> Self {
+        match changes {
+            Some(changes) => {
+                let changes = changes.clone();
+                self.changes_known = true;
+                self.created_note_ids = changes.created_note_ids;
+                self.updated_note_ids = changes.updated_note_ids;
+                self.deleted_note_ids = changes.deleted_note_ids;
+                self.created_tag_ids = changes.created_tag_ids;
+                self.updated_tag_ids = changes.updated_tag_ids;
+                self.deleted_tag_ids = changes.deleted_tag_ids;
+            }
+            None => self.changes_known = false,
+        }
+        self
+    }
+
+    fn timed_out(limit: Duration) -> Self {
+        Self::failed(
+            format!("Sync timed out after {:.1}s", limit.as_secs_f64()),
+            limit,
+        )
+    }
+
+    fn cancelled(elapsed: Duration) -> Self {
+        Self::failed("Sync cancelled".to_string(), elapsed)
+    }
+
+    fn failed(error: String, elapsed: Duration) -> Self {
+        Self {
+            success: false,
+            pulled: 0,
+            pushed: 0,
+            conflicts: 0,
+            errors: vec![error],
+            duration_ms: elapsed.as_millis() as u64,
+            changes_known: true,
+            created_note_ids: Vec::new(),
+            updated_note_ids: Vec::new(),
+            deleted_note_ids: Vec::new(),
+            created_tag_ids: Vec::new(),
+            updated_tag_ids: Vec::new(),
+            deleted_tag_ids: Vec::new(),
         }
     }
 }
@@ -1596,6 +2683,8 @@ impl From<sync_client::SyncResult> for PySyncResult {
 pub struct PySyncClient {
     inner: sync_client::SyncClient,
     runtime: tokio::runtime::Runtime,
+    // Read back after syncs to report changes (see sync_changes)
+    db_path: String,
 }
 
 #[pymethods]
@@ -1618,45 +2707,70 @@ impl PySyncClient {
         let cfg = config::Config::new(config_path).map_err(voice_error_to_pyerr)?;
 
         // Create Database from config's database_file path
-        let db = database::Database::new(cfg.database_file()).map_err(voice_error_to_pyerr)?;
+        let db_path = cfg.database_file().to_string();
+        let db = database::Database::new(&db_path).map_err(voice_error_to_pyerr)?;
 
         // Wrap in Arc<Mutex<>> for SyncClient
         let db_arc = Arc::new(Mutex::new(db));
         let config_arc = Arc::new(Mutex::new(cfg));
 
-        let inner = sync_client::SyncClient::new(db_arc, config_arc)
+        let inner = sync_client::SyncClient::new(Arc::clone(&db_arc), config_arc)
             .map_err(voice_error_to_pyerr)?;
 
-        Ok(Self { inner, runtime })
+        Ok(Self { inner, runtime, db_path })
     }
 
     /// Perform full bidirectional sync with a peer
-    fn sync_with_peer(&self, peer_id: &str) -> PyResult<PySyncResult> {
-        let result = self.runtime.block_on(self.inner.sync_with_peer(peer_id));
-        Ok(PySyncResult::from(result))
+    ///
+    /// The result lists the ids of local notes and tags the sync changed.
+    fn sync_with_peer(&self, py: Python<'_>, peer_id: &str) -> PyResult<PySyncResult> {
+        let started = Instant::now();
+        let (result, changes) = py.allow_threads(|| {
+            track_changes(&self.db_path, || self.runtime.block_on(self.inner.sync_with_peer(peer_id)))
+        });
+        bump_change_version();
+        bump_sync_generation();
+        Ok(PySyncResult::from(result)
+            .with_duration(started.elapsed())
+            .with_changes(changes.as_ref()))
     }
 
     /// Pull changes from a peer (one-way)
-    fn pull_from_peer(&self, peer_id: &str) -> PyResult<PySyncResult> {
-        let result = self.runtime.block_on(self.inner.pull_from_peer(peer_id));
-        Ok(PySyncResult::from(result))
+    fn pull_from_peer(&self, py: Python<'_>, peer_id: &str) -> PyResult<PySyncResult> {
+        let started = Instant::now();
+        let (result, changes) = py.allow_threads(|| {
+            track_changes(&self.db_path, || self.runtime.block_on(self.inner.pull_from_peer(peer_id)))
+        });
+        bump_change_version();
+        bump_sync_generation();
+        Ok(PySyncResult::from(result)
+            .with_duration(started.elapsed())
+            .with_changes(changes.as_ref()))
     }
 
     /// Push changes to a peer (one-way)
-    fn push_to_peer(&self, peer_id: &str) -> PyResult<PySyncResult> {
-        let result = self.runtime.block_on(self.inner.push_to_peer(peer_id));
-        Ok(PySyncResult::from(result))
+    fn push_to_peer(&self, py: Python<'_>, peer_id: &str) -> PyResult<PySyncResult> {
+        let started = Instant::now();
+        let result = py.allow_threads(|| self.runtime.block_on(self.inner.push_to_peer(peer_id)));
+        Ok(PySyncResult::from(result).with_duration(started.elapsed()))
     }
 
     /// Perform initial sync (full dataset transfer) with a peer
-    fn initial_sync(&self, peer_id: &str) -> PyResult<PySyncResult> {
-        let result = self.runtime.block_on(self.inner.initial_sync(peer_id));
-        Ok(PySyncResult::from(result))
+    fn initial_sync(&self, py: Python<'_>, peer_id: &str) -> PyResult<PySyncResult> {
+        let started = Instant::now();
+        let (result, changes) = py.allow_threads(|| {
+            track_changes(&self.db_path, || self.runtime.block_on(self.inner.initial_sync(peer_id)))
+        });
+        bump_change_version();
+        bump_sync_generation();
+        Ok(PySyncResult::from(result)
+            .with_duration(started.elapsed())
+            .with_changes(changes.as_ref()))
     }
 
     /// Check if a peer is reachable
     fn check_peer_status<'py>(&self, py: Python<'py>, peer_id: &str) -> PyResult<PyObject> {
-        let result = self.runtime.block_on(self.inner.check_peer_status(peer_id));
+        let result = py.allow_threads(|| self.runtime.block_on(self.inner.check_peer_status(peer_id)));
         let dict = PyDict::new(py);
         for (key, value) in result {
             dict.set_item(key, json_value_to_pyobject(py, &value)?)?;
@@ -1668,9 +2782,9 @@ impl PySyncClient {
     /// Returns a dict with {"success": bool, "bytes": int} or {"success": false, "error": str}
     fn download_audio_file(&self, py: Python<'_>, peer_url: &str, audio_id: &str, dest_path: &str) -> PyResult<PyObject> {
         let dest = std::path::Path::new(dest_path);
-        let result = self.runtime.block_on(
-            self.inner.download_audio_file(peer_url, audio_id, dest)
-        );
+        let result = py.allow_threads(|| {
+            self.runtime.block_on(self.inner.download_audio_file(peer_url, audio_id, dest))
+        });
         let dict = PyDict::new(py);
         match result {
             Ok(bytes) => {
@@ -1689,9 +2803,9 @@ impl PySyncClient {
     /// Returns a dict with {"success": bool, "bytes": int} or {"success": false, "error": str}
     fn upload_audio_file(&self, py: Python<'_>, peer_url: &str, audio_id: &str, source_path: &str) -> PyResult<PyObject> {
         let source = std::path::Path::new(source_path);
-        let result = self.runtime.block_on(
-            self.inner.upload_audio_file(peer_url, audio_id, source)
-        );
+        let result = py.allow_threads(|| {
+            self.runtime.block_on(self.inner.upload_audio_file(peer_url, audio_id, source))
+        });
         let dict = PyDict::new(py);
         match result {
             Ok(bytes) => {
@@ -1709,11 +2823,11 @@ impl PySyncClient {
     /// Download a single audio file from cloud storage on demand.
     ///
     /// Returns the local file path as a string on success.
-    fn download_audio_file_from_cloud(&self, audio_file_id: &str, audiofile_directory: &str) -> PyResult<String> {
+    fn download_audio_file_from_cloud(&self, py: Python<'_>, audio_file_id: &str, audiofile_directory: &str) -> PyResult<String> {
         let dir = std::path::Path::new(audiofile_directory);
-        let path = self.runtime.block_on(
-            self.inner.download_single_audio_file_from_cloud(audio_file_id, dir)
-        ).map_err(voice_error_to_pyerr)?;
+        let path = py.allow_threads(|| {
+            self.runtime.block_on(self.inner.download_single_audio_file_from_cloud(audio_file_id, dir))
+        }).map_err(voice_error_to_pyerr)?;
         Ok(path.to_string_lossy().to_string())
     }
 
@@ -1746,42 +2860,254 @@ impl PySyncClient {
     }
 }
 
+/// How often a running sync checks whether it was cancelled.
+const CANCEL_POLL_INTERVAL: Duration = Duration::from_millis(100);
+
+/// Whether a Python cancellation object (anything with `is_set()`, such as
+/// `threading.Event`) has been set.
+fn is_cancelled(cancel: Option<&PyObject>) -> bool {
+    cancel.map_or(false, |event| {
+        Python::with_gil(|py| {
+            event
+                .call_method0(py, "is_set")
+                .and_then(|value| value.extract::<bool>(py))
+                .unwrap_or(false)
+        })
+    })
+}
+
+/// Resolve once the cancellation object is set (never, without one).
+async fn cancelled(cancel: Option<&PyObject>) {
+    match cancel {
+        Some(_) => {
+            while !is_cancelled(cancel) {
+                tokio::time::sleep(CANCEL_POLL_INTERVAL).await;
+            }
+        }
+        None => futures::future::pending::<()>().await,
+    }
+}
+
+/// Sync with each peer, at most `max_concurrent` at a time.
+///
+/// `progress(peer_id, result)` is called as each peer finishes. Once
+/// `cancel` is set, peers not yet started are skipped and syncs in flight
+/// are abandoned; both report a "Sync cancelled" error. Whatever an
+/// abandoned sync already applied stays, and the next sync picks up the rest.
+async fn sync_peers(
+    client: &sync_client::SyncClient,
+    peer_ids: Vec<String>,
+    max_concurrent: usize,
+    timeout: Option<Duration>,
+    full: bool,
+    progress: Option<&PyObject>,
+    cancel: Option<&PyObject>,
+) -> Vec<(String, PySyncResult)> {
+    stream::iter(peer_ids)
+        .map(|peer_id| async move {
+            let started = Instant::now();
+            if is_cancelled(cancel) {
+                return (peer_id, PySyncResult::cancelled(started.elapsed()));
+            }
+            let sync = async {
+                let sync = async {
+                    if full {
+                        client.initial_sync(&peer_id).await
+                    } else {
+                        client.sync_with_peer(&peer_id).await
+                    }
+                };
+                match timeout {
+                    Some(limit) => match tokio::time::timeout(limit, sync).await {
+                        Ok(r) => PySyncResult::from(r).with_duration(started.elapsed()),
+                        Err(_) => PySyncResult::timed_out(limit),
+                    },
+                    None => PySyncResult::from(sync.await).with_duration(started.elapsed()),
+                }
+            };
+            let result = match futures::future::select(Box::pin(sync), Box::pin(cancelled(cancel))).await {
+                futures::future::Either::Left((result, _)) => result,
+                futures::future::Either::Right(_) => PySyncResult::cancelled(started.elapsed()),
+            };
+            if let Some(callback) = progress {
+                // Changed ids are only known once every peer is done
+                let update = result.clone().with_changes(None);
+                Python::with_gil(|py| {
+                    if let Err(err) = callback.call1(py, (peer_id.as_str(), update)) {
+                        err.write_unraisable(py, None);
+                    }
+                });
+            }
+            (peer_id, result)
+        })
+        .buffer_unordered(max_concurrent.max(1))
+        .collect()
+        .await
+}
+
 /// Sync with all configured peers
 ///
+/// Peers are contacted concurrently (at most `max_concurrent` at a time), so
+/// one slow or offline peer no longer delays the others. All peers share a
+/// single database handle behind a mutex, which keeps local writes serialised.
+/// The GIL is released throughout, so this can run on a worker thread while
+/// a user interface stays responsive.
+///
 /// Args:
 ///     config_dir: Path to config directory (optional, uses default if None)
+///     max_concurrent: Maximum number of peers to sync at the same time (default: 4)
+///     peer_timeout: Per-peer timeout in seconds (optional, no timeout if None)
+///     full: Perform an initial sync (full dataset transfer) instead of an
+///         incremental sync (default: False)
+///     progress: Optional callable `progress(peer_id, result)`, called from a
+///         worker thread as each peer finishes. These results do not carry
+///         changed ids (changes_known is False).
+///     cancel: Optional object with an `is_set()` method, e.g.
+///         threading.Event. Once set, remaining and in-flight peer syncs stop
+///         with a "Sync cancelled" error.
 ///
 /// Returns:
-///     Dict mapping peer_id to SyncResult
+///     Dict mapping peer_id to SyncResult (with per-peer duration_ms). The
+///     changed note and tag ids on each result cover the whole run.
 #[pyfunction]
-#[pyo3(signature = (config_dir=None))]
+#[pyo3(signature = (config_dir=None, max_concurrent=4, peer_timeout=None, full=false, progress=None, cancel=None))]
 fn sync_all_peers<'py>(
     py: Python<'py>,
     config_dir: Option<&str>,
+    max_concurrent: usize,
+    peer_timeout: Option<f64>,
+    full: bool,
+    progress: Option<PyObject>,
+    cancel: Option<PyObject>,
 ) -> PyResult<PyObject> {
-    // Create Tokio runtime
-    let runtime = tokio::runtime::Runtime::new()
-        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
+    PySyncSession::new(config_dir)?.sync(
+        py,
+        None,
+        max_concurrent,
+        peer_timeout,
+        full,
+        progress,
+        cancel,
+    )
+}
 
-    // Create Config and Database from config_dir
-    let config_path = config_dir.map(std::path::PathBuf::from);
-    let cfg = config::Config::new(config_path).map_err(voice_error_to_pyerr)?;
-    let db = database::Database::new(cfg.database_file()).map_err(voice_error_to_pyerr)?;
+/// Long-lived context for repeated syncs with all peers.
+///
+/// sync_all_peers builds a Tokio runtime, Config, Database and SyncClient
+/// on every call. A session builds them once and reuses them, which suits
+/// schedulers and daemons that sync every few minutes. Like SyncClient it
+/// must be used from the thread that created it.
+#[pyclass(name = "SyncSession", unsendable)]
+pub struct PySyncSession {
+    runtime: tokio::runtime::Runtime,
+    config_path: Option<std::path::PathBuf>,
+    db: Arc<Mutex<database::Database>>,
+    db_path: String,
+    client: sync_client::SyncClient,
+    peer_ids: Vec<String>,
+}
 
-    // Wrap in Arc<Mutex<>> for sync_all_peers
-    let db_arc = Arc::new(Mutex::new(db));
-    let config_arc = Arc::new(Mutex::new(cfg));
+impl PySyncSession {
+    /// Read the config and build a client over the session's database handle.
+    fn open_client(
+        config_path: Option<std::path::PathBuf>,
+        db: &Arc<Mutex<database::Database>>,
+    ) -> PyResult<(sync_client::SyncClient, Vec<String>)> {
+        let cfg = config::Config::new(config_path).map_err(voice_error_to_pyerr)?;
+        let peer_ids = cfg.peers().iter().map(|p| p.peer_id.clone()).collect();
+        let client = sync_client::SyncClient::new(Arc::clone(db), Arc::new(Mutex::new(cfg)))
+            .map_err(voice_error_to_pyerr)?;
+        Ok((client, peer_ids))
+    }
+}
 
-    // Run sync
-    let results = runtime.block_on(sync_client::sync_all_peers(db_arc, config_arc));
+#[pymethods]
+impl PySyncSession {
+    /// Open a sync session.
+    ///
+    /// Args:
+    ///     config_dir: Path to config directory (optional, uses default if None)
+    #[new]
+    #[pyo3(signature = (config_dir=None))]
+    fn new(config_dir: Option<&str>) -> PyResult<Self> {
+        let runtime = tokio::runtime::Runtime::new()
+            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
 
-    // Convert to Python dict
-    let dict = PyDict::new(py);
-    for (peer_id, result) in results {
-        let py_result = PySyncResult::from(result);
-        dict.set_item(peer_id, py_result.into_pyobject(py)?)?;
+        let config_path = config_dir.map(std::path::PathBuf::from);
+        let cfg = config::Config::new(config_path.clone()).map_err(voice_error_to_pyerr)?;
+        let db_path = cfg.database_file().to_string();
+        let db = database::Database::new(&db_path).map_err(voice_error_to_pyerr)?;
+
+        // Every peer sync shares (and serialises on) this one connection
+        let db = Arc::new(Mutex::new(db));
+        let (client, peer_ids) = Self::open_client(config_path.clone(), &db)?;
+
+        Ok(Self { runtime, config_path, db, db_path, client, peer_ids })
+    }
+
+    /// IDs of the configured peers.
+    #[getter]
+    fn peer_ids(&self) -> Vec<String> {
+        self.peer_ids.clone()
+    }
+
+    /// Re-read the config file, e.g. after peers were added or removed.
+    ///
+    /// The runtime and database handle are kept.
+    fn reload_config(&mut self) -> PyResult<()> {
+        let (client, peer_ids) = Self::open_client(self.config_path.clone(), &self.db)?;
+        self.client = client;
+        self.peer_ids = peer_ids;
+        Ok(())
+    }
+
+    /// Sync with peers concurrently.
+    ///
+    /// Args:
+    ///     peer_ids: Peers to sync with (default: all configured peers)
+    ///     max_concurrent, peer_timeout, full, progress, cancel: As for
+    ///         sync_all_peers
+    ///
+    /// Returns:
+    ///     Dict mapping peer_id to SyncResult, as sync_all_peers.
+    #[pyo3(signature = (peer_ids=None, max_concurrent=4, peer_timeout=None, full=false, progress=None, cancel=None))]
+    fn sync(
+        &self,
+        py: Python<'_>,
+        peer_ids: Option<Vec<String>>,
+        max_concurrent: usize,
+        peer_timeout: Option<f64>,
+        full: bool,
+        progress: Option<PyObject>,
+        cancel: Option<PyObject>,
+    ) -> PyResult<PyObject> {
+        let peer_ids = peer_ids.unwrap_or_else(|| self.peer_ids.clone());
+        let timeout = peer_timeout.map(Duration::from_secs_f64);
+
+        // Run syncs concurrently with bounded parallelism, with the GIL released
+        let (results, changes) = py.allow_threads(|| {
+            track_changes(&self.db_path, || {
+                self.runtime.block_on(sync_peers(
+                    &self.client,
+                    peer_ids,
+                    max_concurrent,
+                    timeout,
+                    full,
+                    progress.as_ref(),
+                    cancel.as_ref(),
+                ))
+            })
+        });
+        bump_change_version();
+        bump_sync_generation();
+
+        // Convert to Python dict
+        let dict = PyDict::new(py);
+        for (peer_id, py_result) in results {
+            dict.set_item(peer_id, py_result.with_changes(changes.as_ref()).into_pyobject(py)?)?;
+        }
+        Ok(dict.into_any().unbind())
     }
-    Ok(dict.into_any().unbind())
 }
 
 // ============================================================================
@@ -1964,8 +3290,6 @@ fn apply_sync_changes<'py>(
     local_device_id: Option<&str>,
     local_device_name: Option<&str>,
 ) -> PyResult<PyObject> {
-    let db_ref = db.inner_ref()?;
-
     // Convert Python dicts or dataclass objects to SyncChange structs
     let mut rust_changes = Vec::new();
     for change_item in changes.iter() {
@@ -2028,16 +3352,30 @@ fn apply_sync_changes<'py>(
         });
     }
 
-    // Apply changes
-    let (applied, conflicts, errors) = sync_server::apply_changes_from_peer(
-        db_ref,
-        &rust_changes,
-        peer_device_id,
-        peer_device_name,
-        local_device_id,
-        local_device_name,
-    )
-    .map_err(voice_error_to_pyerr)?;
+    // Apply changes (GIL released; Python objects were converted above)
+    let (applied, conflicts, errors, touched) = db.without_gil(py, |db_ref| {
+        let (applied, conflicts, errors) = sync_server::apply_changes_from_peer(
+            db_ref,
+            &rust_changes,
+            peer_device_id,
+            peer_device_name,
+            local_device_id,
+            local_device_name,
+        )?;
+        // Applied rows keep the peer's timestamps, so queue them for the
+        // full-text index explicitly
+        let mut touched = HashSet::new();
+        for change in &rust_changes {
+            touched.extend(search_index::notes_for_change(
+                db_ref,
+                &change.entity_type,
+                &change.entity_id,
+                Some(&change.data),
+            )?);
+        }
+        Ok((applied, conflicts, errors, touched))
+    })?;
+    db.queue_search_reindex(touched.into_iter().collect())?;
 
     // Return result dict
     let result = PyDict::new(py);
@@ -2135,6 +3473,7 @@ fn py_merge_content(
 #[pyclass(name = "ParsedSearch")]
 pub struct PyParsedSearch {
     inner: search::ParsedSearch,
+    transcript_terms: Vec<String>,
 }
 
 #[pymethods]
@@ -2149,17 +3488,24 @@ impl PyParsedSearch {
         &self.inner.free_text
     }
 
+    /// Terms given as `transcript:word` or `transcript:"some words"`
+    #[getter]
+    fn transcript_terms(&self) -> Vec<String> {
+        self.transcript_terms.clone()
+    }
+
     #[getter]
     fn is_empty(&self) -> bool {
-        self.inner.is_empty()
+        self.inner.is_empty() && self.transcript_terms.is_empty()
     }
 }
 
 #[pyfunction]
 #[pyo3(name = "parse_search_input")]
 fn py_parse_search_input(search_input: &str) -> PyParsedSearch {
-    let result = search::parse_search_input(search_input);
-    PyParsedSearch { inner: result }
+    let (rest, transcript_terms) = search_index::split_transcript_terms(search_input);
+    let result = search::parse_search_input(&rest);
+    PyParsedSearch { inner: result, transcript_terms }
 }
 
 #[pyclass(name = "SearchResult")]
@@ -2191,23 +3537,72 @@ impl PySearchResult {
     }
 }
 
+/// Run a search from raw input.
+///
+/// On top of the core syntax, `transcript:` terms keep only notes whose
+/// transcriptions match, and `include_transcriptions` lets the free text
+/// match transcription text as well as note content.
 #[pyfunction]
 #[pyo3(name = "execute_search")]
-fn py_execute_search(db: &PyDatabase, search_input: &str) -> PyResult<PySearchResult> {
-    let db_ref = db.inner_ref()?;
-    let result = search::execute_search(db_ref, search_input).map_err(voice_error_to_pyerr)?;
-    Ok(PySearchResult {
-        notes: result.notes,
-        ambiguous_tags: result.ambiguous_tags,
-        not_found_tags: result.not_found_tags,
-    })
+#[pyo3(signature = (db, search_input, include_transcriptions=false))]
+fn py_execute_search(
+    py: Python<'_>,
+    db: &PyDatabase,
+    search_input: &str,
+    include_transcriptions: bool,
+) -> PyResult<PySearchResult> {
+    let (rest, transcript_terms) = search_index::split_transcript_terms(search_input);
+    let parsed = search::parse_search_input(&rest);
+    let include_text = !parsed.free_text.trim().is_empty() && include_transcriptions;
+    if transcript_terms.is_empty() && !include_text {
+        let result = db.read_without_gil(py, |db_ref| search::execute_search(db_ref, search_input))?;
+        return Ok(PySearchResult {
+            notes: result.notes,
+            ambiguous_tags: result.ambiguous_tags,
+            not_found_tags: result.not_found_tags,
+        });
+    }
+
+    // Transcription matches are added from the notes the qualifiers alone
+    // select, i.e. the input minus its free-text words
+    let mut free_words: Vec<&str> = parsed.free_text.split_whitespace().collect();
+    let filters = rest
+        .split_whitespace()
+        .filter(|word| match free_words.iter().position(|w| w == word) {
+            Some(i) => {
+                free_words.remove(i);
+                false
+            }
+            None => true,
+        })
+        .collect::<Vec<_>>()
+        .join(" ");
+    let transcript_query = (!transcript_terms.is_empty()).then(|| transcript_terms.join(" "));
+
+    let (notes, ambiguous_tags, not_found_tags) = db.with_search_index(py, move |index, db_ref| {
+        let result = search::execute_search(db_ref, &rest)?;
+        if !result.not_found_tags.is_empty() {
+            return Ok((result.notes, result.ambiguous_tags, result.not_found_tags));
+        }
+        let scope = if filters.is_empty() { Scope::All } else { Scope::Filters(&filters) };
+        let notes = search_index::apply_transcript_search(
+            db_ref,
+            index,
+            result.notes,
+            Some(parsed.free_text.as_str()).filter(|_| include_text),
+            scope,
+            transcript_query.as_deref(),
+        )?;
+        Ok((notes, result.ambiguous_tags, result.not_found_tags))
+    })?;
+    Ok(PySearchResult { notes, ambiguous_tags, not_found_tags })
 }
 
 #[pyfunction]
 #[pyo3(name = "resolve_tag_term")]
 fn py_resolve_tag_term(db: &PyDatabase, tag_term: &str) -> PyResult<(Vec<String>, bool, bool)> {
     let db_ref = db.inner_ref()?;
-    let (tag_ids, is_ambiguous, not_found) = search::resolve_tag_term(db_ref, tag_term)
+    let (tag_ids, is_ambiguous, not_found) = search::resolve_tag_term(&db_ref, tag_term)
         .map_err(voice_error_to_pyerr)?;
     Ok((tag_ids, is_ambiguous, not_found))
 }
@@ -2216,14 +3611,14 @@ fn py_resolve_tag_term(db: &PyDatabase, tag_term: &str) -> PyResult<(Vec<String>
 #[pyo3(name = "get_tag_full_path")]
 fn py_get_tag_full_path(db: &PyDatabase, tag_id: &str) -> PyResult<String> {
     let db_ref = db.inner_ref()?;
-    search::get_tag_full_path(db_ref, tag_id).map_err(voice_error_to_pyerr)
+    search::get_tag_full_path(&db_ref, tag_id).map_err(voice_error_to_pyerr)
 }
 
 #[pyfunction]
 #[pyo3(name = "find_ambiguous_tags")]
 fn py_find_ambiguous_tags(db: &PyDatabase, tag_terms: Vec<String>) -> PyResult<Vec<String>> {
     let db_ref = db.inner_ref()?;
-    search::find_ambiguous_tags(db_ref, &tag_terms).map_err(voice_error_to_pyerr)
+    search::find_ambiguous_tags(&db_ref, &tag_terms).map_err(voice_error_to_pyerr)
 }
 
 #[pyfunction]
@@ -2231,7 +3626,7 @@ fn py_find_ambiguous_tags(db: &PyDatabase, tag_terms: Vec<String>) -> PyResult<V
 #[pyo3(signature = (db, tag_id, use_full_path=false))]
 fn py_build_tag_search_term(db: &PyDatabase, tag_id: &str, use_full_path: bool) -> PyResult<String> {
     let db_ref = db.inner_ref()?;
-    search::build_tag_search_term(db_ref, tag_id, use_full_path).map_err(voice_error_to_pyerr)
+    search::build_tag_search_term(&db_ref, tag_id, use_full_path).map_err(voice_error_to_pyerr)
 }
 
 // ============================================================================
@@ -2381,6 +3776,7 @@ fn voicecore(m: &Bound<'_, PyModule>) -> PyResult<()> {
     // Register sync client classes and functions
     m.add_class::<PySyncResult>()?;
     m.add_class::<PySyncClient>()?;
+    m.add_class::<PySyncSession>()?;
     m.add_function(wrap_pyfunction!(sync_all_peers, m)?)?;
 
     // Register sync server functions
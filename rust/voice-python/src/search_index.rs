@@ -0,0 +1,688 @@
+//! Full-text search index over note content and transcriptions.
+//!
+//! The index is an SQLite FTS5 table kept in a sidecar database next to the
+//! main database file (in memory for in-memory databases). It only holds
+//! derived data, so it can be deleted at any time and is rebuilt on next use.
+//!
+//! The index is kept current lazily: before each query it catches up with
+//! the change log (local writes), with notes queued by sync-apply and
+//! transcription writes, and after a peer sync (or on first use in a
+//! process) with a fingerprint comparison against the notes table.
+
+use std::collections::{HashMap, HashSet};
+use std::time::SystemTime;
+
+use rusqlite::{params, Connection, OptionalExtension};
+use voicecore_lib::{database, error, search};
+
+use crate::DataVersion;
+
+/// Bump when the sidecar schema changes; older indexes are dropped and rebuilt.
+const SCHEMA_VERSION: i64 = 1;
+
+/// Change log rows fetched per catch-up query.
+const CHANGE_BATCH: i64 = 10_000;
+
+/// Relative bm25 weights for the note content and transcripts columns.
+const CONTENT_WEIGHT: f64 = 1.0;
+const TRANSCRIPTS_WEIGHT: f64 = 0.5;
+
+#[derive(Debug)]
+pub enum IndexError {
+    Sqlite(rusqlite::Error),
+    Voice(error::VoiceError),
+}
+
+impl From<rusqlite::Error> for IndexError {
+    fn from(err: rusqlite::Error) -> Self {
+        IndexError::Sqlite(err)
+    }
+}
+
+impl From<error::VoiceError> for IndexError {
+    fn from(err: error::VoiceError) -> Self {
+        IndexError::Voice(err)
+    }
+}
+
+pub type IndexResult<T> = Result<T, IndexError>;
+
+/// Which indexed text a query is matched against.
+#[derive(Clone, Copy)]
+pub enum Field {
+    Any,
+    Content,
+    Transcripts,
+}
+
+impl Field {
+    fn column(self) -> Option<&'static str> {
+        match self {
+            Field::Any => None,
+            Field::Content => Some("content"),
+            Field::Transcripts => Some("transcripts"),
+        }
+    }
+}
+
+/// One ranked search hit.
+pub struct SearchHit {
+    pub note_id: String,
+    /// Relevance score, higher is better (negated FTS5 bm25)
+    pub score: f64,
+    pub snippet: String,
+}
+
+pub struct SearchIndex {
+    conn: Connection,
+    /// Database version the index was last brought up to date with
+    version: Option<DataVersion>,
+    /// Sync generation the index was last reconciled against
+    sync_generation: Option<u64>,
+}
+
+impl SearchIndex {
+    /// Open (creating if needed) the index for a database.
+    ///
+    /// `db_path` is the main database file; None opens an in-memory index.
+    pub fn open(db_path: Option<&str>) -> IndexResult<Self> {
+        let conn = match db_path {
+            Some(path) => {
+                let conn = Connection::open(Self::sidecar_path(path))?;
+                conn.pragma_update(None, "journal_mode", "WAL")?;
+                conn.busy_timeout(std::time::Duration::from_secs(5))?;
+                conn
+            }
+            None => Connection::open_in_memory()?,
+        };
+        let index = Self { conn, version: None, sync_generation: None };
+        index.ensure_schema()?;
+        Ok(index)
+    }
+
+    /// Location of the sidecar index database for a main database file.
+    pub fn sidecar_path(db_path: &str) -> String {
+        format!("{}.search", db_path)
+    }
+
+    fn ensure_schema(&self) -> IndexResult<()> {
+        let version: i64 = self.conn.pragma_query_value(None, "user_version", |row| row.get(0))?;
+        if version != SCHEMA_VERSION {
+            self.conn.execute_batch(
+                "DROP TABLE IF EXISTS notes_fts;
+                 DROP TABLE IF EXISTS indexed_notes;
+                 DROP TABLE IF EXISTS pending_notes;
+                 DROP TABLE IF EXISTS index_state;",
+            )?;
+        }
+        self.conn.execute_batch(
+            "CREATE TABLE IF NOT EXISTS indexed_notes (
+                 rowid INTEGER PRIMARY KEY,
+                 note_id TEXT NOT NULL UNIQUE,
+                 modified_at INTEGER
+             );
+             CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
+                 content,
+                 transcripts,
+                 tokenize = 'unicode61 remove_diacritics 2',
+                 prefix = '2 3'
+             );
+             CREATE TABLE IF NOT EXISTS pending_notes (note_id TEXT PRIMARY KEY);
+             CREATE TABLE IF NOT EXISTS index_state (key TEXT PRIMARY KEY, value INTEGER NOT NULL);",
+        )?;
+        self.conn.pragma_update(None, "user_version", SCHEMA_VERSION)?;
+        Ok(())
+    }
+
+    fn state(&self, key: &str) -> IndexResult<Option<i64>> {
+        Ok(self
+            .conn
+            .query_row("SELECT value FROM index_state WHERE key = ?1", [key], |row| row.get(0))
+            .optional()?)
+    }
+
+    fn set_state(conn: &Connection, key: &str, value: i64) -> IndexResult<()> {
+        conn.execute(
+            "INSERT INTO index_state (key, value) VALUES (?1, ?2)
+             ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            params![key, value],
+        )?;
+        Ok(())
+    }
+
+    /// Number of notes currently in the index.
+    pub fn len(&self) -> IndexResult<usize> {
+        let count: i64 = self.conn.query_row("SELECT COUNT(*) FROM indexed_notes", [], |row| row.get(0))?;
+        Ok(count as usize)
+    }
+
+    /// Queue notes for re-indexing on the next query.
+    ///
+    /// Used for writes the change log cannot be relied on to surface:
+    /// sync-applied rows keep their original (possibly old) timestamps, and
+    /// transcriptions are not part of the change log.
+    pub fn mark_pending<I>(&mut self, note_ids: I) -> IndexResult<()>
+    where
+        I: IntoIterator<Item = String>,
+    {
+        let tx = self.conn.transaction()?;
+        {
+            let mut insert = tx.prepare_cached("INSERT OR IGNORE INTO pending_notes (note_id) VALUES (?1)")?;
+            for note_id in note_ids {
+                insert.execute([note_id])?;
+            }
+        }
+        tx.commit()?;
+        self.version = None;
+        Ok(())
+    }
+
+    /// Bring the index up to date with the database.
+    ///
+    /// Does nothing if neither the database version nor the sync generation
+    /// moved since the last call.
+    pub fn refresh(
+        &mut self,
+        db: &database::Database,
+        version: DataVersion,
+        sync_generation: u64,
+    ) -> IndexResult<()> {
+        if self.version.as_ref() == Some(&version) && self.sync_generation == Some(sync_generation) {
+            return Ok(());
+        }
+
+        let cursor = match self.state("cursor")? {
+            Some(cursor) => cursor,
+            None => return self.rebuild(db, version, sync_generation).map(|_| ()),
+        };
+
+        // Also runs on first use in this process, to pick up syncs made by
+        // other processes since the index was last refreshed
+        if self.sync_generation != Some(sync_generation) {
+            self.reconcile(db)?;
+        }
+
+        let mut note_ids: HashSet<String> = {
+            let mut stmt = self.conn.prepare("SELECT note_id FROM pending_notes")?;
+            let rows = stmt.query_map([], |row| row.get(0))?;
+            rows.collect::<Result<_, _>>()?
+        };
+        let new_cursor = match changed_notes(db, cursor)? {
+            Some((changed, new_cursor)) => {
+                note_ids.extend(changed);
+                new_cursor
+            }
+            // More changes in one second than a batch can hold
+            None => return self.rebuild(db, version, sync_generation).map(|_| ()),
+        };
+
+        self.reindex(db, &note_ids, new_cursor)?;
+        self.version = Some(version);
+        self.sync_generation = Some(sync_generation);
+        Ok(())
+    }
+
+    /// Drop and rebuild the whole index. Returns the number of notes indexed.
+    pub fn rebuild(
+        &mut self,
+        db: &database::Database,
+        version: DataVersion,
+        sync_generation: u64,
+    ) -> IndexResult<usize> {
+        // Taken before reading so that writes made during the rebuild are
+        // picked up again by the next catch-up
+        let started = unix_now();
+        let notes = db.get_all_notes()?;
+        let mut transcripts = all_transcripts(db)?;
+
+        let tx = self.conn.transaction()?;
+        tx.execute_batch(
+            "DELETE FROM notes_fts;
+             DELETE FROM indexed_notes;
+             DELETE FROM pending_notes;",
+        )?;
+        let mut count = 0;
+        {
+            let mut insert_note =
+                tx.prepare_cached("INSERT INTO indexed_notes (note_id, modified_at) VALUES (?1, ?2)")?;
+            let mut insert_fts =
+                tx.prepare_cached("INSERT INTO notes_fts (rowid, content, transcripts) VALUES (?1, ?2, ?3)")?;
+            for note in notes.iter().filter(|n| n.deleted_at.is_none()) {
+                insert_note.execute(params![note.id, note.modified_at])?;
+                let text = transcripts.remove(&note.id).unwrap_or_default().join("\n");
+                insert_fts.execute(params![tx.last_insert_rowid(), note.content, text])?;
+                count += 1;
+            }
+        }
+        Self::set_state(&tx, "cursor", started)?;
+        tx.execute("INSERT INTO notes_fts (notes_fts) VALUES ('optimize')", [])?;
+        tx.commit()?;
+        self.version = Some(version);
+        self.sync_generation = Some(sync_generation);
+        Ok(count)
+    }
+
+    /// Re-index notes whose modification time differs from the one indexed,
+    /// and drop notes that were deleted. Used after a peer sync, whose
+    /// changes carry the peer's timestamps.
+    fn reconcile(&mut self, db: &database::Database) -> IndexResult<()> {
+        let indexed: HashMap<String, Option<i64>> = {
+            let mut stmt = self.conn.prepare("SELECT note_id, modified_at FROM indexed_notes")?;
+            let rows = stmt.query_map([], |row| Ok((row.get(0)?, row.get(1)?)))?;
+            rows.collect::<Result<_, _>>()?
+        };
+
+        let mut stale: HashSet<String> = HashSet::new();
+        let mut live: HashSet<&str> = HashSet::new();
+        let notes = db.get_all_notes()?;
+        for note in notes.iter().filter(|n| n.deleted_at.is_none()) {
+            live.insert(note.id.as_str());
+            if indexed.get(&note.id) != Some(&note.modified_at) {
+                stale.insert(note.id.clone());
+            }
+        }
+        stale.extend(indexed.keys().filter(|id| !live.contains(id.as_str())).cloned());
+
+        let tx = self.conn.transaction()?;
+        {
+            let mut insert = tx.prepare_cached("INSERT OR IGNORE INTO pending_notes (note_id) VALUES (?1)")?;
+            for note_id in stale {
+                insert.execute([note_id])?;
+            }
+        }
+        tx.commit()?;
+        Ok(())
+    }
+
+    fn reindex(&mut self, db: &database::Database, note_ids: &HashSet<String>, cursor: i64) -> IndexResult<()> {
+        // Read everything first so the sidecar write transaction stays short
+        let mut rows = Vec::with_capacity(note_ids.len());
+        for note_id in note_ids {
+            let note = db.get_note(note_id)?.filter(|n| n.deleted_at.is_none());
+            let text = match &note {
+                Some(_) => note_transcripts(db, note_id)?.join("\n"),
+                None => String::new(),
+            };
+            rows.push((note_id, note, text));
+        }
+
+        let tx = self.conn.transaction()?;
+        {
+            let mut find = tx.prepare_cached("SELECT rowid FROM indexed_notes WHERE note_id = ?1")?;
+            let mut delete_fts = tx.prepare_cached("DELETE FROM notes_fts WHERE rowid = ?1")?;
+            let mut delete_note = tx.prepare_cached("DELETE FROM indexed_notes WHERE rowid = ?1")?;
+            let mut insert_note =
+                tx.prepare_cached("INSERT INTO indexed_notes (note_id, modified_at) VALUES (?1, ?2)")?;
+            let mut insert_fts =
+                tx.prepare_cached("INSERT INTO notes_fts (rowid, content, transcripts) VALUES (?1, ?2, ?3)")?;
+            for (note_id, note, text) in &rows {
+                let rowid: Option<i64> = find.query_row([note_id], |row| row.get(0)).optional()?;
+                if let Some(rowid) = rowid {
+                    delete_fts.execute([rowid])?;
+                    delete_note.execute([rowid])?;
+                }
+                if let Some(note) = note {
+                    insert_note.execute(params![note.id, note.modified_at])?;
+                    insert_fts.execute(params![tx.last_insert_rowid(), note.content, text])?;
+                }
+            }
+        }
+        tx.execute("DELETE FROM pending_notes", [])?;
+        Self::set_state(&tx, "cursor", cursor)?;
+        tx.commit()?;
+        Ok(())
+    }
+
+    /// Run a ranked query.
+    ///
+    /// `query` uses the user-facing syntax understood by `match_expression`.
+    /// Snippets wrap matched terms in `highlight` and are taken from the
+    /// best-matching column.
+    pub fn search(
+        &self,
+        query: &str,
+        field: Field,
+        limit: usize,
+        highlight: (&str, &str),
+    ) -> IndexResult<Vec<SearchHit>> {
+        let expression = match match_expression(query, field.column()) {
+            Some(expression) => expression,
+            None => return Ok(Vec::new()),
+        };
+        let mut stmt = self.conn.prepare_cached(
+            "SELECT i.note_id,
+                    bm25(notes_fts, ?2, ?3) AS rank,
+                    snippet(notes_fts, -1, ?4, ?5, '…', 16)
+             FROM notes_fts JOIN indexed_notes i ON i.rowid = notes_fts.rowid
+             WHERE notes_fts MATCH ?1
+             ORDER BY rank
+             LIMIT ?6",
+        )?;
+        let rows = stmt.query_map(
+            params![
+                expression,
+                CONTENT_WEIGHT,
+                TRANSCRIPTS_WEIGHT,
+                highlight.0,
+                highlight.1,
+                limit as i64
+            ],
+            |row| {
+                Ok(SearchHit {
+                    note_id: row.get(0)?,
+                    score: -row.get::<_, f64>(1)?,
+                    snippet: row.get(2)?,
+                })
+            },
+        )?;
+        Ok(rows.collect::<Result<_, _>>()?)
+    }
+
+    /// Ids of every note matching a query, unranked.
+    pub fn matching_notes(&self, query: &str, field: Field) -> IndexResult<HashSet<String>> {
+        let expression = match match_expression(query, field.column()) {
+            Some(expression) => expression,
+            None => return Ok(HashSet::new()),
+        };
+        let mut stmt = self.conn.prepare_cached(
+            "SELECT i.note_id
+             FROM notes_fts JOIN indexed_notes i ON i.rowid = notes_fts.rowid
+             WHERE notes_fts MATCH ?1",
+        )?;
+        let rows = stmt.query_map([expression], |row| row.get(0))?;
+        Ok(rows.collect::<Result<_, _>>()?)
+    }
+}
+
+/// Prefix for search terms matched against transcription text only.
+const TRANSCRIPT_PREFIX: &str = "transcript:";
+
+/// Split `transcript:` terms out of raw search input.
+///
+/// Returns the input without those terms (for the regular search parser)
+/// and the term values. `transcript:"several words"` keeps its quotes so
+/// that it is matched as a phrase. Empty terms are dropped.
+pub fn split_transcript_terms(input: &str) -> (String, Vec<String>) {
+    let mut rest = Vec::new();
+    let mut terms = Vec::new();
+    let mut remaining = input.trim_start();
+    while !remaining.is_empty() {
+        let is_term = remaining
+            .get(..TRANSCRIPT_PREFIX.len())
+            .map_or(false, |p| p.eq_ignore_ascii_case(TRANSCRIPT_PREFIX));
+        let value_start = TRANSCRIPT_PREFIX.len();
+        let end = if is_term && remaining[value_start..].starts_with('"') {
+            let body = &remaining[value_start + 1..];
+            value_start + 1 + body.find('"').map_or(body.len(), |i| i + 1)
+        } else {
+            remaining.find(char::is_whitespace).unwrap_or(remaining.len())
+        };
+        let token = &remaining[..end];
+        if is_term {
+            let value = &token[value_start..];
+            if !value.trim_matches('"').trim().is_empty() {
+                terms.push(value.to_string());
+            }
+        } else {
+            rest.push(token);
+        }
+        remaining = remaining[end..].trim_start();
+    }
+    (rest.join(" "), terms)
+}
+
+/// Notes a transcription match may be added from: the non-text filters of
+/// the original search.
+pub enum Scope<'a> {
+    All,
+    TagGroups(&'a Vec<Vec<String>>),
+    /// Search input holding only qualifiers such as `tag:` and `is:`
+    Filters(&'a str),
+}
+
+/// Widen or narrow a content search with transcription matches.
+///
+/// With `include_text`, notes within `scope` whose transcriptions match it
+/// are added to `notes`. With `transcript_query`, only notes whose
+/// transcriptions match it are kept. Results stay ordered newest first.
+pub fn apply_transcript_search(
+    db: &database::Database,
+    index: &SearchIndex,
+    mut notes: Vec<database::NoteRow>,
+    include_text: Option<&str>,
+    scope: Scope<'_>,
+    transcript_query: Option<&str>,
+) -> IndexResult<Vec<database::NoteRow>> {
+    if let Some(text) = include_text.filter(|t| !t.trim().is_empty()) {
+        let seen: HashSet<String> = notes.iter().map(|n| n.id.clone()).collect();
+        let missing: HashSet<String> = index
+            .matching_notes(text, Field::Transcripts)?
+            .into_iter()
+            .filter(|id| !seen.contains(id))
+            .collect();
+        if !missing.is_empty() {
+            let candidates = match scope {
+                Scope::All => {
+                    let mut found = Vec::with_capacity(missing.len());
+                    for note_id in &missing {
+                        found.extend(db.get_note(note_id)?.filter(|n| n.deleted_at.is_none()));
+                    }
+                    found
+                }
+                Scope::TagGroups(groups) => db.search_notes(None, Some(groups))?,
+                Scope::Filters(input) => search::execute_search(db, input)?.notes,
+            };
+            notes.extend(candidates.into_iter().filter(|n| missing.contains(&n.id)));
+            notes.sort_by(|a, b| (b.created_at, &b.id).cmp(&(a.created_at, &a.id)));
+        }
+    }
+    if let Some(query) = transcript_query {
+        let hits = index.matching_notes(query, Field::Transcripts)?;
+        notes.retain(|n| hits.contains(&n.id));
+    }
+    Ok(notes)
+}
+
+/// Translate a user query into an FTS5 MATCH expression.
+///
+/// Words are ANDed together. `"quoted text"` is a phrase query and a
+/// trailing `*` makes a prefix query. Everything else is quoted, so FTS5
+/// operators and punctuation in user input cannot cause syntax errors.
+/// `column` restricts every term to one column. Returns None if the query
+/// has no searchable terms.
+pub fn match_expression(query: &str, column: Option<&str>) -> Option<String> {
+    let mut terms = Vec::new();
+    let mut chars = query.chars().peekable();
+    while let Some(&c) = chars.peek() {
+        if c.is_whitespace() {
+            chars.next();
+            continue;
+        }
+        let mut text = String::new();
+        if c == '"' {
+            chars.next();
+            for c in chars.by_ref() {
+                if c == '"' {
+                    break;
+                }
+                text.push(c);
+            }
+        } else {
+            while let Some(&c) = chars.peek() {
+                if c.is_whitespace() || c == '"' {
+                    break;
+                }
+                text.push(c);
+                chars.next();
+            }
+        }
+        let prefix = text.ends_with('*');
+        let text = text.trim_end_matches('*');
+        if !text.chars().any(char::is_alphanumeric) {
+            continue;
+        }
+        let mut term = format!("\"{}\"", text.replace('"', "\"\""));
+        if prefix {
+            term.push('*');
+        }
+        if let Some(column) = column {
+            term = format!("{} : {}", column, term);
+        }
+        terms.push(term);
+    }
+    if terms.is_empty() {
+        None
+    } else {
+        Some(terms.join(" AND "))
+    }
+}
+
+fn unix_now() -> i64 {
+    SystemTime::now()
+        .duration_since(SystemTime::UNIX_EPOCH)
+        .map(|d| d.as_secs() as i64)
+        .unwrap_or(0)
+}
+
+fn str_field<'a>(change: &'a HashMap<String, serde_json::Value>, key: &str) -> Option<&'a str> {
+    change.get(key).and_then(serde_json::Value::as_str)
+}
+
+/// Notes whose indexed text may be affected by a change to one entity.
+pub fn notes_for_change(
+    db: &database::Database,
+    entity_type: &str,
+    entity_id: &str,
+    data: Option<&serde_json::Value>,
+) -> Result<Vec<String>, error::VoiceError> {
+    let data_field = |key: &str| data.and_then(|d| d.get(key)).and_then(serde_json::Value::as_str);
+    match entity_type {
+        "note" => Ok(vec![entity_id.to_string()]),
+        "note_attachment" => Ok(data_field("note_id").map(String::from).into_iter().collect()),
+        "audio_file" => db.get_notes_for_audio_file(entity_id),
+        "transcription" => match data_field("audio_file_id") {
+            Some(audio_file_id) => db.get_notes_for_audio_file(audio_file_id),
+            None => Ok(Vec::new()),
+        },
+        _ => Ok(Vec::new()),
+    }
+}
+
+/// Note ids touched by the change log since `cursor`, plus the new cursor.
+///
+/// Returns None if a single second holds more changes than one batch, in
+/// which case the caller falls back to a full rebuild.
+fn changed_notes(db: &database::Database, mut cursor: i64) -> IndexResult<Option<(HashSet<String>, i64)>> {
+    let mut note_ids = HashSet::new();
+    loop {
+        // Timestamps have one-second resolution, so re-read the cursor's second
+        let (changes, _) = db.get_changes_since(Some(cursor - 1), CHANGE_BATCH)?;
+        let mut newest = cursor;
+        for change in &changes {
+            if let Some(timestamp) = change.get("timestamp").and_then(serde_json::Value::as_i64) {
+                newest = newest.max(timestamp);
+            }
+            if let (Some(entity_type), Some(entity_id)) =
+                (str_field(change, "entity_type"), str_field(change, "entity_id"))
+            {
+                note_ids.extend(notes_for_change(db, entity_type, entity_id, change.get("data"))?);
+            }
+        }
+        if (changes.len() as i64) < CHANGE_BATCH {
+            return Ok(Some((note_ids, newest)));
+        }
+        if newest == cursor {
+            return Ok(None);
+        }
+        cursor = newest;
+    }
+}
+
+/// Live transcription texts for one note, oldest audio file first.
+fn note_transcripts(db: &database::Database, note_id: &str) -> IndexResult<Vec<String>> {
+    let mut texts = Vec::new();
+    for audio_file in db.get_audio_files_for_note(note_id)? {
+        if audio_file.deleted_at.is_some() {
+            continue;
+        }
+        for transcription in db.get_transcriptions_for_audio_file(&audio_file.id)? {
+            if transcription.deleted_at.is_none() {
+                texts.push(transcription.content);
+            }
+        }
+    }
+    Ok(texts)
+}
+
+/// Live transcription texts for every note, read per audio file rather than
+/// per note since most notes have no recordings.
+fn all_transcripts(db: &database::Database) -> IndexResult<HashMap<String, Vec<String>>> {
+    let mut by_note: HashMap<String, Vec<String>> = HashMap::new();
+    for audio_file in db.get_all_audio_files()? {
+        if audio_file.deleted_at.is_some() {
+            continue;
+        }
+        let texts: Vec<String> = db
+            .get_transcriptions_for_audio_file(&audio_file.id)?
+            .into_iter()
+            .filter(|t| t.deleted_at.is_none())
+            .map(|t| t.content)
+            .collect();
+        if texts.is_empty() {
+            continue;
+        }
+        for note_id in db.get_notes_for_audio_file(&audio_file.id)? {
+            by_note.entry(note_id).or_default().extend(texts.iter().cloned());
+        }
+    }
+    Ok(by_note)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::{match_expression, split_transcript_terms};
+
+    #[test]
+    fn transcript_terms_are_split_out() {
+        let (rest, terms) = split_transcript_terms("tag:Work transcript:budget Meeting TRANSCRIPT:\"next week\"");
+        assert_eq!(rest, "tag:Work Meeting");
+        assert_eq!(terms, vec!["budget".to_string(), "\"next week\"".to_string()]);
+    }
+
+    #[test]
+    fn empty_transcript_terms_are_dropped() {
+        let (rest, terms) = split_transcript_terms("transcript: hello transcript:\"\"");
+        assert_eq!(rest, "hello");
+        assert!(terms.is_empty());
+    }
+
+    #[test]
+    fn words_are_anded_and_quoted() {
+        assert_eq!(
+            match_expression("hello world", None).as_deref(),
+            Some("\"hello\" AND \"world\"")
+        );
+    }
+
+    #[test]
+    fn phrases_and_prefixes() {
+        assert_eq!(
+            match_expression("\"big red\" dog*", None).as_deref(),
+            Some("\"big red\" AND \"dog\"*")
+        );
+    }
+
+    #[test]
+    fn column_filter_applies_to_every_term() {
+        assert_eq!(
+            match_expression("a* b", Some("content")).as_deref(),
+            Some("content : \"a\"* AND content : \"b\"")
+        );
+    }
+
+    #[test]
+    fn operators_and_punctuation_are_inert() {
+        assert_eq!(match_expression("NEAR( - *", None), Some("\"NEAR(\"".to_string()));
+        assert_eq!(match_expression("  ", None), None);
+    }
+}
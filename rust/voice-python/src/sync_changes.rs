@@ -0,0 +1,136 @@
+//! Change sets reported by peer syncs.
+//!
+//! Syncs apply remote changes through the sync client's own connection and
+//! keep the peer's timestamps, so the change log cannot tell which rows a
+//! sync touched. Every row a sync applies is stamped with sync_received_at,
+//! though, so the rows received since the sync started are read back
+//! afterwards (direct SQL on the database file). A row whose rowid lies
+//! above the table's highest rowid before the sync was inserted by it.
+//! User interfaces use the resulting ids to update only the affected rows.
+//!
+//! sync_received_at has one-second resolution, so rows received by an
+//! earlier sync in the same second as this one started are reported too:
+//! the result is a superset of what the sync changed, never a subset.
+
+use std::collections::HashSet;
+
+use rusqlite::{params, Connection};
+
+use crate::direct_sql;
+
+/// Where the database stood when a sync started.
+pub struct SyncMark {
+    /// Unix timestamp, truncated to the second; rows received by the sync
+    /// are stamped at or after it. Comparing with `>=` keeps rows stamped
+    /// in the starting second; a mark at the highest sync_received_at
+    /// compared with `>` would lose the sync's rows whenever an earlier
+    /// sync finished in that same second.
+    started_at: i64,
+    max_note_rowid: i64,
+    max_tag_rowid: i64,
+}
+
+/// Ids of notes and tags created, updated or deleted by a sync.
+#[derive(Clone, Default)]
+pub struct EntityChanges {
+    pub created_note_ids: Vec<String>,
+    pub updated_note_ids: Vec<String>,
+    pub deleted_note_ids: Vec<String>,
+    pub created_tag_ids: Vec<String>,
+    pub updated_tag_ids: Vec<String>,
+    pub deleted_tag_ids: Vec<String>,
+}
+
+/// Rows of `table` received at or after `since`, as (hex id, new, deleted).
+fn received_rows(
+    conn: &Connection,
+    table: &str,
+    since: i64,
+    max_rowid: i64,
+) -> rusqlite::Result<Vec<(String, bool, bool)>> {
+    let mut stmt = conn.prepare(&format!(
+        "SELECT lower(hex(id)), rowid > ?2, deleted_at IS NOT NULL FROM {} WHERE sync_received_at >= ?1",
+        table
+    ))?;
+    let rows = stmt.query_map(params![since, max_rowid], |row| Ok((row.get(0)?, row.get(1)?, row.get(2)?)))?;
+    rows.collect()
+}
+
+impl SyncMark {
+    /// Record the start time and the highest note and tag rowids.
+    pub fn take(conn: &Connection) -> rusqlite::Result<Self> {
+        let max_rowid = |table: &str| {
+            conn.query_row(&format!("SELECT COALESCE(MAX(rowid), 0) FROM {}", table), [], |row| row.get(0))
+        };
+        Ok(Self {
+            started_at: chrono::Utc::now().timestamp(),
+            max_note_rowid: max_rowid("notes")?,
+            max_tag_rowid: max_rowid("tags")?,
+        })
+    }
+
+    /// What the sync changed, from the rows it received.
+    ///
+    /// A received row inserted by the sync is created (unless it arrived
+    /// already deleted), one that existed is updated or, if soft-deleted,
+    /// deleted. Notes whose tags were received, or carry a received tag,
+    /// count as updated. A note restored by the sync is reported as
+    /// updated. Rows an earlier sync received in the second this one
+    /// started count as well (see the module docs); reporting a row that
+    /// did not change only costs its refresh.
+    pub fn changes(&self, conn: &Connection) -> rusqlite::Result<EntityChanges> {
+        let mut changes = EntityChanges::default();
+
+        for (note_id, new, deleted) in received_rows(conn, "notes", self.started_at, self.max_note_rowid)? {
+            match (new, deleted) {
+                (true, false) => changes.created_note_ids.push(note_id),
+                (true, true) => {}
+                (false, false) => changes.updated_note_ids.push(note_id),
+                (false, true) => changes.deleted_note_ids.push(note_id),
+            }
+        }
+        for (tag_id, new, deleted) in received_rows(conn, "tags", self.started_at, self.max_tag_rowid)? {
+            match (new, deleted) {
+                (true, false) => changes.created_tag_ids.push(tag_id),
+                (true, true) => {}
+                (false, false) => changes.updated_tag_ids.push(tag_id),
+                (false, true) => changes.deleted_tag_ids.push(tag_id),
+            }
+        }
+
+        let mut known: HashSet<String> = changes
+            .created_note_ids
+            .iter()
+            .chain(&changes.updated_note_ids)
+            .chain(&changes.deleted_note_ids)
+            .cloned()
+            .collect();
+        let mut stmt = conn.prepare(
+            "SELECT DISTINCT lower(hex(note_id)) FROM note_tags
+             WHERE sync_received_at >= ?1
+                OR (deleted_at IS NULL AND tag_id IN (SELECT id FROM tags WHERE sync_received_at >= ?1))",
+        )?;
+        for note_id in stmt.query_map(params![self.started_at], |row| row.get::<_, String>(0))? {
+            let note_id = note_id?;
+            if known.insert(note_id.clone()) {
+                changes.updated_note_ids.push(note_id);
+            }
+        }
+        Ok(changes)
+    }
+}
+
+/// Mark the database, run a sync, and report what it changed.
+///
+/// Returns None for the changes if they could not be read back; callers
+/// should then assume anything may have changed.
+pub fn track_changes<T>(db_path: &str, sync: impl FnOnce() -> T) -> (T, Option<EntityChanges>) {
+    let conn = direct_sql::open_read_only(db_path).ok();
+    let mark = conn.as_ref().and_then(|conn| SyncMark::take(conn).ok());
+    let result = sync();
+    let changes = match (&conn, mark) {
+        (Some(conn), Some(mark)) => mark.changes(conn).ok(),
+        _ => None,
+    };
+    (result, changes)
+}
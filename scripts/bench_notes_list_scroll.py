@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Benchmark scrolling the GUI notes list.
+
+Creates a throwaway database with synthetic notes (5,000 by default),
+opens a NotesListPane off screen and scrolls it from top to bottom and
+back, repainting after every step. Frame times are reported with the
+delegate's layout cache disabled ("before") and enabled ("after"):
+
+    python scripts/bench_notes_list_scroll.py
+    python scripts/bench_notes_list_scroll.py --notes 20000 --step 60
+
+Run from the repository root with the voicecore extension and PySide6
+installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QModelIndex  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from core.config import Config  # noqa: E402
+from core.database import Database  # noqa: E402
+from ui.notes_list_pane import LAYOUT_CACHE_SIZE, NotesListPane  # noqa: E402
+
+WORDS = (
+    "meeting budget garden recipe travel invoice doctor school project "
+    "birthday groceries plumber concert deadline weekend library coffee "
+    "שלום תודה בוקר ערב"
+).split()
+
+
+def populate(db: Database, count: int, seed: int) -> None:
+    """Fill the database with random multi-word notes."""
+    rng = random.Random(seed)
+    for i in range(count):
+        db.create_note(" ".join(rng.choices(WORDS, k=rng.randint(3, 80))))
+        if (i + 1) % 5000 == 0:
+            print(f"  created {i + 1} notes", file=sys.stderr)
+
+
+def scroll_frames(app: QApplication, pane: NotesListPane, step: int, passes: int) -> List[float]:
+    """Scroll down and up `passes` times, returning per-frame times in ms."""
+    view = pane.list_widget
+    bar = view.verticalScrollBar()
+    frames = []
+    for _ in range(passes):
+        positions = list(range(0, bar.maximum() + 1, step))
+        for value in positions + positions[::-1]:
+            start = time.perf_counter()
+            bar.setValue(value)
+            view.viewport().repaint()
+            app.processEvents()
+            frames.append((time.perf_counter() - start) * 1000)
+    return frames
+
+
+def report(label: str, frames: List[float]) -> None:
+    """Print frame time statistics."""
+    ordered = sorted(frames)
+    p95 = ordered[int(len(ordered) * 0.95) - 1] if ordered else 0.0
+    print(
+        f"{label:8} frames={len(frames):6d} mean={statistics.mean(frames):7.2f} ms "
+        f"p95={p95:7.2f} ms max={max(frames):7.2f} ms"
+    )
+
+
+def main() -> int:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark scrolling the notes list")
+    parser.add_argument(
+        "--notes",
+        type=int,
+        default=5000,
+        help="Number of notes to create (default: 5000)",
+    )
+    parser.add_argument(
+        "--step",
+        type=int,
+        default=40,
+        help="Scroll bar step per frame (default: 40)",
+    )
+    parser.add_argument(
+        "--passes",
+        type=int,
+        default=2,
+        help="Down-and-up passes per measurement (default: 2)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=1,
+        help="Random seed for note content (default: 1)",
+    )
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    with tempfile.TemporaryDirectory() as tmp:
+        config = Config(config_dir=Path(tmp))
+        db = Database(Path(tmp) / "notes.db")
+        print(f"Creating {args.notes} notes...", file=sys.stderr)
+        populate(db, args.notes, args.seed)
+
+        pane = NotesListPane(config, db)
+        pane.resize(400, 800)
+        pane.show()
+        model = pane.notes_model
+        while model.canFetchMore(QModelIndex()):
+            model.fetchMore(QModelIndex())
+        app.processEvents()
+
+        for label, cache_size in (("before", 0), ("after", LAYOUT_CACHE_SIZE)):
+            pane.delegate.cache_size = cache_size
+            pane.delegate.invalidate()
+            report(label, scroll_frames(app, pane, args.step, args.passes))
+
+        pane.close()
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark the full-text search index against substring search.
+
+Creates a throwaway database with synthetic notes (100,000 by default),
+then times the substring search used by search_notes() against the FTS5
+index behind full_text_search(), plus the index build and an incremental
+update:
+
+    python scripts/bench_search_index.py
+    python scripts/bench_search_index.py --notes 20000 --queries 50
+
+Run from the repository root with the voicecore extension installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.database import Database  # noqa: E402
+
+WORDS = (
+    "meeting budget garden recipe travel invoice doctor school project "
+    "birthday groceries plumber concert deadline weekend library coffee "
+    "train insurance holiday report dentist password dinner football"
+).split()
+
+QUERIES = ["plumber", "budget report", "holi*", '"dinner coffee"']
+
+
+def populate(db: Database, count: int, seed: int) -> None:
+    """Fill the database with random multi-word notes."""
+    rng = random.Random(seed)
+    for i in range(count):
+        words = rng.choices(WORDS, k=rng.randint(5, 60))
+        db.create_note(f"Note {i}: " + " ".join(words))
+        if (i + 1) % 10000 == 0:
+            print(f"  created {i + 1} notes", file=sys.stderr)
+
+
+def time_per_call(fn: Callable[[], object], repeat: int) -> float:
+    """Average wall time of fn() in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> int:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the full-text search index")
+    parser.add_argument(
+        "--notes",
+        type=int,
+        default=100_000,
+        help="Number of notes to create (default: 100000)",
+    )
+    parser.add_argument(
+        "--queries",
+        type=int,
+        default=20,
+        help="Repetitions per query (default: 20)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=1,
+        help="Random seed for note content (default: 1)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(Path(tmp) / "bench.db")
+        print(f"Creating {args.notes} notes...", file=sys.stderr)
+        populate(db, args.notes, args.seed)
+
+        start = time.perf_counter()
+        indexed = db.rebuild_search_index()
+        print(f"Index build: {indexed} notes in {time.perf_counter() - start:.2f}s")
+
+        print(f"{'query':20} {'substring':>12} {'fts5':>12}")
+        for query in QUERIES:
+            plain = query.replace("*", "").replace('"', "")
+            substring_ms = time_per_call(lambda: db.search_notes(text_query=plain), args.queries)
+            fts_ms = time_per_call(lambda: db.full_text_search(query, limit=50), args.queries)
+            print(f"{query:20} {substring_ms:9.1f} ms {fts_ms:9.1f} ms")
+
+        note_id = db.create_note("warmup")
+        db.full_text_search("warmup")
+        start = time.perf_counter()
+        db.update_note(note_id, "incremental marmalade")
+        db.full_text_search("marmalade")
+        print(f"Edit + query (incremental): {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Load test for the Voice Web API.
+
+Measures requests/sec and latency for /api/notes and /api/search against a
+running server. Start the server first, for example:
+
+    python -m src.main web --server gunicorn --workers 4
+    python scripts/load_test_web.py --url http://127.0.0.1:5000 --concurrency 16
+
+Uses only the standard library so it can run on any host with Python.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+
+DEFAULT_ENDPOINTS = ["/api/notes", "/api/search?text=note"]
+
+
+def fetch(url: str, timeout: float) -> Tuple[bool, float]:
+    """Issue one GET request.
+
+    Args:
+        url: Full URL to fetch
+        timeout: Socket timeout in seconds
+
+    Returns:
+        Tuple of (success, latency in seconds)
+    """
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            response.read()
+            ok = response.status == 200
+    except (urllib.error.URLError, OSError):
+        ok = False
+    return ok, time.perf_counter() - start
+
+
+def run_endpoint(
+    base_url: str,
+    path: str,
+    requests: int,
+    concurrency: int,
+    timeout: float,
+) -> None:
+    """Hammer one endpoint and print a summary line.
+
+    Args:
+        base_url: Server base URL (no trailing slash)
+        path: Endpoint path including query string
+        requests: Total number of requests to send
+        concurrency: Number of requests in flight at once
+        timeout: Per-request timeout in seconds
+    """
+    url = base_url + path
+    latencies: List[float] = []
+    failures = 0
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for ok, latency in pool.map(lambda _: fetch(url, timeout), range(requests)):
+            latencies.append(latency)
+            if not ok:
+                failures += 1
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000
+    p95 = latencies[int(len(latencies) * 0.95) - 1] * 1000
+    print(
+        f"{path:30} {requests / elapsed:8.1f} req/s  "
+        f"p50 {p50:7.1f} ms  p95 {p95:7.1f} ms  failures {failures}"
+    )
+
+
+def main() -> int:
+    """Parse arguments and run the load test."""
+    parser = argparse.ArgumentParser(description="Load test the Voice Web API")
+    parser.add_argument(
+        "--url",
+        default="http://127.0.0.1:5000",
+        help="Server base URL (default: http://127.0.0.1:5000)",
+    )
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=500,
+        help="Requests per endpoint (default: 500)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Concurrent requests (default: 8)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=30.0,
+        help="Per-request timeout in seconds (default: 30)",
+    )
+    parser.add_argument(
+        "--endpoint",
+        action="append",
+        dest="endpoints",
+        help="Endpoint path to test (repeatable; default: /api/notes and /api/search?text=note)",
+    )
+    args = parser.parse_args()
+
+    base_url = args.url.rstrip("/")
+    ok, _ = fetch(base_url + "/api/health", args.timeout)
+    if not ok:
+        print(f"Error: server at {base_url} is not responding", file=sys.stderr)
+        return 1
+
+    print(f"{args.requests} requests per endpoint, concurrency {args.concurrency}")
+    for path in args.endpoints or DEFAULT_ENDPOINTS:
+        run_endpoint(base_url, path, args.requests, args.concurrency, args.timeout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,16 +20,19 @@ import argparse
 import json
 import os
 import sys
+import threading
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from src.core.audiofile_manager import AudioFileManager, is_supported_audio_format
+from src.core.cache_rebuild import DEFAULT_BATCH_SIZE, DEFAULT_WORKERS, rebuild_caches
 from src.core.config import Config
 from src.core.conflicts import ConflictManager, ResolutionChoice
 from src.core.database import Database
 from src.core.models import AUDIO_FILE_FORMATS, UUID_SHORT_LEN
-from src.core.search import resolve_tag_term
+from src.core.search import execute_search, resolve_tag_term
+from src.core.sync_scheduler import DEFAULT_SYNC_DEBOUNCE, DEFAULT_SYNC_INTERVAL, SyncScheduler, sync_lock
 from src.core.timestamp_utils import format_timestamp, datetime_to_timestamp
 from voicecore import SyncClient, sync_all_peers, start_sync_server
 from src.core.validation import ValidationError
@@ -374,7 +377,9 @@ def cmd_search(db: Database, args: argparse.Namespace) -> int:
         # Perform search
         notes = db.search_notes(
             text_query=args.text if args.text else None,
-            tag_id_groups=tag_id_groups if tag_id_groups else None
+            tag_id_groups=tag_id_groups if tag_id_groups else None,
+            transcript_query=args.transcript if args.transcript else None,
+            include_transcriptions=args.include_transcriptions,
         )
 
     if args.format == "json":
@@ -516,8 +521,14 @@ def cmd_list_audiofiles(db: Database, config: Config, args: argparse.Namespace)
         Exit code (0 for success)
     """
     if args.note_id:
-        # List audio files for a specific note
-        audio_files = db.get_audio_files_for_note(args.note_id)
+        # List audio files for a specific note, with transcriptions, in one call
+        attachments = db.get_attachments_with_audio_files(
+            args.note_id, include_transcriptions=True
+        ) or []
+        audio_files = [
+            a["audio_file"] for a in attachments
+            if a.get("audio_file") and not a["audio_file"].get("deleted_at")
+        ]
         if not audio_files:
             print(f"No audio files attached to note {args.note_id}")
             return 0
@@ -538,6 +549,7 @@ def cmd_list_audiofiles(db: Database, config: Config, args: argparse.Namespace)
             print(f"  File created: {format_timestamp(af['file_created_at'])}")
         if af.get('summary'):
             print(f"  Summary: {af['summary']}")
+        print(f"  Transcriptions: {len(af.get('transcriptions', []))}")
         print()
 
     return 0
@@ -1187,6 +1199,7 @@ def cmd_sync_now(db: Database, config: Config, args: argparse.Namespace) -> int:
                 "pushed": result.pushed,
                 "conflicts": result.conflicts,
                 "errors": result.errors,
+                "duration_ms": result.duration_ms,
             }, indent=2))
         else:
             if result.success:
@@ -1203,8 +1216,12 @@ def cmd_sync_now(db: Database, config: Config, args: argparse.Namespace) -> int:
                     print(f"  - {error}")
                 return 1
     else:
-        # Sync with all peers
-        results = sync_all_peers(str(config.get_config_dir()))
+        # Sync with all peers (concurrently, bounded by --max-concurrent)
+        results = sync_all_peers(
+            str(config.get_config_dir()),
+            max_concurrent=args.max_concurrent,
+            peer_timeout=args.timeout,
+        )
 
         if not results:
             if args.format == "json":
@@ -1224,6 +1241,7 @@ def cmd_sync_now(db: Database, config: Config, args: argparse.Namespace) -> int:
                     "pushed": result.pushed,
                     "conflicts": result.conflicts,
                     "errors": result.errors,
+                    "duration_ms": result.duration_ms,
                 }
             print(json.dumps(output, indent=2))
         else:
@@ -1231,15 +1249,16 @@ def cmd_sync_now(db: Database, config: Config, args: argparse.Namespace) -> int:
             for pid, result in results.items():
                 peer = config.get_peer(pid)
                 peer_name = peer.get("peer_name", pid) if peer else pid
+                elapsed = f"{result.duration_ms / 1000:.1f}s"
 
                 if result.success:
-                    print(f"  {peer_name}: OK (↓{result.pulled} ↑{result.pushed})")
+                    print(f"  {peer_name}: OK (↓{result.pulled} ↑{result.pushed}) in {elapsed}")
                     if result.conflicts > 0:
                         print(f"    Errors: {result.conflicts}")
                         for error in result.errors:
                             print(f"      - {error}")
                 else:
-                    print(f"  {peer_name}: FAILED")
+                    print(f"  {peer_name}: FAILED after {elapsed}")
                     for error in result.errors:
                         print(f"    - {error}")
 
@@ -1486,6 +1505,7 @@ def cmd_sync_full_resync(db: Database, config: Config, args: argparse.Namespace)
                 "pushed": result.pushed,
                 "conflicts": result.conflicts,
                 "errors": result.errors,
+                "duration_ms": result.duration_ms,
             }, indent=2))
         else:
             if result.success:
@@ -1511,16 +1531,14 @@ def cmd_sync_full_resync(db: Database, config: Config, args: argparse.Namespace)
                 print("No peers configured for sync.")
             return 0
 
-        client = SyncClient(str(config.get_config_dir()))
-        results = {}
-        all_success = True
-
-        for peer in peers:
-            pid = peer["peer_id"]
-            result = client.initial_sync(pid)
-            results[pid] = result
-            if not result.success:
-                all_success = False
+        # Peers are re-synced concurrently, bounded by --max-concurrent
+        results = sync_all_peers(
+            str(config.get_config_dir()),
+            max_concurrent=args.max_concurrent,
+            peer_timeout=args.timeout,
+            full=True,
+        )
+        all_success = all(r.success for r in results.values())
 
         if args.format == "json":
             output = {}
@@ -1531,6 +1549,7 @@ def cmd_sync_full_resync(db: Database, config: Config, args: argparse.Namespace)
                     "pushed": result.pushed,
                     "conflicts": result.conflicts,
                     "errors": result.errors,
+                    "duration_ms": result.duration_ms,
                 }
             print(json.dumps(output, indent=2))
         else:
@@ -1538,15 +1557,16 @@ def cmd_sync_full_resync(db: Database, config: Config, args: argparse.Namespace)
             for pid, result in results.items():
                 peer = config.get_peer(pid)
                 peer_name = peer.get("peer_name", pid) if peer else pid
+                elapsed = f"{result.duration_ms / 1000:.1f}s"
 
                 if result.success:
-                    print(f"  {peer_name}: OK (↓{result.pulled} ↑{result.pushed})")
+                    print(f"  {peer_name}: OK (↓{result.pulled} ↑{result.pushed}) in {elapsed}")
                     if result.conflicts > 0:
                         print(f"    Conflicts: {result.conflicts}")
                         for error in result.errors:
                             print(f"      - {error}")
                 else:
-                    print(f"  {peer_name}: FAILED")
+                    print(f"  {peer_name}: FAILED after {elapsed}")
                     for error in result.errors:
                         print(f"    - {error}")
 
@@ -1586,6 +1606,102 @@ def cmd_sync_serve(db: Database, config: Config, args: argparse.Namespace) -> in
     return 0
 
 
+def cmd_sync_daemon(db: Database, config: Config, args: argparse.Namespace) -> int:
+    """Sync with all peers periodically until interrupted.
+
+    Runs a SyncScheduler in the foreground: peers are synced every
+    --interval seconds, and --debounce seconds after the database is
+    changed by another program (the GUI, TUI, web server or CLI). Peers
+    that cannot be reached are retried with exponential backoff.
+
+    Args:
+        db: Database instance
+        config: Config instance
+        args: Parsed command-line arguments
+
+    Returns:
+        Exit code (0 for success)
+    """
+    interval = args.interval
+    if interval is None:
+        interval = config.get_sync_interval() or DEFAULT_SYNC_INTERVAL
+
+    def print_run(results: Dict[str, Any], changes: Any) -> None:
+        stats = scheduler.last_run
+        if args.format == "json":
+            print(json.dumps({
+                "reason": stats.reason,
+                "started_at": stats.started_at,
+                "duration": round(stats.duration, 3),
+                "peers_synced": stats.peers_synced,
+                "peers_failed": stats.peers_failed,
+                "peers_skipped": stats.peers_skipped,
+                "peers": {
+                    pid: {
+                        "success": r.success,
+                        "pulled": r.pulled,
+                        "pushed": r.pushed,
+                        "errors": r.errors,
+                        "duration_ms": r.duration_ms,
+                    }
+                    for pid, r in results.items()
+                },
+            }), flush=True)
+            return
+        started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(stats.started_at))
+        print(
+            f"[{started}] Sync ({stats.reason}) took {stats.duration:.1f}s: "
+            f"{stats.peers_synced} OK, {stats.peers_failed} failed, "
+            f"{stats.peers_skipped} backing off"
+        )
+        for pid, result in results.items():
+            peer = config.get_peer(pid)
+            peer_name = peer.get("peer_name", pid) if peer else pid
+            if result.success:
+                print(f"  {peer_name}: OK (↓{result.pulled} ↑{result.pushed})")
+            else:
+                print(f"  {peer_name}: FAILED: {', '.join(result.errors)}")
+        sys.stdout.flush()
+
+    scheduler = SyncScheduler(
+        str(config.get_config_dir()),
+        interval=interval,
+        debounce=args.debounce,
+        max_concurrent=args.max_concurrent,
+        peer_timeout=args.timeout,
+        on_results=print_run,
+    )
+
+    if args.format != "json":
+        print(f"Syncing every {interval:g}s and {args.debounce:g}s after local changes. "
+              "Press Ctrl-C to stop.")
+    scheduler.start()
+    if args.now:
+        scheduler.request_sync()
+
+    # Other processes write to the database file directly, so watch its
+    # version. Writes made by the scheduler's own syncs are ignored.
+    last_version = db.get_data_version()
+    last_run_count = scheduler.run_count
+    try:
+        while scheduler.is_running():
+            time.sleep(1.0)
+            if sync_lock.locked():
+                continue
+            version = db.get_data_version()
+            if scheduler.run_count != last_run_count:
+                last_run_count = scheduler.run_count
+            elif version != last_version:
+                scheduler.notify_local_change()
+            last_version = version
+    except KeyboardInterrupt:
+        pass
+    finally:
+        scheduler.stop()
+
+    return 0
+
+
 def cmd_maintenance_database_normalize(db: Database, args: argparse.Namespace) -> int:
     """Normalize database data for consistency.
 
@@ -1610,6 +1726,74 @@ def cmd_maintenance_database_normalize(db: Database, args: argparse.Namespace) -
         return 1
 
 
+def _run_cache_rebuild(db: Database, args: argparse.Namespace) -> int:
+    """Rebuild stale note caches with progress, stopping cleanly on Ctrl+C.
+
+    The rebuild runs on a worker thread; Ctrl+C asks it to stop after the
+    current batch. Running the command again continues where it stopped.
+
+    Args:
+        db: Database instance
+        args: Parsed command-line arguments (force, workers, batch_size)
+
+    Returns:
+        Exit code (0 for success, 1 for errors, 130 if interrupted)
+    """
+    cancel = threading.Event()
+    outcome: Dict[str, Any] = {}
+    show_progress = sys.stderr.isatty()
+
+    def on_progress(done: int, total: int) -> None:
+        if show_progress and total:
+            print(f"\r  Rebuilt {done}/{total} notes", end="", file=sys.stderr, flush=True)
+
+    def run() -> None:
+        try:
+            outcome["summary"] = rebuild_caches(
+                db,
+                force=args.force,
+                batch_size=args.batch_size,
+                workers=args.workers,
+                progress=on_progress,
+                cancel=cancel,
+            )
+        except Exception as e:
+            outcome["error"] = e
+
+    worker = threading.Thread(target=run, name="cache-rebuild", daemon=True)
+    worker.start()
+    try:
+        while worker.is_alive():
+            worker.join(0.2)
+    except KeyboardInterrupt:
+        print("\nInterrupted; finishing the current batch...", file=sys.stderr)
+        cancel.set()
+        worker.join()
+    if show_progress:
+        print(file=sys.stderr)
+
+    if "error" in outcome:
+        raise outcome["error"]
+    summary = outcome["summary"]
+    if summary.cancelled:
+        print("Cache rebuild interrupted; run the command again to continue.")
+    else:
+        print("Cache rebuild complete.")
+    print(f"  Notes up to date (skipped): {summary.notes_skipped}")
+    print(f"  Notes rebuilt: {summary.notes_rebuilt}")
+    if summary.cancelled:
+        print(f"  Notes remaining: {summary.notes_pending}")
+    print(f"  Time: {summary.duration:.1f}s")
+    if summary.errors:
+        print(f"  Errors: {len(summary.errors)}")
+        for error in summary.errors:
+            print(f"    - {error}")
+
+    if summary.cancelled:
+        return 130
+    return 0 if not summary.errors else 1
+
+
 def cmd_maintenance_rebuild_cache(db: Database, args: argparse.Namespace) -> int:
     """Rebuild all cache fields for notes.
 
@@ -1617,6 +1801,9 @@ def cmd_maintenance_rebuild_cache(db: Database, args: argparse.Namespace) -> int
     - di_cache_note_pane_display: Tags, conflicts, attachments for Note pane
     - di_cache_note_list_pane_display: Date, marked status, content preview for List pane
 
+    Without a note ID only notes whose cache inputs changed are rebuilt
+    (see core.cache_rebuild).
+
     Args:
         db: Database instance
         args: Parsed command-line arguments (optional note_id)
@@ -1630,17 +1817,9 @@ def cmd_maintenance_rebuild_cache(db: Database, args: argparse.Namespace) -> int
             print(f"Rebuilding all caches for note {note_id}...")
             db.rebuild_all_caches_for_note(note_id)
             print("Cache rebuild complete.")
-        else:
-            print("Rebuilding all caches for all notes...")
-            result = db.rebuild_all_database_caches()
-            print(f"Cache rebuild complete.")
-            print(f"  Notes processed: {result['notes_processed']}")
-            print(f"  Cache fields rebuilt: {result['cache_fields_rebuilt']}")
-            if result.get('errors'):
-                print(f"  Errors: {len(result['errors'])}")
-                for error in result['errors']:
-                    print(f"    - {error}")
-        return 0
+            return 0
+        print("Rebuilding caches for all notes...")
+        return _run_cache_rebuild(db, args)
     except Exception as e:
         print(f"Error rebuilding cache: {e}", file=sys.stderr)
         return 1
@@ -1649,15 +1828,17 @@ def cmd_maintenance_rebuild_cache(db: Database, args: argparse.Namespace) -> int
 def cmd_maintenance_rebuild_all_caches(db: Database, args: argparse.Namespace) -> int:
     """Rebuild all di_* cache fields in the entire database.
 
-    Uses the cache registry to identify all cache fields across all tables
-    and rebuilds them.
+    Uses the cache registry to identify all cache fields across all tables.
+    Notes whose cache inputs have not changed since their last rebuild are
+    skipped unless --force is given; the rest are rebuilt in parallel
+    batches.
 
     Args:
         db: Database instance
         args: Parsed command-line arguments
 
     Returns:
-        Exit code (0 for success, 1 for error)
+        Exit code (0 for success, 1 for error, 130 if interrupted)
     """
     try:
         verbose = getattr(args, 'verbose', False)
@@ -1672,19 +1853,33 @@ def cmd_maintenance_rebuild_all_caches(db: Database, args: argparse.Namespace) -
             print()
 
         print("Rebuilding all database caches...")
-        result = db.rebuild_all_database_caches()
+        return _run_cache_rebuild(db, args)
+    except Exception as e:
+        print(f"Error rebuilding caches: {e}", file=sys.stderr)
+        return 1
+
+
+def cmd_maintenance_search_index_rebuild(db: Database, args: argparse.Namespace) -> int:
+    """Drop and rebuild the full-text search index.
+
+    The index is kept up to date automatically; rebuilding is only needed
+    if the index file was damaged or to compact it after many edits.
 
-        print(f"Cache rebuild complete.")
-        print(f"  Notes processed: {result['notes_processed']}")
-        print(f"  Cache fields rebuilt: {result['cache_fields_rebuilt']}")
-        if result.get('errors'):
-            print(f"  Errors: {len(result['errors'])}")
-            for error in result['errors']:
-                print(f"    - {error}")
+    Args:
+        db: Database instance
+        args: Parsed command-line arguments
 
-        return 0 if not result.get('errors') else 1
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    try:
+        print("Rebuilding search index...")
+        count = db.rebuild_search_index()
+        print("Search index rebuild complete.")
+        print(f"  Notes indexed: {count}")
+        return 0
     except Exception as e:
-        print(f"Error rebuilding caches: {e}", file=sys.stderr)
+        print(f"Error rebuilding search index: {e}", file=sys.stderr)
         return 1
 
 
@@ -1942,7 +2137,10 @@ def cmd_new_tag(db: Database, args: argparse.Namespace) -> int:
 
 
 def cmd_tag_notes(db: Database, args: argparse.Namespace) -> int:
-    """Attach tags to notes.
+    """Attach tags to notes, or detach them with --remove.
+
+    The notes are given by ID (--notes) or are the results of a search
+    (--from-search). All pairs are written in one batch.
 
     Args:
         db: Database instance
@@ -1952,33 +2150,44 @@ def cmd_tag_notes(db: Database, args: argparse.Namespace) -> int:
         Exit code (0 for success, 1 for error)
     """
     tag_prefixes = args.tags
-    note_prefixes = args.notes
+    remove = args.remove
 
     if not tag_prefixes:
         print("Error: At least one tag is required (--tags)", file=sys.stderr)
         return 1
 
-    if not note_prefixes:
-        print("Error: At least one note is required (--notes)", file=sys.stderr)
-        return 1
+    if args.from_search is not None:
+        result = execute_search(db, args.from_search)
+        for term in result.ambiguous_tags:
+            print(f"Warning: Tag '{term}' is ambiguous - matching multiple tags (using OR logic)", file=sys.stderr)
+        for term in result.not_found_tags:
+            print(f"Warning: Tag '{term}' not found.", file=sys.stderr)
+        note_ids = [note["id"] for note in result.notes]
+    else:
+        note_ids = args.notes
+        if not note_ids:
+            print("Error: At least one note is required (--notes or --from-search)", file=sys.stderr)
+            return 1
 
     try:
         # VoiceCore handles UUID prefix resolution internally
-        # Attach each tag to each note
-        attached = 0
-        for note_prefix in note_prefixes:
-            for tag_prefix in tag_prefixes:
-                if db.add_tag_to_note(note_prefix, tag_prefix):
-                    attached += 1
+        if not note_ids:
+            changed = 0
+        elif remove:
+            changed = db.remove_tags_from_notes(note_ids, tag_prefixes)["changed"]
+        else:
+            changed = db.add_tags_to_notes(note_ids, tag_prefixes)["changed"]
 
         if args.format == "json":
             print(json.dumps({
-                "attached": attached,
+                "removed" if remove else "attached": changed,
                 "tags": len(tag_prefixes),
-                "notes": len(note_prefixes),
+                "notes": len(note_ids),
             }))
+        elif remove:
+            print(f"Detached {len(tag_prefixes)} tag(s) from {len(note_ids)} note(s) ({changed} associations removed)")
         else:
-            print(f"Attached {len(tag_prefixes)} tag(s) to {len(note_prefixes)} note(s) ({attached} new associations)")
+            print(f"Attached {len(tag_prefixes)} tag(s) to {len(note_ids)} note(s) ({changed} new associations)")
         return 0
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -1988,6 +2197,47 @@ def cmd_tag_notes(db: Database, args: argparse.Namespace) -> int:
         return 1
 
 
+def _add_cache_rebuild_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options shared by the cache rebuild commands."""
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild every note, not only those whose cache inputs changed"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Parallel rebuild connections (default: {DEFAULT_WORKERS})"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Notes per batch; progress is saved after each (default: {DEFAULT_BATCH_SIZE})"
+    )
+
+
+def _add_peer_concurrency_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the multi-peer concurrency options shared by sync commands.
+
+    Args:
+        parser: Sync subcommand parser to add the options to
+    """
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=4,
+        help="Maximum number of peers to sync at the same time (default: 4)"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Per-peer timeout in seconds (default: no timeout)"
+    )
+
+
 def add_cli_subparser(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
     """Add CLI subparser and its nested subcommands.
 
@@ -2097,7 +2347,7 @@ def add_cli_subparser(subparsers: argparse._SubParsersAction[argparse.ArgumentPa
     # notes-tag command
     tag_notes_parser = cli_subparsers.add_parser(
         "notes-tag",
-        help="Attach tags to notes"
+        help="Attach tags to notes (or detach them with --remove)"
     )
     tag_notes_parser.add_argument(
         "--tags",
@@ -2105,12 +2355,23 @@ def add_cli_subparser(subparsers: argparse._SubParsersAction[argparse.ArgumentPa
         required=True,
         help="Tag ID(s) or prefix(es) to attach"
     )
-    tag_notes_parser.add_argument(
+    tag_notes_target = tag_notes_parser.add_mutually_exclusive_group(required=True)
+    tag_notes_target.add_argument(
         "--notes",
         nargs="+",
-        required=True,
         help="Note ID(s) or prefix(es) to tag"
     )
+    tag_notes_target.add_argument(
+        "--from-search",
+        type=str,
+        metavar="QUERY",
+        help="Tag every note matching a search (e.g., 'tag:Work budget')"
+    )
+    tag_notes_parser.add_argument(
+        "--remove",
+        action="store_true",
+        help="Detach the tags instead of attaching them"
+    )
 
     # notes-search command
     search_parser = cli_subparsers.add_parser(
@@ -2128,6 +2389,16 @@ def add_cli_subparser(subparsers: argparse._SubParsersAction[argparse.ArgumentPa
         action="append",
         help="Tag path to filter by (can be specified multiple times for AND logic)"
     )
+    search_parser.add_argument(
+        "--transcript",
+        type=str,
+        help="Only show notes whose transcriptions contain these words"
+    )
+    search_parser.add_argument(
+        "--include-transcriptions",
+        action="store_true",
+        help="Match --text against transcriptions as well as note content"
+    )
 
     # audiofiles-import command
     import_audio_parser = cli_subparsers.add_parser(
@@ -2312,6 +2583,7 @@ def add_cli_subparser(subparsers: argparse._SubParsersAction[argparse.ArgumentPa
         type=str,
         help="Sync with specific peer ID (default: all peers)"
     )
+    _add_peer_concurrency_arguments(sync_now_parser)
 
     # sync conflicts
     conflicts_parser = sync_subparsers.add_parser("conflicts", help="List unresolved sync conflicts")
@@ -2365,6 +2637,30 @@ def add_cli_subparser(subparsers: argparse._SubParsersAction[argparse.ArgumentPa
         help="Disable ANSI color codes in log output"
     )
 
+    # sync daemon
+    daemon_parser = sync_subparsers.add_parser(
+        "daemon",
+        help="Sync with all peers periodically, with backoff for unreachable peers"
+    )
+    daemon_parser.add_argument(
+        "--interval",
+        type=float,
+        default=None,
+        help=f"Seconds between syncs (default: sync_interval from config, or {DEFAULT_SYNC_INTERVAL:g})"
+    )
+    daemon_parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_SYNC_DEBOUNCE,
+        help=f"Seconds to wait after a local change before syncing (default: {DEFAULT_SYNC_DEBOUNCE:g})"
+    )
+    daemon_parser.add_argument(
+        "--now",
+        action="store_true",
+        help="Sync once right away instead of waiting for the first interval"
+    )
+    _add_peer_concurrency_arguments(daemon_parser)
+
     # sync reset-timestamps
     sync_subparsers.add_parser(
         "reset-timestamps",
@@ -2382,6 +2678,7 @@ def add_cli_subparser(subparsers: argparse._SubParsersAction[argparse.ArgumentPa
         type=str,
         help="Full re-sync with specific peer ID (default: all peers)"
     )
+    _add_peer_concurrency_arguments(full_resync_parser)
 
     # db-maintenance command with subcommands
     maintenance_parser = cli_subparsers.add_parser(
@@ -2408,6 +2705,7 @@ def add_cli_subparser(subparsers: argparse._SubParsersAction[argparse.ArgumentPa
         nargs="?",
         help="Note ID to rebuild caches for (rebuilds all notes if not specified)"
     )
+    _add_cache_rebuild_arguments(rebuild_cache_parser)
 
     # maintenance rebuild-all-caches (rebuild ALL di_* fields in the database)
     rebuild_all_parser = maintenance_subparsers.add_parser(
@@ -2419,6 +2717,13 @@ def add_cli_subparser(subparsers: argparse._SubParsersAction[argparse.ArgumentPa
         action="store_true",
         help="Show cache registry info before rebuilding"
     )
+    _add_cache_rebuild_arguments(rebuild_all_parser)
+
+    # maintenance search-index-rebuild (rebuild the full-text search index)
+    maintenance_subparsers.add_parser(
+        "search-index-rebuild",
+        help="Rebuild the full-text search index over notes and transcriptions"
+    )
 
     # maintenance audio-rebuild-durations (find and set duration for audio files)
     audio_duration_parser = maintenance_subparsers.add_parser(
@@ -2561,6 +2866,8 @@ def run(config_dir: Optional[Path], args: argparse.Namespace) -> int:
                 return cmd_sync_resolve(db, args)
             elif sync_cmd == "serve":
                 return cmd_sync_serve(db, config, args)
+            elif sync_cmd == "daemon":
+                return cmd_sync_daemon(db, config, args)
             elif sync_cmd == "reset-timestamps":
                 return cmd_sync_reset_timestamps(db, args)
             elif sync_cmd == "full-resync":
@@ -2580,6 +2887,8 @@ def run(config_dir: Optional[Path], args: argparse.Namespace) -> int:
                 return cmd_maintenance_rebuild_cache(db, args)
             elif maint_cmd == "rebuild-all-caches":
                 return cmd_maintenance_rebuild_all_caches(db, args)
+            elif maint_cmd == "search-index-rebuild":
+                return cmd_maintenance_search_index_rebuild(db, args)
             elif maint_cmd == "audio-rebuild-durations":
                 return cmd_maintenance_audio_rebuild_durations(db, config, args)
             else:
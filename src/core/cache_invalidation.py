@@ -0,0 +1,318 @@
+"""Lazy, dirty-set driven invalidation of the note display caches.
+
+Writes that change many notes' cache inputs at once (tag renames, moves
+and deletes, syncs) do not rebuild those caches themselves. They mark the
+affected notes dirty instead, and a background worker rebuilds the dirty
+notes in batches:
+
+- mark_notes() / mark_tags() / mark_changes() add notes to the dirty set.
+  A tag stands for every note carrying it or one of its descendants, since
+  their tag paths change with it.
+- The worker (start()/stop()) drains the set in batches, a note asked for
+  through request() first, and tells listeners which notes it rebuilt.
+- Readers check is_dirty() or a missing cache, show what they have, call
+  request() and reload when a listener reports the note, so they never
+  rebuild on their own thread.
+
+The dirty set lives in the cache state file of cache_rebuild (memory for
+in-memory databases), so marks made by another process (CLI, web server)
+or left over when the application quit are picked up as well.
+
+CRITICAL: This module must have NO Qt/PySide6 dependencies.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import weakref
+from typing import Callable, Iterable, List, Optional
+
+from .cache_rebuild import CacheFingerprints, get_cache_fingerprints
+from .database import Database
+from .models import ChangeSet
+from .tag_index import get_tag_index
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "CacheInvalidator",
+    "get_cache_invalidator",
+    "has_cache_invalidator",
+    "DEFAULT_INVALIDATION_BATCH_SIZE",
+    "DEFAULT_POLL_INTERVAL",
+]
+
+# Notes rebuilt per worker batch; small enough that a requested note
+# waits for at most one batch
+DEFAULT_INVALIDATION_BATCH_SIZE = 50
+
+# Seconds between checks for marks made by other processes
+DEFAULT_POLL_INTERVAL = 5.0
+
+
+class CacheInvalidator:
+    """Dirty set of notes with stale caches, and the worker draining it.
+
+    Thread-safe. Listeners are called on the worker thread (or the thread
+    calling drain()) with the IDs of the notes whose caches were rebuilt.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        store: CacheFingerprints,
+        batch_size: int = DEFAULT_INVALIDATION_BATCH_SIZE,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        """Initialize the invalidator (worker not started).
+
+        Args:
+            db: Database connection
+            store: Cache state store holding the dirty set
+            batch_size: Notes rebuilt per batch
+            poll_interval: Seconds between checks for marks made by other
+                processes while idle
+        """
+        self._db = weakref.ref(db)
+        self.store = store
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+
+        self._listeners: List[Callable[[List[str]], None]] = []
+        self._requested: List[str] = []
+        self._wake = threading.Condition()
+        self._stop = threading.Event()
+        self._rebuild_lock = threading.Lock()  # One batch at a time
+        self._thread: Optional[threading.Thread] = None
+
+    # ===== Marking =====
+
+    def mark_notes(self, note_ids: Iterable[str]) -> None:
+        """Mark notes' caches as stale.
+
+        Args:
+            note_ids: Note IDs (hex strings)
+        """
+        note_ids = list(note_ids)
+        if not note_ids:
+            return
+        self.store.mark_dirty(note_ids)
+        logger.debug(f"Marked {len(note_ids)} note caches dirty")
+        with self._wake:
+            self._wake.notify_all()
+
+    def notes_for_tags(self, tag_ids: Iterable[str]) -> List[str]:
+        """Get the notes carrying any of the tags or their descendants.
+
+        Args:
+            tag_ids: Tag IDs (hex strings)
+
+        Returns:
+            Note IDs (hex strings)
+        """
+        index = get_tag_index(self._database())
+        subtree = {tag for tag_id in tag_ids for tag in index.descendants(tag_id)}
+        if not subtree:
+            return []
+        notes = self._database().search_notes(tag_id_groups=[sorted(subtree)])
+        return [note["id"] for note in notes]
+
+    def mark_tags(self, tag_ids: Iterable[str]) -> None:
+        """Mark the caches of notes carrying the tags or their descendants.
+
+        Args:
+            tag_ids: Tag IDs (hex strings)
+        """
+        self.mark_notes(self.notes_for_tags(tag_ids))
+
+    def mark_all(self) -> None:
+        """Mark every note's caches as stale."""
+        self.mark_notes(note["id"] for note in self._database().get_all_notes())
+
+    def mark_changes(self, changes: ChangeSet) -> None:
+        """Mark the notes a write or sync touched, directly or through tags.
+
+        Args:
+            changes: Change set of the write or sync; an incomplete one
+                marks every note
+        """
+        if not changes.complete:
+            self.mark_all()
+            return
+        tag_ids = changes.created_tags | changes.updated_tags | changes.deleted_tags
+        self.mark_notes(
+            (changes.created_notes | changes.updated_notes | set(self.notes_for_tags(tag_ids)))
+            - changes.deleted_notes
+        )
+
+    # ===== Reading =====
+
+    def is_dirty(self, note_id: str) -> bool:
+        """Whether a note's caches are waiting to be rebuilt."""
+        return self.store.is_dirty(note_id)
+
+    def pending(self) -> int:
+        """Number of notes waiting to be rebuilt."""
+        return self.store.dirty_count()
+
+    def request(self, note_id: str) -> None:
+        """Rebuild a note's caches ahead of the rest of the dirty set.
+
+        Used by readers that found the note's cache stale or missing. The
+        note is rebuilt by the worker; listeners report when it is done.
+
+        Args:
+            note_id: Note ID (hex string)
+        """
+        with self._wake:
+            if note_id not in self._requested:
+                self._requested.append(note_id)
+            self._wake.notify_all()
+
+    def add_listener(self, listener: Callable[[List[str]], None]) -> None:
+        """Call `listener(note_ids)` after each rebuilt batch."""
+        with self._wake:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[List[str]], None]) -> None:
+        """Stop calling a listener added with add_listener()."""
+        with self._wake:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    # ===== Worker =====
+
+    def start(self) -> None:
+        """Start the worker thread (does nothing if already running)."""
+        if self.is_running():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="cache-invalidator", daemon=True)
+        self._thread.start()
+        logger.info("Cache invalidation worker started")
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the worker after the batch in progress.
+
+        Notes still dirty stay marked for the next start or rebuild.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish
+        """
+        self._stop.set()
+        with self._wake:
+            self._wake.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        logger.info("Cache invalidation worker stopped")
+
+    def is_running(self) -> bool:
+        """Whether the worker thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def drain(self) -> int:
+        """Rebuild every dirty or requested note on the calling thread.
+
+        For command-line use and tests; interactive callers use the worker.
+
+        Returns:
+            Number of notes rebuilt
+        """
+        rebuilt = 0
+        while True:
+            count = self._rebuild_batch()
+            if count is None:
+                return rebuilt
+            rebuilt += count
+
+    def _loop(self) -> None:
+        """Worker thread: rebuild batches until stopped."""
+        while not self._stop.is_set():
+            try:
+                if self._rebuild_batch() is not None:
+                    continue
+            except Exception as e:
+                logger.error(f"Cache invalidation batch failed: {e}")
+            with self._wake:
+                if not self._requested and not self._stop.is_set():
+                    self._wake.wait(self.poll_interval)
+
+    def _rebuild_batch(self) -> Optional[int]:
+        """Rebuild the next batch of requested and dirty notes.
+
+        Returns:
+            Number of notes rebuilt, or None if there was nothing to do
+        """
+        with self._rebuild_lock:
+            with self._wake:
+                requested = self._requested[:self.batch_size]
+                del self._requested[:self.batch_size]
+            marks = self.store.dirty(note_ids=requested) if requested else {}
+            marks.update(self.store.dirty(self.batch_size - len(requested)))
+            batch = requested + [note_id for note_id in marks if note_id not in requested]
+            if not batch:
+                return None
+
+            db = self._database()
+            result = db.rebuild_caches_for_notes(batch)
+            # Marks are cleared for failed notes too (most likely deleted),
+            # so they are not retried forever; without a fingerprint they
+            # are still picked up by the next full rebuild
+            self.store.clear_dirty(marks)
+            for error in result["errors"]:
+                logger.warning(f"Cache rebuild failed: {error}")
+            logger.debug(f"Rebuilt caches of {result['notes_rebuilt']} dirty notes")
+
+        rebuilt = result["rebuilt_note_ids"]
+        if rebuilt:
+            with self._wake:
+                listeners = list(self._listeners)
+            for listener in listeners:
+                try:
+                    listener(rebuilt)
+                except Exception as e:
+                    logger.warning(f"Cache invalidation listener failed: {e}")
+        return len(rebuilt)
+
+    def _database(self) -> Database:
+        """The database, which must still be open."""
+        db = self._db()
+        if db is None:
+            raise RuntimeError("Database of the cache invalidator was closed")
+        return db
+
+
+_invalidators: "weakref.WeakKeyDictionary[Database, CacheInvalidator]" = weakref.WeakKeyDictionary()
+_invalidators_lock = threading.Lock()
+
+
+def get_cache_invalidator(db: Database) -> CacheInvalidator:
+    """Get the shared cache invalidator of a database.
+
+    Args:
+        db: Database connection
+
+    Returns:
+        CacheInvalidator for the database (worker not started)
+    """
+    with _invalidators_lock:
+        invalidator = _invalidators.get(db)
+        if invalidator is None:
+            invalidator = CacheInvalidator(db, get_cache_fingerprints(db))
+            _invalidators[db] = invalidator
+        return invalidator
+
+
+def has_cache_invalidator(db: Database) -> bool:
+    """Check whether a database has a cache invalidator.
+
+    Only the GUI and TUI create one; writes from other front ends need not
+    mark caches dirty.
+
+    Args:
+        db: Database connection
+    """
+    with _invalidators_lock:
+        return db in _invalidators
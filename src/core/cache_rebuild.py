@@ -0,0 +1,385 @@
+"""Incremental, resumable rebuild of the note display caches.
+
+Each note has two display caches (note pane and list pane) built from its
+content, its tags and their full paths, conflicts, attachments, audio files
+and transcriptions. Rebuilding every cache from scratch takes a long time
+on a large database, so rebuild_caches():
+
+- fingerprints each note's cache inputs (read in bulk) and skips notes
+  whose fingerprint matches the one recorded when their caches were last
+  rebuilt
+- rebuilds the remaining notes in batches, each batch spread over several
+  worker connections, and reports progress after every batch
+- records fingerprints after every batch, so a cancelled or interrupted
+  run continues where it stopped when run again
+
+Fingerprints are kept in a sidecar SQLite file next to the database
+("<database>.cachestate"); in-memory databases keep them in memory. The
+same file holds the dirty set of cache_invalidation: notes a write marked
+as stale count as stale here too, and rebuilding them clears their mark.
+
+CRITICAL: This module must have NO Qt/PySide6 dependencies.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .database import Database
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "CacheFingerprints",
+    "CacheRebuildSummary",
+    "compute_fingerprints",
+    "get_cache_fingerprints",
+    "rebuild_caches",
+    "DEFAULT_BATCH_SIZE",
+    "DEFAULT_WORKERS",
+]
+
+# Bump when the cache format changes so every note is rebuilt once
+CACHE_STATE_VERSION = 1
+
+# Notes rebuilt per batch (progress, cancellation and fingerprints are
+# handled between batches)
+DEFAULT_BATCH_SIZE = 200
+
+# Worker connections per batch
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+
+@dataclass
+class CacheRebuildSummary:
+    """Outcome of rebuild_caches().
+
+    Attributes:
+        notes_total: Notes considered
+        notes_skipped: Notes whose caches were already up to date
+        notes_rebuilt: Notes whose caches were rebuilt
+        errors: Error messages of notes that could not be rebuilt
+        cancelled: True if the run stopped before all stale notes were rebuilt
+        duration: Wall-clock seconds taken
+    """
+
+    notes_total: int = 0
+    notes_skipped: int = 0
+    notes_rebuilt: int = 0
+    errors: List[str] = field(default_factory=list)
+    cancelled: bool = False
+    duration: float = 0.0
+
+    @property
+    def notes_pending(self) -> int:
+        """Stale notes left over (failed, or not reached before cancelling)."""
+        return self.notes_total - self.notes_skipped - self.notes_rebuilt
+
+
+class CacheFingerprints:
+    """Fingerprints of the inputs each note's caches were last built from,
+    and the dirty set of notes whose caches a write made stale.
+
+    Thread-safe. A note without a fingerprint, or marked dirty, is rebuilt
+    by the next rebuild_caches() run.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Open (or create) a fingerprint store.
+
+        Args:
+            path: Sidecar file path, or None to keep fingerprints in memory
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._last_mark = 0
+        # Several processes may share the file (GUI, CLI, web server)
+        self._conn = sqlite3.connect(path or ":memory:", timeout=5.0, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS note_fingerprints "
+                "(note_id TEXT PRIMARY KEY, fingerprint TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS dirty_notes "
+                "(note_id TEXT PRIMARY KEY, marked_at INTEGER NOT NULL)"
+            )
+
+    @staticmethod
+    def sidecar_path(db_path: str) -> str:
+        """Path of the fingerprint store for a database file."""
+        return f"{db_path}.cachestate"
+
+    def load(self) -> Dict[str, str]:
+        """Get all fingerprints, keyed by note ID."""
+        with self._lock:
+            return dict(self._conn.execute("SELECT note_id, fingerprint FROM note_fingerprints"))
+
+    def store(self, fingerprints: Dict[str, str]) -> None:
+        """Record fingerprints of notes whose caches were just rebuilt."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO note_fingerprints (note_id, fingerprint) VALUES (?, ?)",
+                fingerprints.items(),
+            )
+
+    def discard(self, note_ids: Iterable[str]) -> None:
+        """Forget notes' fingerprints so their caches count as stale."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM note_fingerprints WHERE note_id = ?",
+                ((note_id,) for note_id in note_ids),
+            )
+
+    def clear(self) -> None:
+        """Forget all fingerprints."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM note_fingerprints")
+
+    def mark_dirty(self, note_ids: Iterable[str]) -> None:
+        """Add notes to the dirty set and forget their fingerprints."""
+        with self._lock, self._conn:
+            # Strictly increasing, so a mark made while a rebuild runs is
+            # never mistaken for one the rebuild covered
+            self._last_mark = max(time.time_ns(), self._last_mark + 1)
+            rows = [(note_id, self._last_mark) for note_id in set(note_ids)]
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO dirty_notes (note_id, marked_at) VALUES (?, ?)", rows
+            )
+            self._conn.executemany(
+                "DELETE FROM note_fingerprints WHERE note_id = ?", ((row[0],) for row in rows)
+            )
+
+    def dirty(
+        self, limit: Optional[int] = None, note_ids: Optional[Iterable[str]] = None
+    ) -> Dict[str, int]:
+        """Get dirty notes, oldest mark first.
+
+        Args:
+            limit: Maximum number of notes (default: all)
+            note_ids: Only consider these notes (default: all)
+
+        Returns:
+            Mark of each note, to be passed back to clear_dirty()
+        """
+        if note_ids is not None:
+            wanted = list(note_ids)
+            with self._lock:
+                return dict(self._conn.execute(
+                    "SELECT note_id, marked_at FROM dirty_notes WHERE note_id IN "
+                    f"({', '.join('?' * len(wanted))}) ORDER BY marked_at",
+                    wanted,
+                )) if wanted else {}
+        with self._lock:
+            return dict(self._conn.execute(
+                "SELECT note_id, marked_at FROM dirty_notes ORDER BY marked_at LIMIT ?",
+                (-1 if limit is None else limit,),
+            ))
+
+    def dirty_count(self) -> int:
+        """Number of notes in the dirty set."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM dirty_notes").fetchone()[0]
+
+    def is_dirty(self, note_id: str) -> bool:
+        """Whether a note is in the dirty set."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM dirty_notes WHERE note_id = ?", (note_id,)
+            ).fetchone() is not None
+
+    def clear_dirty(self, marks: Dict[str, int]) -> None:
+        """Remove notes from the dirty set after rebuilding them.
+
+        Notes marked again since `marks` was read stay dirty.
+
+        Args:
+            marks: Marks as returned by dirty()
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM dirty_notes WHERE note_id = ? AND marked_at <= ?", marks.items()
+            )
+
+    def close(self) -> None:
+        """Close the store."""
+        with self._lock:
+            self._conn.close()
+
+
+_stores: "weakref.WeakKeyDictionary[Database, CacheFingerprints]" = weakref.WeakKeyDictionary()
+_stores_lock = threading.Lock()
+
+
+def get_cache_fingerprints(db: Database) -> CacheFingerprints:
+    """Get the shared fingerprint store of a database.
+
+    Args:
+        db: Database connection
+
+    Returns:
+        CacheFingerprints for the database
+    """
+    with _stores_lock:
+        store = _stores.get(db)
+        if store is None:
+            path = None if db.path == ":memory:" else CacheFingerprints.sidecar_path(db.path)
+            store = CacheFingerprints(path)
+            _stores[db] = store
+        return store
+
+
+def _digest(value: Any) -> str:
+    """Stable digest of a JSON-serializable value."""
+    encoded = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def compute_fingerprints(db: Database, note_ids: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """Fingerprint the cache inputs of notes.
+
+    A fingerprint covers the note row, its tag rows and those of their
+    ancestors (full paths), its attachments with their audio files and
+    transcriptions, its conflicts, and the cache registry. Rows are read in
+    bulk rather than note by note.
+
+    Args:
+        db: Database connection
+        note_ids: Notes to fingerprint (default: all non-deleted notes)
+
+    Returns:
+        Fingerprint per note ID
+    """
+    dataset = db.get_full_dataset()
+    wanted = set(note_ids) if note_ids is not None else {note["id"] for note in db.get_all_notes()}
+
+    tag_rows = {tag["id"]: tag for tag in dataset.get("tags", [])}
+    tag_digests: Dict[str, str] = {}
+
+    def tag_digest(tag_id: str) -> str:
+        # A tag's full path changes when any ancestor is renamed or moved
+        if tag_id not in tag_digests:
+            chain: List[Dict[str, Any]] = []
+            current: Optional[str] = tag_id
+            while current in tag_rows and len(chain) <= len(tag_rows):
+                chain.append(tag_rows[current])
+                current = tag_rows[current].get("parent_id")
+            tag_digests[tag_id] = _digest(chain)
+        return tag_digests[tag_id]
+
+    inputs: Dict[str, List[str]] = {note_id: [] for note_id in wanted}
+    for row in dataset.get("note_tags", []):
+        if row.get("note_id") in inputs:
+            inputs[row["note_id"]].append(_digest([row, tag_digest(row.get("tag_id"))]))
+
+    audio_rows = {audio["id"]: audio for audio in dataset.get("audio_files", [])}
+    attachments = [row for row in dataset.get("note_attachments", []) if row.get("note_id") in inputs]
+    attached_audio = sorted({row.get("attachment_id") for row in attachments} & audio_rows.keys())
+    transcriptions = db.get_transcriptions_for_audio_files(attached_audio) if attached_audio else {}
+    audio_digests = {
+        audio_id: _digest([audio_rows[audio_id], transcriptions.get(audio_id, [])])
+        for audio_id in attached_audio
+    }
+    for row in attachments:
+        inputs[row["note_id"]].append(_digest([row, audio_digests.get(row.get("attachment_id"))]))
+
+    conflicts = db.get_conflict_types_for_notes(list(wanted)) if wanted else {}
+    registry = db.get_cache_registry_info()
+
+    fingerprints: Dict[str, str] = {}
+    for note in dataset.get("notes", []):
+        note_id = note["id"]
+        if note_id in inputs:
+            fingerprints[note_id] = _digest([
+                CACHE_STATE_VERSION,
+                registry,
+                note,
+                sorted(inputs[note_id]),
+                sorted(conflicts.get(note_id, [])),
+            ])
+    return fingerprints
+
+
+def rebuild_caches(
+    db: Database,
+    force: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int = DEFAULT_WORKERS,
+    progress: Optional[Callable[[int, int], None]] = None,
+    cancel: Optional[threading.Event] = None,
+) -> CacheRebuildSummary:
+    """Rebuild the display caches of notes whose cache inputs changed.
+
+    Args:
+        db: Database connection
+        force: Rebuild every note, ignoring recorded fingerprints
+        batch_size: Notes rebuilt per batch
+        workers: Worker connections per batch
+        progress: Called as progress(processed, stale_total) before the
+            first batch and after each batch
+        cancel: Set to stop after the current batch
+
+    Returns:
+        CacheRebuildSummary of the run
+    """
+    started = time.monotonic()
+    store = get_cache_fingerprints(db)
+    if force:
+        store.clear()
+
+    dirty = store.dirty()
+    notes = db.get_all_notes()
+    fingerprints = compute_fingerprints(db, [note["id"] for note in notes])
+    recorded = store.load()
+    store.discard(set(recorded) - set(fingerprints))  # Deleted notes
+    store.clear_dirty({note_id: mark for note_id, mark in dirty.items() if note_id not in fingerprints})
+
+    stale = [
+        note["id"] for note in notes
+        if note["id"] in dirty
+        or not note.get("display_cache")
+        or not note.get("list_display_cache")
+        or note["id"] not in fingerprints
+        or recorded.get(note["id"]) != fingerprints[note["id"]]
+    ]
+    summary = CacheRebuildSummary(notes_total=len(notes), notes_skipped=len(notes) - len(stale))
+    logger.info(f"Cache rebuild: {len(stale)} of {len(notes)} notes stale")
+
+    if progress:
+        progress(0, len(stale))
+    for start in range(0, len(stale), max(1, batch_size)):
+        if cancel is not None and cancel.is_set():
+            summary.cancelled = True
+            logger.info(f"Cache rebuild cancelled with {summary.notes_pending} notes left")
+            break
+        batch = stale[start:start + max(1, batch_size)]
+        result = db.rebuild_caches_for_notes(batch, workers)
+        # Fingerprints were taken before the rebuild: a note edited since is
+        # rebuilt once more by the next run rather than wrongly skipped
+        store.store({
+            note_id: fingerprints[note_id]
+            for note_id in result["rebuilt_note_ids"] if note_id in fingerprints
+        })
+        store.clear_dirty({
+            note_id: dirty[note_id] for note_id in result["rebuilt_note_ids"] if note_id in dirty
+        })
+        summary.notes_rebuilt += result["notes_rebuilt"]
+        summary.errors.extend(result["errors"])
+        if progress:
+            progress(start + len(batch), len(stale))
+
+    summary.duration = time.monotonic() - started
+    logger.info(
+        f"Cache rebuild: {summary.notes_rebuilt} rebuilt, {summary.notes_skipped} skipped, "
+        f"{len(summary.errors)} errors in {summary.duration:.1f}s"
+    )
+    return summary
@@ -102,6 +102,13 @@ class Config:
         """Set the sync server port."""
         self._rust_config.set_sync_server_port(port)
 
+    def get_sync_interval(self) -> float:
+        """Get the automatic sync interval in seconds (0 if disabled)."""
+        try:
+            return max(float(self.get("sync_interval", 0)), 0.0)
+        except (TypeError, ValueError):
+            return 0.0
+
     def get_peers(self) -> List[Dict[str, Any]]:
         """Get list of sync peers."""
         return self._rust_config.get_peers()
@@ -254,14 +254,7 @@ class ConflictManager:
         Returns:
             True if the note has unresolved conflicts
         """
-        note_id_lower = note_id.lower()
-        for c in self.get_note_content_conflicts():
-            if c.note_id.lower().startswith(note_id_lower):
-                return True
-        for c in self.get_note_delete_conflicts():
-            if c.note_id.lower().startswith(note_id_lower):
-                return True
-        return False
+        return bool(self.db.get_note_conflict_types(note_id))
 
     def get_note_conflict_types(self, note_id: str) -> List[str]:
         """Get the types of unresolved conflicts for a note.
@@ -272,17 +265,18 @@ class ConflictManager:
         Returns:
             List of conflict type strings (e.g., ["content", "delete"])
         """
-        note_id_lower = note_id.lower()
-        types = []
-        for c in self.get_note_content_conflicts():
-            if c.note_id.lower().startswith(note_id_lower):
-                if "content" not in types:
-                    types.append("content")
-        for c in self.get_note_delete_conflicts():
-            if c.note_id.lower().startswith(note_id_lower):
-                if "delete" not in types:
-                    types.append("delete")
-        return types
+        return self.db.get_note_conflict_types(note_id)
+
+    def get_conflict_types_for_notes(self, note_ids: List[str]) -> Dict[str, List[str]]:
+        """Get the types of unresolved conflicts for several notes.
+
+        Args:
+            note_ids: Note IDs (UUID hex, each can be a partial prefix)
+
+        Returns:
+            Dict mapping each note ID to its conflict types (empty if none)
+        """
+        return self.db.get_conflict_types_for_notes(note_ids)
 
     def resolve_note_content_conflict(
         self,
@@ -12,8 +12,10 @@ CRITICAL: This module must have NO Qt/PySide6 dependencies.
 from __future__ import annotations
 
 import logging
+import sqlite3
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypedDict, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TypedDict, Union
 
 
 class TagChangeResult(TypedDict):
@@ -22,6 +24,13 @@ class TagChangeResult(TypedDict):
     note_id: str
     list_cache_rebuilt: bool
 
+
+class BatchTagChangeResult(TypedDict):
+    """Result of a batch tag change (add/remove tags on many notes)."""
+    changed: int
+    note_ids: List[str]
+    list_caches_rebuilt: int
+
 # Import Database from the Rust extension
 from voicecore import Database as RustDatabase
 from voicecore import set_local_device_id as _rust_set_local_device_id
@@ -44,6 +53,56 @@ def set_local_device_id(device_id: Union[bytes, str]) -> None:
 __all__ = ["Database", "set_local_device_id"]
 
 
+class _ChangeCounter:
+    """Database change counter persisted in a ``<db>.version`` sidecar.
+
+    Every process sharing the database (web workers, GUI, CLI, sync
+    server) bumps the same counter when it sees the database change, so
+    the value survives restarts and agrees between processes. A change
+    seen by several processes may bump it more than once; it never goes
+    back and never misses a commit.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Open (or create) a counter.
+
+        Args:
+            path: Sidecar file path, or None to keep the counter in memory
+        """
+        self._lock = threading.Lock()
+        self._seen: Any = None
+        self._conn = sqlite3.connect(path or ":memory:", timeout=5.0, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS change_counter "
+                "(id INTEGER PRIMARY KEY CHECK (id = 1), value INTEGER NOT NULL)"
+            )
+            self._conn.execute("INSERT OR IGNORE INTO change_counter (id, value) VALUES (1, 0)")
+
+    @staticmethod
+    def sidecar_path(db_path: str) -> str:
+        """Path of the counter for a database file."""
+        return f"{db_path}.version"
+
+    def value(self, local_version: Any) -> int:
+        """Get the counter, bumping it first if the database changed.
+
+        Args:
+            local_version: This process's view of the database version; the
+                counter is bumped whenever it differs from the last call's
+        """
+        with self._lock:
+            if local_version != self._seen:
+                with self._conn:
+                    self._conn.execute("UPDATE change_counter SET value = value + 1 WHERE id = 1")
+                self._seen = local_version
+            return self._conn.execute("SELECT value FROM change_counter WHERE id = 1").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
 class Database:
     """Wrapper around the Rust Database for backward compatibility.
 
@@ -51,15 +110,61 @@ class Database:
     but delegates to the Rust implementation.
     """
 
-    def __init__(self, db_path: Union[Path, str]) -> None:
+    def __init__(self, db_path: Union[Path, str], pool_size: int = 0) -> None:
         """Initialize database connection.
 
+        The handle is safe to share between threads. Writes are serialised
+        on a single connection; with ``pool_size`` > 0 bulk reads (note and
+        tag listings, searches, sync change feeds) are spread over that many
+        additional read connections so concurrent readers do not queue
+        behind each other.
+
         Args:
             db_path: Path to the SQLite database file, or ':memory:' for in-memory
+            pool_size: Number of extra read connections (ignored for ':memory:')
         """
         path_str = str(db_path) if isinstance(db_path, Path) else db_path
-        self._rust_db = RustDatabase(path_str)
-        logger.info(f"Opened Rust database at {path_str}")
+        self._path = path_str
+        self._rust_db = RustDatabase(path_str, pool_size)
+        self._changes = _ChangeCounter(
+            None if path_str == ":memory:" else _ChangeCounter.sidecar_path(path_str)
+        )
+        logger.info(
+            f"Opened Rust database at {path_str} "
+            f"({self._rust_db.pool_size} pooled readers)"
+        )
+
+    @property
+    def path(self) -> str:
+        """Path of the database file, or ':memory:'."""
+        return self._path
+
+    @property
+    def pool_size(self) -> int:
+        """Number of pooled read connections."""
+        return self._rust_db.pool_size
+
+    @property
+    def change_version(self) -> int:
+        """Counter that increases after every write to the database.
+
+        Persisted next to the database file, so it keeps increasing across
+        restarts and is shared by every process using the database. Writes
+        made by other processes (other web workers, the GUI, a sync server)
+        are picked up through SQLite's data_version.
+        """
+        return self._changes.value(self._rust_db.local_data_version)
+
+    def get_data_version(self) -> str:
+        """Get a token that changes whenever the database contents change.
+
+        No database rows are read, so this is cheap enough to call on every
+        request.
+
+        Returns:
+            Opaque version string
+        """
+        return str(self.change_version)
 
     def get_all_notes(self) -> List[Dict[str, Any]]:
         """Get all non-deleted notes."""
@@ -113,6 +218,18 @@ class Database:
         """Get all non-deleted tags."""
         return self._rust_db.get_all_tags()
 
+    def get_tag_note_counts(self, include_descendants: bool = False) -> Dict[str, int]:
+        """Get the number of notes carrying each tag.
+
+        Args:
+            include_descendants: Count notes tagged with any descendant as
+                well (each note counted once per tag)
+
+        Returns:
+            Mapping of tag ID hex string to note count
+        """
+        return self._rust_db.get_tag_note_counts(include_descendants)
+
     def get_tag_descendants(self, tag_id: Union[bytes, str]) -> List[bytes]:
         """Get all descendant tag IDs for a tag."""
         if isinstance(tag_id, bytes):
@@ -160,8 +277,21 @@ class Database:
         self,
         text_query: Optional[str] = None,
         tag_id_groups: Optional[List[List[Union[bytes, str]]]] = None,
+        transcript_query: Optional[str] = None,
+        include_transcriptions: bool = False,
     ) -> List[Dict[str, Any]]:
-        """Search notes by text and/or tags."""
+        """Search notes by text and/or tags.
+
+        Args:
+            text_query: Text to search for in note content
+            tag_id_groups: Tag ID groups; notes must match one ID from every group
+            transcript_query: Only return notes whose transcriptions match
+                these words (full-text syntax, see full_text_search())
+            include_transcriptions: Let text_query match transcription text too
+
+        Returns:
+            List of matching note dicts, newest first.
+        """
         # Convert bytes to hex strings in tag_id_groups
         converted_groups = None
         if tag_id_groups is not None:
@@ -175,7 +305,84 @@ class Database:
                     else:
                         converted_group.append(tid)
                 converted_groups.append(converted_group)
-        return self._rust_db.search_notes(text_query, converted_groups)
+        return self._rust_db.search_notes(
+            text_query, converted_groups, transcript_query, include_transcriptions
+        )
+
+    def get_notes_page(
+        self,
+        limit: int,
+        after_created_at: Optional[int] = None,
+        after_id: Optional[str] = None,
+        text_query: Optional[str] = None,
+        tag_id_groups: Optional[List[List[Union[bytes, str]]]] = None,
+        transcript_query: Optional[str] = None,
+        include_transcriptions: bool = False,
+    ) -> Dict[str, Any]:
+        """Get one page of notes, newest first, optionally filtered by a search.
+
+        Pages are keyed on (created_at, id) rather than offsets: pass the
+        created_at and id of the last note from the previous page to get
+        the next one.
+
+        Args:
+            limit: Maximum number of notes to return
+            after_created_at: created_at of the last note on the previous page
+            after_id: ID of the last note on the previous page
+            text_query: Optional text to search for
+            tag_id_groups: Optional tag ID groups, as for search_notes()
+            transcript_query: Optional transcription filter, as for search_notes()
+            include_transcriptions: Let text_query match transcription text too
+
+        Returns:
+            Dict with 'notes' (list of note dicts) and 'has_more' (bool).
+        """
+        converted_groups = None
+        if tag_id_groups is not None:
+            converted_groups = [
+                [uuid_module.UUID(bytes=tid).hex if isinstance(tid, bytes) else tid for tid in group]
+                for group in tag_id_groups
+            ]
+        return self._rust_db.get_notes_page(
+            limit, after_created_at, after_id, text_query, converted_groups,
+            transcript_query, include_transcriptions,
+        )
+
+    def full_text_search(
+        self,
+        query: str,
+        limit: int = 50,
+        include_transcriptions: bool = True,
+        highlight: Tuple[str, str] = ("[", "]"),
+    ) -> List[Dict[str, Any]]:
+        """Ranked full-text search over note content and transcriptions.
+
+        Backed by an SQLite FTS5 index stored next to the database file
+        (`<db>.search`), which is brought up to date before each query.
+        Words are ANDed together, "quoted text" matches a phrase and a
+        trailing * matches a prefix.
+
+        Args:
+            query: Search query
+            limit: Maximum number of results
+            include_transcriptions: Also match transcription text
+            highlight: Strings placed before and after matched terms in snippets
+
+        Returns:
+            List of dicts with 'note' (note dict), 'score' (higher is better)
+            and 'snippet', best match first.
+        """
+        return self._rust_db.full_text_search(
+            query, limit, include_transcriptions, highlight[0], highlight[1]
+        )
+
+    def rebuild_search_index(self) -> int:
+        """Drop and rebuild the full-text search index.
+
+        Returns:
+            Number of notes indexed
+        """
+        return self._rust_db.rebuild_search_index()
 
     def create_tag(
         self, name: str, parent_id: Optional[Union[bytes, str]] = None
@@ -187,11 +394,20 @@ class Database:
         return self._rust_db.create_tag(name, parent_id)
 
     def rename_tag(self, tag_id: Union[bytes, str], new_name: str) -> bool:
-        """Rename a tag."""
+        """Rename a tag.
+
+        When the database has a cache invalidator (GUI, TUI), the caches of
+        notes carrying the tag or a descendant are marked dirty and rebuilt
+        in the background (see cache_invalidation).
+        """
         if isinstance(tag_id, bytes):
             import uuid
             tag_id = uuid.UUID(bytes=tag_id).hex
-        return self._rust_db.rename_tag(tag_id, new_name)
+        note_ids = self._tag_note_ids(tag_id)
+        changed = self._rust_db.rename_tag(tag_id, new_name)
+        if changed:
+            self._mark_caches_dirty(note_ids)
+        return changed
 
     def reparent_tag(
         self, tag_id: Union[bytes, str], new_parent_id: Optional[Union[bytes, str]] = None
@@ -211,7 +427,11 @@ class Database:
         if isinstance(new_parent_id, bytes):
             import uuid
             new_parent_id = uuid.UUID(bytes=new_parent_id).hex
-        return self._rust_db.reparent_tag(tag_id, new_parent_id)
+        note_ids = self._tag_note_ids(tag_id)
+        changed = self._rust_db.reparent_tag(tag_id, new_parent_id)
+        if changed:
+            self._mark_caches_dirty(note_ids)
+        return changed
 
     def delete_tag(self, tag_id: Union[bytes, str]) -> bool:
         """Soft delete a tag.
@@ -225,7 +445,40 @@ class Database:
         if isinstance(tag_id, bytes):
             import uuid
             tag_id = uuid.UUID(bytes=tag_id).hex
-        return self._rust_db.delete_tag(tag_id)
+        note_ids = self._tag_note_ids(tag_id)
+        changed = self._rust_db.delete_tag(tag_id)
+        if changed:
+            self._mark_caches_dirty(note_ids)
+        return changed
+
+    def _tag_note_ids(self, tag_id: str) -> List[str]:
+        """Get the notes carrying a tag or a descendant, for cache invalidation.
+
+        Looked up before a tag write, while a tag being deleted still has
+        its subtree. Empty without a cache invalidator, so CLI and web
+        writes skip the lookup; their caches are caught up by fingerprints
+        on the next rebuild_caches() run.
+        """
+        from .cache_invalidation import get_cache_invalidator, has_cache_invalidator
+
+        if not has_cache_invalidator(self):
+            return []
+        try:
+            return get_cache_invalidator(self).notes_for_tags([tag_id])
+        except Exception as e:
+            logger.warning(f"Could not look up notes of tag {tag_id}: {e}")
+            return []
+
+    def _mark_caches_dirty(self, note_ids: List[str]) -> None:
+        """Queue background rebuilds of notes' caches (see cache_invalidation)."""
+        from .cache_invalidation import get_cache_invalidator
+
+        if not note_ids:
+            return
+        try:
+            get_cache_invalidator(self).mark_notes(note_ids)
+        except Exception as e:
+            logger.warning(f"Could not mark {len(note_ids)} note caches dirty: {e}")
 
     def add_tag_to_note(
         self, note_id: Union[bytes, str], tag_id: Union[bytes, str]
@@ -265,6 +518,47 @@ class Database:
             tag_id = uuid.UUID(bytes=tag_id).hex
         return self._rust_db.remove_tag_from_note(note_id, tag_id)
 
+    def add_tags_to_notes(
+        self,
+        note_ids: Iterable[Union[bytes, str]],
+        tag_ids: Iterable[Union[bytes, str]],
+    ) -> BatchTagChangeResult:
+        """Add every tag to every note in one call.
+
+        Much faster than calling add_tag_to_note() per pair: the batch
+        holds the write lock once with the GIL released, and notes that
+        already carry a tag are skipped without a write or cache rebuild.
+        Each pair is written like add_tag_to_note(), so it syncs the same.
+
+        Returns:
+            BatchTagChangeResult with:
+            - changed: Number of note/tag pairs added
+            - note_ids: IDs of the notes that gained a tag
+            - list_caches_rebuilt: Number of list pane cache rebuilds
+        """
+        return self._rust_db.add_tags_to_notes(
+            [uuid_module.UUID(bytes=i).hex if isinstance(i, bytes) else i for i in note_ids],
+            [uuid_module.UUID(bytes=i).hex if isinstance(i, bytes) else i for i in tag_ids],
+        )
+
+    def remove_tags_from_notes(
+        self,
+        note_ids: Iterable[Union[bytes, str]],
+        tag_ids: Iterable[Union[bytes, str]],
+    ) -> BatchTagChangeResult:
+        """Remove every tag from every note in one call.
+
+        Returns:
+            BatchTagChangeResult with:
+            - changed: Number of note/tag pairs removed
+            - note_ids: IDs of the notes that lost a tag
+            - list_caches_rebuilt: Number of list pane cache rebuilds
+        """
+        return self._rust_db.remove_tags_from_notes(
+            [uuid_module.UUID(bytes=i).hex if isinstance(i, bytes) else i for i in note_ids],
+            [uuid_module.UUID(bytes=i).hex if isinstance(i, bytes) else i for i in tag_ids],
+        )
+
     def get_note_tags(self, note_id: Union[bytes, str]) -> List[Dict[str, Any]]:
         """Get all tags for a note."""
         if isinstance(note_id, bytes):
@@ -275,6 +569,7 @@ class Database:
     def close(self) -> None:
         """Close the database connection."""
         self._rust_db.close()
+        self._changes.close()
         logger.info("Closed Rust database connection")
 
     # ============================================================================
@@ -504,6 +799,22 @@ class Database:
         """Get counts of unresolved conflicts by type."""
         return self._rust_db.get_unresolved_conflict_counts()
 
+    def get_note_conflict_types(self, note_id: str) -> List[str]:
+        """Get unresolved conflict types ("content", "delete") for a note.
+
+        Looks the note up in the conflict tables by note_id range instead
+        of reading every conflict row. note_id may be a prefix.
+        """
+        return self._rust_db.get_note_conflict_types(note_id)
+
+    def get_conflict_types_for_notes(self, note_ids: List[str]) -> Dict[str, List[str]]:
+        """Get unresolved conflict types for several notes at once.
+
+        Returns:
+            Dict mapping each given note ID to its conflict types (may be empty)
+        """
+        return self._rust_db.get_conflict_types_for_notes(list(note_ids))
+
     def get_note_content_conflicts(
         self, include_resolved: bool = False
     ) -> List[Dict[str, Any]]:
@@ -594,6 +905,17 @@ class Database:
         """
         return self._rust_db.get_audio_files_for_note(note_id)
 
+    def get_notes_for_audio_file(self, audio_file_id: str) -> List[str]:
+        """Get the notes an audio file is attached to.
+
+        Args:
+            audio_file_id: Audio file UUID hex string
+
+        Returns:
+            List of note UUID hex strings
+        """
+        return self._rust_db.get_notes_for_audio_file(audio_file_id)
+
     def get_all_audio_files(self) -> List[Dict[str, Any]]:
         """Get all audio files in the database.
 
@@ -665,6 +987,25 @@ class Database:
         """
         return self._rust_db.get_attachments_for_note(note_id)
 
+    def get_attachments_with_audio_files(
+        self, note_id: str, include_transcriptions: bool = False
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Get all attachments for a note with their audio files inline.
+
+        Fetches everything in a single call instead of one get_audio_file()
+        per attachment. Audio file attachments carry an 'audio_file' dict;
+        with include_transcriptions that dict also has a 'transcriptions'
+        list.
+
+        Args:
+            note_id: Note UUID hex string
+            include_transcriptions: Also return each audio file's transcriptions
+
+        Returns:
+            List of attachment dicts, or None if the note does not exist
+        """
+        return self._rust_db.get_attachments_with_audio_files(note_id, include_transcriptions)
+
     def get_attachment(self, association_id: str) -> Optional[Dict[str, Any]]:
         """Get an attachment by association ID.
 
@@ -803,6 +1144,19 @@ class Database:
         """
         return self._rust_db.get_transcriptions_for_audio_file(audio_file_id)
 
+    def get_transcriptions_for_audio_files(
+        self, audio_file_ids: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the transcriptions of many audio files in one call.
+
+        Args:
+            audio_file_ids: Audio file UUID hex strings
+
+        Returns:
+            Dict of audio file ID to its list of transcription dicts
+        """
+        return self._rust_db.get_transcriptions_for_audio_files(audio_file_ids)
+
     def delete_transcription(self, transcription_id: str) -> bool:
         """Soft delete a transcription.
 
@@ -920,6 +1274,28 @@ class Database:
             "errors": errors,
         }
 
+    def rebuild_caches_for_notes(
+        self, note_ids: Iterable[Union[bytes, str]], workers: int = 1
+    ) -> Dict[str, Any]:
+        """Rebuild ALL cache fields for some notes.
+
+        Args:
+            note_ids: Note UUIDs (bytes or hex strings)
+            workers: Threads to spread the notes over, each with its own
+                connection (file-backed databases only)
+
+        Returns:
+            Summary dict with:
+            - notes_rebuilt: Number of notes rebuilt
+            - rebuilt_note_ids: IDs of the notes rebuilt
+            - errors: List of error messages (if any)
+        """
+        rebuilt, errors = self._rust_db.rebuild_caches_for_notes(
+            [uuid_module.UUID(bytes=i).hex if isinstance(i, bytes) else i for i in note_ids],
+            workers,
+        )
+        return {"notes_rebuilt": len(rebuilt), "rebuilt_note_ids": rebuilt, "errors": errors}
+
     def get_cache_registry_info(self) -> List[Dict[str, str]]:
         """Get information about all registered cache fields.
 
@@ -1,7 +1,8 @@
 """Data models for the Voice application.
 
 This module defines immutable dataclasses representing the core entities:
-Note, Tag, NoteAttachment, and AudioFile.
+Note, Tag, NoteAttachment, and AudioFile, plus ChangeSet, the ids touched
+by a write or sync.
 
 All IDs are UUID7 stored as bytes (16 bytes).
 """
@@ -11,7 +12,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, FrozenSet, Iterable, Optional
 
 # Length of short UUID display (e.g., "019b8ffd5711" instead of full 32-char UUID)
 UUID_SHORT_LEN = 12
@@ -149,5 +150,83 @@ class AudioFile:
     deleted_at: Optional[datetime] = None
 
 
+@dataclass(frozen=True)
+class ChangeSet:
+    """IDs of notes and tags created, updated or deleted by a write or sync.
+
+    User interfaces apply a change set to update only the affected list
+    rows and tree nodes instead of reloading everything.
+
+    Attributes:
+        created_notes: IDs (hex) of new or restored notes
+        updated_notes: IDs (hex) of changed notes, including tag changes
+        deleted_notes: IDs (hex) of deleted notes
+        created_tags: IDs (hex) of new tags
+        updated_tags: IDs (hex) of renamed or moved tags
+        deleted_tags: IDs (hex) of deleted tags
+        complete: False if what changed is unknown; reload everything
+    """
+
+    created_notes: FrozenSet[str] = frozenset()
+    updated_notes: FrozenSet[str] = frozenset()
+    deleted_notes: FrozenSet[str] = frozenset()
+    created_tags: FrozenSet[str] = frozenset()
+    updated_tags: FrozenSet[str] = frozenset()
+    deleted_tags: FrozenSet[str] = frozenset()
+    complete: bool = True
+
+    @property
+    def has_note_changes(self) -> bool:
+        """Whether any note was touched (or it is unknown)."""
+        return not self.complete or bool(
+            self.created_notes or self.updated_notes or self.deleted_notes
+        )
+
+    @property
+    def has_tag_changes(self) -> bool:
+        """Whether any tag was touched (or it is unknown)."""
+        return not self.complete or bool(
+            self.created_tags or self.updated_tags or self.deleted_tags
+        )
+
+    def merge(self, other: ChangeSet) -> ChangeSet:
+        """Combine two change sets, the other one being the later.
+
+        An ID deleted after being created or updated ends up deleted only;
+        one created again after being deleted ends up created only.
+        """
+        deleted_notes = (self.deleted_notes - other.created_notes) | other.deleted_notes
+        deleted_tags = (self.deleted_tags - other.created_tags) | other.deleted_tags
+        created_notes = (self.created_notes | other.created_notes) - deleted_notes
+        created_tags = (self.created_tags | other.created_tags) - deleted_tags
+        return ChangeSet(
+            created_notes=created_notes,
+            updated_notes=(self.updated_notes | other.updated_notes) - deleted_notes - created_notes,
+            deleted_notes=deleted_notes,
+            created_tags=created_tags,
+            updated_tags=(self.updated_tags | other.updated_tags) - deleted_tags - created_tags,
+            deleted_tags=deleted_tags,
+            complete=self.complete and other.complete,
+        )
+
+    @classmethod
+    def from_sync_results(cls, results: Iterable[Any]) -> ChangeSet:
+        """Combine the change sets of voicecore SyncResult objects."""
+        change_set = cls()
+        for result in results:
+            if not result.changes_known:
+                change_set = change_set.merge(cls(complete=False))
+                continue
+            change_set = change_set.merge(cls(
+                created_notes=frozenset(result.created_note_ids),
+                updated_notes=frozenset(result.updated_note_ids),
+                deleted_notes=frozenset(result.deleted_note_ids),
+                created_tags=frozenset(result.created_tag_ids),
+                updated_tags=frozenset(result.updated_tag_ids),
+                deleted_tags=frozenset(result.deleted_tag_ids),
+            ))
+        return change_set
+
+
 # Supported audio file formats for import
 AUDIO_FILE_FORMATS = frozenset(["mp3", "wav", "flac", "ogg", "opus", "m4a"])
@@ -11,7 +11,9 @@ CRITICAL: This module must have NO Qt/PySide6 dependencies.
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
 # Import from Rust extension
@@ -20,13 +22,12 @@ from voicecore import (
     SearchResult as RustSearchResult,
     parse_search_input as _rust_parse_search_input,
     execute_search as _rust_execute_search,
-    resolve_tag_term as _rust_resolve_tag_term,
-    get_tag_full_path as _rust_get_tag_full_path,
     find_ambiguous_tags as _rust_find_ambiguous_tags,
     build_tag_search_term as _rust_build_tag_search_term,
 )
 
 from .database import Database
+from .tag_index import get_tag_index
 
 logger = logging.getLogger(__name__)
 
@@ -39,8 +40,15 @@ __all__ = [
     "find_ambiguous_tags",
     "execute_search",
     "build_tag_search_term",
+    "SearchCache",
 ]
 
+# Number of recent searches kept by SearchCache
+SEARCH_CACHE_SIZE = 32
+
+# SQLite's LOWER() only folds ASCII letters; narrowing must do the same
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
 
 @dataclass
 class SearchResult:
@@ -64,14 +72,17 @@ class ParsedSearch:
     Attributes:
         tag_terms: List of tag search terms (without 'tag:' prefix)
         free_text: Free text search query
+        transcript_terms: Terms matched against transcription text only
+            (without 'transcript:' prefix; quoted phrases keep their quotes)
     """
 
     tag_terms: List[str]
     free_text: str
+    transcript_terms: List[str] = field(default_factory=list)
 
 
 def parse_search_input(search_input: str) -> ParsedSearch:
-    """Parse search input to extract tag: keywords and free text.
+    """Parse search input to extract tag: and transcript: keywords and free text.
 
     Uses the Rust implementation for parsing.
 
@@ -79,7 +90,7 @@ def parse_search_input(search_input: str) -> ParsedSearch:
         search_input: Raw search input string
 
     Returns:
-        ParsedSearch with extracted tag terms and free text.
+        ParsedSearch with extracted tag terms, transcript terms and free text.
     """
     if not search_input or not search_input.strip():
         return ParsedSearch(tag_terms=[], free_text="")
@@ -88,13 +99,14 @@ def parse_search_input(search_input: str) -> ParsedSearch:
     return ParsedSearch(
         tag_terms=list(rust_result.tag_terms),
         free_text=rust_result.free_text,
+        transcript_terms=list(rust_result.transcript_terms),
     )
 
 
 def get_tag_full_path(db: Database, tag_id: str) -> str:
     """Get the full hierarchical path for a tag.
 
-    This is a thin wrapper around the Rust implementation.
+    Answered from the shared tag index (see tag_index.get_tag_index).
 
     Args:
         db: Database connection
@@ -103,7 +115,7 @@ def get_tag_full_path(db: Database, tag_id: str) -> str:
     Returns:
         Full path like "Europe/France/Paris" or just "Work" for root tags.
     """
-    return _rust_get_tag_full_path(db._rust_db, tag_id)
+    return get_tag_index(db).full_path(tag_id)
 
 
 def resolve_tag_term(
@@ -111,7 +123,7 @@ def resolve_tag_term(
 ) -> Tuple[List[str], bool, bool]:
     """Resolve a tag search term to tag IDs.
 
-    This is a thin wrapper around the Rust implementation.
+    Answered from the shared tag index (see tag_index.get_tag_index).
 
     Args:
         db: Database connection
@@ -123,7 +135,7 @@ def resolve_tag_term(
         - Boolean indicating if the term was ambiguous (matched multiple tags)
         - Boolean indicating if the term was not found
     """
-    return _rust_resolve_tag_term(db._rust_db, tag_term)
+    return get_tag_index(db).resolve(tag_term)
 
 
 def find_ambiguous_tags(db: Database, tag_terms: List[str]) -> List[str]:
@@ -141,21 +153,28 @@ def find_ambiguous_tags(db: Database, tag_terms: List[str]) -> List[str]:
     return _rust_find_ambiguous_tags(db._rust_db, tag_terms)
 
 
-def execute_search(db: Database, search_input: str) -> SearchResult:
+def execute_search(
+    db: Database, search_input: str, include_transcriptions: bool = False
+) -> SearchResult:
     """Execute a full search operation.
 
     Parses the search input, resolves tags, and queries the database.
+    transcript:word (or transcript:"some words") keeps only notes whose
+    transcriptions match; both it and include_transcriptions are answered
+    from the full-text index.
     This is a thin wrapper around the Rust implementation.
 
     Args:
         db: Database connection
         search_input: Raw search input string
+        include_transcriptions: Let free text match transcription text as
+            well as note content
 
     Returns:
         SearchResult containing matching notes and metadata about the search.
     """
     # Call Rust implementation
-    rust_result = _rust_execute_search(db._rust_db, search_input)
+    rust_result = _rust_execute_search(db._rust_db, search_input, include_transcriptions)
 
     logger.info(f"Search returned {len(rust_result.notes)} notes")
     if rust_result.ambiguous_tags:
@@ -185,3 +204,157 @@ def build_tag_search_term(db: Database, tag_id: str, use_full_path: bool = False
         Search term like "tag:Work" or "tag:Europe/France/Paris"
     """
     return _rust_build_tag_search_term(db._rust_db, tag_id, use_full_path)
+
+
+@dataclass
+class _CachedSearch:
+    """A SearchCache entry."""
+
+    parsed: ParsedSearch
+    result: SearchResult
+
+
+def _can_narrow(old_input: str, old: ParsedSearch, new_input: str, new: ParsedSearch) -> bool:
+    """Check whether new_input only appends free text to old_input.
+
+    Appending characters to a single free-text word can only remove
+    matches, so the old result is a superset of the new one and is
+    filtered with a substring check. Free text of several words is
+    searched from scratch, since its words need not appear together in a
+    note. So is anything touching a qualifier (tag:, transcript:, is:) or
+    a quoted phrase.
+    """
+    if not new_input.startswith(old_input) or new_input == old_input:
+        return False
+    suffix = new_input[len(old_input):]
+    if ":" in suffix or '"' in suffix:
+        return False
+    old_words = old_input.split()
+    if old_words and not old_input[-1].isspace() and (":" in old_words[-1] or '"' in old_words[-1]):
+        return False
+    return (
+        old.tag_terms == new.tag_terms
+        and old.transcript_terms == new.transcript_terms
+        and len(new.free_text.split()) <= 1
+        and new.free_text.startswith(old.free_text)
+    )
+
+
+class SearchCache:
+    """LRU cache of recent search results for search-as-you-type.
+
+    Results are keyed by the search input and the include_transcriptions
+    flag, and are all dropped when Database.get_data_version() changes. A
+    search that only appends characters to the free text of a cached one
+    is answered by filtering the cached notes instead of querying the
+    database again, as long as the free text is a single word.
+
+    Safe to use from a worker thread while the UI thread reads it.
+    """
+
+    def __init__(self, db: Database, max_entries: int = SEARCH_CACHE_SIZE) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            db: Database connection
+            max_entries: Number of searches to keep
+        """
+        self.db = db
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Tuple[str, bool], _CachedSearch] = OrderedDict()
+        self._ambiguous: Dict[Tuple[str, ...], List[str]] = {}
+        self._version: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self._ambiguous.clear()
+
+    def _check_version(self) -> str:
+        """Drop everything if the database changed. Caller holds the lock."""
+        version = self.db.get_data_version()
+        if version != self._version:
+            self._entries.clear()
+            self._ambiguous.clear()
+            self._version = version
+        return version
+
+    def find_ambiguous_tags(self, tag_terms: List[str]) -> List[str]:
+        """Cached find_ambiguous_tags().
+
+        Args:
+            tag_terms: List of tag search terms
+
+        Returns:
+            List of tag terms that match multiple tags (formatted as "tag:term")
+        """
+        key = tuple(tag_terms)
+        with self._lock:
+            self._check_version()
+            cached = self._ambiguous.get(key)
+        if cached is not None:
+            return list(cached)
+        ambiguous = find_ambiguous_tags(self.db, tag_terms)
+        with self._lock:
+            self._ambiguous[key] = ambiguous
+        return list(ambiguous)
+
+    def search(self, search_input: str, include_transcriptions: bool = False) -> SearchResult:
+        """Run execute_search(), reusing recent results where possible.
+
+        Args:
+            search_input: Raw search input string
+            include_transcriptions: Let free text match transcription text as
+                well as note content
+
+        Returns:
+            SearchResult containing matching notes and metadata about the search.
+        """
+        search_input = search_input.strip()
+        key = (search_input, include_transcriptions)
+        with self._lock:
+            version = self._check_version()
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry.result
+            candidates = [
+                (cached_input, cached)
+                for (cached_input, cached_flag), cached in reversed(self._entries.items())
+                if not cached_flag and not include_transcriptions
+            ]
+
+        parsed = parse_search_input(search_input)
+        base = max(
+            (
+                (cached_input, cached)
+                for cached_input, cached in candidates
+                if _can_narrow(cached_input, cached.parsed, search_input, parsed)
+            ),
+            key=lambda item: len(item[0]),
+            default=None,
+        )
+        if base is not None:
+            needle = parsed.free_text.translate(_ASCII_LOWER)
+            cached = base[1].result
+            result = SearchResult(
+                notes=[
+                    note for note in cached.notes
+                    if needle in note.get("content", "").translate(_ASCII_LOWER)
+                ],
+                ambiguous_tags=cached.ambiguous_tags,
+                not_found_tags=cached.not_found_tags,
+            )
+            logger.debug(f"Narrowed cached search '{base[0]}' to '{search_input}'")
+        else:
+            result = execute_search(self.db, search_input, include_transcriptions)
+
+        with self._lock:
+            # Results computed against an older version are not kept
+            if self._version == version:
+                self._entries[key] = _CachedSearch(parsed=parsed, result=result)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return result
@@ -26,6 +26,7 @@ from uuid6 import uuid7
 
 from flask import Blueprint, Flask, jsonify, request
 
+from .cache_invalidation import get_cache_invalidator
 from .database import Database
 from .validation import uuid_to_hex, validate_uuid_hex
 
@@ -585,17 +586,85 @@ def apply_sync_changes(
     Returns:
         Tuple of (applied count, conflict count, error messages)
     """
+    changes = list(changes)  # Ensure it's a list
+    # Looked up before applying, while tags deleted by the peer still have
+    # their subtrees and detached audio files their notes
+    stale_note_ids = _notes_for_sync_changes(db, changes)
+
     # Delegate to Rust implementation via voicecore
     # The Rust function accepts both dict and dataclass objects
     result = _rust_apply_sync_changes(
         db._rust_db,
-        list(changes),  # Ensure it's a list
+        changes,
         peer_device_id,
         peer_device_name,
     )
+
+    # Caches of the affected notes are rebuilt in the background
+    if stale_note_ids:
+        try:
+            get_cache_invalidator(db).mark_notes(stale_note_ids)
+        except Exception as e:
+            logger.warning(f"Could not mark {len(stale_note_ids)} note caches dirty after sync: {e}")
     return result["applied"], result["conflicts"], result["errors"]
 
 
+def _notes_for_sync_changes(db: Database, changes: List[Any]) -> List[str]:
+    """Get the notes whose display caches a batch of sync changes affects.
+
+    Tags stand for the notes carrying them or a descendant; audio files
+    and transcriptions for the notes the audio file is attached to. A
+    failed lookup is logged and leaves those notes out, so it never stops
+    the sync itself.
+
+    Args:
+        db: Database instance
+        changes: SyncChange objects or dicts
+
+    Returns:
+        Note IDs (hex strings)
+    """
+    note_ids = set()
+    tag_ids = set()
+    audio_file_ids = set()
+    for change in changes:
+        if not isinstance(change, dict):
+            change = vars(change)
+        entity_type = change.get("entity_type")
+        data = change.get("data") or {}
+        if entity_type == "note":
+            note_ids.add(change["entity_id"])
+        elif entity_type == "tag":
+            tag_ids.add(change["entity_id"])
+        elif entity_type in ("note_tag", "note_attachment") and data.get("note_id"):
+            note_ids.add(data["note_id"])
+        elif entity_type == "audio_file":
+            audio_file_ids.add(change["entity_id"])
+        elif entity_type == "transcription":
+            audio_file_id = data.get("audio_file_id")
+            if not audio_file_id:
+                try:
+                    transcription = db.get_transcription(change["entity_id"])
+                except Exception as e:
+                    logger.warning(f"Could not look up transcription {change['entity_id']}: {e}")
+                    transcription = None
+                audio_file_id = transcription.get("audio_file_id") if transcription else None
+            if audio_file_id:
+                audio_file_ids.add(audio_file_id)
+
+    if tag_ids:
+        try:
+            note_ids.update(get_cache_invalidator(db).notes_for_tags(tag_ids))
+        except Exception as e:
+            logger.warning(f"Could not look up notes of {len(tag_ids)} synced tags: {e}")
+    for audio_file_id in audio_file_ids:
+        try:
+            note_ids.update(db.get_notes_for_audio_file(audio_file_id))
+        except Exception as e:
+            logger.warning(f"Could not look up notes of audio file {audio_file_id}: {e}")
+    return sorted(note_ids)
+
+
 def get_full_dataset(db: Database) -> Dict[str, List[Dict[str, Any]]]:
     """Get the full dataset for initial sync.
 
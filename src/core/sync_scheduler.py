@@ -0,0 +1,353 @@
+"""Background periodic sync with per-peer backoff.
+
+SyncScheduler keeps one voicecore.SyncSession (Tokio runtime, config and
+database handle) alive on its own thread and syncs with all peers:
+
+- every `interval` seconds,
+- `debounce` seconds after the last local change reported through
+  notify_local_change(), so a burst of edits leads to one sync,
+- right away after request_sync().
+
+A peer whose sync fails is skipped until its backoff delay has passed.
+The delay doubles with each consecutive failure (up to `backoff_max`) and
+resets after a successful sync or when the peer is removed from the
+config. Timing of the last run is kept in
+`last_run` for status displays.
+
+The GUI, the TUI and `cli sync daemon` all use this class.
+
+CRITICAL: This module must have NO Qt/PySide6 dependencies.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .models import ChangeSet
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SYNC_INTERVAL = 300.0  # Seconds between periodic syncs
+DEFAULT_SYNC_DEBOUNCE = 10.0  # Quiet seconds after a local change before syncing
+DEFAULT_BACKOFF_BASE = 30.0  # First retry delay for a failing peer
+DEFAULT_BACKOFF_MAX = 3600.0  # Longest retry delay for a failing peer
+
+# Held while a sync runs in this process, so that a manual sync and the
+# scheduler never sync at the same time
+sync_lock = threading.Lock()
+
+
+@dataclass
+class PeerBackoff:
+    """Retry state of a peer whose syncs failed.
+
+    Attributes:
+        failures: Consecutive failed syncs
+        retry_at: time.monotonic() value before which the peer is skipped
+        last_error: Error of the last failed sync
+    """
+
+    failures: int = 0
+    retry_at: float = 0.0
+    last_error: Optional[str] = None
+
+
+@dataclass
+class SyncRunStats:
+    """Timing and outcome of one scheduled sync run.
+
+    Attributes:
+        reason: What triggered the run ("interval", "local_change",
+            "requested" or "retry")
+        started_at: Unix timestamp when the run started
+        duration: Wall-clock seconds the run took
+        peers_synced: Peers that synced successfully
+        peers_failed: Peers whose sync failed
+        peers_skipped: Peers skipped because of backoff
+        peer_durations: Seconds spent per peer
+    """
+
+    reason: str
+    started_at: float
+    duration: float = 0.0
+    peers_synced: int = 0
+    peers_failed: int = 0
+    peers_skipped: int = 0
+    peer_durations: Dict[str, float] = field(default_factory=dict)
+
+
+def _default_session_factory(config_dir: str) -> Any:
+    """Open a voicecore.SyncSession."""
+    from voicecore import SyncSession
+
+    return SyncSession(config_dir)
+
+
+class SyncScheduler:
+    """Runs peer syncs on a background thread on a schedule.
+
+    Attributes:
+        config_dir: Config directory of the peers and database to sync
+        interval: Seconds between periodic syncs (0 disables them)
+        debounce: Seconds to wait after the last local change
+        backoff_base: Retry delay after a peer's first failure
+        backoff_max: Upper bound for the retry delay
+        last_run: Stats of the most recent run, or None
+        run_count: Number of completed runs
+    """
+
+    def __init__(
+        self,
+        config_dir: str,
+        interval: float = DEFAULT_SYNC_INTERVAL,
+        debounce: float = DEFAULT_SYNC_DEBOUNCE,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        max_concurrent: int = 4,
+        peer_timeout: Optional[float] = None,
+        on_results: Optional[Callable[[Dict[str, Any], ChangeSet], None]] = None,
+        session_factory: Callable[[str], Any] = _default_session_factory,
+    ) -> None:
+        """Initialize the scheduler (not started).
+
+        Args:
+            config_dir: Config directory of the peers and database to sync
+            interval: Seconds between periodic syncs (0 disables them)
+            debounce: Seconds to wait after the last local change
+            backoff_base: Retry delay after a peer's first failure
+            backoff_max: Upper bound for the retry delay
+            max_concurrent: Maximum number of peers to sync at the same time
+            peer_timeout: Per-peer timeout in seconds (None for no timeout)
+            on_results: Called on the scheduler thread after each run with
+                the results (peer_id -> SyncResult) and the change set
+            session_factory: Opens the session used for all runs
+        """
+        self.config_dir = config_dir
+        self.interval = interval
+        self.debounce = debounce
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_concurrent = max_concurrent
+        self.peer_timeout = peer_timeout
+        self.on_results = on_results
+        self._session_factory = session_factory
+        self._session: Any = None
+
+        self.last_run: Optional[SyncRunStats] = None
+        self.run_count = 0
+
+        self._backoff: Dict[str, PeerBackoff] = {}
+        self._wake = threading.Condition()
+        self._stop = threading.Event()  # Also cancels a sync in progress
+        self._thread: Optional[threading.Thread] = None
+        self._next_interval_at: Optional[float] = None
+        self._local_change_at: Optional[float] = None
+        self._requested = False
+
+    # ===== Control =====
+
+    def start(self) -> None:
+        """Start the scheduler thread (does nothing if already running)."""
+        if self.is_running():
+            return
+        self._stop.clear()
+        self._session = None  # Sessions belong to the thread that opened them
+        with self._wake:
+            self._next_interval_at = time.monotonic() + self.interval if self.interval > 0 else None
+        self._thread = threading.Thread(target=self._loop, name="sync-scheduler", daemon=True)
+        self._thread.start()
+        logger.info(f"Sync scheduler started (interval {self.interval}s, debounce {self.debounce}s)")
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the scheduler, cancelling a sync in progress.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish
+        """
+        self._stop.set()
+        with self._wake:
+            self._wake.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        logger.info("Sync scheduler stopped")
+
+    def is_running(self) -> bool:
+        """Whether the scheduler thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def notify_local_change(self) -> None:
+        """Schedule a sync once local edits have paused for `debounce` seconds."""
+        with self._wake:
+            self._local_change_at = time.monotonic()
+            self._wake.notify_all()
+
+    def request_sync(self) -> None:
+        """Sync with all peers now, ignoring their backoff."""
+        with self._wake:
+            self._requested = True
+            self._wake.notify_all()
+
+    def peer_backoff(self) -> Dict[str, PeerBackoff]:
+        """Copy of the backoff state of peers whose last sync failed."""
+        with self._wake:
+            return {peer_id: replace(state) for peer_id, state in self._backoff.items()}
+
+    # ===== Scheduling =====
+
+    def _due(self, now: float) -> Tuple[Optional[str], Optional[float]]:
+        """Return (reason, due_at) of the next run, or (None, None) if none is pending."""
+        candidates = []
+        if self._requested:
+            candidates.append(("requested", now))
+        if self._local_change_at is not None:
+            candidates.append(("local_change", self._local_change_at + self.debounce))
+        if self._next_interval_at is not None:
+            candidates.append(("interval", self._next_interval_at))
+        retries = [b.retry_at for b in self._backoff.values() if b.failures]
+        if retries:
+            candidates.append(("retry", min(retries)))
+        if not candidates:
+            return None, None
+        return min(candidates, key=lambda candidate: candidate[1])
+
+    def _wait_for_run(self) -> Optional[str]:
+        """Block until a run is due; return its reason, or None when stopping."""
+        with self._wake:
+            while not self._stop.is_set():
+                now = time.monotonic()
+                reason, due_at = self._due(now)
+                if reason is not None and due_at <= now:
+                    if reason == "requested":
+                        self._requested = False
+                    # Any run also covers pending local changes and
+                    # restarts the interval
+                    self._local_change_at = None
+                    if self.interval > 0:
+                        self._next_interval_at = now + self.interval
+                    return reason
+                self._wake.wait(None if due_at is None else due_at - now)
+        return None
+
+    def _peers_for(self, reason: str, peer_ids: List[str], now: float) -> List[str]:
+        """Choose the peers a run syncs with.
+
+        Requested runs sync every peer. Retry runs sync only failed peers
+        whose delay has passed; other runs skip peers still backing off.
+        """
+        if reason == "requested":
+            return list(peer_ids)
+        with self._wake:
+            if reason == "retry":
+                return [
+                    p for p in peer_ids
+                    if p in self._backoff and self._backoff[p].retry_at <= now
+                ]
+            return [
+                p for p in peer_ids
+                if p not in self._backoff or self._backoff[p].retry_at <= now
+            ]
+
+    def _prune_backoff(self, peer_ids: List[str]) -> None:
+        """Drop the backoff state of peers no longer in the config.
+
+        Called after every config (re)load. A removed peer is never synced
+        again, so its retry time would stay due and wake the scheduler in
+        a busy loop.
+        """
+        with self._wake:
+            removed = [p for p in self._backoff if p not in peer_ids]
+            for peer_id in removed:
+                del self._backoff[peer_id]
+        if removed:
+            logger.info(f"Dropped backoff state of {len(removed)} removed peer(s)")
+
+    def _record(self, results: Dict[str, Any]) -> None:
+        """Update backoff state from a run's results."""
+        now = time.monotonic()
+        with self._wake:
+            for peer_id, result in results.items():
+                if result.success:
+                    self._backoff.pop(peer_id, None)
+                    continue
+                if self._stop.is_set():
+                    continue  # Cancelled, not unreachable
+                state = self._backoff.setdefault(peer_id, PeerBackoff())
+                state.failures += 1
+                delay = min(self.backoff_base * 2 ** (state.failures - 1), self.backoff_max)
+                state.retry_at = now + delay
+                state.last_error = ", ".join(result.errors) if result.errors else None
+                logger.warning(
+                    f"Sync with {peer_id} failed {state.failures} time(s), retrying in {delay:.0f}s"
+                )
+
+    # ===== Running =====
+
+    def run_once(self, reason: str = "requested") -> Dict[str, Any]:
+        """Run one sync on the calling thread.
+
+        The scheduler thread calls this; it can also be called directly
+        when no thread is running (e.g. in tests). The session is opened
+        on first use, so it must always be called from the same thread.
+
+        Args:
+            reason: What triggered the run (see SyncRunStats.reason)
+
+        Returns:
+            Dict mapping peer_id to SyncResult (empty if nothing was synced).
+        """
+        if self._session is None:
+            self._session = self._session_factory(self.config_dir)
+        else:
+            self._session.reload_config()
+
+        now = time.monotonic()
+        all_peers = list(self._session.peer_ids)
+        self._prune_backoff(all_peers)
+        peer_ids = self._peers_for(reason, all_peers, now)
+        stats = SyncRunStats(reason=reason, started_at=time.time())
+        stats.peers_skipped = len(all_peers) - len(peer_ids)
+
+        results: Dict[str, Any] = {}
+        if peer_ids:
+            with sync_lock:
+                results = self._session.sync(
+                    peer_ids,
+                    max_concurrent=self.max_concurrent,
+                    peer_timeout=self.peer_timeout,
+                    cancel=self._stop,
+                )
+        self._record(results)
+
+        stats.duration = time.time() - stats.started_at
+        stats.peers_synced = sum(1 for r in results.values() if r.success)
+        stats.peers_failed = len(results) - stats.peers_synced
+        stats.peer_durations = {p: r.duration_ms / 1000 for p, r in results.items()}
+        self.last_run = stats
+        self.run_count += 1
+        logger.info(
+            f"Sync run ({reason}) took {stats.duration:.1f}s: {stats.peers_synced} ok, "
+            f"{stats.peers_failed} failed, {stats.peers_skipped} skipped"
+        )
+
+        if results and self.on_results is not None:
+            try:
+                self.on_results(results, ChangeSet.from_sync_results(results.values()))
+            except Exception as e:
+                logger.error(f"Sync results callback failed: {e}")
+        return results
+
+    def _loop(self) -> None:
+        """Scheduler thread body."""
+        while True:
+            reason = self._wait_for_run()
+            if reason is None:
+                break
+            try:
+                self.run_once(reason)
+            except Exception as e:
+                logger.error(f"Scheduled sync failed: {e}")
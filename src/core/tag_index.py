@@ -0,0 +1,282 @@
+"""Shared in-memory index of the tag hierarchy.
+
+Tag lookups (resolving names and paths, full paths, descendants) used to
+query the database once per tag or per search term. TagIndex reads all
+tags once and answers them from memory:
+
+- id -> TagNode (name, parent, full path)
+- name -> ids and full path -> id (both case-insensitive)
+- descendants from an Euler tour: each tag's subtree is a contiguous
+  slice of the pre-order tag list, so descendants are a slice and
+  "is A under B" is two integer comparisons.
+
+get_tag_index(db) returns one index shared by every caller using the same
+Database. It is rebuilt when Database.get_data_version() changes, i.e.
+after any write, including tag edits and syncs made by other processes.
+
+CRITICAL: This module must have NO Qt/PySide6 dependencies.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import uuid
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .database import Database
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["TagNode", "TagIndex", "get_tag_index", "PATH_SEPARATOR"]
+
+# Separator of tag paths in search terms ("Europe/France/Paris")
+PATH_SEPARATOR = "/"
+
+
+@dataclass(frozen=True)
+class TagNode:
+    """One tag in a TagIndex.
+
+    Attributes:
+        id: Tag ID (hex string)
+        name: Tag name
+        parent_id: Parent tag ID, or None for root tags (and for tags
+            whose parent does not exist)
+        path_names: Names from the root tag down to this tag
+        start: Position of the tag in the pre-order tag list
+        end: Position just after the tag's last descendant
+    """
+
+    id: str
+    name: str
+    parent_id: Optional[str]
+    path_names: Tuple[str, ...]
+    start: int
+    end: int
+
+    @property
+    def depth(self) -> int:
+        """Number of ancestors (0 for root tags)."""
+        return len(self.path_names) - 1
+
+    @property
+    def path(self) -> str:
+        """Full path like "Geography/Europe/France"."""
+        return PATH_SEPARATOR.join(self.path_names)
+
+
+def _hex_id(tag_id: Union[bytes, str]) -> str:
+    """Normalize a tag ID to a hex string."""
+    if isinstance(tag_id, bytes):
+        return uuid.UUID(bytes=tag_id).hex
+    return tag_id
+
+
+class TagIndex:
+    """Immutable snapshot of the tag hierarchy.
+
+    Attributes:
+        version: Database data version the index was built from (or None)
+        tags: Tag rows as read from the database (do not modify)
+    """
+
+    def __init__(self, tags: Iterable[Dict[str, Any]], version: Optional[str] = None) -> None:
+        """Build the index.
+
+        Args:
+            tags: Tag dicts with id, name and parent_id (as from get_all_tags())
+            version: Database data version the tags were read at
+        """
+        self.version = version
+        self.tags: List[Dict[str, Any]] = list(tags)
+
+        rows = {tag["id"]: tag for tag in self.tags}
+        children: Dict[Optional[str], List[str]] = {}
+        for tag in self.tags:
+            parent_id = tag.get("parent_id")
+            if parent_id not in rows or parent_id == tag["id"]:
+                parent_id = None
+            children.setdefault(parent_id, []).append(tag["id"])
+
+        # Euler tour: number tags in pre-order and record where each
+        # subtree ends. Tags only reachable through a parent cycle are
+        # treated as roots so every tag gets a place.
+        self._order: List[str] = []
+        self._nodes: Dict[str, TagNode] = {}
+        starts: Dict[str, int] = {}
+        path_names: Dict[str, Tuple[str, ...]] = {}
+        roots = list(children.get(None, []))
+        for root_id in roots + [tag_id for tag_id in rows]:
+            if root_id in starts:
+                continue
+            path_names[root_id] = (rows[root_id]["name"],)
+            stack: List[Tuple[str, bool]] = [(root_id, False)]
+            while stack:
+                tag_id, leaving = stack.pop()
+                if leaving:
+                    tag = rows[tag_id]
+                    parent_id = tag.get("parent_id") if len(path_names[tag_id]) > 1 else None
+                    self._nodes[tag_id] = TagNode(
+                        id=tag_id,
+                        name=tag["name"],
+                        parent_id=parent_id,
+                        path_names=path_names[tag_id],
+                        start=starts[tag_id],
+                        end=len(self._order),
+                    )
+                    continue
+                starts[tag_id] = len(self._order)
+                self._order.append(tag_id)
+                stack.append((tag_id, True))
+                for child_id in reversed(children.get(tag_id, [])):
+                    if child_id not in starts:
+                        path_names[child_id] = path_names[tag_id] + (rows[child_id]["name"],)
+                        stack.append((child_id, False))
+
+        self._children: Dict[Optional[str], List[str]] = {}
+        self._ids_by_name: Dict[str, List[str]] = {}
+        self._id_by_path: Dict[str, str] = {}
+        for tag_id in self._order:
+            node = self._nodes[tag_id]
+            self._children.setdefault(node.parent_id, []).append(tag_id)
+            self._ids_by_name.setdefault(node.name.lower(), []).append(tag_id)
+            self._id_by_path.setdefault(node.path.lower(), tag_id)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, tag_id: object) -> bool:
+        return tag_id in self._nodes
+
+    def get(self, tag_id: Union[bytes, str]) -> Optional[TagNode]:
+        """Get a tag's node, or None if there is no such tag."""
+        return self._nodes.get(_hex_id(tag_id))
+
+    def children(self, tag_id: Optional[Union[bytes, str]] = None) -> List[TagNode]:
+        """Get the child tags of a tag, or the root tags if tag_id is None."""
+        parent_id = None if tag_id is None else _hex_id(tag_id)
+        return [self._nodes[child_id] for child_id in self._children.get(parent_id, [])]
+
+    def ids_by_name(self, name: str) -> List[str]:
+        """Get the IDs of all tags with a name (case-insensitive)."""
+        return list(self._ids_by_name.get(name.lower(), []))
+
+    def id_by_path(self, path: str) -> Optional[str]:
+        """Get the ID of the tag with a full path from the root (case-insensitive)."""
+        return self._id_by_path.get(path.strip(PATH_SEPARATOR).lower())
+
+    def full_path(self, tag_id: Union[bytes, str], separator: str = PATH_SEPARATOR) -> str:
+        """Get a tag's full path, like "Europe/France/Paris".
+
+        Args:
+            tag_id: Tag ID (hex string or bytes)
+            separator: String put between tag names
+
+        Returns:
+            The path, or "" if there is no such tag.
+        """
+        node = self.get(tag_id)
+        return separator.join(node.path_names) if node is not None else ""
+
+    def descendants(self, tag_id: Union[bytes, str], include_self: bool = True) -> List[str]:
+        """Get the IDs of a tag's descendants, in pre-order.
+
+        Args:
+            tag_id: Tag ID (hex string or bytes)
+            include_self: Include the tag itself (first)
+
+        Returns:
+            Tag IDs, or [] if there is no such tag.
+        """
+        node = self.get(tag_id)
+        if node is None:
+            return []
+        return self._order[node.start if include_self else node.start + 1:node.end]
+
+    def is_descendant(self, tag_id: Union[bytes, str], ancestor_id: Union[bytes, str]) -> bool:
+        """Whether a tag is an ancestor's descendant (or the ancestor itself)."""
+        node = self.get(tag_id)
+        ancestor = self.get(ancestor_id)
+        if node is None or ancestor is None:
+            return False
+        return ancestor.start <= node.start < ancestor.end
+
+    def find(self, term: str) -> List[TagNode]:
+        """Find the tags a search term names.
+
+        A term is a tag name ("Paris") or the last part of a tag's path
+        ("France/Paris", "Geography/Europe/France/Paris"). Matching is
+        case-insensitive.
+
+        Args:
+            term: Tag name or path
+
+        Returns:
+            Matching tags (more than one if the term is ambiguous).
+        """
+        parts = [part.strip().lower() for part in term.strip().strip(PATH_SEPARATOR).split(PATH_SEPARATOR)]
+        if not all(parts):
+            return []
+        matches = []
+        for tag_id in self._ids_by_name.get(parts[-1], []):
+            names = self._nodes[tag_id].path_names
+            if len(names) >= len(parts) and all(
+                name.lower() == part for name, part in zip(names[-len(parts):], parts)
+            ):
+                matches.append(self._nodes[tag_id])
+        return matches
+
+    def resolve(self, term: str) -> Tuple[List[str], bool, bool]:
+        """Resolve a tag search term to the tag IDs it covers.
+
+        Args:
+            term: Tag name or path (e.g., "Work" or "Europe/France/Paris")
+
+        Returns:
+            Tuple of:
+            - Tag IDs of all matching tags and their descendants
+            - Whether the term was ambiguous (matched multiple tags)
+            - Whether the term was not found
+        """
+        matches = self.find(term)
+        if not matches:
+            return [], False, True
+        tag_ids: List[str] = []
+        seen = set()
+        for node in matches:
+            for tag_id in self._order[node.start:node.end]:
+                if tag_id not in seen:
+                    seen.add(tag_id)
+                    tag_ids.append(tag_id)
+        return tag_ids, len(matches) > 1, False
+
+
+_indexes: "weakref.WeakKeyDictionary[Database, TagIndex]" = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+def get_tag_index(db: Database) -> TagIndex:
+    """Get the shared tag index of a database, rebuilding it if the data changed.
+
+    Args:
+        db: Database connection
+
+    Returns:
+        TagIndex for the current data version
+    """
+    version = db.get_data_version()
+    with _indexes_lock:
+        index = _indexes.get(db)
+    if index is not None and index.version == version:
+        return index
+
+    # Read before storing: a write in between leaves the index stamped
+    # with the older version, so the next call rebuilds it again
+    index = TagIndex(db.get_all_tags(), version)
+    with _indexes_lock:
+        _indexes[db] = index
+    logger.debug(f"Built tag index ({len(index)} tags)")
+    return index
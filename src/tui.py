@@ -38,10 +38,11 @@ RTL Support:
 from __future__ import annotations
 
 import argparse
+import json
 import logging
 import unicodedata
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from rich.text import Text as RichText
 
@@ -49,6 +50,7 @@ from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.events import Key
+from textual.message import Message
 from textual.screen import ModalScreen
 from textual.widgets import (
     Button,
@@ -68,13 +70,22 @@ from textual.widgets.tree import TreeNode
 # Default transcription state
 DEFAULT_TRANSCRIPTION_STATE = "original !verified !verbatim !cleaned !polished"
 
+# Notes list rows are created this many at a time, as the list is scrolled
+NOTES_PAGE_SIZE = 100
+# Load the next page when the highlight gets this close to the last row
+NOTES_PAGE_MARGIN = 10
+NOTE_PREVIEW_LENGTH = 50
+
 from src.core.audio_player import AudioPlayer, PlaybackState, format_time, is_mpv_available
+from src.core.cache_invalidation import get_cache_invalidator
 from src.core.config import Config
 from src.core.conflicts import ConflictManager
 from src.core.database import Database
-from src.core.models import UUID_SHORT_LEN
+from src.core.models import UUID_SHORT_LEN, ChangeSet
 from src.core.note_editor import NoteEditorMixin
 from src.core.search import build_tag_search_term, execute_search
+from src.core.sync_scheduler import SyncScheduler
+from src.core.tag_index import get_tag_index
 from src.core.timestamp_utils import format_timestamp
 from src.core.waveform import extract_waveform, waveform_with_progress, WAVEFORM_BAR_COUNT
 
@@ -141,19 +152,29 @@ def format_rtl_block(text: str) -> str:
 
 
 class TagsTree(Tree[Dict[str, Any]]):
-    """Collapsible tags tree widget."""
+    """Collapsible tags tree widget.
+
+    A tag's child nodes are added the first time it is expanded, so large
+    hierarchies mount quickly. Expanded tags stay expanded across
+    reload_tags().
+    """
 
     GUIDE_DEPTH = 2  # Indentation spaces for child nodes
 
     def __init__(self, db: Database) -> None:
         super().__init__("Tags", id="tags-tree")
         self.db = db
+        # parent_id -> child tags, for all shown tags
+        self._children_by_parent: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        self._populated: set = set()  # Tag IDs whose child nodes were added
+        self._expanded: set = set()  # Tag IDs the user expanded
 
     def on_key(self, event: Key) -> None:
         """Handle arrow keys for expand/collapse."""
         if event.key == "right":
             node = self.cursor_node
             if node and not node.is_expanded and node.allow_expand:
+                self.populate(node)
                 node.expand()
                 # Move focus to first child
                 self.action_cursor_down()
@@ -171,8 +192,27 @@ class TagsTree(Tree[Dict[str, Any]]):
                     node.parent.collapse()
                     event.stop()
 
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        """Add a node's children the first time it is expanded."""
+        if event.node.data:
+            self._expanded.add(event.node.data["id"])
+            self.populate(event.node)
+
+    def on_tree_node_collapsed(self, event: Tree.NodeCollapsed) -> None:
+        """Forget a collapsed node's expansion."""
+        if event.node.data:
+            self._expanded.discard(event.node.data["id"])
+
     def on_mount(self) -> None:
         """Build the tree when mounted."""
+        self.reload_tags()
+
+    def reload_tags(self) -> None:
+        """Rebuild the tree from the database.
+
+        Only root tags and the children of expanded tags get nodes.
+        """
+        self.clear()
         self.root.expand()
         tags = self.db.get_all_tags()
 
@@ -184,31 +224,36 @@ class TagsTree(Tree[Dict[str, Any]]):
                 if tag["id"] != system_tag_id and tag.get("parent_id") != system_tag_id
             ]
 
-        # Build set of tags that have children (for determining leaf vs branch)
-        tags_with_children = {tag["parent_id"] for tag in tags if tag["parent_id"] is not None}
-
         # Build mapping of parent_id -> list of children
-        children_by_parent: Dict[Optional[int], List[Dict[str, Any]]] = {}
+        self._children_by_parent = {}
         for tag in tags:
-            parent_id = tag["parent_id"]
-            if parent_id not in children_by_parent:
-                children_by_parent[parent_id] = []
-            children_by_parent[parent_id].append(tag)
-
-        def add_tag_recursive(parent_node: TreeNode, tag: Dict[str, Any]) -> None:
-            """Recursively add a tag and all its descendants."""
-            label = make_rtl_text(tag["name"]) if detect_rtl(tag["name"]) else tag["name"]
-            if tag["id"] in tags_with_children:
-                node = parent_node.add(label, data=tag)
-            else:
-                node = parent_node.add_leaf(label, data=tag)
-            # Recursively add children
-            for child in children_by_parent.get(tag["id"], []):
-                add_tag_recursive(node, child)
-
-        # Start from root tags (parent_id=None) and build recursively
-        for tag in children_by_parent.get(None, []):
-            add_tag_recursive(self.root, tag)
+            self._children_by_parent.setdefault(tag["parent_id"], []).append(tag)
+        self._populated = set()
+
+        # Start from root tags (parent_id=None), then re-expand remembered tags
+        pending = [self._add_tag_node(self.root, tag) for tag in self._children_by_parent.get(None, [])]
+        while pending:
+            node = pending.pop()
+            if node.data["id"] in self._expanded and node.allow_expand:
+                self.populate(node)
+                node.expand()
+                pending.extend(node.children)
+
+    def _add_tag_node(self, parent_node: TreeNode, tag: Dict[str, Any]) -> TreeNode:
+        """Add a tag's node; a tag with children can be expanded."""
+        label = make_rtl_text(tag["name"]) if detect_rtl(tag["name"]) else tag["name"]
+        if tag["id"] in self._children_by_parent:
+            return parent_node.add(label, data=tag)
+        return parent_node.add_leaf(label, data=tag)
+
+    def populate(self, node: TreeNode) -> None:
+        """Add the child nodes of a tag node if they were not added yet."""
+        tag = node.data
+        if not tag or tag["id"] in self._populated:
+            return
+        self._populated.add(tag["id"])
+        for child in self._children_by_parent.get(tag["id"], []):
+            self._add_tag_node(node, child)
 
 
 class TagManagementScreen(ModalScreen[None]):
@@ -298,6 +343,7 @@ class TagManagementScreen(ModalScreen[None]):
         self._filtered_tags: List[Dict[str, Any]] = []
         self._children_by_parent: Dict[str, set] = {}  # parent_id -> set of child ids
         self._collapsed_ids: set = set()  # Set of collapsed tag IDs
+        self._note_counts: Dict[str, int] = {}  # tag_id -> number of notes
 
     def compose(self) -> ComposeResult:
         with Vertical(id="tag-management-dialog"):
@@ -329,8 +375,11 @@ class TagManagementScreen(ModalScreen[None]):
         note_tags = self.db.get_note_tags(self.note_id)
         self._note_tag_ids = {t["id"] for t in note_tags}
 
-        # Build tag lookup by ID
-        tag_by_id = {t["id"]: t for t in all_tags}
+        try:
+            self._note_counts = self.db.get_tag_note_counts()
+        except Exception as e:
+            logger.warning(f"Error getting tag note counts: {e}")
+            self._note_counts = {}
 
         # Build children map
         self._children_by_parent = {}
@@ -341,16 +390,9 @@ class TagManagementScreen(ModalScreen[None]):
                     self._children_by_parent[parent_id] = set()
                 self._children_by_parent[parent_id].add(tag["id"])
 
-        # Compute full path for each tag
-        self._tag_paths = {}
-        for tag in all_tags:
-            path_parts = []
-            current = tag
-            while current:
-                path_parts.insert(0, current["name"])
-                parent_id = current.get("parent_id")
-                current = tag_by_id.get(parent_id) if parent_id else None
-            self._tag_paths[tag["id"]] = " > ".join(path_parts)
+        # Full path of each tag, from the shared tag index
+        tag_index = get_tag_index(self.db)
+        self._tag_paths = {tag["id"]: tag_index.full_path(tag["id"], " > ") for tag in all_tags}
 
         # Sort tags by their full path to get hierarchical order
         self._all_tags = sorted(all_tags, key=lambda t: self._tag_paths[t["id"]].lower())
@@ -411,8 +453,9 @@ class TagManagementScreen(ModalScreen[None]):
             is_collapsed = tag_id in self._collapsed_ids
 
             # Show path when filtering, otherwise just name with hierarchy
+            count_suffix = f" ({self._note_counts.get(tag_id, 0)})"
             if is_filtering:
-                display_text = self._tag_paths[tag_id]
+                display_text = self._tag_paths[tag_id] + count_suffix
                 # Simple checkbox for filtered view
                 checkbox = Checkbox(
                     display_text,
@@ -448,7 +491,7 @@ class TagManagementScreen(ModalScreen[None]):
 
                 # Add checkbox
                 checkbox = Checkbox(
-                    tag["name"],
+                    tag["name"] + count_suffix,
                     value=is_selected,
                     id=f"tag-checkbox-{tag_id}",
                     classes="tag-item" + (" tag-item-selected" if is_selected else "")
@@ -581,6 +624,7 @@ class TUIAudioPlayer(Container):
         audio_files: List[Dict[str, Any]],
         db: Database,
         transcription_counts: Optional[Dict[str, int]] = None,
+        cached_waveforms: Optional[Dict[str, List[int]]] = None,
     ) -> None:
         """Set the audio files to display.
 
@@ -588,6 +632,9 @@ class TUIAudioPlayer(Container):
             audio_files: List of audio file dicts.
             db: Database for getting file paths.
             transcription_counts: Optional dict mapping audio_file_id to transcription count.
+            cached_waveforms: Optional dict mapping audio_file_id to a waveform
+                from the display cache (0-255 per bar); these files are not
+                decoded again.
         """
         self._audio_files = audio_files
         self._db = db
@@ -618,8 +665,12 @@ class TUIAudioPlayer(Container):
         self._player.set_audio_files(self._file_paths)
 
         # Extract waveforms (synchronous for simplicity)
+        cached_waveforms = cached_waveforms or {}
         for i, path in enumerate(self._file_paths):
-            if path.exists():
+            cached = cached_waveforms.get(audio_files[i].get("id", ""))
+            if cached:
+                self._waveforms[i] = [value / 255 for value in cached]
+            elif path.exists():
                 waveform = extract_waveform(path, WAVEFORM_BAR_COUNT)
                 self._waveforms[i] = waveform
 
@@ -701,18 +752,19 @@ class TUITranscriptionBox(Container):
         self._is_editing = False
         self._original_content = ""
         self._original_state = ""
+        # Display cache entries carry only content_preview; the full text
+        # is fetched when the box is first expanded or edited
+        self._content_loaded = "content" in transcription
 
     def compose(self) -> ComposeResult:
         service = self._transcription.get("service", "Unknown")
-        content = self._transcription.get("content", "")
+        if self._content_loaded:
+            content = self._transcription.get("content", "")
+        else:
+            content = self._transcription.get("content_preview", "")
         state = self._transcription.get("state", DEFAULT_TRANSCRIPTION_STATE)
         created_at = format_timestamp(self._transcription.get("created_at"))
 
-        # Preview text (first 100 chars)
-        preview = content[:100].replace("\n", " ")
-        if len(content) > 100:
-            preview += "..."
-
         with Collapsible(title=f"{service} - {created_at}", collapsed=True):
             # View mode widgets
             yield Static(content, id=f"trans-view-{self._index}", classes="transcription-content")
@@ -737,6 +789,25 @@ class TUITranscriptionBox(Container):
         self.query_one(f"#trans-save-btn-{self._index}", Button).display = False
         self.query_one(f"#trans-cancel-btn-{self._index}", Button).display = False
 
+    def on_collapsible_expanded(self, event: Collapsible.Expanded) -> None:
+        """Fetch the full transcription the first time it is shown."""
+        self._load_full_content()
+
+    def _load_full_content(self) -> None:
+        """Replace the cached preview with the full transcription text."""
+        if self._content_loaded:
+            return
+        self._content_loaded = True
+        transcription_id = self._transcription.get("id", "")
+        try:
+            content = self._db.get_transcription_content(transcription_id)
+        except Exception as e:
+            logger.warning(f"Failed to load content for transcription {transcription_id}: {e}")
+            return
+        if content is not None:
+            self._transcription["content"] = content
+            self.query_one(f"#trans-view-{self._index}", Static).update(content)
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         button_id = event.button.id or ""
@@ -753,6 +824,7 @@ class TUITranscriptionBox(Container):
 
     def _start_editing(self) -> None:
         """Start editing mode."""
+        self._load_full_content()
         content = self._transcription.get("content", "")
         state = self._transcription.get("state", DEFAULT_TRANSCRIPTION_STATE)
 
@@ -867,9 +939,18 @@ class TUITranscriptionsContainer(Container):
 class NotesListView(ListView):
     """ListView widget for displaying notes."""
 
+    class NearEnd(Message):
+        """Posted when the list is scrolled to its last rows."""
+
     def __init__(self) -> None:
         super().__init__(id="notes-listview")
 
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        """Ask for more rows when scrolled to the bottom."""
+        super().watch_scroll_y(old_value, new_value)
+        if new_value > old_value and new_value >= self.max_scroll_y - self.size.height:
+            self.post_message(self.NearEnd())
+
     def on_focus(self) -> None:
         """Handle focus: select item or redirect to search if empty."""
         if len(self.children) == 0:
@@ -893,7 +974,14 @@ class NotesListView(ListView):
 
 
 class NotesList(Container):
-    """Notes list container with search input."""
+    """Notes list container with search input.
+
+    Rows are created NOTES_PAGE_SIZE at a time: the first page when the
+    list is (re)loaded, the next ones as the list is scrolled or the
+    highlight nears the last row. Showing all notes also reads them from
+    the database a page at a time. Row text comes from each note's
+    list_display_cache.
+    """
 
     def __init__(self, db: Database) -> None:
         super().__init__(id="notes-list")
@@ -901,44 +989,74 @@ class NotesList(Container):
         self.notes: List[Dict[str, Any]] = []
         self.current_filter_tag: Optional[Dict[str, Any]] = None
         self.current_search: str = ""
+        # When True, free text also matches transcription text
+        self.include_transcriptions: bool = False
+        # Search/filter results not yet shown, or None when paging all notes
+        self._pending: Optional[List[Dict[str, Any]]] = None
+        self._has_more_notes = False  # More notes in the database (all notes)
 
     def compose(self) -> ComposeResult:
-        yield SearchInput(placeholder="Search (tag:Name or free text)...", id="search-input")
+        yield SearchInput(placeholder="Search (tag:Name, transcript:words or free text)...", id="search-input")
         yield NotesListView()
 
     def on_mount(self) -> None:
         """Load notes when mounted."""
         self.refresh_notes()
 
-    def _populate_list(self, notes: List[Dict[str, Any]]) -> None:
-        """Populate the list view with notes."""
+    def _note_row(self, note: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a row's display fields from the note's list display cache.
+
+        Falls back to the note's own fields (and a marked-state query) only
+        when the cache is missing or unreadable.
+        """
+        row = {
+            "id": note["id"],
+            "content": note["content"],
+            "created_at": note["created_at"],
+            "tag_names": note.get("tag_names", ""),
+            "duration_seconds": None,
+        }
+        cache_data = None
+        if note.get("list_display_cache"):
+            try:
+                cache_data = json.loads(note["list_display_cache"])
+            except (json.JSONDecodeError, TypeError):
+                cache_data = None
+        if isinstance(cache_data, dict):
+            row["is_marked"] = bool(cache_data.get("marked", False))
+            preview = cache_data.get("content_preview", "")
+            row["tag_names"] = ", ".join(cache_data.get("tags", [])) or row["tag_names"]
+            row["duration_seconds"] = cache_data.get("duration_seconds")
+        else:
+            row["is_marked"] = self.db.is_note_marked(note["id"])
+            preview = note["content"]
+
+        preview = preview[:NOTE_PREVIEW_LENGTH].replace("\n", " ")
+        if len(note["content"]) > NOTE_PREVIEW_LENGTH:
+            preview += "..."
+        row["preview"] = preview
+        return row
+
+    def _append_rows(self, notes: List[Dict[str, Any]]) -> None:
+        """Create list items for notes and add them below the current rows."""
         listview = self.query_one("#notes-listview", NotesListView)
-        listview.clear()
-        self.notes = []
 
         # Star icons
         STAR_FILLED = "★"  # U+2605
         STAR_EMPTY = "☆"   # U+2606
 
+        items = []
         for note in notes:
-            # Check if note is marked (starred)
-            is_marked = self.db.is_note_marked(note["id"])
-
-            note_dict = {
-                "id": note["id"],
-                "content": note["content"],
-                "created_at": note["created_at"],
-                "tag_names": note.get("tag_names", ""),
-                "is_marked": is_marked
-            }
+            note_dict = self._note_row(note)
             self.notes.append(note_dict)
 
-            content_preview = note["content"][:50].replace("\n", " ")
-            if len(note["content"]) > 50:
-                content_preview += "..."
+            content_preview = note_dict["preview"]
             tags = note_dict["tag_names"] or "No tags"
+            if note_dict["duration_seconds"]:
+                tags = f"{format_time(note_dict['duration_seconds'])} | {tags}"
 
             # Add star icon to header
+            is_marked = note_dict["is_marked"]
             star = STAR_FILLED if is_marked else STAR_EMPTY
             header_line = f"{star} #{note['id']} | {tags}"
             is_rtl = detect_rtl(content_preview) or detect_rtl(tags)
@@ -957,7 +1075,76 @@ class NotesList(Container):
             rich_text.append("\n")
             rich_text.append(content_preview)
             static = Static(rich_text, classes="rtl" if is_rtl else "")
-            listview.append(ListItem(static))
+            items.append(ListItem(static))
+        if items:
+            listview.extend(items)
+
+    def _populate_list(self, notes: List[Dict[str, Any]]) -> None:
+        """Show the given notes, creating rows for the first page."""
+        listview = self.query_one("#notes-listview", NotesListView)
+        listview.clear()
+        self.notes = []
+        self._has_more_notes = False
+        self._pending = list(notes)
+        self.load_more()
+
+    def _show_all_notes(self) -> None:
+        """Show all notes, reading them from the database a page at a time."""
+        listview = self.query_one("#notes-listview", NotesListView)
+        listview.clear()
+        self.notes = []
+        self._pending = None
+        self._has_more_notes = True
+        self.load_more()
+
+    def has_more(self) -> bool:
+        """Whether notes remain below the last row."""
+        if self._pending is not None:
+            return bool(self._pending)
+        return self._has_more_notes
+
+    def load_more(self) -> None:
+        """Add the next page of rows, if any."""
+        if self._pending is not None:
+            page, self._pending = self._pending[:NOTES_PAGE_SIZE], self._pending[NOTES_PAGE_SIZE:]
+        elif self._has_more_notes:
+            last = self.notes[-1] if self.notes else None
+            result = self.db.get_notes_page(
+                NOTES_PAGE_SIZE,
+                after_created_at=last["created_at"] if last else None,
+                after_id=last["id"] if last else None,
+            )
+            page = result["notes"]
+            self._has_more_notes = bool(result["has_more"]) and bool(page)
+        else:
+            return
+        self._append_rows(page)
+
+    def load_until(self, note_id: str) -> int:
+        """Load pages until a note has a row.
+
+        Returns:
+            Index of the note's row, or -1 if it is not in the list.
+        """
+        while True:
+            for idx, note in enumerate(self.notes):
+                if note["id"] == note_id:
+                    return idx
+            if not self.has_more():
+                return -1
+            self.load_more()
+
+    def on_notes_list_view_near_end(self, event: NotesListView.NearEnd) -> None:
+        """Load the next page when scrolled to the bottom."""
+        event.stop()
+        if self.has_more():
+            self.load_more()
+
+    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        """Load the next page when the highlight nears the last row."""
+        index = event.list_view.index
+        if index is not None and index >= len(self.notes) - NOTES_PAGE_MARGIN and self.has_more():
+            self.load_more()
 
     def refresh_notes(self, filter_tag: Optional[Dict[str, Any]] = None) -> None:
         """Refresh the notes list, optionally filtered by tag."""
@@ -965,12 +1152,11 @@ class NotesList(Container):
 
         if filter_tag:
             # Get notes by tag (including descendants)
-            tag_ids = self.db.get_tag_descendants(filter_tag["id"])
+            tag_ids = get_tag_index(self.db).descendants(filter_tag["id"])
             notes = self.db.filter_notes(tag_ids)
+            self._populate_list(notes)
         else:
-            notes = self.db.get_all_notes()
-
-        self._populate_list(notes)
+            self._show_all_notes()
 
     def perform_search(self, search_text: str) -> None:
         """Execute search and update notes list."""
@@ -979,11 +1165,12 @@ class NotesList(Container):
 
         if not search_text.strip():
             # Empty search - show all notes
-            notes = self.db.get_all_notes()
-            self._populate_list(notes)
+            self._show_all_notes()
             return
 
-        result = execute_search(self.db, search_text)
+        result = execute_search(
+            self.db, search_text, include_transcriptions=self.include_transcriptions
+        )
 
         if result.not_found_tags:
             self.app.notify(f"Tags not found: {', '.join(result.not_found_tags)}", severity="warning")
@@ -1078,12 +1265,25 @@ class NoteDetail(Container, NoteEditorMixin):
     def load_note(self, note_id: str) -> None:
         """Load and display note details.
 
+        Tags, conflicts, attachments and transcription previews are read
+        from the note's display cache, so opening a note takes a single
+        get_note() call; a transcription's full text is fetched when it is
+        expanded. A missing or stale cache is queued for a background
+        rebuild (the note is reloaded once it is done) and meanwhile the
+        stale cache is shown, or the details are queried directly.
+
         Args:
             note_id: ID of the note to display (hex string)
         """
         note = self.db.get_note(note_id)
         if note:
-            tags = note.get("tag_names") or ""
+            note, cache = self._load_display_cache(note_id, note)
+            if cache is not None:
+                tags = ", ".join(
+                    t.get("display_name", t.get("name", "")) for t in cache.get("tags", [])
+                )
+            else:
+                tags = note.get("tag_names") or ""
             self.is_rtl = detect_rtl(tags) or detect_rtl(note["content"])
 
             # Update header
@@ -1096,80 +1296,184 @@ class NoteDetail(Container, NoteEditorMixin):
                 header.update(header_text)
                 header.remove_class("rtl")
 
-            # Check for conflicts
-            conflict_warning = self.query_one("#note-conflict-warning", Label)
+            if cache is not None:
+                self._show_details_from_cache(cache)
+            else:
+                self._show_details_without_cache(note_id)
+
+            # Use mixin to handle content and state
+            self.load_note_content(note_id, note["content"])
+
+    def _load_display_cache(
+        self, note_id: str, note: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Parse the note's display cache, queueing a rebuild if missing or stale.
+
+        Returns:
+            Tuple of (note, cache); cache is None if no usable cache exists.
+        """
+        cache = None
+        cache_str = note.get("display_cache")
+        if cache_str:
             try:
-                conflict_mgr = ConflictManager(self.db)
-                conflict_types = conflict_mgr.get_note_conflict_types(note_id)
-                if conflict_types:
-                    types_str = ", ".join(conflict_types)
-                    conflict_warning.update(f"WARNING: This note has unresolved {types_str} conflict(s)")
-                    conflict_warning.display = True
-                else:
-                    conflict_warning.display = False
-            except Exception as e:
-                logger.warning(f"Error checking conflicts for note {note_id}: {e}")
+                cache = json.loads(cache_str)
+            except json.JSONDecodeError:
+                pass
+        invalidator = get_cache_invalidator(self.db)
+        if cache is None or invalidator.is_dirty(note_id):
+            # VoiceTUI reloads the note when the worker reports it rebuilt
+            logger.info(f"Cache of note {note_id} missing or stale, queued for rebuild")
+            invalidator.request(note_id)
+        return note, cache
+
+    def _show_details_from_cache(self, cache: Dict[str, Any]) -> None:
+        """Show conflicts and attachments from a note's display cache."""
+        conflict_warning = self.query_one("#note-conflict-warning", Label)
+        conflicts = cache.get("conflicts", [])
+        if conflicts:
+            conflict_warning.update(f"WARNING: This note has unresolved {', '.join(conflicts)} conflict(s)")
+            conflict_warning.display = True
+        else:
+            conflict_warning.display = False
+
+        attachments_label = self.query_one("#note-attachments", Label)
+        audio_player = self.query_one("#tui-audio-player")
+        transcriptions_container = self.query_one("#tui-transcriptions")
+
+        audio_files: List[Dict[str, Any]] = []
+        transcription_counts: Dict[str, int] = {}
+        cached_waveforms: Dict[str, List[int]] = {}
+        first_transcriptions: List[Dict[str, Any]] = []
+        for attachment in cache.get("attachments", []):
+            if attachment.get("type") != "audio_file":
+                continue
+            af_data = attachment.get("audio_file", {})
+            audio_id = af_data.get("id", "")
+            transcriptions = af_data.get("transcriptions", [])
+            audio_files.append({
+                "id": audio_id,
+                "filename": af_data.get("filename", ""),
+                "imported_at": af_data.get("imported_at"),
+                "file_created_at": af_data.get("file_created_at"),
+                "summary": af_data.get("summary"),
+            })
+            transcription_counts[audio_id] = len(transcriptions)
+            if af_data.get("waveform"):
+                cached_waveforms[audio_id] = af_data["waveform"]
+            if len(audio_files) == 1:
+                first_transcriptions = [dict(t) for t in transcriptions]
+
+        if not audio_files:
+            audio_player.display = False
+            transcriptions_container.display = False
+            attachments_label.update("Attachments: None")
+            return
+
+        # Show the first file's transcriptions if any file has some
+        if any(transcription_counts.values()):
+            self._transcriptions_container.set_audio_file(audio_files[0]["id"], first_transcriptions)
+            transcriptions_container.display = True
+        else:
+            transcriptions_container.display = False
+
+        if self.audiofile_directory and is_mpv_available():
+            self._audio_player.set_audio_files(
+                audio_files, self.db, transcription_counts, cached_waveforms
+            )
+            audio_player.display = True
+            attachments_label.update("")
+            return
+
+        def cached_time(value: Any) -> str:
+            """Format a cached timestamp, which may be pre-formatted."""
+            if isinstance(value, int):
+                return format_timestamp(value)
+            return str(value) if value else "unknown"
+
+        audio_player.display = False
+        attachment_lines = []
+        for af in audio_files:
+            id_short = af["id"][:UUID_SHORT_LEN]
+            t_count = transcription_counts.get(af["id"], 0)
+            attachment_lines.append(
+                f"  {id_short}... | {af['filename'] or 'unknown'} | T:{t_count} | "
+                f"{cached_time(af['imported_at'])} | {cached_time(af['file_created_at'])}"
+            )
+        attachments_label.update(f"Attachments ({len(audio_files)}):\n" + "\n".join(attachment_lines))
+
+    def _show_details_without_cache(self, note_id: str) -> None:
+        """Query and show conflicts and attachments (no display cache)."""
+        # Check for conflicts
+        conflict_warning = self.query_one("#note-conflict-warning", Label)
+        try:
+            conflict_mgr = ConflictManager(self.db)
+            conflict_types = conflict_mgr.get_note_conflict_types(note_id)
+            if conflict_types:
+                types_str = ", ".join(conflict_types)
+                conflict_warning.update(f"WARNING: This note has unresolved {types_str} conflict(s)")
+                conflict_warning.display = True
+            else:
                 conflict_warning.display = False
+        except Exception as e:
+            logger.warning(f"Error checking conflicts for note {note_id}: {e}")
+            conflict_warning.display = False
 
-            # Update attachments - displayed BELOW content per requirements
-            attachments_label = self.query_one("#note-attachments", Label)
-            audio_player = self.query_one("#tui-audio-player")
-            transcriptions_container = self.query_one("#tui-transcriptions")
-            try:
-                audio_files = self.db.get_audio_files_for_note(note_id)
-                if audio_files:
-                    # Get transcription counts and transcriptions for each audio file
-                    transcription_counts = {}
-                    all_transcriptions: List[Dict[str, Any]] = []
-                    for af in audio_files:
-                        audio_id = af.get("id", "")
-                        transcriptions = self.db.get_transcriptions_for_audio_file(audio_id)
-                        transcription_counts[audio_id] = len(transcriptions)
-                        all_transcriptions.extend(transcriptions)
-
-                    # Show transcriptions if any exist
-                    if all_transcriptions:
-                        first_audio_id = audio_files[0].get("id", "")
-                        first_transcriptions = self.db.get_transcriptions_for_audio_file(first_audio_id)
-                        self._transcriptions_container.set_audio_file(first_audio_id, first_transcriptions)
-                        transcriptions_container.display = True
-                    else:
-                        transcriptions_container.display = False
-
-                    # Use audio player if audiofile directory is configured and MPV available
-                    if self.audiofile_directory and is_mpv_available():
-                        self._audio_player.set_audio_files(
-                            audio_files, self.db, transcription_counts
-                        )
-                        audio_player.display = True
-                        attachments_label.update("")
-                    else:
-                        # Fallback to text display
-                        audio_player.display = False
-                        attachment_lines = []
-                        for af in audio_files:
-                            id_short = af.get("id", "")[:UUID_SHORT_LEN]
-                            filename = af.get("filename", "unknown")
-                            t_count = transcription_counts.get(af.get("id", ""), 0)
-                            imported_at = format_timestamp(af.get("imported_at")) or "unknown"
-                            file_created_at = format_timestamp(af.get("file_created_at")) or "unknown"
-                            attachment_lines.append(
-                                f"  {id_short}... | {filename} | T:{t_count} | {imported_at} | {file_created_at}"
-                            )
-                        attachments_text = f"Attachments ({len(audio_files)}):\n" + "\n".join(attachment_lines)
-                        attachments_label.update(attachments_text)
+        # Update attachments - displayed BELOW content per requirements
+        attachments_label = self.query_one("#note-attachments", Label)
+        audio_player = self.query_one("#tui-audio-player")
+        transcriptions_container = self.query_one("#tui-transcriptions")
+        try:
+            audio_files = self.db.get_audio_files_for_note(note_id)
+            if audio_files:
+                # Get transcription counts and transcriptions for each audio file
+                transcription_counts = {}
+                all_transcriptions: List[Dict[str, Any]] = []
+                for af in audio_files:
+                    audio_id = af.get("id", "")
+                    transcriptions = self.db.get_transcriptions_for_audio_file(audio_id)
+                    transcription_counts[audio_id] = len(transcriptions)
+                    all_transcriptions.extend(transcriptions)
+
+                # Show transcriptions if any exist
+                if all_transcriptions:
+                    first_audio_id = audio_files[0].get("id", "")
+                    first_transcriptions = self.db.get_transcriptions_for_audio_file(first_audio_id)
+                    self._transcriptions_container.set_audio_file(first_audio_id, first_transcriptions)
+                    transcriptions_container.display = True
                 else:
-                    audio_player.display = False
                     transcriptions_container.display = False
-                    attachments_label.update("Attachments: None")
-            except Exception as e:
-                logger.warning(f"Error loading attachments for note {note_id}: {e}")
+
+                # Use audio player if audiofile directory is configured and MPV available
+                if self.audiofile_directory and is_mpv_available():
+                    self._audio_player.set_audio_files(
+                        audio_files, self.db, transcription_counts
+                    )
+                    audio_player.display = True
+                    attachments_label.update("")
+                else:
+                    # Fallback to text display
+                    audio_player.display = False
+                    attachment_lines = []
+                    for af in audio_files:
+                        id_short = af.get("id", "")[:UUID_SHORT_LEN]
+                        filename = af.get("filename", "unknown")
+                        t_count = transcription_counts.get(af.get("id", ""), 0)
+                        imported_at = format_timestamp(af.get("imported_at")) or "unknown"
+                        file_created_at = format_timestamp(af.get("file_created_at")) or "unknown"
+                        attachment_lines.append(
+                            f"  {id_short}... | {filename} | T:{t_count} | {imported_at} | {file_created_at}"
+                        )
+                    attachments_text = f"Attachments ({len(audio_files)}):\n" + "\n".join(attachment_lines)
+                    attachments_label.update(attachments_text)
+            else:
                 audio_player.display = False
                 transcriptions_container.display = False
                 attachments_label.update("Attachments: None")
-
-            # Use mixin to handle content and state
-            self.load_note_content(note_id, note["content"])
+        except Exception as e:
+            logger.warning(f"Error loading attachments for note {note_id}: {e}")
+            audio_player.display = False
+            transcriptions_container.display = False
+            attachments_label.update("Attachments: None")
 
     # ===== NoteEditorMixin abstract method implementations =====
 
@@ -1225,6 +1529,21 @@ class NoteDetail(Container, NoteEditorMixin):
 class VoiceTUI(App):
     """Voice TUI Application."""
 
+    class ScheduledSyncFinished(Message):
+        """Posted from the sync scheduler thread after a background sync."""
+
+        def __init__(self, results: Dict[str, Any], changes: ChangeSet) -> None:
+            super().__init__()
+            self.results = results
+            self.changes = changes
+
+    class CachesRebuilt(Message):
+        """Posted from the cache invalidation worker after rebuilding notes' caches."""
+
+        def __init__(self, note_ids: List[str]) -> None:
+            super().__init__()
+            self.note_ids = note_ids
+
     # LLM NOTE: RTL display in Textual requires BOTH:
     # 1. Unicode RLI/PDI markers around RTL text
     # 2. CSS text-align: right on the widget
@@ -1240,6 +1559,11 @@ class VoiceTUI(App):
         tui_colors = config.get_tui_colors()
         self._border_focused = tui_colors["focused"]
         self._border_unfocused = tui_colors["unfocused"]
+        # Periodic background sync, when "sync_interval" is configured
+        self._sync_scheduler: Optional[SyncScheduler] = None
+        # Rebuilds note caches marked stale by tag edits and syncs
+        self._cache_invalidator = get_cache_invalidator(db)
+        self._cache_listener = lambda note_ids: self.post_message(self.CachesRebuilt(note_ids))
 
     @property
     def CSS(self) -> str:
@@ -1422,6 +1746,7 @@ class VoiceTUI(App):
         Binding("a", "show_all", "All Notes"),
         Binding("t", "manage_tags", "Tags"),
         Binding("m", "toggle_star", "Star"),
+        Binding("i", "toggle_transcript_search", "Transcripts"),
     ]
 
     def compose(self) -> ComposeResult:
@@ -1433,6 +1758,71 @@ class VoiceTUI(App):
         footer.command_palette_key_display = "● ^p"
         yield footer
 
+    def on_mount(self) -> None:
+        """Start background cache rebuilds, and periodic sync if configured."""
+        self._cache_invalidator.add_listener(self._cache_listener)
+        self._cache_invalidator.start()
+
+        interval = self.config.get_sync_interval()
+        if interval > 0:
+            self._sync_scheduler = SyncScheduler(
+                str(self.config.get_config_dir()),
+                interval=interval,
+                # post_message is thread-safe and, unlike call_from_thread,
+                # does not block the scheduler while the app shuts down
+                on_results=lambda results, changes: self.post_message(
+                    self.ScheduledSyncFinished(results, changes)
+                ),
+            )
+            self._sync_scheduler.start()
+
+    def on_unmount(self) -> None:
+        """Stop background sync and cache rebuilds."""
+        if self._sync_scheduler is not None:
+            self._sync_scheduler.stop()
+        self._cache_invalidator.remove_listener(self._cache_listener)
+        self._cache_invalidator.stop()
+
+    def _notify_local_change(self) -> None:
+        """Let the sync scheduler sync local edits soon."""
+        if self._sync_scheduler is not None:
+            self._sync_scheduler.notify_local_change()
+
+    def on_voice_tui_scheduled_sync_finished(self, event: ScheduledSyncFinished) -> None:
+        """Refresh the panes after a background sync."""
+        changes = event.changes
+        self._cache_invalidator.mark_changes(changes)
+        if changes.has_tag_changes or not changes.complete:
+            self.query_one("#tags-tree", TagsTree).reload_tags()
+        if changes.has_note_changes or not changes.complete:
+            notes_list = self.query_one("#notes-list", NotesList)
+            search_text = notes_list.get_search_text()
+            if search_text:
+                notes_list.perform_search(search_text)
+            else:
+                notes_list.refresh_notes()
+
+            # Reload the open note unless it is being edited
+            detail = self.query_one("#note-detail", NoteDetail)
+            note_id = detail.current_note_id
+            if note_id and not detail.editing and (
+                not changes.complete or note_id in changes.updated_notes
+            ):
+                detail.load_note(note_id)
+
+        failed = [peer_id for peer_id, result in event.results.items() if not result.success]
+        pulled = sum(result.pulled for result in event.results.values())
+        if failed:
+            self.notify(f"Background sync failed for {len(failed)} peer(s)", severity="warning")
+        elif pulled:
+            self.notify(f"Synced: {pulled} change(s) received")
+
+    def on_voice_tui_caches_rebuilt(self, event: CachesRebuilt) -> None:
+        """Reload the open note once its stale cache has been rebuilt."""
+        detail = self.query_one("#note-detail", NoteDetail)
+        if detail.current_note_id in event.note_ids and not detail.editing:
+            detail.load_note(detail.current_note_id)
+
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle note selection from the notes listview."""
         notes_list = self.query_one("#notes-list", NotesList)
@@ -1480,6 +1870,7 @@ class VoiceTUI(App):
             self._open_tag_management()
         elif event.button.id == "save-btn":
             detail.save_note()
+            self._notify_local_change()
             # Refresh notes list (preserve search)
             notes_list = self.query_one("#notes-list", NotesList)
             search_text = notes_list.get_search_text()
@@ -1504,6 +1895,7 @@ class VoiceTUI(App):
         """Save the current note."""
         detail = self.query_one("#note-detail", NoteDetail)
         detail.save_note()
+        self._notify_local_change()
 
     def action_show_all(self) -> None:
         """Show all notes (clear search)."""
@@ -1515,6 +1907,7 @@ class VoiceTUI(App):
         """Create a new note and open it for editing."""
         # Create the note
         note_id = self.db.create_note()
+        self._notify_local_change()
 
         # Clear search and refresh notes list
         notes_list = self.query_one("#notes-list", NotesList)
@@ -1540,6 +1933,7 @@ class VoiceTUI(App):
 
     def _on_tag_management_closed(self, result: None) -> None:
         """Called when tag management modal is closed."""
+        self._notify_local_change()
         # Refresh the note detail to show updated tags
         detail = self.query_one("#note-detail", NoteDetail)
         if detail.current_note_id:
@@ -1576,6 +1970,17 @@ class VoiceTUI(App):
         else:
             notes_list.refresh_notes()
 
+    def action_toggle_transcript_search(self) -> None:
+        """Toggle whether search text also matches transcriptions."""
+        notes_list = self.query_one("#notes-list", NotesList)
+        notes_list.include_transcriptions = not notes_list.include_transcriptions
+        state = "included in" if notes_list.include_transcriptions else "excluded from"
+        self.notify(f"Transcriptions {state} search")
+
+        search_text = notes_list.get_search_text()
+        if search_text:
+            notes_list.perform_search(search_text)
+
 
 def add_tui_subparser(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
     """Add TUI subparser and its arguments.
@@ -8,9 +8,9 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtWidgets import (
     QDialog,
@@ -19,17 +19,22 @@ from PySide6.QtWidgets import (
     QMainWindow,
     QMessageBox,
     QPlainTextEdit,
+    QProgressDialog,
     QSplitter,
     QVBoxLayout,
     QWidget,
 )
 
 from src import __version__
+from src.core.cache_invalidation import get_cache_invalidator
 from src.core.config import Config
 from src.core.database import Database
+from src.core.models import ChangeSet
+from src.core.sync_scheduler import SyncScheduler
 from src.core.transcription_service import TranscriptionService
 from src.ui.note_pane import NotePane
 from src.ui.notes_list_pane import NotesListPane
+from src.ui.sync_worker import SyncWorker
 from src.ui.tag_hierarchy_dialog import TagHierarchyDialog
 from src.ui.tags_pane import TagsPane
 from src.ui.transcription_dialog import TranscriptionDialog
@@ -69,6 +74,14 @@ class MainWindow(QMainWindow):
         note_pane: Right pane for note detail
     """
 
+    # Emitted on the scheduler thread after a background sync run
+    # (results, ChangeSet); queued to _on_scheduled_sync on the UI thread
+    _scheduled_sync_finished = Signal(object, object)
+
+    # Emitted on the cache invalidation worker thread with the IDs of notes
+    # whose caches were rebuilt; queued to _on_caches_rebuilt on the UI thread
+    _caches_rebuilt = Signal(list)
+
     def __init__(
         self, config: Config, db: Database, theme: str = "dark", parent: Optional[QWidget] = None
     ) -> None:
@@ -98,8 +111,22 @@ class MainWindow(QMainWindow):
         # Track currently selected note for delete action
         self._current_note_id: Optional[str] = None
 
+        # Background sync started by "Sync Now", and its progress dialog
+        self._sync_worker: Optional[SyncWorker] = None
+        self._sync_progress: Optional[QProgressDialog] = None
+        self._sync_progress_lines: List[str] = []
+
+        # Periodic background sync, when "sync_interval" is configured
+        self._sync_scheduler: Optional[SyncScheduler] = None
+
+        # Rebuilds note caches marked stale by tag edits and syncs
+        self._cache_invalidator = get_cache_invalidator(self.db)
+        self._cache_listener = self._caches_rebuilt.emit
+
         self.setup_ui()
         self.connect_signals()
+        self._start_sync_scheduler()
+        self._start_cache_invalidator()
 
         logger.info("Main window initialized")
 
@@ -247,11 +274,19 @@ class MainWindow(QMainWindow):
         self.delete_note_action.setEnabled(True)
 
     def _on_tag_add_requested(self, tag_id: str) -> None:
-        """Handle tag add request (shift-click) - add tag to current note.
+        """Handle tag add request (shift-click) - add tag to the selected notes.
+
+        With several notes selected in the list the tag is added to all of
+        them in one batch, otherwise to the current note.
 
         Args:
             tag_id: ID of the tag to add (hex string)
         """
+        selected_note_ids = self.notes_list_pane.selected_note_ids()
+        if len(selected_note_ids) > 1:
+            self._add_tag_to_notes(tag_id, selected_note_ids)
+            return
+
         if not self._current_note_id:
             logger.warning("Cannot add tag: no note selected")
             return
@@ -263,24 +298,63 @@ class MainWindow(QMainWindow):
             # Refresh the note pane to show updated tags
             self.note_pane.load_note(self._current_note_id)
             # Mark as having unsynced changes
-            self._has_unsynced_changes = True
-            self._update_sync_action_text()
+            self._mark_unsynced_changes()
         else:
             logger.warning(f"Failed to add tag {tag_id} to note {self._current_note_id}")
 
+    def _add_tag_to_notes(self, tag_id: str, note_ids: List[str]) -> None:
+        """Add a tag to several notes at once.
+
+        Args:
+            tag_id: ID of the tag to add (hex string)
+            note_ids: IDs of the notes to tag
+        """
+        result = self.db.add_tags_to_notes(note_ids, [tag_id])
+        logger.info(f"Added tag {tag_id} to {result['changed']} of {len(note_ids)} selected notes")
+        if not result["note_ids"]:
+            return
+
+        self.apply_changes(ChangeSet(updated_notes=frozenset(result["note_ids"])))
+        if self._current_note_id in result["note_ids"]:
+            self.note_pane.load_note(self._current_note_id)
+        self._mark_unsynced_changes()
+
+    def apply_changes(self, changes: ChangeSet) -> None:
+        """Update the notes list and tag tree for a write or sync.
+
+        Only the rows and tree nodes named in the change set are touched.
+
+        Args:
+            changes: IDs of the notes and tags that changed
+        """
+        self.notes_list_pane.apply_changes(changes)
+        self.tags_pane.apply_changes(changes)
+
+    def _start_cache_invalidator(self) -> None:
+        """Start rebuilding stale note caches in the background."""
+        self._caches_rebuilt.connect(self._on_caches_rebuilt)
+        self._cache_invalidator.add_listener(self._cache_listener)
+        self._cache_invalidator.start()
+
+    def _on_caches_rebuilt(self, note_ids: List[str]) -> None:
+        """Refresh list rows whose caches the background worker rebuilt.
+
+        Args:
+            note_ids: IDs of the notes whose caches were rebuilt
+        """
+        self.notes_list_pane.apply_changes(ChangeSet(updated_notes=frozenset(note_ids)))
+
     def on_note_saved(self, note_id: int) -> None:
-        """Handle note saved event - refresh notes list and mark unsynced.
+        """Handle note saved event - refresh the note's row and mark unsynced.
 
         Args:
             note_id: ID of the saved note
         """
-        self.notes_list_pane.load_notes()
+        self.apply_changes(ChangeSet(updated_notes=frozenset([note_id])))
         self.notes_list_pane.select_note_by_id(note_id)
 
         # Immediately mark as having unsynced changes
-        if not self._has_unsynced_changes:
-            self._has_unsynced_changes = True
-            self._update_sync_action_style()
+        self._mark_unsynced_changes()
 
         logger.info(f"Refreshed notes list after saving note {note_id}")
 
@@ -289,18 +363,19 @@ class MainWindow(QMainWindow):
         note_id = self.db.create_note()
         logger.info(f"Created new note {note_id}")
 
-        # Refresh the notes list and select the new note
-        self.notes_list_pane.load_notes()
-        self.notes_list_pane.select_note_by_id(note_id)
+        # Add the new note to the list and select it; a search result
+        # the note does not appear in is replaced by all notes
+        self.apply_changes(ChangeSet(created_notes=frozenset([note_id])))
+        if not self.notes_list_pane.select_note_by_id(note_id):
+            self.notes_list_pane.load_notes()
+            self.notes_list_pane.select_note_by_id(note_id)
 
         # Load the note in the detail pane and start editing
         self.note_pane.load_note(note_id)
         self.note_pane.start_editing()
 
         # Mark as having unsynced changes
-        if not self._has_unsynced_changes:
-            self._has_unsynced_changes = True
-            self._update_sync_action_style()
+        self._mark_unsynced_changes()
 
     def delete_current_note(self) -> None:
         """Delete the currently selected note after confirmation."""
@@ -331,9 +406,10 @@ class MainWindow(QMainWindow):
 
         # Perform soft delete
         try:
-            success = self.db.delete_note(self._current_note_id)
+            note_id = self._current_note_id
+            success = self.db.delete_note(note_id)
             if success:
-                logger.info(f"Deleted note {self._current_note_id}")
+                logger.info(f"Deleted note {note_id}")
 
                 # Clear the note pane
                 self.note_pane.clear()
@@ -342,13 +418,11 @@ class MainWindow(QMainWindow):
                 self.delete_note_action.setEnabled(False)
                 self._current_note_id = None
 
-                # Refresh notes list
-                self.notes_list_pane.load_notes()
+                # Remove the note's row from the list
+                self.apply_changes(ChangeSet(deleted_notes=frozenset([note_id])))
 
                 # Mark as having unsynced changes
-                if not self._has_unsynced_changes:
-                    self._has_unsynced_changes = True
-                    self._update_sync_action_style()
+                self._mark_unsynced_changes()
             else:
                 self._show_error("Delete Failed", "Failed to delete the note.")
         except Exception as e:
@@ -384,6 +458,14 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.warning(f"Error checking unsynced changes: {e}")
 
+    def _mark_unsynced_changes(self) -> None:
+        """Flag local edits as unsynced and let the scheduler sync them soon."""
+        if not self._has_unsynced_changes:
+            self._has_unsynced_changes = True
+            self._update_sync_action_style()
+        if self._sync_scheduler is not None:
+            self._sync_scheduler.notify_local_change()
+
     def _update_sync_action_style(self) -> None:
         """Update the Sync Now menu item text based on unsynced state."""
         if self._has_unsynced_changes:
@@ -407,18 +489,27 @@ class MainWindow(QMainWindow):
             self.note_pane.load_note(self._current_note_id)
 
         # Mark as having unsynced changes
-        if not self._has_unsynced_changes:
-            self._has_unsynced_changes = True
-            self._update_sync_action_style()
+        self._mark_unsynced_changes()
 
         logger.info("Tags modified - refreshed UI")
 
     def sync_now(self) -> None:
-        """Perform sync with all configured peers."""
+        """Start a sync with all configured peers in the background.
+
+        A progress dialog lists peers as they finish and lets the user
+        cancel. The window stays usable meanwhile; when the sync is done
+        only the notes and tags it touched are refreshed.
+        """
         if not SYNC_AVAILABLE:
             self._show_warning("Sync Unavailable", "Sync functionality is not available.")
             return
 
+        if self._sync_worker is not None and self._sync_worker.is_running():
+            if self._sync_progress is not None:
+                self._sync_progress.show()
+                self._sync_progress.raise_()
+            return
+
         peers = self.config.get_peers()
         if not peers:
             self._show_info(
@@ -429,49 +520,156 @@ class MainWindow(QMainWindow):
             )
             return
 
-        try:
-            config_dir = str(self.config.get_config_dir())
-            results: Dict[str, object] = sync_all_peers(config_dir)
+        config_dir = str(self.config.get_config_dir())
+        self._sync_worker = SyncWorker(sync_all_peers, config_dir, parent=self)
+        self._sync_worker.peer_finished.connect(self._on_sync_peer_finished)
+        self._sync_worker.finished.connect(self._on_sync_finished)
+        self._sync_worker.failed.connect(self._on_sync_failed)
 
-            if not results:
-                self._show_info("Sync Complete", "No peers to sync with.")
-                return
+        self._sync_progress_lines = []
+        self._sync_progress = QProgressDialog(
+            f"Syncing with {len(peers)} peer(s)...", "Cancel", 0, len(peers), self
+        )
+        self._sync_progress.setWindowTitle("Sync")
+        self._sync_progress.setWindowModality(Qt.WindowModality.NonModal)
+        self._sync_progress.setAutoClose(False)
+        self._sync_progress.setAutoReset(False)
+        self._sync_progress.setMinimumDuration(0)
+        self._sync_progress.setValue(0)
+        self._sync_progress.canceled.connect(self._cancel_sync)
+
+        self.sync_now_action.setEnabled(False)
+        self._sync_worker.start()
+
+    def _cancel_sync(self) -> None:
+        """Cancel the running background sync."""
+        if self._sync_worker is not None:
+            self._sync_worker.cancel()
+        if self._sync_progress is not None:
+            self._sync_progress.setLabelText("Cancelling sync...")
+
+    def _sync_summary_line(self, peer_id: str, result: Any) -> str:
+        """One line describing a peer's sync result.
 
-            # Build result summary
-            all_success = True
-            summary_lines = []
-            for peer_id, result in results.items():
-                peer = self.config.get_peer(peer_id)
-                peer_name = peer.get("peer_name", peer_id) if peer else peer_id
+        Args:
+            peer_id: Peer the result belongs to
+            result: SyncResult for the peer
+        """
+        peer = self.config.get_peer(peer_id)
+        peer_name = peer.get("peer_name", peer_id) if peer else peer_id
+        if result.success:
+            return f"{peer_name}: OK (pulled {result.pulled}, pushed {result.pushed})"
+        errors = ", ".join(result.errors) if result.errors else "Unknown error"
+        return f"{peer_name}: FAILED - {errors}"
 
-                if result.success:
-                    summary_lines.append(
-                        f"{peer_name}: OK (pulled {result.pulled}, pushed {result.pushed})"
-                    )
-                else:
-                    all_success = False
-                    errors = ", ".join(result.errors) if result.errors else "Unknown error"
-                    summary_lines.append(f"{peer_name}: FAILED - {errors}")
+    def _on_sync_peer_finished(self, peer_id: str, result: Any) -> None:
+        """Show a peer's result in the progress dialog as soon as it is done.
 
-            # Refresh notes list after sync
-            self.notes_list_pane.load_notes()
-            self.tags_pane.load_tags()
+        Args:
+            peer_id: Peer that finished
+            result: SyncResult for the peer
+        """
+        self._sync_progress_lines.append(self._sync_summary_line(peer_id, result))
+        if self._sync_progress is not None:
+            self._sync_progress.setValue(len(self._sync_progress_lines))
+            if not self._sync_progress.wasCanceled():
+                self._sync_progress.setLabelText("\n".join(self._sync_progress_lines))
+
+    def _finish_sync(self) -> None:
+        """Close the progress dialog and re-enable Sync Now."""
+        if self._sync_progress is not None:
+            self._sync_progress.close()
+            self._sync_progress.deleteLater()
+            self._sync_progress = None
+        self.sync_now_action.setEnabled(True)
+
+    def _on_sync_finished(self, results: Dict[str, Any]) -> None:
+        """Refresh the panes and report the outcome of a background sync.
 
-            # Re-check unsynced changes
-            self._check_unsynced_changes()
+        Args:
+            results: Dict mapping peer_id to SyncResult
+        """
+        cancelled = self._sync_worker is not None and self._sync_worker.is_cancelled()
+        self._finish_sync()
 
-            # Show result
-            summary = "\n".join(summary_lines)
-            if all_success:
-                self._show_info("Sync Complete", summary)
-            else:
-                self._show_warning("Sync Completed with Errors", summary)
+        if not results:
+            self._show_info("Sync Complete", "No peers to sync with.")
+            return
 
-            logger.info(f"Sync completed: {summary_lines}")
+        summary_lines = [
+            self._sync_summary_line(peer_id, result) for peer_id, result in results.items()
+        ]
+        all_success = all(result.success for result in results.values())
 
-        except Exception as e:
-            logger.error(f"Sync failed: {e}")
-            self._show_error("Sync Failed", f"An error occurred during sync:\n\n{e}")
+        # Update only the notes and tags the sync touched
+        changes = ChangeSet.from_sync_results(results.values())
+        self._cache_invalidator.mark_changes(changes)
+        self.apply_changes(changes)
+
+        # Re-check unsynced changes
+        self._check_unsynced_changes()
+
+        # Show result
+        summary = "\n".join(summary_lines)
+        if cancelled:
+            self._show_warning("Sync Cancelled", summary)
+        elif all_success:
+            self._show_info("Sync Complete", summary)
+        else:
+            self._show_warning("Sync Completed with Errors", summary)
+
+        logger.info(f"Sync completed: {summary_lines}")
+
+    def _on_sync_failed(self, error: str) -> None:
+        """Report a background sync that could not run.
+
+        Args:
+            error: Error message
+        """
+        self._finish_sync()
+        logger.error(f"Sync failed: {error}")
+        self._show_error("Sync Failed", f"An error occurred during sync:\n\n{error}")
+
+    def _start_sync_scheduler(self) -> None:
+        """Start periodic background sync if an interval is configured."""
+        interval = self.config.get_sync_interval()
+        if not SYNC_AVAILABLE or interval <= 0:
+            return
+        self._scheduled_sync_finished.connect(self._on_scheduled_sync)
+        self._sync_scheduler = SyncScheduler(
+            str(self.config.get_config_dir()),
+            interval=interval,
+            on_results=self._scheduled_sync_finished.emit,
+        )
+        self._sync_scheduler.start()
+
+    def _on_scheduled_sync(self, results: Dict[str, Any], changes: ChangeSet) -> None:
+        """Refresh the panes after a background sync, without a popup.
+
+        Args:
+            results: Dict mapping peer_id to SyncResult
+            changes: Notes and tags the sync touched
+        """
+        self._cache_invalidator.mark_changes(changes)
+        self.apply_changes(changes)
+        self._check_unsynced_changes()
+
+        summary_lines = [
+            self._sync_summary_line(peer_id, result) for peer_id, result in results.items()
+        ]
+        level = "info" if all(result.success for result in results.values()) else "warning"
+        self._log_message(level, "Background Sync", "\n".join(summary_lines))
+        logger.info(f"Background sync completed: {summary_lines}")
+
+    def closeEvent(self, event: Any) -> None:
+        """Stop background syncs when the window closes."""
+        if self._sync_worker is not None:
+            self._sync_worker.cancel()
+        if self._sync_scheduler is not None:
+            self._sync_scheduler.stop()
+        self._cache_invalidator.remove_listener(self._cache_listener)
+        self._cache_invalidator.stop()
+        super().closeEvent(event)
 
     # ===== User-facing message methods =====
 
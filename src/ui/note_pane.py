@@ -22,6 +22,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from src.core.cache_invalidation import get_cache_invalidator
 from src.core.conflicts import ConflictManager
 from src.core.database import Database
 from src.core.models import UUID_SHORT_LEN
@@ -68,6 +69,10 @@ class NotePane(QWidget, NoteEditorMixin):
     note_saved = Signal(str)  # Emits note_id when saved
     transcribe_requested = Signal(str)  # Emits audio_file_id when transcription requested
 
+    # Emitted on the cache invalidation worker thread with the IDs of notes
+    # whose caches were rebuilt; queued to _on_caches_rebuilt on the UI thread
+    _caches_rebuilt = Signal(list)
+
     def __init__(
         self,
         db: Database,
@@ -89,6 +94,13 @@ class NotePane(QWidget, NoteEditorMixin):
         self.config_dir = Path(config_dir) if config_dir else None
         self.init_editor_state()  # Initialize mixin state
 
+        # Stale caches are rebuilt by the shared worker, never on the UI thread
+        self._cache_invalidator = get_cache_invalidator(db)
+        self._caches_rebuilt.connect(self._on_caches_rebuilt)
+        cache_listener = self._caches_rebuilt.emit
+        self._cache_invalidator.add_listener(cache_listener)
+        self.destroyed.connect(lambda: self._cache_invalidator.remove_listener(cache_listener))
+
         self.setup_ui()
 
         logger.info("Note pane initialized")
@@ -195,8 +207,9 @@ class NotePane(QWidget, NoteEditorMixin):
     def load_note(self, note_id: str) -> None:
         """Load and display note details.
 
-        Uses the display cache for faster loading when available.
-        If cache is not populated, rebuilds it and reloads.
+        Uses the display cache for faster loading when available. A
+        missing or stale cache is queued for a background rebuild, and the
+        note is reloaded once it is done.
 
         Args:
             note_id: ID of the note to display (hex string)
@@ -234,25 +247,12 @@ class NotePane(QWidget, NoteEditorMixin):
             except json.JSONDecodeError:
                 pass
 
-        if cache is None:
-            # Cache not populated - show empty strings, rebuild cache, then reload
-            logger.info(f"Cache not populated for note {note_id}, rebuilding...")
-            self.tags_display.setText("")
-            self.conflict_label.hide()
-            self.attachments_label.setText("Attachments:")
-            self.attachments_list.clear()
-            self.audio_player.hide()
-            self.transcriptions_container.hide()
-            self._current_audio_files = []
-
-            # Rebuild cache and re-fetch note to get updated cache
-            try:
-                self.db.rebuild_note_cache(note_id)
-                note = self.db.get_note(note_id)
-                if note and note.get("display_cache"):
-                    cache = json.loads(note["display_cache"])
-            except Exception as e:
-                logger.warning(f"Failed to rebuild cache for note {note_id}: {e}")
+        if cache is None or self._cache_invalidator.is_dirty(note_id):
+            # Missing or stale: the background worker rebuilds it ahead of
+            # other dirty notes and _on_caches_rebuilt() reloads the note.
+            # Until then show the stale cache or query directly.
+            logger.info(f"Cache of note {note_id} missing or stale, queued for rebuild")
+            self._cache_invalidator.request(note_id)
 
         # Load from cache if available, otherwise fall back to direct queries
         if cache:
@@ -446,7 +446,14 @@ class NotePane(QWidget, NoteEditorMixin):
         self._current_audio_files = []
 
         try:
-            audio_files = self.db.get_audio_files_for_note(note_id)
+            # Audio files and their transcriptions in a single database call
+            attachments = self.db.get_attachments_with_audio_files(
+                note_id, include_transcriptions=True
+            ) or []
+            audio_files = [
+                a["audio_file"] for a in attachments
+                if a.get("audio_file") and not a["audio_file"].get("deleted_at")
+            ]
             self._current_audio_files = audio_files
             if audio_files:
                 self.attachments_label.setText(f"Audio Files ({len(audio_files)}):")
@@ -455,7 +462,7 @@ class NotePane(QWidget, NoteEditorMixin):
                 transcription_counts = {}
                 for af in audio_files:
                     audio_id = af.get("id", "")
-                    transcriptions = self.db.get_transcriptions_for_audio_file(audio_id)
+                    transcriptions = af.get("transcriptions", [])
                     transcription_counts[audio_id] = len(transcriptions)
 
                     # Show transcriptions for the first audio file by default
@@ -557,6 +564,15 @@ class NotePane(QWidget, NoteEditorMixin):
         self._current_audio_files = []
         self.clear_editor()  # Handles content and state via mixin
 
+    def _on_caches_rebuilt(self, note_ids: List[str]) -> None:
+        """Reload the shown note once the worker has rebuilt its cache.
+
+        Args:
+            note_ids: IDs of the notes whose caches were rebuilt
+        """
+        if self.current_note_id in note_ids and not self.editing:
+            self.load_note(self.current_note_id)
+
     def _open_tag_management(self) -> None:
         """Open the tag management dialog."""
         if not self.current_note_id:
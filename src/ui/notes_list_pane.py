@@ -6,10 +6,23 @@ Each note displays created_at on the first line and truncated content on the sec
 
 from __future__ import annotations
 
+import json
 import logging
-from typing import Any, Dict, List, Optional, Union
-
-from PySide6.QtCore import QEvent, QModelIndex, QPersistentModelIndex, QSize, Qt, Signal
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QEvent,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QSize,
+    Qt,
+    QTimer,
+    Signal,
+)
 from PySide6.QtGui import (
     QAbstractTextDocumentLayout,
     QColor,
@@ -24,8 +37,7 @@ from PySide6.QtGui import (
 from PySide6.QtWidgets import (
     QFrame,
     QHBoxLayout,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QPushButton,
     QTextEdit,
     QToolButton,
@@ -38,10 +50,11 @@ from PySide6.QtWidgets import (
 
 from src.core.config import Config
 from src.core.database import Database
+from src.core.models import ChangeSet
 from src.core.search import (
+    SearchCache,
+    SearchResult,
     build_tag_search_term,
-    execute_search,
-    find_ambiguous_tags,
     parse_search_input,
 )
 from src.core.timestamp_utils import format_timestamp
@@ -51,6 +64,11 @@ logger = logging.getLogger(__name__)
 
 # Constants
 CONTENT_TRUNCATE_LENGTH = 200
+SEARCH_DEBOUNCE_MS = 250  # Typing pause before search-as-you-type runs
+NOTES_PAGE_SIZE = 200  # Rows added to the list per fetchMore()
+DISPLAY_CACHE_SIZE = 2000  # Formatted rows kept by NotesListModel
+LAYOUT_CACHE_SIZE = 500  # Laid-out QTextDocuments kept by HTMLDelegate
+SIZE_CACHE_SIZE = 50000  # Row size hints kept by HTMLDelegate
 
 # Custom item data roles (typed to satisfy mypy)
 ROLE_NOTE_ID = Qt.ItemDataRole.UserRole
@@ -126,38 +144,391 @@ class SearchTextEdit(QTextEdit):
         super().keyPressEvent(event)
 
 
-class NotesListWidget(QListWidget):
-    """Custom list widget that emits itemActivated on Space key."""
+class NotesListView(QListView):
+    """Custom list view that emits activated on Space key."""
 
     def keyPressEvent(self, event: QKeyEvent) -> None:
-        """Handle key press - emit itemActivated on Space."""
+        """Handle key press - emit activated on Space."""
         if event.key() == Qt.Key.Key_Space:
-            item = self.currentItem()
-            if item:
-                self.itemActivated.emit(item)
+            index = self.currentIndex()
+            if index.isValid():
+                self.activated.emit(index)
                 event.accept()
                 return
         super().keyPressEvent(event)
 
 
+class NotesListModel(QAbstractListModel):
+    """List model of notes that loads and formats rows on demand.
+
+    Without a search the notes are read from the database NOTES_PAGE_SIZE
+    at a time as the view scrolls (canFetchMore/fetchMore). Search results
+    are already in memory but are still exposed page by page. A row's HTML
+    and plain text are only built when the view asks for them, and the
+    most recent DISPLAY_CACHE_SIZE are kept.
+    """
+
+    def __init__(
+        self, db: Database, page_size: int = NOTES_PAGE_SIZE, parent: Optional[QObject] = None
+    ) -> None:
+        """Initialize an empty model.
+
+        Args:
+            db: Database connection
+            page_size: Rows added per fetchMore()
+            parent: Parent object (default None)
+        """
+        super().__init__(parent)
+        self.db = db
+        self.page_size = page_size
+        self._notes: List[Dict[str, Any]] = []  # Rows exposed to the view
+        self._source: Optional[List[Dict[str, Any]]] = None  # Search results, or None for all notes
+        self._has_more = False  # More notes in the database (all-notes mode)
+        self._display: OrderedDict[str, Tuple[str, str, bool]] = OrderedDict()
+
+    def load_all(self) -> None:
+        """Show all notes, reading them from the database page by page."""
+        self.beginResetModel()
+        self._source = None
+        self._display.clear()
+        page = self.db.get_notes_page(self.page_size)
+        self._notes = list(page["notes"])
+        self._has_more = bool(page["has_more"])
+        self.endResetModel()
+
+    def set_notes(self, notes: List[Dict[str, Any]]) -> None:
+        """Show the given notes, e.g. a search result.
+
+        Args:
+            notes: List of note dictionaries, in display order
+        """
+        self.beginResetModel()
+        self._source = list(notes)
+        self._display.clear()
+        self._notes = list(notes[:self.page_size])
+        self._has_more = False
+        self.endResetModel()
+
+    def is_showing_all(self) -> bool:
+        """Whether the model lists all notes rather than a search result."""
+        return self._source is None
+
+    def rowCount(self, parent: Union[QModelIndex, QPersistentModelIndex] = QModelIndex()) -> int:
+        """Number of rows fetched so far."""
+        return 0 if parent.isValid() else len(self._notes)
+
+    def canFetchMore(self, parent: Union[QModelIndex, QPersistentModelIndex]) -> bool:
+        """Whether more notes can be added below the last row."""
+        if parent.isValid():
+            return False
+        if self._source is not None:
+            return len(self._notes) < len(self._source)
+        return self._has_more
+
+    def fetchMore(self, parent: Union[QModelIndex, QPersistentModelIndex]) -> None:
+        """Append the next page of notes."""
+        if not self.canFetchMore(parent):
+            return
+        start = len(self._notes)
+        if self._source is not None:
+            more = self._source[start:start + self.page_size]
+        else:
+            last = self._notes[-1]
+            page = self.db.get_notes_page(
+                self.page_size, after_created_at=last["created_at"], after_id=last["id"]
+            )
+            more = page["notes"]
+            self._has_more = bool(page["has_more"]) and bool(more)
+        if not more:
+            return
+        self.beginInsertRows(QModelIndex(), start, start + len(more) - 1)
+        self._notes.extend(more)
+        self.endInsertRows()
+
+    def data(self, index: Union[QModelIndex, QPersistentModelIndex], role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Return note ID, HTML, plain text or marked state for a row."""
+        if not index.isValid() or not 0 <= index.row() < len(self._notes):
+            return None
+        note = self._notes[index.row()]
+        if role == ROLE_NOTE_ID:
+            return note["id"]
+        if role not in (Qt.ItemDataRole.DisplayRole, ROLE_HTML_TEXT, ROLE_MARKED):
+            return None
+        html_text, plain_text, is_marked = self._display_for(note)
+        if role == ROLE_HTML_TEXT:
+            return html_text
+        if role == ROLE_MARKED:
+            return is_marked
+        return plain_text
+
+    def note_at(self, row: int) -> Dict[str, Any]:
+        """Return the note dictionary shown in a row."""
+        return self._notes[row]
+
+    def row_of(self, note_id: str, fetch: bool = False) -> int:
+        """Find the row showing a note.
+
+        Args:
+            note_id: Note ID to look for
+            fetch: Keep fetching pages until the note is found
+
+        Returns:
+            Row number, or -1 if the note is not in the list.
+        """
+        start = 0
+        while True:
+            for row in range(start, len(self._notes)):
+                if self._notes[row]["id"] == note_id:
+                    return row
+            if not fetch or not self.canFetchMore(QModelIndex()):
+                return -1
+            start = len(self._notes)
+            self.fetchMore(QModelIndex())
+
+    def update_note(self, row: int, note: Dict[str, Any]) -> None:
+        """Replace the note shown in a row and redraw it.
+
+        Args:
+            row: Row to update
+            note: Fresh note dictionary from the database
+        """
+        self._notes[row] = note
+        if self._source is not None and row < len(self._source):
+            self._source[row] = note
+        self._display.pop(note["id"], None)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def insert_note(self, note: Dict[str, Any]) -> int:
+        """Insert a note at its place in the newest-first order.
+
+        A note that sorts below the last fetched row is left for fetchMore()
+        to bring in, unless there is nothing more to fetch.
+
+        Args:
+            note: Note dictionary from the database
+
+        Returns:
+            Row the note was inserted at, or -1 if it was not inserted.
+        """
+        key = (note["created_at"], note["id"])
+        row = next(
+            (i for i, n in enumerate(self._notes) if (n["created_at"], n["id"]) < key),
+            len(self._notes),
+        )
+        if self._source is not None:
+            source_row = next(
+                (i for i, n in enumerate(self._source) if (n["created_at"], n["id"]) < key),
+                len(self._source),
+            )
+            self._source.insert(source_row, note)
+            if row == len(self._notes) and source_row > row:
+                return -1  # Paged in by fetchMore()
+        elif row == len(self._notes) and self._has_more:
+            return -1
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._notes.insert(row, note)
+        self.endInsertRows()
+        return row
+
+    def remove_note(self, note_id: str) -> bool:
+        """Remove a note from the list.
+
+        Args:
+            note_id: Note ID to remove
+
+        Returns:
+            True if the note was shown and removed, False otherwise.
+        """
+        if self._source is not None:
+            self._source = [n for n in self._source if n["id"] != note_id]
+        self._display.pop(note_id, None)
+        row = self.row_of(note_id)
+        if row < 0:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._notes[row]
+        self.endRemoveRows()
+        return True
+
+    def _display_for(self, note: Dict[str, Any]) -> Tuple[str, str, bool]:
+        """Formatted (html, plain text, marked) for a note, cached."""
+        note_id = note["id"]
+        display = self._display.get(note_id)
+        if display is not None:
+            self._display.move_to_end(note_id)
+            return display
+        display = self._build_note_item_display(note)
+        self._display[note_id] = display
+        if len(self._display) > DISPLAY_CACHE_SIZE:
+            self._display.popitem(last=False)
+        return display
+
+    def _build_note_item_display(self, note: Dict[str, Any]) -> Tuple[str, str, bool]:
+        """Build HTML and plain text display for a note item.
+
+        Args:
+            note: Note dictionary from database
+
+        Returns:
+            Tuple of (html_text, plain_text, is_marked)
+        """
+        # Try to use cached data if available
+        list_cache = note.get("list_display_cache")
+        duration_seconds = None
+        tags: List[str] = []
+        if list_cache:
+            try:
+                cache_data = json.loads(list_cache)
+                # "date" in cache is pre-formatted string; fallback formats the integer timestamp
+                created_at = cache_data.get("date") or format_timestamp(note.get("created_at")) or "Unknown"
+                is_marked = cache_data.get("marked", False)
+                content = cache_data.get("content_preview", "")
+                duration_seconds = cache_data.get("duration_seconds")
+                tags = cache_data.get("tags", [])
+                # Truncate cached preview if longer than display limit
+                if len(content) > CONTENT_TRUNCATE_LENGTH:
+                    content = content[:CONTENT_TRUNCATE_LENGTH] + "..."
+                elif len(note.get("content", "")) > len(content):
+                    # Original was truncated by cache, add ellipsis
+                    content = content + "..."
+            except (json.JSONDecodeError, TypeError):
+                # Fall back to computing values
+                list_cache = None
+
+        if not list_cache:
+            # No cache or cache parse failed - compute values
+            # Format Unix timestamp for display
+            created_at = format_timestamp(note.get("created_at")) or "Unknown"
+            is_marked = self.db.is_note_marked(note["id"])
+            content = note.get("content", "")
+            # Replace newlines and carriage returns with spaces
+            content = content.replace("\n", " ").replace("\r", "")
+            # Truncate if too long
+            if len(content) > CONTENT_TRUNCATE_LENGTH:
+                content = content[:CONTENT_TRUNCATE_LENGTH] + "..."
+            # Tags not available without cache
+            tags = []
+
+        # Build star HTML
+        if is_marked:
+            star_html = f'<span style="color: {STAR_COLOR_GOLD};">{STAR_FILLED}</span>'
+        else:
+            star_html = f'<span style="color: {STAR_COLOR_GRAY};">{STAR_EMPTY}</span>'
+
+        # Format duration if available
+        duration_str = ""
+        if duration_seconds is not None and duration_seconds > 0:
+            duration_str = f" | {format_duration(duration_seconds)}"
+
+        # Format tags if available
+        tags_str = ""
+        if tags:
+            tags_str = f" | {', '.join(tags)}"
+
+        # Create two-line text with star, bold date/time, optional duration, optional tags
+        # Top row is forced LTR so date/duration/tags display correctly even with RTL content
+        # Bottom row: explicit direction, single line with overflow hidden
+        content_dir = detect_text_direction(content)
+        html_text = (
+            f'<div dir="ltr">{star_html} <b>{created_at}</b>{duration_str}{tags_str}</div>'
+            f'<div dir="{content_dir}" style="overflow: hidden;">{content}</div>'
+        )
+
+        # Plain text for accessibility
+        star_plain = STAR_FILLED if is_marked else STAR_EMPTY
+        plain_text = f"{star_plain} {created_at}\n{content}"
+
+        return html_text, plain_text, is_marked
+
+
+class _Layout(NamedTuple):
+    """A laid-out row document cached by HTMLDelegate."""
+
+    doc: QTextDocument
+    height: int
+    ideal_width: int
+
+
 class HTMLDelegate(QStyledItemDelegate):
     """Custom delegate to render HTML in list widget items.
 
+    Laid-out documents and size hints are cached by (note id, HTML hash,
+    width, theme), so scrolling back over rows that were already drawn
+    neither re-parses HTML nor re-runs text layout. Size hints are kept in a
+    separate, larger cache because the view asks for them for every row.
+    Call invalidate() when a note's row changes.
+
     Signals:
         star_clicked: Emitted when the star icon is clicked (note_id: str)
     """
 
     star_clicked = Signal(str)  # Emits note_id when star is clicked
 
-    def __init__(self, parent: Optional[QWidget] = None, theme: str = "dark") -> None:
+    def __init__(
+        self,
+        parent: Optional[QWidget] = None,
+        theme: str = "dark",
+        cache_size: int = LAYOUT_CACHE_SIZE,
+    ) -> None:
         """Initialize the delegate.
 
         Args:
             parent: Parent widget
             theme: UI theme ("dark" or "light")
+            cache_size: Number of laid-out documents to keep (0 disables caching)
         """
         super().__init__(parent)
         self.theme = theme
+        self.cache_size = cache_size
+        # Least recently used first
+        self._layouts: OrderedDict[Tuple[str, int, int, str], _Layout] = OrderedDict()
+        self._sizes: OrderedDict[Tuple[str, int, int, str], QSize] = OrderedDict()
+
+    def _layout(self, note_id: str, html: str, width: int, option: QStyleOptionViewItem) -> _Layout:
+        """Return html laid out at width, from the cache when possible.
+
+        Args:
+            note_id: ID of the note the row shows
+            html: Full HTML to render
+            width: Text width to lay out at
+            option: Style option supplying the font
+        """
+        key = (note_id, hash(html), width, self.theme)
+        layout = self._layouts.get(key)
+        if layout is not None:
+            self._layouts.move_to_end(key)
+            return layout
+
+        layout = self._lay_out(html, width, option)
+        if self.cache_size > 0:
+            self._layouts[key] = layout
+            if len(self._layouts) > self.cache_size:
+                self._layouts.popitem(last=False)
+        return layout
+
+    @staticmethod
+    def _lay_out(html: str, width: int, option: QStyleOptionViewItem) -> _Layout:
+        """Parse and lay out html without caching."""
+        doc = QTextDocument()
+        doc.setTextWidth(width)
+        doc.setDefaultFont(option.font)
+        doc.setHtml(html)
+        return _Layout(doc, int(doc.size().height()), int(doc.idealWidth()))
+
+    def invalidate(self, note_id: Optional[str] = None) -> None:
+        """Drop cached layouts for one note, or for all notes.
+
+        Args:
+            note_id: Note whose row changed, or None to clear everything
+        """
+        if note_id is None:
+            self._layouts.clear()
+            self._sizes.clear()
+            return
+        for cache in (self._layouts, self._sizes):
+            for key in [key for key in cache if key[0] == note_id]:
+                del cache[key]
 
     def editorEvent(
         self,
@@ -188,11 +559,6 @@ class HTMLDelegate(QStyledItemDelegate):
             super().paint(painter, option, index)
             return
 
-        # Create text document for rendering
-        doc = QTextDocument()
-        doc.setTextWidth(option.rect.width() - 2)  # Ultra-minimal margin
-        doc.setDefaultFont(option.font)
-
         # Determine text color based on selection state
         if option.state & QStyle.StateFlag.State_Selected:
             text_color = option.palette.color(QPalette.ColorGroup.Active, QPalette.ColorRole.HighlightedText)
@@ -201,10 +567,13 @@ class HTMLDelegate(QStyledItemDelegate):
 
         # Set HTML with proper text color and ultra-tight line height
         html_with_color = f'<div style="color: {text_color.name()}; line-height: 1.0;">{html_text}</div>'
-        doc.setHtml(html_with_color)
+        layout = self._layout(
+            index.data(ROLE_NOTE_ID) or "", html_with_color, option.rect.width() - 2, option
+        )  # Ultra-minimal margin
+        doc = layout.doc
 
-        # Calculate actual content height
-        content_height = int(doc.size().height())
+        # Actual content height
+        content_height = layout.height
 
         # Save painter state
         painter.save()
@@ -250,16 +619,23 @@ class HTMLDelegate(QStyledItemDelegate):
         if not html_text:
             return super().sizeHint(option, index)
 
-        # Create text document to calculate size
-        doc = QTextDocument()
-        # Apply same line height as in paint
+        # Calculate size from a document with the same line height as in paint
         html_with_style = f'<div style="line-height: 1.0;">{html_text}</div>'
-        doc.setHtml(html_with_style)
-        doc.setTextWidth(option.rect.width() - 2 if option.rect.width() > 0 else 400)
-        doc.setDefaultFont(option.font)
-
-        # Return size with absolute minimal padding + space for 1px dividing line
-        return QSize(int(doc.idealWidth()) + 2, int(doc.size().height()) + 1 + 2)
+        width = option.rect.width() - 2 if option.rect.width() > 0 else 400
+        key = (index.data(ROLE_NOTE_ID) or "", hash(html_with_style), width, self.theme)
+        size = self._sizes.get(key)
+        if size is not None:
+            self._sizes.move_to_end(key)
+            return size
+
+        # Size with absolute minimal padding + space for 1px dividing line
+        layout = self._lay_out(html_with_style, width, option)
+        size = QSize(layout.ideal_width + 2, layout.height + 1 + 2)
+        if self.cache_size > 0:
+            self._sizes[key] = size
+            if len(self._sizes) > SIZE_CACHE_SIZE:
+                self._sizes.popitem(last=False)
+        return size
 
 
 class NotesListPane(QWidget):
@@ -274,6 +650,10 @@ class NotesListPane(QWidget):
     - tag:tagname syntax for tag filtering (case-insensitive)
     - Hierarchical paths like tag:Europe/France/Paris
 
+    Results update as you type: once typing pauses for SEARCH_DEBOUNCE_MS
+    the search runs on a worker thread, and results of searches overtaken
+    by newer input are discarded. Recent results are cached.
+
     Signals:
         note_selected: Emitted when a note is clicked (note_id: int)
 
@@ -282,11 +662,14 @@ class NotesListPane(QWidget):
         db: Database connection
         search_field: QLineEdit for search input
         search_button: QPushButton to trigger search
-        list_widget: QListWidget for displaying notes
+        notes_model: NotesListModel holding the listed notes
+        list_widget: NotesListView displaying notes_model
         warning_color: Hex color for highlighting ambiguous tags
     """
 
     note_selected = Signal(str)  # Emits note_id (UUID hex string)
+    # Worker thread -> UI thread: (search generation, SearchResult)
+    _search_finished = Signal(int, object)
 
     def __init__(
         self, config: Config, db: Database, theme: str = "dark", parent: Optional[QWidget] = None
@@ -306,6 +689,17 @@ class NotesListPane(QWidget):
         self.warning_color = self.config.get_warning_color(theme=theme)
         self._updating_search_field = False  # Flag to prevent recursive updates
 
+        # Search-as-you-type: each new search bumps the generation so that
+        # queued or running searches for older input are ignored
+        self.search_cache = SearchCache(db)
+        self._search_generation = 0
+        self._search_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notes-search")
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._start_background_search)
+        self._search_finished.connect(self._on_background_search_finished)
+
         self.setup_ui()
         self.load_notes()
 
@@ -371,7 +765,7 @@ class NotesListPane(QWidget):
         self.clear_button.clicked.connect(self.clear_search)
 
         self.search_field = SearchTextEdit()
-        self.search_field.setPlaceholderText("Search notes... (use tag:tagname or is:marked)")
+        self.search_field.setPlaceholderText("Search notes... (use tag:tagname, transcript:words or is:marked)")
         self.search_field.setAcceptRichText(False)  # Use plain text to prevent formatting inheritance
         # Configure as single-line input with no frame (container provides the frame)
         self.search_field.setFrameShape(QFrame.Shape.NoFrame)
@@ -392,15 +786,27 @@ class NotesListPane(QWidget):
         self.search_button.setStyleSheet(BUTTON_STYLE)
         self.search_button.clicked.connect(self.perform_search)
 
+        # When checked, free text also matches transcription text
+        self.transcripts_button = QPushButton("Transcripts")
+        self.transcripts_button.setCheckable(True)
+        self.transcripts_button.setToolTip("Also search the text of audio transcriptions")
+        self.transcripts_button.setStyleSheet(BUTTON_STYLE)
+        self.transcripts_button.toggled.connect(self.perform_search)
+
         toolbar.addWidget(search_container, 1)  # stretch factor 1
+        toolbar.addWidget(self.transcripts_button)
         toolbar.addWidget(self.search_button)
 
         layout.addLayout(toolbar)
 
-        # Create list widget
-        self.list_widget = NotesListWidget()
-        self.list_widget.itemClicked.connect(self.on_note_clicked)
-        self.list_widget.itemActivated.connect(self.on_note_clicked)  # Enter/Space keys
+        # Create list view over a lazily loaded model
+        self.notes_model = NotesListModel(self.db, parent=self)
+        self.list_widget = NotesListView()
+        self.list_widget.setModel(self.notes_model)
+        # Ctrl/Shift-click selects several notes (e.g. to tag them together)
+        self.list_widget.setSelectionMode(QListView.SelectionMode.ExtendedSelection)
+        self.list_widget.clicked.connect(self.on_note_clicked)
+        self.list_widget.activated.connect(self.on_note_clicked)  # Enter/Space keys
 
         # Set custom delegate for HTML rendering (with theme-aware dividing lines)
         self.delegate = HTMLDelegate(self.list_widget, theme=self.theme)
@@ -410,131 +816,34 @@ class NotesListPane(QWidget):
         layout.addWidget(self.list_widget)
 
     def load_notes(self, notes: Optional[List[Dict[str, Any]]] = None) -> None:
-        """Load notes into the list widget.
+        """Load notes into the list.
 
         Args:
-            notes: List of note dictionaries. If None, loads all notes from database.
+            notes: List of note dictionaries. If None, shows all notes,
+                read from the database as the list is scrolled.
         """
-        self.list_widget.clear()
-
         if notes is None:
-            notes = self.db.get_all_notes()
-
-        for note in notes:
-            item = self.create_note_item(note)
-            self.list_widget.addItem(item)
-
-        logger.info(f"Loaded {len(notes)} notes into list")
-
-    def _build_note_item_display(self, note: Dict[str, Any]) -> tuple:
-        """Build HTML and plain text display for a note item.
-
-        Args:
-            note: Note dictionary from database
-
-        Returns:
-            Tuple of (html_text, plain_text, is_marked)
-        """
-        import json
-
-        # Try to use cached data if available
-        list_cache = note.get("list_display_cache")
-        duration_seconds = None
-        tags: List[str] = []
-        if list_cache:
-            try:
-                cache_data = json.loads(list_cache)
-                # "date" in cache is pre-formatted string; fallback formats the integer timestamp
-                created_at = cache_data.get("date") or format_timestamp(note.get("created_at")) or "Unknown"
-                is_marked = cache_data.get("marked", False)
-                content = cache_data.get("content_preview", "")
-                duration_seconds = cache_data.get("duration_seconds")
-                tags = cache_data.get("tags", [])
-                # Truncate cached preview if longer than display limit
-                if len(content) > CONTENT_TRUNCATE_LENGTH:
-                    content = content[:CONTENT_TRUNCATE_LENGTH] + "..."
-                elif len(note.get("content", "")) > len(content):
-                    # Original was truncated by cache, add ellipsis
-                    content = content + "..."
-            except (json.JSONDecodeError, TypeError):
-                # Fall back to computing values
-                list_cache = None
-
-        if not list_cache:
-            # No cache or cache parse failed - compute values
-            # Format Unix timestamp for display
-            created_at = format_timestamp(note.get("created_at")) or "Unknown"
-            is_marked = self.db.is_note_marked(note["id"])
-            content = note.get("content", "")
-            # Replace newlines and carriage returns with spaces
-            content = content.replace("\n", " ").replace("\r", "")
-            # Truncate if too long
-            if len(content) > CONTENT_TRUNCATE_LENGTH:
-                content = content[:CONTENT_TRUNCATE_LENGTH] + "..."
-            # Tags not available without cache
-            tags = []
-
-        # Build star HTML
-        if is_marked:
-            star_html = f'<span style="color: {STAR_COLOR_GOLD};">{STAR_FILLED}</span>'
+            self.notes_model.load_all()
+            logger.info("Loaded all notes into list")
         else:
-            star_html = f'<span style="color: {STAR_COLOR_GRAY};">{STAR_EMPTY}</span>'
-
-        # Format duration if available
-        duration_str = ""
-        if duration_seconds is not None and duration_seconds > 0:
-            duration_str = f" | {format_duration(duration_seconds)}"
-
-        # Format tags if available
-        tags_str = ""
-        if tags:
-            tags_str = f" | {', '.join(tags)}"
-
-        # Create two-line text with star, bold date/time, optional duration, optional tags
-        # Top row is forced LTR so date/duration/tags display correctly even with RTL content
-        # Bottom row: explicit direction, single line with overflow hidden
-        content_dir = detect_text_direction(content)
-        html_text = (
-            f'<div dir="ltr">{star_html} <b>{created_at}</b>{duration_str}{tags_str}</div>'
-            f'<div dir="{content_dir}" style="overflow: hidden;">{content}</div>'
-        )
-
-        # Plain text for accessibility
-        star_plain = STAR_FILLED if is_marked else STAR_EMPTY
-        plain_text = f"{star_plain} {created_at}\n{content}"
-
-        return html_text, plain_text, is_marked
-
-    def create_note_item(self, note: Dict[str, Any]) -> QListWidgetItem:
-        """Create a list item for a note with two-line format.
-
-        Args:
-            note: Note dictionary from database
-
-        Returns:
-            QListWidgetItem configured with note data.
-        """
-        html_text, plain_text, is_marked = self._build_note_item_display(note)
-
-        # Create item
-        item = QListWidgetItem()
-        item.setData(ROLE_NOTE_ID, note["id"])  # Store note_id
-        item.setData(ROLE_MARKED, is_marked)  # Store marked state
-        item.setData(ROLE_HTML_TEXT, html_text)
-        item.setText(plain_text)
-
-        return item
+            self.notes_model.set_notes(notes)
+            logger.info(f"Loaded {len(notes)} notes into list")
 
-    def on_note_clicked(self, item: QListWidgetItem) -> None:
+    def on_note_clicked(self, index: QModelIndex) -> None:
         """Handle note click event.
 
         Args:
-            item: Clicked list widget item
+            index: Clicked model index
         """
-        note_id = item.data(ROLE_NOTE_ID)
+        note_id = index.data(ROLE_NOTE_ID)
         logger.info(f"Note selected: ID {note_id}")
         self.note_selected.emit(note_id)
 
+    def selected_note_ids(self) -> List[str]:
+        """Get the IDs of the selected notes, in list order."""
+        indexes = sorted(self.list_widget.selectionModel().selectedIndexes(), key=lambda index: index.row())
+        return [index.data(ROLE_NOTE_ID) for index in indexes]
+
     def on_star_clicked(self, note_id: str) -> None:
         """Handle star icon click to toggle marked state.
 
@@ -545,30 +854,8 @@ class NotesListPane(QWidget):
         new_state = self.db.toggle_note_marked(note_id)
         logger.info(f"Toggled marked state for note {note_id[:8]}... to {new_state}")
 
-        # Find and update the item in the list
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item and item.data(ROLE_NOTE_ID) == note_id:
-                # Rebuild the item display from fresh note data
-                note = self.db.get_note(note_id)
-                if note:
-                    self._refresh_item_display(item, note)
-
-                # Force repaint
-                self.list_widget.update()
-                break
-
-    def _refresh_item_display(self, item: QListWidgetItem, note: Dict[str, Any]) -> None:
-        """Refresh a list item's display from note data.
-
-        Args:
-            item: The list widget item to refresh
-            note: Note dictionary from database
-        """
-        html_text, plain_text, is_marked = self._build_note_item_display(note)
-        item.setData(ROLE_MARKED, is_marked)
-        item.setData(ROLE_HTML_TEXT, html_text)
-        item.setText(plain_text)
+        # Rebuild the row's display from fresh note data
+        self.refresh_note_item(note_id)
 
     def refresh_note_item(self, note_id: str) -> bool:
         """Refresh a specific note item in the list.
@@ -582,21 +869,48 @@ class NotesListPane(QWidget):
         Returns:
             True if the item was found and refreshed, False otherwise.
         """
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item and item.data(ROLE_NOTE_ID) == note_id:
-                # Fetch fresh note data and rebuild display
+        row = self.notes_model.row_of(note_id)
+        if row < 0:
+            logger.debug(f"Note {note_id[:8]}... not in current list view")
+            return False
+        # Fetch fresh note data and rebuild display
+        note = self.db.get_note(note_id)
+        if not note:
+            logger.warning(f"Note {note_id[:8]}... not found when refreshing")
+            return False
+        self.notes_model.update_note(row, note)
+        self.delegate.invalidate(note_id)
+        logger.info(f"Refreshed list item for note {note_id[:8]}...")
+        return True
+
+    def apply_changes(self, changes: ChangeSet) -> None:
+        """Update the list for notes created, updated or deleted elsewhere.
+
+        Only the affected rows are touched. While a search is shown, new
+        notes are not added (they may not match it) until it is run again;
+        updated and deleted notes are refreshed or removed as usual.
+
+        Args:
+            changes: IDs touched by a write or sync
+        """
+        if not changes.complete:
+            self.load_notes()
+            return
+        for note_id in changes.deleted_notes:
+            self.notes_model.remove_note(note_id)
+            self.delegate.invalidate(note_id)
+        for note_id in changes.updated_notes:
+            self.refresh_note_item(note_id)
+        if self.notes_model.is_showing_all():
+            for note_id in changes.created_notes:
                 note = self.db.get_note(note_id)
-                if note:
-                    self._refresh_item_display(item, note)
-                    self.list_widget.update()
-                    logger.info(f"Refreshed list item for note {note_id[:8]}...")
-                    return True
-                else:
-                    logger.warning(f"Note {note_id[:8]}... not found when refreshing")
-                    return False
-        logger.debug(f"Note {note_id[:8]}... not in current list view")
-        return False
+                if note and self.notes_model.row_of(note_id) < 0:
+                    self.notes_model.insert_note(note)
+        if changes.has_note_changes:
+            logger.info(
+                f"Applied note changes: {len(changes.created_notes)} created, "
+                f"{len(changes.updated_notes)} updated, {len(changes.deleted_notes)} deleted"
+            )
 
     def select_note_by_id(self, note_id: int) -> bool:
         """Select a note in the list by its ID.
@@ -607,12 +921,11 @@ class NotesListPane(QWidget):
         Returns:
             True if the note was found and selected, False otherwise.
         """
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item and item.data(ROLE_NOTE_ID) == note_id:
-                self.list_widget.setCurrentItem(item)
-                logger.info(f"Selected note {note_id} in list")
-                return True
+        row = self.notes_model.row_of(note_id, fetch=True)
+        if row >= 0:
+            self.list_widget.setCurrentIndex(self.notes_model.index(row))
+            logger.info(f"Selected note {note_id} in list")
+            return True
         logger.warning(f"Note {note_id} not found in list")
         return False
 
@@ -664,7 +977,7 @@ class NotesListPane(QWidget):
 
             # Parse to find tag terms and check which are ambiguous
             parsed = parse_search_input(text)
-            ambiguous_tag_terms = find_ambiguous_tags(self.db, parsed.tag_terms)
+            ambiguous_tag_terms = self.search_cache.find_ambiguous_tags(parsed.tag_terms)
 
             # Save cursor position before making changes
             cursor_position = self.search_field.textCursor().position()
@@ -683,6 +996,9 @@ class NotesListPane(QWidget):
         finally:
             self._updating_search_field = False
 
+        # Restart the debounce timer; the search runs once typing pauses
+        self._search_timer.start()
+
     def _clear_all_formatting(self, text: str, cursor_position: int) -> None:
         """Clear all formatting and set text to default color.
 
@@ -758,6 +1074,7 @@ class NotesListPane(QWidget):
     def clear_search(self) -> None:
         """Clear the search field and show all notes."""
         self.search_field.clear()
+        self._cancel_background_search()
         self._update_star_filter_button_state("")
         self.load_notes()
         logger.info("Search cleared, showing all notes")
@@ -821,18 +1138,74 @@ class NotesListPane(QWidget):
     def perform_search(self) -> None:
         """Perform search based on search field content.
 
-        Parses tag: keywords and free text, then searches database.
+        Parses tag: and transcript: keywords and free text, then searches
+        database. With the Transcripts button checked, free text also
+        matches transcription text.
         Ambiguous tags (matching multiple tags) use OR logic within the group.
+        Runs immediately on the UI thread and cancels any pending
+        search-as-you-type search.
         """
         search_text = self.search_field.toPlainText().strip()
         logger.info(f"Performing search: '{search_text}'")
+        self._cancel_background_search()
 
         # Execute search using the search module
-        result = execute_search(self.db, search_text)
+        result = self.search_cache.search(
+            search_text,
+            include_transcriptions=self.transcripts_button.isChecked(),
+        )
+        self._show_search_result(result)
+
+    def _show_search_result(self, result: SearchResult) -> None:
+        """Display the notes of a search result.
 
+        Args:
+            result: Result of the search
+        """
         # Log any not-found tags
         for tag in result.not_found_tags:
             logger.warning(f"Tag path '{tag}' not found")
 
         # Update display
         self.load_notes(result.notes)
+
+    def _cancel_background_search(self) -> None:
+        """Stop the debounce timer and drop results of searches in flight."""
+        self._search_timer.stop()
+        self._search_generation += 1
+
+    def _start_background_search(self) -> None:
+        """Run the search for the current input on the worker thread."""
+        self._search_generation += 1
+        generation = self._search_generation
+        search_text = self.search_field.toPlainText().strip()
+        include_transcriptions = self.transcripts_button.isChecked()
+
+        def _do_search() -> None:
+            # Skip searches overtaken while waiting for the worker
+            if generation != self._search_generation:
+                return
+            try:
+                result = self.search_cache.search(search_text, include_transcriptions)
+            except Exception as e:
+                logger.error(f"Search for '{search_text}' failed: {e}")
+                return
+            try:
+                self._search_finished.emit(generation, result)
+            except RuntimeError:
+                # Pane was deleted while the search ran
+                pass
+
+        self._search_executor.submit(_do_search)
+
+    def _on_background_search_finished(self, generation: int, result: SearchResult) -> None:
+        """Show a search-as-you-type result unless newer input superseded it.
+
+        Args:
+            generation: Search generation the result belongs to
+            result: Result of the search
+        """
+        if generation != self._search_generation:
+            logger.debug("Discarding stale search result")
+            return
+        self._show_search_result(result)
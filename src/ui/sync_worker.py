@@ -0,0 +1,111 @@
+"""Background peer sync for the GUI.
+
+Syncing waits on the network and on conflict detection, which can take
+many seconds. SyncWorker runs it on a worker thread and reports progress
+through Qt signals, so the window stays responsive and the user can
+cancel a sync in progress.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from PySide6.QtCore import QObject, Signal
+
+from src.core.sync_scheduler import sync_lock
+
+logger = logging.getLogger(__name__)
+
+
+class SyncWorker(QObject):
+    """Runs sync_all_peers on a worker thread.
+
+    Signals are emitted from the worker thread; Qt queues them to slots of
+    objects living on the UI thread.
+
+    Signals:
+        peer_finished: A peer finished syncing (peer_id: str, SyncResult)
+        finished: All peers are done (Dict[str, SyncResult])
+        failed: The sync could not run at all (error message: str)
+    """
+
+    peer_finished = Signal(str, object)
+    finished = Signal(object)
+    failed = Signal(str)
+
+    def __init__(
+        self,
+        sync_func: Callable[..., Dict[str, Any]],
+        config_dir: str,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            sync_func: voicecore.sync_all_peers (or a function with its signature)
+            config_dir: Path of the config directory to sync
+            parent: Parent object (default None)
+        """
+        super().__init__(parent)
+        self._sync_func = sync_func
+        self.config_dir = config_dir
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def is_running(self) -> bool:
+        """Whether a sync is in progress."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def is_cancelled(self) -> bool:
+        """Whether the current (or last) sync was cancelled."""
+        return self._cancel.is_set()
+
+    def start(self) -> bool:
+        """Start syncing on a worker thread.
+
+        Returns:
+            True if a sync was started, False if one is already running.
+        """
+        if self.is_running():
+            return False
+        self._cancel.clear()
+        self._thread = threading.Thread(target=self._run, name="gui-sync", daemon=True)
+        self._thread.start()
+        logger.info("Background sync started")
+        return True
+
+    def cancel(self) -> None:
+        """Ask the running sync to stop as soon as possible."""
+        if self.is_running():
+            logger.info("Cancelling background sync")
+        self._cancel.set()
+
+    def _run(self) -> None:
+        """Worker thread body."""
+        try:
+            # Waits for a scheduled sync in progress to finish
+            with sync_lock:
+                results = self._sync_func(
+                    self.config_dir,
+                    progress=self._on_progress,
+                    cancel=self._cancel,
+                )
+        except Exception as e:
+            logger.error(f"Background sync failed: {e}")
+            self._emit(self.failed, str(e))
+            return
+        self._emit(self.finished, results)
+
+    def _on_progress(self, peer_id: str, result: Any) -> None:
+        """Called by sync_all_peers as each peer finishes."""
+        self._emit(self.peer_finished, peer_id, result)
+
+    @staticmethod
+    def _emit(signal: Any, *args: Any) -> None:
+        """Emit a signal, ignoring a worker deleted while the sync ran."""
+        try:
+            signal.emit(*args)
+        except RuntimeError:
+            pass
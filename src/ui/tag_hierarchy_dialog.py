@@ -30,6 +30,7 @@ from PySide6.QtWidgets import (
 )
 
 from src.core.database import Database
+from src.core.tag_index import get_tag_index
 from src.ui.styles import BUTTON_STYLE
 
 logger = logging.getLogger(__name__)
@@ -249,31 +250,8 @@ class TagHierarchyDialog(QDialog):
         Returns:
             Mapping of tag_id to full path (e.g., "Parent > Child > Grandchild")
         """
-        tag_by_id = {t["id"]: t for t in self.all_tags}
-        paths: Dict[str, str] = {}
-
-        def get_path(tag_id: str) -> str:
-            if tag_id in paths:
-                return paths[tag_id]
-
-            tag = tag_by_id.get(tag_id)
-            if not tag:
-                return ""
-
-            parent_id = tag.get("parent_id")
-            if parent_id and parent_id in tag_by_id:
-                parent_path = get_path(parent_id)
-                path = f"{parent_path} > {tag['name']}" if parent_path else tag["name"]
-            else:
-                path = tag["name"]
-
-            paths[tag_id] = path
-            return path
-
-        for tag in self.all_tags:
-            get_path(tag["id"])
-
-        return paths
+        tag_index = get_tag_index(self.db)
+        return {tag["id"]: tag_index.full_path(tag["id"], " > ") for tag in self.all_tags}
 
     def _get_note_counts(self) -> Dict[str, int]:
         """Get note count for each tag.
@@ -281,15 +259,11 @@ class TagHierarchyDialog(QDialog):
         Returns:
             Mapping of tag_id to number of notes with that tag
         """
-        counts: Dict[str, int] = {}
         try:
-            for tag in self.all_tags:
-                # Get notes for this tag using filter_notes
-                notes = self.db.filter_notes([tag["id"]])
-                counts[tag["id"]] = len(notes) if notes else 0
+            return self.db.get_tag_note_counts()
         except Exception as e:
             logger.warning(f"Error getting note counts: {e}")
-        return counts
+            return {}
 
     def _on_filter_changed(self, text: str) -> None:
         """Handle filter text change."""
@@ -497,22 +471,7 @@ class TagHierarchyDialog(QDialog):
         Returns:
             Set of descendant tag IDs
         """
-        descendants = set()
-        tags_by_parent: Dict[Optional[str], List[dict]] = {}
-
-        for tag in self.all_tags:
-            parent_id = tag.get("parent_id")
-            if parent_id not in tags_by_parent:
-                tags_by_parent[parent_id] = []
-            tags_by_parent[parent_id].append(tag)
-
-        def collect(parent_id: str) -> None:
-            for child in tags_by_parent.get(parent_id, []):
-                descendants.add(child["id"])
-                collect(child["id"])
-
-        collect(tag_id)
-        return descendants
+        return set(get_tag_index(self.db).descendants(tag_id, include_self=False))
 
     def _reparent_tag(self, tag_id: str, new_parent_id: Optional[str]) -> None:
         """Move a tag to a new parent.
@@ -28,6 +28,7 @@ from PySide6.QtWidgets import (
 )
 
 from src.core.database import Database
+from src.core.tag_index import get_tag_index
 from src.ui.styles import BUTTON_STYLE
 
 logger = logging.getLogger(__name__)
@@ -320,31 +321,8 @@ class TagManagementDialog(QDialog):
 
     def _build_tag_paths(self) -> Dict[str, str]:
         """Build full paths for all tags."""
-        tag_by_id = {t["id"]: t for t in self.all_tags}
-        paths: Dict[str, str] = {}
-
-        def get_path(tag_id: str) -> str:
-            if tag_id in paths:
-                return paths[tag_id]
-
-            tag = tag_by_id.get(tag_id)
-            if not tag:
-                return ""
-
-            parent_id = tag.get("parent_id")
-            if parent_id and parent_id in tag_by_id:
-                parent_path = get_path(parent_id)
-                path = f"{parent_path} > {tag['name']}" if parent_path else tag["name"]
-            else:
-                path = tag["name"]
-
-            paths[tag_id] = path
-            return path
-
-        for tag in self.all_tags:
-            get_path(tag["id"])
-
-        return paths
+        tag_index = get_tag_index(self.db)
+        return {tag["id"]: tag_index.full_path(tag["id"], " > ") for tag in self.all_tags}
 
     def _add_tags_recursive(
         self,
@@ -414,14 +392,14 @@ class TagManagementDialog(QDialog):
             logger.info(f"  Tags to add: {tags_to_add}")
             logger.info(f"  Tags to remove: {tags_to_remove}")
 
-            # Apply changes
-            for tag_id in tags_to_add:
-                result = self.db.add_tag_to_note(self.note_id, tag_id)
-                logger.info(f"Added tag {tag_id} to note {self.note_id}, result: {result}")
+            # Apply changes, one batch each way
+            if tags_to_add:
+                result = self.db.add_tags_to_notes([self.note_id], tags_to_add)
+                logger.info(f"Added tags {tags_to_add} to note {self.note_id}, result: {result}")
 
-            for tag_id in tags_to_remove:
-                result = self.db.remove_tag_from_note(self.note_id, tag_id)
-                logger.info(f"Removed tag {tag_id} from note {self.note_id}, result: {result}")
+            if tags_to_remove:
+                result = self.db.remove_tags_from_notes([self.note_id], tags_to_remove)
+                logger.info(f"Removed tags {tags_to_remove} from note {self.note_id}, result: {result}")
 
             # Verify changes were saved
             note_tags_after = self.db.get_note_tags(self.note_id)
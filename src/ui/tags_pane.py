@@ -2,18 +2,22 @@
 
 This module provides the left pane showing tags in a tree structure.
 Users can click tags to filter notes by that tag and its descendants.
+
+Tree nodes are created lazily: a tag's child rows are added the first
+time it is expanded, so large imported hierarchies load quickly.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QModelIndex, Qt, Signal
 from PySide6.QtGui import QKeyEvent, QMouseEvent, QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import QApplication, QTreeView, QVBoxLayout, QWidget
 
 from src.core.database import Database
+from src.core.models import ChangeSet
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +52,32 @@ class TagsTreeView(QTreeView):
         super().mousePressEvent(event)
 
 
+class TagsTreeModel(QStandardItemModel):
+    """Tag model whose child rows are created when a node is first expanded.
+
+    Until then hasChildren() answers from the pane's child map, so the
+    view still draws an expand arrow for the node.
+
+    Attributes:
+        unpopulated: IDs of tags that have children with no rows yet
+    """
+
+    def __init__(self, parent: Optional[Any] = None) -> None:
+        super().__init__(parent)
+        self.unpopulated: Set[str] = set()
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """Report children of nodes that were not populated yet."""
+        if parent.isValid() and parent.data(Qt.ItemDataRole.UserRole) in self.unpopulated:
+            return True
+        return super().hasChildren(parent)
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self.unpopulated.clear()
+        super().clear()
+
+
 class TagsPane(QWidget):
     """Pane displaying hierarchical tag tree.
 
@@ -55,6 +85,9 @@ class TagsPane(QWidget):
     to filter notes by that tag (including descendant tags).
     Shift-clicking a tag emits a signal to add it to the current note.
 
+    Root tags are expanded on first load. Expanded tags are remembered
+    and expanded again when the tree is reloaded.
+
     Signals:
         tag_selected: Emitted when a tag is clicked (tag_id: str)
         tag_add_requested: Emitted when a tag is shift-clicked (tag_id: str)
@@ -77,6 +110,11 @@ class TagsPane(QWidget):
         """
         super().__init__(parent)
         self.db = db
+        self._items: Dict[str, QStandardItem] = {}  # tag_id -> tree item (created ones only)
+        self._tags: Dict[str, Dict[str, Any]] = {}  # tag_id -> tag, for all shown tags
+        self._parent_ids: Dict[str, Optional[str]] = {}  # tag_id -> shown parent (None for root)
+        self._child_ids: Dict[Optional[str], List[str]] = {}  # parent (None for root) -> tag_ids
+        self._expanded: Optional[Set[str]] = None  # Expanded tag_ids, None before first load
 
         self.setup_ui()
         self.load_tags()
@@ -95,16 +133,26 @@ class TagsPane(QWidget):
         self.tree_view.clicked.connect(self.on_tag_clicked)
         self.tree_view.activated.connect(self.on_tag_clicked)  # Enter/Space keys
         self.tree_view.shift_clicked.connect(self.on_tag_shift_clicked)  # Shift+click
+        self.tree_view.expanded.connect(self._on_expanded)
+        self.tree_view.collapsed.connect(self._on_collapsed)
 
         # Create model
-        self.model = QStandardItemModel()
+        self.model = TagsTreeModel()
         self.tree_view.setModel(self.model)
 
         layout.addWidget(self.tree_view)
 
     def load_tags(self) -> None:
-        """Load tags from database and build tree structure."""
+        """Load tags from database and build the top of the tree.
+
+        Only root tags and the children of expanded tags get rows; the
+        rest are added as their parents are expanded.
+        """
         self.model.clear()
+        self._items = {}
+        self._tags = {}
+        self._parent_ids = {}
+        self._child_ids = {}
 
         tags = self.db.get_all_tags()
         if not tags:
@@ -121,44 +169,208 @@ class TagsPane(QWidget):
                 if tag["id"] != system_tag_id and tag.get("parent_id") != system_tag_id
             ]
 
-        # Build a map of tag_id -> tag_data for quick lookup
-        tag_map: Dict[int, Dict[str, Any]] = {tag["id"]: tag for tag in tags}
+        self._tags = {tag["id"]: tag for tag in tags}
+        for tag in tags:
+            parent_id = tag.get("parent_id")
+            if parent_id is not None and parent_id not in self._tags:
+                # Parent not found, treat as root
+                logger.warning(f"Tag {tag['id']} has invalid parent_id {parent_id}")
+                parent_id = None
+            self._parent_ids[tag["id"]] = parent_id
+            self._child_ids.setdefault(parent_id, []).append(tag["id"])
+
+        for tag_id in self._child_ids.get(None, []):
+            self.model.appendRow(self._create_item(tag_id))
 
-        # Build a map of tag_id -> QStandardItem
-        item_map: Dict[int, QStandardItem] = {}
+        if self._expanded is None:
+            # First load: show one level below the root tags
+            self._expanded = set(self._child_ids.get(None, []))
+        self._restore_expansion()
 
-        # First pass: create items for all tags
-        for tag in tags:
-            item = QStandardItem(tag["name"])
-            item.setData(tag["id"], role=Qt.ItemDataRole.UserRole)  # Store tag_id
-            item_map[tag["id"]] = item
+        logger.info(f"Loaded {len(tags)} tags ({len(self._items)} shown in tree)")
 
-        # Second pass: build hierarchy
-        root_items: List[QStandardItem] = []
-        for tag in tags:
-            item = item_map[tag["id"]]
-            parent_id = tag.get("parent_id")
+    def _create_item(self, tag_id: str) -> QStandardItem:
+        """Create the node of a tag; its children are added when it is expanded.
+
+        Args:
+            tag_id: ID of the tag
+
+        Returns:
+            The new node, not yet attached to the tree
+        """
+        item = QStandardItem(self._tags[tag_id]["name"])
+        item.setData(tag_id, role=Qt.ItemDataRole.UserRole)  # Store tag_id
+        self._items[tag_id] = item
+        if self._child_ids.get(tag_id):
+            self.model.unpopulated.add(tag_id)
+        return item
+
+    def _populate(self, tag_id: str) -> None:
+        """Add the child rows of a tag if they were not added yet.
+
+        Args:
+            tag_id: ID of the tag
+        """
+        if tag_id not in self.model.unpopulated:
+            return
+        self.model.unpopulated.discard(tag_id)
+        item = self._items[tag_id]
+        for child_id in self._child_ids.get(tag_id, []):
+            if child_id not in self._items:
+                item.appendRow(self._create_item(child_id))
+
+    def _is_populated(self, tag_id: Optional[str]) -> bool:
+        """Whether a tag's children have rows (always true for the root)."""
+        return tag_id is None or (tag_id in self._items and tag_id not in self.model.unpopulated)
+
+    def _restore_expansion(self) -> None:
+        """Expand the remembered tags again, populating them on the way down."""
+        pending = list(self._child_ids.get(None, []))
+        while pending:
+            tag_id = pending.pop()
+            if tag_id not in self._expanded or not self._child_ids.get(tag_id):
+                continue
+            self._populate(tag_id)
+            self.tree_view.expand(self._items[tag_id].index())
+            pending.extend(self._child_ids[tag_id])
+
+    def _on_expanded(self, index: QModelIndex) -> None:
+        """Add a node's children the first time it is expanded."""
+        tag_id = index.data(Qt.ItemDataRole.UserRole)
+        if tag_id is None:
+            return
+        if self._expanded is not None:
+            self._expanded.add(tag_id)
+        self._populate(tag_id)
+
+    def _on_collapsed(self, index: QModelIndex) -> None:
+        """Forget a collapsed node's expansion."""
+        if self._expanded is not None:
+            self._expanded.discard(index.data(Qt.ItemDataRole.UserRole))
+
+    def apply_changes(self, changes: ChangeSet) -> None:
+        """Update the tree for tags created, updated or deleted elsewhere.
 
-            if parent_id is None:
-                # Root level tag
-                root_items.append(item)
-            elif parent_id in item_map:
-                # Add as child to parent
-                parent_item = item_map[parent_id]
-                parent_item.appendRow(item)
+        Only the affected nodes are added, renamed, moved or removed;
+        the rest of the tree, including its expansion state, is kept.
+        Tags under a parent that was never expanded get no row until it is.
+
+        Args:
+            changes: IDs touched by a write or sync
+        """
+        if not changes.complete:
+            self.load_tags()
+            return
+        if not changes.has_tag_changes:
+            return
+
+        for tag_id in changes.deleted_tags:
+            self._remove_tag(tag_id)
+
+        # Read every touched tag first so that a new child can be placed
+        # under a parent created by the same change set
+        system_tag_id = self.db.get_system_tag_id_hex()
+        tags: List[Dict[str, Any]] = []
+        for tag_id in changes.created_tags | changes.updated_tags:
+            tag = self.db.get_tag(tag_id)
+            if tag is None:
+                self._remove_tag(tag_id)
+            elif system_tag_id and system_tag_id in (tag["id"], tag.get("parent_id")):
+                continue
             else:
-                # Parent not found, treat as root
-                logger.warning(f"Tag {tag['id']} has invalid parent_id {parent_id}")
-                root_items.append(item)
+                tags.append(tag)
+        for tag in tags:
+            self._tags[tag["id"]] = tag
+            item = self._items.get(tag["id"])
+            if item is not None:
+                item.setText(tag["name"])
+        for tag in tags:
+            self._place_tag(tag["id"], tag.get("parent_id"))
+
+        logger.info(
+            f"Applied tag changes: {len(changes.created_tags)} created, "
+            f"{len(changes.updated_tags)} updated, {len(changes.deleted_tags)} deleted"
+        )
+
+    def _remove_tag(self, tag_id: str) -> None:
+        """Remove a tag's node, moving any remaining children to the root.
+
+        Args:
+            tag_id: ID of the tag to remove
+        """
+        if self._tags.pop(tag_id, None) is None:
+            return
+        self._child_ids[self._parent_ids.pop(tag_id)].remove(tag_id)
+        children = self._child_ids.pop(tag_id, [])
+        for child_id in children:
+            self._parent_ids[child_id] = None
+            self._child_ids.setdefault(None, []).append(child_id)
+
+        item = self._items.pop(tag_id, None)
+        self.model.unpopulated.discard(tag_id)
+        if item is not None:
+            while item.rowCount():
+                self.model.appendRow(item.takeRow(0))
+            parent = item.parent()
+            if parent is None:
+                parent = self.model.invisibleRootItem()
+            parent.removeRow(item.row())
+        # Children of a node that was never expanded have no rows yet
+        for child_id in children:
+            if child_id not in self._items:
+                self.model.appendRow(self._create_item(child_id))
+
+    def _place_tag(self, tag_id: str, parent_id: Optional[str]) -> None:
+        """Put a tag under its parent (or at the root), moving its node if needed.
 
-        # Add root items to model
-        for item in root_items:
+        Args:
+            tag_id: ID of the tag
+            parent_id: ID of the tag's parent, or None for a root tag
+        """
+        if parent_id is not None and parent_id not in self._tags:
+            logger.warning(f"Tag {tag_id} has invalid parent_id {parent_id}")
+            parent_id = None
+
+        if tag_id in self._parent_ids:
+            old_parent_id = self._parent_ids[tag_id]
+            if old_parent_id == parent_id:
+                return
+            self._child_ids[old_parent_id].remove(tag_id)
+        self._parent_ids[tag_id] = parent_id
+        self._child_ids.setdefault(parent_id, []).append(tag_id)
+
+        item = self._items.get(tag_id)
+        if item is not None and item.model() is not None:
+            current = item.parent()
+            if current is None:
+                current = self.model.invisibleRootItem()
+            item = current.takeRow(item.row())[0]
+
+        if not self._is_populated(parent_id):
+            # The row is created when the parent is expanded
+            if item is not None:
+                self._forget_item(item)
+            return
+
+        if item is None:
+            item = self._create_item(tag_id)
+        if parent_id is None:
             self.model.appendRow(item)
+        else:
+            self._items[parent_id].appendRow(item)
+            self.tree_view.expand(self._items[parent_id].index())
 
-        # Expand all tags by default
-        self.tree_view.expandAll()
+    def _forget_item(self, item: QStandardItem) -> None:
+        """Drop a detached node and its descendants from the item map.
 
-        logger.info(f"Loaded {len(tags)} tags into tree")
+        Args:
+            item: Node taken out of the tree
+        """
+        tag_id = item.data(Qt.ItemDataRole.UserRole)
+        self._items.pop(tag_id, None)
+        self.model.unpopulated.discard(tag_id)
+        for row in range(item.rowCount()):
+            self._forget_item(item.child(row))
 
     def on_tag_clicked(self, index: Any) -> None:
         """Handle tag click event.
@@ -13,7 +13,10 @@ Endpoints:
     GET  /api/notes/<id>/attachments     List attachments for a note
     GET  /api/audiofiles/<id>            Get audio file details
     GET  /api/tags                       List all tags
+    POST /api/tags/<id>/notes            Add a tag to many notes
+    DELETE /api/tags/<id>/notes          Remove a tag from many notes
     GET  /api/search                     Search notes
+    GET  /api/events                     Change notifications (SSE or long-poll)
 
 All endpoints return JSON responses.
 IDs are UUID7 hex strings (32 characters, no hyphens).
@@ -21,21 +24,60 @@ IDs are UUID7 hex strings (32 characters, no hyphens).
 Query parameters for /api/search:
     - text: Text to search for in note content
     - tag: Tag path to filter by (can be specified multiple times for AND logic)
+    - transcript: Only return notes whose transcriptions contain these words
+    - include_transcriptions: 1 to match text against transcriptions as well
+
+Query parameters for /api/notes and /api/search:
+    - limit: Return at most this many notes (newest first) and a Link header
+      with rel="next" when more remain
+    - cursor: Opaque cursor from a previous page's Link header
+    - fields: Comma-separated fields to return (e.g. id,created_at,preview)
+
+GET /api/notes and GET /api/tags send an ETag; repeat the request with
+If-None-Match to get 304 Not Modified while nothing in the database has
+changed. X-Change-Version carries the database's change counter, which is
+persisted next to the database and shared by all workers.
+
+Query parameters for /api/tags:
+    - with_counts: 1 to add note_count to each tag, or "descendants" to
+      count notes tagged with the tag or any of its descendants
+
+Query parameters for /api/events:
+    - since: Unix timestamp to start from (default: now; the SSE
+      Last-Event-ID header is honoured on reconnect)
+    - types: Comma-separated entity types to report (e.g. note,tag)
+    - poll: 1 to long-poll instead of streaming; returns
+      {"changes": [...], "cursor": <timestamp>} once changes arrive
+    - timeout: Seconds before the stream or long-poll ends; streams end
+      after EVENTS_MAX_STREAM_DURATION seconds at the latest, after an id
+      line carrying the cursor, so EventSource clients reconnect (with
+      Last-Event-ID) without missing changes
 
 POST /api/notes body:
     - content: Note content (string, required)
 
 PUT /api/notes/<id> body:
     - content: New note content (string, required)
+
+POST and DELETE /api/tags/<id>/notes body (one of):
+    - note_ids: Note IDs to tag or untag (list of strings)
+    - search: Search input (e.g. "tag:Work budget"); applies to every
+      matching note
 """
 
 from __future__ import annotations
 
 import argparse
+import base64
 import functools
+import hashlib
+import json
 import logging
+import sys
+import time
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlencode
 
 from flask import Flask, jsonify, request, Response
 from flask_cors import CORS
@@ -43,6 +85,8 @@ from flask_cors import CORS
 from src.core.config import Config
 from src.core.conflicts import ConflictManager
 from src.core.database import Database
+from src.core.search import execute_search
+from src.core.tag_index import get_tag_index
 from src.core.validation import ValidationError, validate_uuid_hex
 
 logger = logging.getLogger(__name__)
@@ -50,6 +94,34 @@ logger = logging.getLogger(__name__)
 # Global database instance
 db: Optional[Database] = None
 
+# Pooled read connections opened by the web server's database handle
+DEFAULT_POOL_SIZE = 4
+
+# Pagination for /api/notes and /api/search
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+PREVIEW_LENGTH = 100
+
+# Fields selectable with ?fields= (preview is derived from content)
+NOTE_FIELDS = (
+    "id", "created_at", "modified_at", "deleted_at", "content", "tag_names",
+    "display_cache", "list_display_cache", "preview",
+)
+
+# Change feed for /api/events
+EVENTS_POLL_INTERVAL = 0.25
+EVENTS_HEARTBEAT_INTERVAL = 15.0
+EVENTS_BATCH_LIMIT = 500
+EVENTS_DEFAULT_POLL_TIMEOUT = 25.0
+# An open stream holds a server thread, so it is recycled this often
+EVENTS_MAX_STREAM_DURATION = 300.0
+
+# Servers supported by `web --server`
+SERVER_CHOICES = ("dev", "gunicorn", "waitress")
+DEFAULT_REQUEST_TIMEOUT = 30
+# Threads per gunicorn worker; every open /api/events stream occupies one
+DEFAULT_GUNICORN_THREADS = 8
+
 
 def api_endpoint(func: Callable) -> Callable:
     """Decorator for consistent API error handling.
@@ -69,11 +141,268 @@ def api_endpoint(func: Callable) -> Callable:
     return wrapper
 
 
-def create_app(config_dir: Optional[Path] = None) -> Flask:
+def _encode_cursor(note: Dict[str, Any]) -> str:
+    """Build an opaque pagination cursor pointing after the given note."""
+    raw = f"{note['created_at']}:{note['id']}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[int, str]:
+    """Decode a cursor produced by _encode_cursor().
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, note_id = base64.urlsafe_b64decode(padded).decode("ascii").split(":", 1)
+        validate_uuid_hex(note_id, "cursor")
+        return int(created_at), note_id
+    except (ValueError, UnicodeDecodeError):
+        raise ValidationError("cursor", "malformed pagination cursor") from None
+
+
+def _parse_fields() -> Optional[List[str]]:
+    """Parse the ?fields= projection parameter.
+
+    Returns:
+        List of requested fields, or None to return whole notes
+
+    Raises:
+        ValidationError: If an unknown field is requested
+    """
+    raw = request.args.get("fields")
+    if not raw:
+        return None
+    fields = [f.strip() for f in raw.split(",") if f.strip()]
+    unknown = [f for f in fields if f not in NOTE_FIELDS]
+    if unknown:
+        raise ValidationError(
+            "fields", f"unknown field(s) {', '.join(unknown)}; choose from {', '.join(NOTE_FIELDS)}"
+        )
+    return fields
+
+
+def _project_note(note: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Reduce a note dict to the requested fields."""
+    if fields is None:
+        return note
+    result = {}
+    for field in fields:
+        if field == "preview":
+            content = note.get("content") or ""
+            preview = content[:PREVIEW_LENGTH].replace("\n", " ")
+            if len(content) > PREVIEW_LENGTH:
+                preview += "…"
+            result["preview"] = preview
+        else:
+            result[field] = note.get(field)
+    return result
+
+
+def _notes_response(
+    text_query: Optional[str] = None,
+    tag_id_groups: Optional[List[List[str]]] = None,
+    transcript_query: Optional[str] = None,
+    include_transcriptions: bool = False,
+) -> Response:
+    """Return notes as JSON, honouring limit/cursor/fields query parameters.
+
+    Without limit or cursor every matching note is returned, as before.
+    With them, one keyset page is returned and a Link header with
+    rel="next" points at the following page when there is one.
+    """
+    fields = _parse_fields()
+    limit_arg = request.args.get("limit")
+    cursor = request.args.get("cursor")
+
+    if limit_arg is None and cursor is None:
+        if text_query or tag_id_groups or transcript_query:
+            notes = db.search_notes(
+                text_query=text_query,
+                tag_id_groups=tag_id_groups,
+                transcript_query=transcript_query,
+                include_transcriptions=include_transcriptions,
+            )
+        else:
+            notes = db.get_all_notes()
+        return jsonify([_project_note(n, fields) for n in notes])
+
+    try:
+        limit = int(limit_arg) if limit_arg is not None else DEFAULT_PAGE_SIZE
+    except ValueError:
+        raise ValidationError("limit", "must be an integer") from None
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValidationError("limit", f"must be between 1 and {MAX_PAGE_SIZE}")
+
+    after_created_at, after_id = _decode_cursor(cursor) if cursor else (None, None)
+    page = db.get_notes_page(
+        limit,
+        after_created_at=after_created_at,
+        after_id=after_id,
+        text_query=text_query,
+        tag_id_groups=tag_id_groups,
+        transcript_query=transcript_query,
+        include_transcriptions=include_transcriptions,
+    )
+    notes = page["notes"]
+    response = jsonify([_project_note(n, fields) for n in notes])
+
+    if page["has_more"] and notes:
+        args = request.args.to_dict(flat=False)
+        args["cursor"] = [_encode_cursor(notes[-1])]
+        args["limit"] = [str(limit)]
+        response.headers["Link"] = f'<{request.base_url}?{urlencode(args, doseq=True)}>; rel="next"'
+    return response
+
+
+def _conditional_json(resource: str, build: Callable[[], Response]) -> Response:
+    """Serve a JSON resource with ETag validation.
+
+    The ETag is derived from the database data version and the request's
+    query string, so a matching If-None-Match is answered with 304 before
+    any rows are read or serialised.
+
+    Args:
+        resource: Name of the resource, to keep ETags distinct per endpoint
+        build: Callable producing the full response on a cache miss
+
+    Returns:
+        304 response, or the built response with ETag headers set
+    """
+    # Take the version before reading so a concurrent write can only make
+    # the ETag older than the body, never newer
+    version = db.get_data_version()
+    key = f"{resource}|{version}|{request.query_string.decode('latin-1')}"
+    etag = hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = build()
+    response.set_etag(etag)
+    response.headers["X-Change-Version"] = str(db.change_version)
+    return response
+
+
+class _ChangeFeed:
+    """Cursor over the sync change log for /api/events.
+
+    Change timestamps have one-second resolution, so each query re-reads
+    the cursor's own second and drops changes that were already reported.
+    The log can only be queried from a timestamp, so when a whole batch
+    lies within the cursor's second the next query asks for a larger
+    batch until it reaches past that second.
+    The change log is only queried when the database data version moves,
+    so idle clients cost a stat() call per poll interval.
+    """
+
+    def __init__(self, since: int, types: Optional[set[str]]) -> None:
+        self.cursor = since
+        self.types = types
+        self._seen: set[tuple[Any, ...]] = set()
+        self._version: Optional[str] = None
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """Return changes not yet reported, oldest first."""
+        version = db.get_data_version()
+        if version == self._version:
+            return []
+
+        events: List[Dict[str, Any]] = []
+        limit = EVENTS_BATCH_LIMIT
+        while True:
+            result = db.get_changes_since(self.cursor - 1, limit)
+            batch = sorted(result["changes"], key=lambda c: c["timestamp"])
+            start = self.cursor
+            for change in batch:
+                timestamp = change["timestamp"]
+                key = (change["entity_type"], change["entity_id"], change["operation"], timestamp)
+                if timestamp < self.cursor or key in self._seen:
+                    continue
+                if timestamp > self.cursor:
+                    self.cursor = timestamp
+                    self._seen.clear()
+                self._seen.add(key)
+                if self.types is None or change["entity_type"] in self.types:
+                    events.append({
+                        "entity_type": change["entity_type"],
+                        "entity_id": change["entity_id"],
+                        "operation": change["operation"],
+                        "timestamp": timestamp,
+                    })
+            if len(batch) < limit:
+                break
+            if self.cursor == start:
+                # The whole batch lies within the cursor's second, so the
+                # same query would return it again; widen it to get past
+                limit *= 2
+            else:
+                limit = EVENTS_BATCH_LIMIT
+
+        # Only remember the version once the log has been fully read
+        self._version = version
+        return events
+
+
+def _parse_events_args() -> tuple[int, Optional[set[str]], Optional[float]]:
+    """Parse since/Last-Event-ID, types and timeout for /api/events.
+
+    Raises:
+        ValidationError: If a parameter is malformed
+    """
+    since_arg = request.args.get("since") or request.headers.get("Last-Event-ID")
+    try:
+        since = int(since_arg) if since_arg else int(time.time())
+    except ValueError:
+        raise ValidationError("since", "must be a Unix timestamp") from None
+
+    types_arg = request.args.get("types")
+    types = {t.strip() for t in types_arg.split(",") if t.strip()} if types_arg else None
+
+    timeout_arg = request.args.get("timeout")
+    try:
+        timeout = float(timeout_arg) if timeout_arg else None
+    except ValueError:
+        raise ValidationError("timeout", "must be a number of seconds") from None
+    if timeout is not None and timeout < 0:
+        raise ValidationError("timeout", "must not be negative")
+
+    return since, types, timeout
+
+
+def _sse_stream(feed: _ChangeFeed, timeout: Optional[float]) -> Iterator[str]:
+    """Yield server-sent events for a change feed until timeout.
+
+    Streams never outlive EVENTS_MAX_STREAM_DURATION, so a client cannot
+    hold a server thread forever. The stream ends with the feed's cursor
+    as event id, which clients send back as Last-Event-ID on reconnect.
+    """
+    duration = EVENTS_MAX_STREAM_DURATION if timeout is None else min(timeout, EVENTS_MAX_STREAM_DURATION)
+    deadline = time.monotonic() + duration
+    last_sent = time.monotonic()
+    yield "retry: 1000\n\n"
+
+    while time.monotonic() < deadline:
+        events = feed.poll()
+        for event in events:
+            yield f"id: {event['timestamp']}\nevent: change\ndata: {json.dumps(event)}\n\n"
+        now = time.monotonic()
+        if events:
+            last_sent = now
+        elif now - last_sent >= EVENTS_HEARTBEAT_INTERVAL:
+            yield ": keep-alive\n\n"
+            last_sent = now
+        time.sleep(EVENTS_POLL_INTERVAL)
+    yield f"id: {feed.cursor}\n\n"
+
+
+def create_app(config_dir: Optional[Path] = None, pool_size: int = DEFAULT_POOL_SIZE) -> Flask:
     """Create and configure Flask application.
 
     Args:
         config_dir: Custom configuration directory (default: None)
+        pool_size: Number of pooled database read connections
 
     Returns:
         Configured Flask application
@@ -88,7 +417,7 @@ def create_app(config_dir: Optional[Path] = None) -> Flask:
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
     global db
-    db = Database(db_path)
+    db = Database(db_path, pool_size=pool_size)
 
     logger.info(f"Web API initialized with database: {db_path}")
 
@@ -114,9 +443,8 @@ def create_app(config_dir: Optional[Path] = None) -> Flask:
     @app.route("/api/notes", methods=["GET"])
     @api_endpoint
     def get_notes() -> Response:
-        """Get all notes."""
-        notes = db.get_all_notes()
-        return jsonify(notes)
+        """Get all notes, or one page of them with limit/cursor."""
+        return _conditional_json("notes", _notes_response)
 
     @app.route("/api/notes", methods=["POST"])
     @api_endpoint
@@ -187,17 +515,15 @@ def create_app(config_dir: Optional[Path] = None) -> Flask:
         """Get all attachments for a note.
 
         Returns list of attachments with their type and details.
-        For audio_file type, includes audio file details inline.
+        For audio_file type, includes audio file details inline, and with
+        ?transcriptions=1 the audio file's transcriptions as well.
         """
         validate_uuid_hex(note_id, "note_id")
-        note = db.get_note(note_id)
-        if not note:
+        include_transcriptions = request.args.get("transcriptions") in ("1", "true")
+        attachments = db.get_attachments_with_audio_files(note_id, include_transcriptions)
+        if attachments is None:
             return jsonify({"error": f"Note {note_id} not found"}), 404
 
-        # Get all attachments for the note
-        attachments = db.get_attachments_for_note(note_id)
-
-        # Enrich audio_file attachments with audio file details
         result = []
         for attachment in attachments:
             item = {
@@ -207,10 +533,8 @@ def create_app(config_dir: Optional[Path] = None) -> Flask:
                 "attachment_type": attachment["attachment_type"],
                 "created_at": attachment["created_at"],
             }
-            if attachment["attachment_type"] == "audio_file":
-                audio_file = db.get_audio_file(attachment["attachment_id"])
-                if audio_file:
-                    item["audio_file"] = audio_file
+            if attachment.get("audio_file"):
+                item["audio_file"] = attachment["audio_file"]
             result.append(item)
 
         return jsonify({"attachments": result}), 200
@@ -228,9 +552,63 @@ def create_app(config_dir: Optional[Path] = None) -> Flask:
     @app.route("/api/tags", methods=["GET"])
     @api_endpoint
     def get_tags() -> Response:
-        """Get all tags."""
-        tags = db.get_all_tags()
-        return jsonify(tags)
+        """Get all tags.
+
+        With ?with_counts=1 each tag carries note_count (notes tagged with
+        it directly); with_counts=descendants counts its subtree instead.
+        """
+        with_counts = request.args.get("with_counts")
+
+        def build() -> Response:
+            tags = db.get_all_tags()
+            if with_counts in ("1", "true", "descendants"):
+                counts = db.get_tag_note_counts(include_descendants=with_counts == "descendants")
+                for tag in tags:
+                    tag["note_count"] = counts.get(tag["id"], 0)
+            return jsonify(tags)
+
+        return _conditional_json("tags", build)
+
+    def _tag_notes_target() -> List[str]:
+        """Note IDs named by a /api/tags/<id>/notes request body."""
+        data = request.get_json(silent=True)
+        if not data:
+            raise ValidationError("body", "note_ids or search is required")
+        if "search" in data:
+            search_input = data["search"]
+            if not isinstance(search_input, str):
+                raise ValidationError("search", "must be a string")
+            return [note["id"] for note in execute_search(db, search_input).notes]
+        note_ids = data.get("note_ids")
+        if not isinstance(note_ids, list):
+            raise ValidationError("note_ids", "must be a list of note IDs")
+        for note_id in note_ids:
+            validate_uuid_hex(note_id, "note_ids")
+        return note_ids
+
+    @app.route("/api/tags/<tag_id>/notes", methods=["POST", "DELETE"])
+    @api_endpoint
+    def tag_notes(tag_id: str) -> tuple[Response, int]:
+        """Add a tag to (POST) or remove it from (DELETE) many notes at once."""
+        validate_uuid_hex(tag_id, "tag_id")
+        if not db.get_tag(tag_id):
+            return jsonify({"error": f"Tag {tag_id} not found"}), 404
+
+        note_ids = _tag_notes_target()
+        if request.method == "DELETE":
+            result = db.remove_tags_from_notes(note_ids, [tag_id])
+        else:
+            result = db.add_tags_to_notes(note_ids, [tag_id])
+        logger.info(
+            f"{'Removed' if request.method == 'DELETE' else 'Added'} tag {tag_id} "
+            f"on {result['changed']} of {len(note_ids)} notes via API"
+        )
+        return jsonify({
+            "tag_id": tag_id,
+            "matched": len(note_ids),
+            "changed": result["changed"],
+            "note_ids": result["note_ids"],
+        }), 200
 
     @app.route("/api/search", methods=["GET"])
     @api_endpoint
@@ -238,40 +616,62 @@ def create_app(config_dir: Optional[Path] = None) -> Flask:
         """Search notes by text and/or tags."""
         text_query = request.args.get("text")
         tag_paths = request.args.getlist("tag")
+        transcript_query = request.args.get("transcript")
+        include_transcriptions = request.args.get("include_transcriptions", "").lower() in ("1", "true")
 
         # Build tag_id_groups
         # For ambiguous tags, all matching tags' descendants go into ONE group (OR logic)
-        tag_id_groups: List[List[bytes]] = []
+        tag_id_groups: List[List[str]] = []
         any_tag_not_found = False
 
+        tag_index = get_tag_index(db)
         for tag_path in tag_paths:
-            matching_tags = db.get_all_tags_by_path(tag_path)
-
-            if matching_tags:
-                # Collect all descendants from all matching tags into ONE group (OR logic)
-                all_descendants: List[bytes] = []
-                for tag in matching_tags:
-                    descendants = db.get_tag_descendants(tag["id"])
-                    all_descendants.extend(descendants)
+            # All descendants of all matching tags go into ONE group (OR logic)
+            tag_ids, is_ambiguous, not_found = tag_index.resolve(tag_path)
 
-                all_descendants = list(set(all_descendants))
-                tag_id_groups.append(all_descendants)
+            if not not_found:
+                tag_id_groups.append(tag_ids)
 
-                if len(matching_tags) > 1:
-                    logger.info(f"Tag '{tag_path}' is ambiguous - matching {len(matching_tags)} tags (using OR logic)")
+                if is_ambiguous:
+                    logger.info(f"Tag '{tag_path}' is ambiguous - matching multiple tags (using OR logic)")
             else:
                 logger.warning(f"Tag path '{tag_path}' not found")
                 any_tag_not_found = True
 
         if any_tag_not_found:
-            notes: List[Dict[str, Any]] = []
-        else:
-            notes = db.search_notes(
-                text_query=text_query if text_query else None,
-                tag_id_groups=tag_id_groups if tag_id_groups else None
-            )
+            return jsonify([]), 200
 
-        return jsonify(notes), 200
+        return _notes_response(
+            text_query=text_query if text_query else None,
+            tag_id_groups=tag_id_groups if tag_id_groups else None,
+            transcript_query=transcript_query if transcript_query else None,
+            include_transcriptions=include_transcriptions,
+        ), 200
+
+    @app.route("/api/events", methods=["GET"])
+    @api_endpoint
+    def events() -> Response:
+        """Stream change notifications (SSE), or long-poll with ?poll=1.
+
+        Notifications come from the sync change log and cover notes, tags,
+        note tags, attachments and audio files/transcriptions.
+        """
+        since, types, timeout = _parse_events_args()
+        feed = _ChangeFeed(since, types)
+
+        if request.args.get("poll") in ("1", "true"):
+            limit = timeout if timeout is not None else EVENTS_DEFAULT_POLL_TIMEOUT
+            deadline = time.monotonic() + limit
+            changes = feed.poll()
+            while not changes and time.monotonic() < deadline:
+                time.sleep(EVENTS_POLL_INTERVAL)
+                changes = feed.poll()
+            return jsonify({"changes": changes, "cursor": feed.cursor})
+
+        response = Response(_sse_stream(feed, timeout), mimetype="text/event-stream")
+        response.headers["Cache-Control"] = "no-cache"
+        response.headers["X-Accel-Buffering"] = "no"
+        return response
 
     @app.route("/api/health", methods=["GET"])
     def health_check() -> tuple[Response, int]:
@@ -317,6 +717,124 @@ def add_web_subparser(subparsers: argparse._SubParsersAction[argparse.ArgumentPa
         help="Enable debug mode"
     )
 
+    web_parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=DEFAULT_POOL_SIZE,
+        help=f"Number of pooled database read connections (default: {DEFAULT_POOL_SIZE})"
+    )
+
+    web_parser.add_argument(
+        "--server",
+        choices=SERVER_CHOICES,
+        default="dev",
+        help="HTTP server to run under: Flask's development server, or gunicorn/waitress "
+             "for production use (default: dev)"
+    )
+
+    web_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes (gunicorn) or threads (waitress) to serve requests (default: 1)"
+    )
+
+    web_parser.add_argument(
+        "--timeout",
+        type=int,
+        default=DEFAULT_REQUEST_TIMEOUT,
+        help=f"Seconds before a stalled request or worker is dropped "
+             f"(default: {DEFAULT_REQUEST_TIMEOUT}; ignored by dev server)"
+    )
+
+    web_parser.add_argument(
+        "--threads",
+        type=int,
+        default=DEFAULT_GUNICORN_THREADS,
+        help=f"Threads per gunicorn worker; each open /api/events stream holds one "
+             f"(default: {DEFAULT_GUNICORN_THREADS})"
+    )
+
+
+def _run_gunicorn(config_dir: Optional[Path], args: argparse.Namespace) -> int:
+    """Serve the API with gunicorn.
+
+    The app is not preloaded, so every worker process builds its own app
+    and opens its own database handle after forking. Workers are threaded
+    (gthread), so a long-lived /api/events stream occupies one thread
+    rather than a whole worker. Send SIGHUP to the
+    master process for a graceful reload: new workers are started and old
+    ones finish their in-flight requests before exiting.
+
+    Args:
+        config_dir: Custom configuration directory or None for default
+        args: Parsed command-line arguments
+
+    Returns:
+        Exit code (0 for success, 1 if gunicorn is not installed)
+    """
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        print("Error: gunicorn is not installed. Install it with: pip install gunicorn",
+              file=sys.stderr)
+        return 1
+
+    class VoiceGunicornApp(BaseApplication):  # type: ignore[misc]
+        """Gunicorn application that creates the Flask app per worker."""
+
+        def load_config(self) -> None:
+            options = {
+                "bind": f"{args.host}:{args.port}",
+                "workers": args.workers,
+                "worker_class": "gthread",
+                "threads": args.threads,
+                "timeout": args.timeout,
+                "graceful_timeout": args.timeout,
+                "keepalive": 5,
+                "preload_app": False,
+                "loglevel": "debug" if args.debug else "info",
+            }
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self) -> Flask:
+            return create_app(config_dir=config_dir, pool_size=max(args.pool_size, args.threads))
+
+    VoiceGunicornApp().run()
+    return 0
+
+
+def _run_waitress(config_dir: Optional[Path], args: argparse.Namespace) -> int:
+    """Serve the API with waitress.
+
+    Waitress is a single-process threaded server, so all worker threads
+    share one pooled database handle.
+
+    Args:
+        config_dir: Custom configuration directory or None for default
+        args: Parsed command-line arguments
+
+    Returns:
+        Exit code (0 for success, 1 if waitress is not installed)
+    """
+    try:
+        from waitress import serve
+    except ImportError:
+        print("Error: waitress is not installed. Install it with: pip install waitress",
+              file=sys.stderr)
+        return 1
+
+    app = create_app(config_dir=config_dir, pool_size=max(args.pool_size, args.workers))
+    serve(
+        app,
+        host=args.host,
+        port=args.port,
+        threads=args.workers,
+        channel_timeout=args.timeout,
+    )
+    return 0
+
 
 def run(config_dir: Optional[Path], args: argparse.Namespace) -> int:
     """Run web server with given arguments.
@@ -332,15 +850,28 @@ def run(config_dir: Optional[Path], args: argparse.Namespace) -> int:
     if config_dir:
         logger.info(f"Using custom config directory: {config_dir}")
 
+    server = getattr(args, "server", "dev")
+    if getattr(args, "workers", 1) < 1:
+        print("Error: --workers must be at least 1", file=sys.stderr)
+        return 1
+    if getattr(args, "threads", 1) < 1:
+        print("Error: --threads must be at least 1", file=sys.stderr)
+        return 1
+
+    if server == "gunicorn":
+        return _run_gunicorn(config_dir, args)
+    if server == "waitress":
+        return _run_waitress(config_dir, args)
+
     # Create Flask app
-    app = create_app(config_dir=config_dir)
+    app = create_app(config_dir=config_dir, pool_size=args.pool_size)
 
-    # Run server (single-threaded because PyDatabase is not thread-safe)
+    # Database handle is thread-safe; reads are spread over the pool
     app.run(
         host=args.host,
         port=args.port,
         debug=args.debug,
-        threaded=False
+        threaded=True
     )
 
     return 0
@@ -0,0 +1,125 @@
+"""CLI tests for notes-tag command.
+
+Tests attaching and detaching tags on notes given by ID or by search.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from core.database import Database
+from tests.helpers import get_note_uuid_hex, get_tag_uuid_hex
+
+
+def _run_notes_tag(test_db_path: Path, *args: str) -> subprocess.CompletedProcess:
+    """Run the notes-tag command with JSON output."""
+    return subprocess.run(
+        [
+            sys.executable, "-m", "src.main",
+            "-d", str(test_db_path.parent),
+            "cli", "--format", "json",
+            "notes-tag", *args,
+        ],
+        capture_output=True,
+        text=True
+    )
+
+
+def _note_tag_ids(test_db_path: Path, note_id: str) -> List[str]:
+    """Read a note's tag IDs with a fresh connection."""
+    db = Database(test_db_path)
+    try:
+        return [tag["id"] for tag in db.get_note_tags(note_id)]
+    finally:
+        db.close()
+
+
+@pytest.mark.cli
+class TestTagNotes:
+    """Test notes-tag with explicit note IDs."""
+
+    def test_attach_to_notes(
+        self, test_db_path: Path, populated_db: Database
+    ) -> None:
+        """Tags are attached to every given note."""
+        health = get_tag_uuid_hex("Health")
+        notes = [get_note_uuid_hex(1), get_note_uuid_hex(2)]
+
+        result = _run_notes_tag(test_db_path, "--tags", health, "--notes", *notes)
+
+        assert result.returncode == 0
+        assert json.loads(result.stdout) == {"attached": 2, "tags": 1, "notes": 2}
+        for note_id in notes:
+            assert health in _note_tag_ids(test_db_path, note_id)
+
+    def test_already_attached_not_counted(
+        self, test_db_path: Path, populated_db: Database
+    ) -> None:
+        """Notes that already carry the tag are not counted as new."""
+        result = _run_notes_tag(
+            test_db_path, "--tags", get_tag_uuid_hex("Work"), "--notes", get_note_uuid_hex(1)
+        )
+
+        assert result.returncode == 0
+        assert json.loads(result.stdout)["attached"] == 0
+
+    def test_remove(
+        self, test_db_path: Path, populated_db: Database
+    ) -> None:
+        """--remove detaches the tags."""
+        meetings = get_tag_uuid_hex("Meetings")
+
+        result = _run_notes_tag(
+            test_db_path, "--tags", meetings, "--notes", get_note_uuid_hex(1), "--remove"
+        )
+
+        assert result.returncode == 0
+        assert json.loads(result.stdout)["removed"] == 1
+        assert meetings not in _note_tag_ids(test_db_path, get_note_uuid_hex(1))
+
+    def test_notes_or_search_required(
+        self, test_db_path: Path, populated_db: Database
+    ) -> None:
+        """Either --notes or --from-search must be given."""
+        result = _run_notes_tag(test_db_path, "--tags", get_tag_uuid_hex("Work"))
+
+        assert result.returncode != 0
+
+
+@pytest.mark.cli
+class TestTagNotesFromSearch:
+    """Test notes-tag --from-search."""
+
+    def test_attach_to_search_results(
+        self, test_db_path: Path, populated_db: Database
+    ) -> None:
+        """Every note matching the search is tagged."""
+        health = get_tag_uuid_hex("Health")
+
+        result = _run_notes_tag(test_db_path, "--tags", health, "--from-search", "tag:Projects")
+
+        assert result.returncode == 0
+        output = json.loads(result.stdout)
+        assert output["notes"] == 2
+        assert output["attached"] == 2
+        for note_number in (1, 2):
+            assert health in _note_tag_ids(test_db_path, get_note_uuid_hex(note_number))
+        assert health not in _note_tag_ids(test_db_path, get_note_uuid_hex(9))
+
+    def test_unknown_tag_in_search_tags_nothing(
+        self, test_db_path: Path, populated_db: Database
+    ) -> None:
+        """A search naming an unknown tag matches no notes."""
+        result = _run_notes_tag(
+            test_db_path, "--tags", get_tag_uuid_hex("Health"), "--from-search", "tag:Nonexistent"
+        )
+
+        assert result.returncode == 0
+        assert json.loads(result.stdout) == {"attached": 0, "tags": 1, "notes": 0}
+        assert "not found" in result.stderr
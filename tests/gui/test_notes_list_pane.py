@@ -11,11 +11,13 @@ from __future__ import annotations
 
 import pytest
 from PySide6.QtTest import QSignalSpy, QTest
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QItemSelectionModel, QModelIndex, QRect, Qt
+from PySide6.QtWidgets import QStyleOptionViewItem
 
 from core.config import Config
 from core.database import Database
-from ui.notes_list_pane import NotesListPane
+from core.models import ChangeSet
+from ui.notes_list_pane import ROLE_HTML_TEXT, ROLE_NOTE_ID, NotesListModel, NotesListPane
 from tests.helpers import get_note_uuid_hex, get_tag_uuid_hex
 
 
@@ -39,7 +41,7 @@ class TestNotesListPaneInit:
     ) -> None:
         """Test that notes are loaded on initialization."""
         pane = NotesListPane(test_config, populated_db)
-        assert pane.list_widget.count() == 9  # 9 notes in fixture
+        assert pane.notes_model.rowCount() == 9  # 9 notes in fixture
 
 
 @pytest.mark.gui
@@ -51,7 +53,7 @@ class TestNoteDisplay:
     ) -> None:
         """Test that all notes are displayed."""
         pane = NotesListPane(test_config, populated_db)
-        assert pane.list_widget.count() == 9
+        assert pane.notes_model.rowCount() == 9
 
     def test_note_format_two_lines(
         self, qapp, test_config: Config, populated_db: Database
@@ -60,8 +62,8 @@ class TestNoteDisplay:
         pane = NotesListPane(test_config, populated_db)
 
         # Get first note
-        item = pane.list_widget.item(0)
-        text = item.text()
+        item = pane.notes_model.index(0)
+        text = item.data()
 
         # Should have newline separating timestamp and content
         assert "\n" in text
@@ -84,9 +86,9 @@ class TestNoteDisplay:
 
         # Find the note with long content
         found_truncated = False
-        for i in range(pane.list_widget.count()):
-            item = pane.list_widget.item(i)
-            text = item.text()
+        for i in range(pane.notes_model.rowCount()):
+            item = pane.notes_model.index(i)
+            text = item.data()
             if "AAAA" in text:  # Part of our long content
                 assert text.endswith("...")
                 # Content line should be truncated
@@ -105,9 +107,9 @@ class TestNoteDisplay:
 
         # Find Hebrew note (Note 6)
         found_hebrew = False
-        for i in range(pane.list_widget.count()):
-            item = pane.list_widget.item(i)
-            text = item.text()
+        for i in range(pane.notes_model.rowCount()):
+            item = pane.notes_model.index(i)
+            text = item.data()
             if "שלום" in text:
                 found_hebrew = True
                 break
@@ -127,7 +129,7 @@ class TestNoteSelection:
         spy = QSignalSpy(pane.note_selected)
 
         # Click first note
-        item = pane.list_widget.item(0)
+        item = pane.notes_model.index(0)
         pane.on_note_clicked(item)
 
         # Signal should be emitted
@@ -145,9 +147,9 @@ class TestNoteSelection:
         spy = QSignalSpy(pane.note_selected)
 
         # Find note with known content
-        for i in range(pane.list_widget.count()):
-            item = pane.list_widget.item(i)
-            if "Meeting notes" in item.text():
+        for i in range(pane.notes_model.rowCount()):
+            item = pane.notes_model.index(i)
+            if "Meeting notes" in item.data():
                 pane.on_note_clicked(item)
                 break
 
@@ -156,6 +158,21 @@ class TestNoteSelection:
         args = spy.at(0)
         assert args[0] == get_note_uuid_hex(1)
 
+    def test_selected_note_ids_multi_select(
+        self, qapp, test_config: Config, populated_db: Database
+    ) -> None:
+        """Several notes can be selected; their IDs come back in list order."""
+        pane = NotesListPane(test_config, populated_db)
+        selection = pane.list_widget.selectionModel()
+        flags = QItemSelectionModel.SelectionFlag.Select
+        selection.select(pane.notes_model.index(2), flags)
+        selection.select(pane.notes_model.index(0), flags)
+
+        assert pane.selected_note_ids() == [
+            pane.notes_model.index(0).data(ROLE_NOTE_ID),
+            pane.notes_model.index(2).data(ROLE_NOTE_ID),
+        ]
+
 
 @pytest.mark.gui
 class TestSearchField:
@@ -182,9 +199,9 @@ class TestSearchField:
         pane.search_button.click()
 
         # Should filter to 1 note
-        assert pane.list_widget.count() == 1
-        item = pane.list_widget.item(0)
-        assert "Meeting notes" in item.text()
+        assert pane.notes_model.rowCount() == 1
+        item = pane.notes_model.index(0)
+        assert "Meeting notes" in item.data()
 
     def test_return_key_triggers_search(
         self, qapp, test_config: Config, populated_db: Database
@@ -199,7 +216,7 @@ class TestSearchField:
         QTest.keyClick(pane.search_field, Qt.Key.Key_Return)
 
         # Should filter to 1 note
-        assert pane.list_widget.count() == 1
+        assert pane.notes_model.rowCount() == 1
 
     def test_clear_button_clears_search(
         self, qapp, test_config: Config, populated_db: Database
@@ -210,14 +227,14 @@ class TestSearchField:
         # Enter search and execute
         pane.search_field.setPlainText("meeting")
         pane.search_button.click()
-        assert pane.list_widget.count() == 1
+        assert pane.notes_model.rowCount() == 1
 
         # Click clear
         pane.clear_button.click()
 
         # Search field should be empty and all notes shown
         assert pane.search_field.toPlainText() == ""
-        assert pane.list_widget.count() == 9
+        assert pane.notes_model.rowCount() == 9
 
 
 @pytest.mark.gui
@@ -233,9 +250,9 @@ class TestFreeTextSearch:
         pane.search_field.setPlainText("doctor")
         pane.perform_search()
 
-        assert pane.list_widget.count() == 1
-        item = pane.list_widget.item(0)
-        assert "Doctor appointment" in item.text()
+        assert pane.notes_model.rowCount() == 1
+        item = pane.notes_model.index(0)
+        assert "Doctor appointment" in item.data()
 
     def test_case_insensitive_search(
         self, qapp, test_config: Config, populated_db: Database
@@ -248,7 +265,7 @@ class TestFreeTextSearch:
         for query in test_cases:
             pane.search_field.setPlainText(query)
             pane.perform_search()
-            assert pane.list_widget.count() == 1
+            assert pane.notes_model.rowCount() == 1
 
     def test_hebrew_text_search(
         self, qapp, test_config: Config, populated_db: Database
@@ -259,9 +276,253 @@ class TestFreeTextSearch:
         pane.search_field.setPlainText("שלום")
         pane.perform_search()
 
-        assert pane.list_widget.count() == 1
-        item = pane.list_widget.item(0)
-        assert "שלום עולם" in item.text()
+        assert pane.notes_model.rowCount() == 1
+        item = pane.notes_model.index(0)
+        assert "שלום עולם" in item.data()
+
+
+@pytest.mark.gui
+class TestNotesListModel:
+    """Test lazy loading in NotesListModel."""
+
+    def test_all_notes_fetched_in_pages(self, qapp, populated_db: Database) -> None:
+        """All-notes mode reads one page at a time from the database."""
+        model = NotesListModel(populated_db, page_size=4)
+        model.load_all()
+        assert model.rowCount() == 4
+        assert model.canFetchMore(QModelIndex())
+
+        while model.canFetchMore(QModelIndex()):
+            model.fetchMore(QModelIndex())
+
+        ids = [model.index(i).data(ROLE_NOTE_ID) for i in range(model.rowCount())]
+        assert sorted(ids) == sorted(n["id"] for n in populated_db.get_all_notes())
+
+    def test_search_results_exposed_in_pages(self, qapp, populated_db: Database) -> None:
+        """In-memory results are also added page by page."""
+        model = NotesListModel(populated_db, page_size=5)
+        model.set_notes(populated_db.get_all_notes())
+        assert model.rowCount() == 5
+        model.fetchMore(QModelIndex())
+        assert model.rowCount() == 9
+        assert not model.canFetchMore(QModelIndex())
+
+    def test_data_formats_uncached_row(self, qapp, populated_db: Database) -> None:
+        """data() builds and caches the display of a row not formatted yet."""
+        model = NotesListModel(populated_db)
+        model.load_all()
+        index = model.index(0)
+        note_id = index.data(ROLE_NOTE_ID)
+        assert note_id not in model._display
+
+        html_text = index.data(ROLE_HTML_TEXT)
+        plain_text = index.data(Qt.ItemDataRole.DisplayRole)
+
+        assert isinstance(html_text, str) and "<b>" in html_text
+        assert isinstance(plain_text, str) and plain_text
+        assert note_id in model._display
+
+    def test_row_of_fetches_until_found(self, qapp, populated_db: Database) -> None:
+        """row_of(fetch=True) loads pages until the note appears."""
+        model = NotesListModel(populated_db, page_size=2)
+        model.load_all()
+        last_id = populated_db.get_all_notes()[-1]["id"]
+
+        assert model.row_of(last_id) == -1
+        row = model.row_of(last_id, fetch=True)
+        assert model.index(row).data(ROLE_NOTE_ID) == last_id
+
+    def test_refresh_note_item_updates_row(
+        self, qapp, test_config: Config, populated_db: Database
+    ) -> None:
+        """refresh_note_item re-renders the row from the database."""
+        pane = NotesListPane(test_config, populated_db)
+        note_id = get_note_uuid_hex(3)
+        populated_db.update_note(note_id, "Dentist appointment instead")
+
+        assert pane.refresh_note_item(note_id)
+        row = pane.notes_model.row_of(note_id)
+        assert "Dentist" in pane.notes_model.index(row).data(ROLE_HTML_TEXT)
+
+
+@pytest.mark.gui
+class TestApplyChanges:
+    """Test incremental list updates from change sets."""
+
+    def test_created_note_inserted_at_top(
+        self, qapp, test_config: Config, populated_db: Database
+    ) -> None:
+        """A new note gets its own row without reloading the others."""
+        pane = NotesListPane(test_config, populated_db)
+        reset_spy = QSignalSpy(pane.notes_model.modelReset)
+        count = pane.notes_model.rowCount()
+
+        note_id = populated_db.create_note("Freshly created note")
+        pane.apply_changes(ChangeSet(created_notes=frozenset([note_id])))
+
+        assert pane.notes_model.rowCount() == count + 1
+        assert pane.notes_model.index(0).data(ROLE_NOTE_ID) == note_id
+        assert reset_spy.count() == 0
+
+    def test_updated_note_row_refreshed(
+        self, qapp, test_config: Config, populated_db: Database
+    ) -> None:
+        """An edited note's row shows the new content."""
+        pane = NotesListPane(test_config, populated_db)
+        note_id = get_note_uuid_hex(3)
+        populated_db.update_note(note_id, "Dentist appointment moved")
+
+        pane.apply_changes(ChangeSet(updated_notes=frozenset([note_id])))
+
+        row = pane.notes_model.row_of(note_id)
+        assert "Dentist appointment moved" in pane.notes_model.index(row).data()
+
+    def test_deleted_note_row_removed(
+        self, qapp, test_config: Config, populated_db: Database
+    ) -> None:
+        """A deleted note's row is removed."""
+        pane = NotesListPane(test_config, populated_db)
+        count = pane.notes_model.rowCount()
+        note_id = get_note_uuid_hex(3)
+        populated_db.delete_note(note_id)
+
+        pane.apply_changes(ChangeSet(deleted_notes=frozenset([note_id])))
+
+        assert pane.notes_model.rowCount() == count - 1
+        assert pane.notes_model.row_of(note_id) == -1
+
+    def test_created_note_not_added_to_search_result(
+        self, qapp, test_config: Config, populated_db: Database
+    ) -> None:
+        """New notes do not appear in a search result they may not match."""
+        pane = NotesListPane(test_config, populated_db)
+        pane.search_field.setPlainText("tag:Work")
+        pane.perform_search()
+        count = pane.notes_model.rowCount()
+
+        note_id = populated_db.create_note("Unrelated note")
+        pane.apply_changes(ChangeSet(created_notes=frozenset([note_id])))
+
+        assert pane.notes_model.rowCount() == count
+
+    def test_incomplete_change_set_reloads(
+        self, qapp, test_config: Config, populated_db: Database
+    ) -> None:
+        """Unknown changes fall back to a full reload."""
+        pane = NotesListPane(test_config, populated_db)
+        reset_spy = QSignalSpy(pane.notes_model.modelReset)
+
+        pane.apply_changes(ChangeSet(complete=False))
+
+        assert reset_spy.count() == 1
+
+
+@pytest.mark.gui
+class TestHTMLDelegateCache:
+    """Test the delegate's layout cache."""
+
+    def _option(self, width: int) -> QStyleOptionViewItem:
+        option = QStyleOptionViewItem()
+        option.rect = QRect(0, 0, width, 40)
+        return option
+
+    def test_size_hint_cached_per_width(
+        self, qapp, test_config: Config, populated_db: Database
+    ) -> None:
+        """Size hints are computed once per note and width."""
+        pane = NotesListPane(test_config, populated_db)
+        delegate = pane.delegate
+        delegate.invalidate()
+        index = pane.notes_model.index(0)
+
+        first = delegate.sizeHint(self._option(300), index)
+        assert delegate.sizeHint(self._option(300), index) == first
+        assert len(delegate._sizes) == 1
+
+        delegate.sizeHint(self._option(150), index)
+        assert len(delegate._sizes) == 2
+
+    def test_refresh_invalidates_note(
+        self, qapp, test_config: Config, populated_db: Database
+    ) -> None:
+        """refresh_note_item drops the refreshed note's cached layouts."""
+        pane = NotesListPane(test_config, populated_db)
+        delegate = pane.delegate
+        delegate.invalidate()
+        index = pane.notes_model.index(0)
+        note_id = index.data(ROLE_NOTE_ID)
+        delegate.sizeHint(self._option(300), index)
+        delegate.sizeHint(self._option(300), pane.notes_model.index(1))
+
+        pane.refresh_note_item(note_id)
+
+        assert [key[0] for key in delegate._sizes] == [pane.notes_model.index(1).data(ROLE_NOTE_ID)]
+
+    def test_cache_disabled(
+        self, qapp, test_config: Config, populated_db: Database
+    ) -> None:
+        """cache_size=0 keeps nothing."""
+        pane = NotesListPane(test_config, populated_db)
+        pane.delegate.cache_size = 0
+        pane.delegate.invalidate()
+
+        pane.delegate.sizeHint(self._option(300), pane.notes_model.index(0))
+
+        assert len(pane.delegate._sizes) == 0
+
+
+def _wait_for_count(pane: NotesListPane, count: int, timeout_ms: int = 3000) -> None:
+    """Process events until the list shows count notes or time runs out."""
+    waited = 0
+    while pane.notes_model.rowCount() != count and waited < timeout_ms:
+        QTest.qWait(50)
+        waited += 50
+
+
+@pytest.mark.gui
+class TestSearchAsYouType:
+    """Test debounced background search while typing."""
+
+    def test_typing_searches_after_pause(
+        self, qapp, test_config: Config, populated_db: Database
+    ) -> None:
+        """Editing the search field updates the list without pressing Enter."""
+        pane = NotesListPane(test_config, populated_db)
+
+        QTest.keyClicks(pane.search_field, "doctor")
+        assert pane.notes_model.rowCount() > 1  # Debounced, not run yet
+
+        _wait_for_count(pane, 1)
+        assert pane.notes_model.rowCount() == 1
+        assert "Doctor appointment" in pane.notes_model.index(0).data()
+
+    def test_explicit_search_cancels_pending(
+        self, qapp, test_config: Config, populated_db: Database
+    ) -> None:
+        """A pending background result does not overwrite an explicit search."""
+        pane = NotesListPane(test_config, populated_db)
+
+        QTest.keyClicks(pane.search_field, "doctor")
+        pane.search_field.setPlainText("meeting")
+        pane.perform_search()
+        QTest.qWait(500)
+
+        assert pane.notes_model.rowCount() == 1
+        assert "Meeting notes" in pane.notes_model.index(0).data()
+
+    def test_results_reflect_new_notes(
+        self, qapp, test_config: Config, populated_db: Database
+    ) -> None:
+        """Cached results are dropped when the database changes."""
+        pane = NotesListPane(test_config, populated_db)
+        pane.search_field.setPlainText("doctor")
+        pane.perform_search()
+        assert pane.notes_model.rowCount() == 1
+
+        populated_db.create_note("Call the doctor back")
+        pane.perform_search()
+
+        assert pane.notes_model.rowCount() == 2
 
 
 @pytest.mark.gui
@@ -280,7 +541,7 @@ class TestTagFiltering:
         # Should add to search field and perform search
         assert "tag:Work" in pane.search_field.toPlainText()
         # Work has 2 notes directly tagged
-        assert pane.list_widget.count() >= 2
+        assert pane.notes_model.rowCount() >= 2
 
     def test_filter_includes_child_tags(
         self, qapp, test_config: Config, populated_db: Database
@@ -293,7 +554,7 @@ class TestTagFiltering:
         pane.filter_by_tag(get_tag_uuid_hex("Personal"))
 
         # Should find 4 notes (3, 4, 5, 6)
-        assert pane.list_widget.count() == 4
+        assert pane.notes_model.rowCount() == 4
 
     def test_appends_to_existing_search(
         self, qapp, test_config: Config, populated_db: Database
@@ -335,7 +596,7 @@ class TestTagFiltering:
         pane.perform_search()
 
         # Should find 2 notes: France/Paris and Texas/Paris
-        assert pane.list_widget.count() == 2
+        assert pane.notes_model.rowCount() == 2
 
 
 @pytest.mark.gui
@@ -31,7 +31,7 @@ class TestTagSyntax:
         pane.perform_search()
 
         # Should find Work-tagged notes (1, 2)
-        assert pane.list_widget.count() >= 2
+        assert pane.notes_model.rowCount() >= 2
 
     def test_hierarchical_tag_path(
         self, qapp, test_config: Config, populated_db: Database
@@ -43,9 +43,9 @@ class TestTagSyntax:
         pane.perform_search()
 
         # Should find note 4 (Paris)
-        assert pane.list_widget.count() == 1
-        item = pane.list_widget.item(0)
-        assert "Paris" in item.text()
+        assert pane.notes_model.rowCount() == 1
+        item = pane.notes_model.index(0)
+        assert "Paris" in item.data()
 
     def test_case_insensitive_tag_search(
         self, qapp, test_config: Config, populated_db: Database
@@ -57,7 +57,7 @@ class TestTagSyntax:
         for query in test_cases:
             pane.search_field.setPlainText(query)
             pane.perform_search()
-            assert pane.list_widget.count() >= 2
+            assert pane.notes_model.rowCount() >= 2
 
 
 @pytest.mark.gui
@@ -76,7 +76,7 @@ class TestHierarchicalSearch:
         pane.perform_search()
 
         # Should find 4 notes (3, 4, 5, 6)
-        assert pane.list_widget.count() == 4
+        assert pane.notes_model.rowCount() == 4
 
     def test_parent_tag_includes_deep_children(
         self, qapp, test_config: Config, populated_db: Database
@@ -89,7 +89,7 @@ class TestHierarchicalSearch:
         pane.perform_search()
 
         # Should find notes 4, 5, 9 (France Paris, Israel, Texas Paris paths)
-        assert pane.list_widget.count() == 3
+        assert pane.notes_model.rowCount() == 3
 
 
 @pytest.mark.gui
@@ -109,7 +109,7 @@ class TestMultipleTagsAND:
         pane.perform_search()
 
         # Notes 1 and 2 have both Work and Projects
-        assert pane.list_widget.count() == 2
+        assert pane.notes_model.rowCount() == 2
 
     def test_parent_and_child_tag_search(
         self, qapp, test_config: Config, populated_db: Database
@@ -123,7 +123,7 @@ class TestMultipleTagsAND:
         pane.perform_search()
 
         # Should find note 1 only
-        assert pane.list_widget.count() == 1
+        assert pane.notes_model.rowCount() == 1
 
     def test_three_tags_and_logic(
         self, qapp, test_config: Config, populated_db: Database
@@ -137,9 +137,9 @@ class TestMultipleTagsAND:
         pane.perform_search()
 
         # Should find only note 4
-        assert pane.list_widget.count() == 1
-        item = pane.list_widget.item(0)
-        assert "reunion" in item.text()
+        assert pane.notes_model.rowCount() == 1
+        item = pane.notes_model.index(0)
+        assert "reunion" in item.data()
 
 
 @pytest.mark.gui
@@ -157,9 +157,9 @@ class TestCombinedSearch:
         pane.perform_search()
 
         # Should find only note 1
-        assert pane.list_widget.count() == 1
-        item = pane.list_widget.item(0)
-        assert "Meeting notes" in item.text()
+        assert pane.notes_model.rowCount() == 1
+        item = pane.notes_model.index(0)
+        assert "Meeting notes" in item.data()
 
     def test_text_and_multiple_tags(
         self, qapp, test_config: Config, populated_db: Database
@@ -173,7 +173,7 @@ class TestCombinedSearch:
         pane.perform_search()
 
         # Should find note 4
-        assert pane.list_widget.count() == 1
+        assert pane.notes_model.rowCount() == 1
 
     def test_text_with_hierarchical_tag(
         self, qapp, test_config: Config, populated_db: Database
@@ -185,7 +185,7 @@ class TestCombinedSearch:
         pane.perform_search()
 
         # Should find note 4
-        assert pane.list_widget.count() == 1
+        assert pane.notes_model.rowCount() == 1
 
     def test_multiple_text_words_with_tags(
         self, qapp, test_config: Config, populated_db: Database
@@ -197,7 +197,7 @@ class TestCombinedSearch:
         pane.search_field.setPlainText("Family reunion tag:Personal")
         pane.perform_search()
 
-        assert pane.list_widget.count() == 1
+        assert pane.notes_model.rowCount() == 1
 
 
 @pytest.mark.gui
@@ -247,7 +247,7 @@ class TestSearchEdgeCases:
         pane.perform_search()
 
         # Should return no results
-        assert pane.list_widget.count() == 0
+        assert pane.notes_model.rowCount() == 0
 
     def test_empty_search_shows_all_notes(
         self, qapp, test_config: Config, populated_db: Database
@@ -258,14 +258,14 @@ class TestSearchEdgeCases:
         # Start with filtered view
         pane.search_field.setPlainText("tag:Work")
         pane.perform_search()
-        assert pane.list_widget.count() < 6
+        assert pane.notes_model.rowCount() < 6
 
         # Clear and search empty
         pane.search_field.clear()
         pane.perform_search()
 
         # Should show all notes
-        assert pane.list_widget.count() == 9
+        assert pane.notes_model.rowCount() == 9
 
     def test_tag_with_no_matching_notes(
         self, qapp, test_config: Config, populated_db: Database
@@ -277,7 +277,7 @@ class TestSearchEdgeCases:
         pane.search_field.setPlainText("tag:Germany")
         pane.perform_search()
 
-        assert pane.list_widget.count() == 0
+        assert pane.notes_model.rowCount() == 0
 
     def test_conflicting_criteria_returns_nothing(
         self, qapp, test_config: Config, populated_db: Database
@@ -289,7 +289,7 @@ class TestSearchEdgeCases:
         pane.search_field.setPlainText("tag:Voice tag:Health")
         pane.perform_search()
 
-        assert pane.list_widget.count() == 0
+        assert pane.notes_model.rowCount() == 0
 
 
 @pytest.mark.gui
@@ -307,8 +307,8 @@ class TestAmbiguousTagSearch:
         pane.perform_search()
 
         # Should find notes 4 (France Paris) and 9 (Texas Paris)
-        assert pane.list_widget.count() == 2
-        texts = [pane.list_widget.item(i).text() for i in range(pane.list_widget.count())]
+        assert pane.notes_model.rowCount() == 2
+        texts = [pane.notes_model.index(i).data() for i in range(pane.notes_model.rowCount())]
         assert any("reunion" in text for text in texts)  # Note 4
         assert any("Cowboys" in text for text in texts)  # Note 9
 
@@ -323,8 +323,8 @@ class TestAmbiguousTagSearch:
         pane.perform_search()
 
         # Should find only note 4 (France Paris)
-        assert pane.list_widget.count() == 1
-        item_text = pane.list_widget.item(0).text()
+        assert pane.notes_model.rowCount() == 1
+        item_text = pane.notes_model.index(0).data()
         assert "reunion" in item_text
 
     def test_search_full_path_texas_paris_finds_one(
@@ -338,8 +338,8 @@ class TestAmbiguousTagSearch:
         pane.perform_search()
 
         # Should find only note 9 (Texas Paris)
-        assert pane.list_widget.count() == 1
-        item_text = pane.list_widget.item(0).text()
+        assert pane.notes_model.rowCount() == 1
+        item_text = pane.notes_model.index(0).data()
         assert "Cowboys" in item_text
 
     def test_search_ambiguous_bar_finds_both(
@@ -353,7 +353,7 @@ class TestAmbiguousTagSearch:
         pane.perform_search()
 
         # Should find notes 7 (Foo/Bar) and 8 (Boom/Bar)
-        assert pane.list_widget.count() == 2
-        texts = [pane.list_widget.item(i).text() for i in range(pane.list_widget.count())]
+        assert pane.notes_model.rowCount() == 2
+        texts = [pane.notes_model.index(i).data() for i in range(pane.notes_model.rowCount())]
         assert any("Testing ambiguous tag with Foo/bar" in text for text in texts)  # Note 7
         assert any("Another note with Boom/bar" in text for text in texts)  # Note 8
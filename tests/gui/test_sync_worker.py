@@ -0,0 +1,100 @@
+"""Tests for SyncWorker.
+
+Tests the background sync worker including:
+- Progress signals per peer
+- Completion and failure signals
+- Cancellation
+"""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+from PySide6.QtTest import QTest
+
+from ui.sync_worker import SyncWorker
+
+
+def _result(success: bool = True, pulled: int = 0, pushed: int = 0) -> SimpleNamespace:
+    """A stand-in for voicecore.SyncResult."""
+    return SimpleNamespace(success=success, pulled=pulled, pushed=pushed, errors=[])
+
+
+def _wait_until(condition, timeout_ms: int = 3000) -> None:
+    """Process events until condition() is true or time runs out."""
+    waited = 0
+    while not condition() and waited < timeout_ms:
+        QTest.qWait(20)
+        waited += 20
+
+
+@pytest.mark.gui
+class TestSyncWorker:
+    """Test running sync on a worker thread."""
+
+    def test_reports_each_peer_then_finishes(self, qapp) -> None:
+        """peer_finished fires per peer, then finished with all results."""
+        ui_thread = threading.current_thread()
+        calls: List[Dict[str, Any]] = []
+
+        def fake_sync(config_dir: str, progress=None, cancel=None) -> Dict[str, Any]:
+            calls.append({"config_dir": config_dir, "thread": threading.current_thread()})
+            results = {"peer-a": _result(pulled=2), "peer-b": _result(pushed=1)}
+            for peer_id, result in results.items():
+                progress(peer_id, result)
+            return results
+
+        worker = SyncWorker(fake_sync, "/tmp/config")
+        progress: List[str] = []
+        finished: List[Dict[str, Any]] = []
+        worker.peer_finished.connect(lambda peer_id, result: progress.append(peer_id))
+        worker.finished.connect(finished.append)
+
+        assert worker.start() is True
+        _wait_until(lambda: bool(finished))
+
+        assert progress == ["peer-a", "peer-b"]
+        assert set(finished[0]) == {"peer-a", "peer-b"}
+        assert calls[0]["config_dir"] == "/tmp/config"
+        assert calls[0]["thread"] is not ui_thread
+
+    def test_failure_is_reported(self, qapp) -> None:
+        """An exception from the sync is emitted as failed."""
+
+        def fake_sync(config_dir: str, progress=None, cancel=None) -> Dict[str, Any]:
+            raise RuntimeError("network down")
+
+        worker = SyncWorker(fake_sync, "/tmp/config")
+        errors: List[str] = []
+        worker.failed.connect(errors.append)
+
+        worker.start()
+        _wait_until(lambda: bool(errors))
+
+        assert errors == ["network down"]
+
+    def test_cancel_sets_event_seen_by_sync(self, qapp) -> None:
+        """cancel() sets the event passed to the sync function."""
+        started = threading.Event()
+
+        def fake_sync(config_dir: str, progress=None, cancel=None) -> Dict[str, Any]:
+            started.set()
+            cancel.wait(timeout=3)
+            return {"peer-a": _result(success=False)} if cancel.is_set() else {}
+
+        worker = SyncWorker(fake_sync, "/tmp/config")
+        finished: List[Dict[str, Any]] = []
+        worker.finished.connect(finished.append)
+
+        worker.start()
+        assert started.wait(timeout=3)
+        assert worker.start() is False  # Already running
+        worker.cancel()
+        _wait_until(lambda: bool(finished))
+
+        assert worker.is_cancelled()
+        assert "peer-a" in finished[0]
+        assert not worker.is_running()
@@ -4,6 +4,7 @@ Tests the tags pane UI component including:
 - Tag tree display
 - Tag hierarchy
 - Signal emission on tag clicks
+- Lazy child population and expansion state
 """
 
 from __future__ import annotations
@@ -13,6 +14,7 @@ from PySide6.QtCore import QModelIndex, Qt
 from PySide6.QtTest import QSignalSpy
 
 from core.database import Database
+from core.models import ChangeSet
 from ui.tags_pane import TagsPane
 from tests.helpers import get_tag_uuid_hex
 
@@ -102,6 +104,9 @@ class TestTagTreeDisplay:
 
         assert europe_item is not None
 
+        # Children are created when a tag is expanded
+        pane.tree_view.expand(europe_item.index())
+
         # Find France child
         france_item = None
         for i in range(europe_item.rowCount()):
@@ -111,6 +116,7 @@ class TestTagTreeDisplay:
                 break
 
         assert france_item is not None
+        pane.tree_view.expand(france_item.index())
 
         # Check Paris is child of France
         paris_found = False
@@ -310,3 +316,134 @@ class TestTagShiftClick:
         assert add_spy.count() == 1
         # tag_selected should NOT be emitted
         assert selected_spy.count() == 0
+
+
+def _find_child(parent, name: str):
+    """Return the child item of a QStandardItem (or model) with the given text."""
+    for i in range(parent.rowCount()):
+        item = parent.child(i) if hasattr(parent, "child") else parent.item(i)
+        if item.text() == name:
+            return item
+    return None
+
+
+@pytest.mark.gui
+class TestApplyChanges:
+    """Test incremental tree updates from change sets."""
+
+    def test_created_tag_added_under_parent(self, qapp, populated_db: Database) -> None:
+        """A new tag is added under its parent and the tree is not rebuilt."""
+        pane = TagsPane(populated_db)
+        work_item = _find_child(pane.model, "Work")
+        tag_id = populated_db.create_tag("Reviews", get_tag_uuid_hex("Work"))
+
+        pane.apply_changes(ChangeSet(created_tags=frozenset([tag_id])))
+
+        assert _find_child(pane.model, "Work") is work_item
+        assert _find_child(work_item, "Reviews") is not None
+
+    def test_renamed_tag_updated(self, qapp, populated_db: Database) -> None:
+        """A renamed tag keeps its node and shows the new name."""
+        pane = TagsPane(populated_db)
+        tag_id = get_tag_uuid_hex("Work")
+        populated_db.rename_tag(tag_id, "Job")
+
+        pane.apply_changes(ChangeSet(updated_tags=frozenset([tag_id])))
+
+        job_item = _find_child(pane.model, "Job")
+        assert job_item is not None
+        assert _find_child(job_item, "Projects") is not None
+
+    def test_reparented_tag_moved(self, qapp, populated_db: Database) -> None:
+        """A moved tag is taken from its old parent to the new one."""
+        pane = TagsPane(populated_db)
+        tag_id = get_tag_uuid_hex("Projects")
+        populated_db.reparent_tag(tag_id, get_tag_uuid_hex("Personal"))
+
+        pane.apply_changes(ChangeSet(updated_tags=frozenset([tag_id])))
+
+        assert _find_child(_find_child(pane.model, "Work"), "Projects") is None
+        assert _find_child(_find_child(pane.model, "Personal"), "Projects") is not None
+
+    def test_deleted_tag_removed(self, qapp, populated_db: Database) -> None:
+        """A deleted tag's node is removed."""
+        pane = TagsPane(populated_db)
+        tag_id = get_tag_uuid_hex("Meetings")
+        populated_db.delete_tag(tag_id)
+
+        pane.apply_changes(ChangeSet(deleted_tags=frozenset([tag_id])))
+
+        assert _find_child(_find_child(pane.model, "Work"), "Meetings") is None
+
+
+@pytest.mark.gui
+class TestLazyPopulation:
+    """Test that child rows are created on first expand."""
+
+    def test_unexpanded_tag_has_no_child_rows(self, qapp, populated_db: Database) -> None:
+        """A collapsed tag has no child rows, but still reports children."""
+        pane = TagsPane(populated_db)
+        europe_item = _find_child(_find_child(pane.model, "Geography"), "Europe")
+
+        assert europe_item.rowCount() == 0
+        assert pane.model.hasChildren(europe_item.index())
+        assert not pane.tree_view.isExpanded(europe_item.index())
+
+    def test_expanding_creates_child_rows(self, qapp, populated_db: Database) -> None:
+        """Expanding a tag adds its children once."""
+        pane = TagsPane(populated_db)
+        europe_item = _find_child(_find_child(pane.model, "Geography"), "Europe")
+
+        pane.tree_view.expand(europe_item.index())
+        pane.tree_view.collapse(europe_item.index())
+        pane.tree_view.expand(europe_item.index())
+
+        assert _find_child(europe_item, "France") is not None
+        assert [europe_item.child(i).text() for i in range(europe_item.rowCount())].count("France") == 1
+
+    def test_leaf_tag_has_no_children(self, qapp, populated_db: Database) -> None:
+        """A tag without children shows no expand arrow."""
+        pane = TagsPane(populated_db)
+        meetings_item = _find_child(_find_child(pane.model, "Work"), "Meetings")
+
+        assert not pane.model.hasChildren(meetings_item.index())
+
+    def test_reload_keeps_expansion_state(self, qapp, populated_db: Database) -> None:
+        """load_tags expands the same tags again, including nested ones."""
+        pane = TagsPane(populated_db)
+        geography_item = _find_child(pane.model, "Geography")
+        pane.tree_view.expand(_find_child(geography_item, "Europe").index())
+        pane.tree_view.collapse(_find_child(pane.model, "Work").index())
+
+        pane.load_tags()
+
+        geography_item = _find_child(pane.model, "Geography")
+        europe_item = _find_child(geography_item, "Europe")
+        assert pane.tree_view.isExpanded(europe_item.index())
+        assert _find_child(europe_item, "France") is not None
+        assert not pane.tree_view.isExpanded(_find_child(pane.model, "Work").index())
+
+    def test_created_tag_under_collapsed_parent(self, qapp, populated_db: Database) -> None:
+        """A new tag under a collapsed parent appears when the parent is expanded."""
+        pane = TagsPane(populated_db)
+        europe_item = _find_child(_find_child(pane.model, "Geography"), "Europe")
+        tag_id = populated_db.create_tag("Spain", get_tag_uuid_hex("Europe"))
+
+        pane.apply_changes(ChangeSet(created_tags=frozenset([tag_id])))
+        assert _find_child(europe_item, "Spain") is None
+
+        pane.tree_view.expand(europe_item.index())
+        assert _find_child(europe_item, "Spain") is not None
+        assert _find_child(europe_item, "France") is not None
+
+    def test_deleted_collapsed_tag_children_move_to_root(self, qapp, populated_db: Database) -> None:
+        """Children of a deleted tag that was never expanded are shown at the root."""
+        pane = TagsPane(populated_db)
+        tag_id = get_tag_uuid_hex("Europe")
+        populated_db.delete_tag(tag_id)
+
+        pane.apply_changes(ChangeSet(deleted_tags=frozenset([tag_id])))
+
+        assert _find_child(_find_child(pane.model, "Geography"), "Europe") is None
+        assert _find_child(pane.model, "France") is not None
+        assert _find_child(pane.model, "Germany") is not None
@@ -45,8 +45,8 @@ class TestSearchConsistency:
         pane.perform_search()
         gui_note_ids = sorted(
             [
-                pane.list_widget.item(i).data(0x0100)  # UserRole
-                for i in range(pane.list_widget.count())
+                pane.notes_model.index(i).data(0x0100)  # UserRole
+                for i in range(pane.notes_model.rowCount())
             ]
         )
 
@@ -87,8 +87,8 @@ class TestSearchConsistency:
         pane.perform_search()
         gui_note_ids = sorted(
             [
-                pane.list_widget.item(i).data(0x0100)
-                for i in range(pane.list_widget.count())
+                pane.notes_model.index(i).data(0x0100)
+                for i in range(pane.notes_model.rowCount())
             ]
         )
 
@@ -129,8 +129,8 @@ class TestSearchConsistency:
         pane.perform_search()
         gui_note_ids = sorted(
             [
-                pane.list_widget.item(i).data(0x0100)
-                for i in range(pane.list_widget.count())
+                pane.notes_model.index(i).data(0x0100)
+                for i in range(pane.notes_model.rowCount())
             ]
         )
 
@@ -174,8 +174,8 @@ class TestSearchConsistency:
         pane.perform_search()
         gui_note_ids = sorted(
             [
-                pane.list_widget.item(i).data(0x0100)
-                for i in range(pane.list_widget.count())
+                pane.notes_model.index(i).data(0x0100)
+                for i in range(pane.notes_model.rowCount())
             ]
         )
 
@@ -217,7 +217,7 @@ class TestDataConsistency:
 
         # GUI
         pane = NotesListPane(test_config, populated_db)
-        gui_count = pane.list_widget.count()
+        gui_count = pane.notes_model.rowCount()
 
         # CLI
         returncode, stdout, stderr = cli_runner("--format", "json", "list-notes")
@@ -317,7 +317,7 @@ class TestHierarchicalSearchConsistency:
         pane = NotesListPane(test_config, populated_db)
         pane.search_field.setPlainText("tag:Personal")
         pane.perform_search()
-        gui_count = pane.list_widget.count()
+        gui_count = pane.notes_model.rowCount()
 
         # CLI
         returncode, stdout, _ = cli_runner("--format", "json", "search", "--tag", "Personal")
@@ -349,7 +349,7 @@ class TestHierarchicalSearchConsistency:
         pane = NotesListPane(test_config, populated_db)
         pane.search_field.setPlainText("tag:Geography/Europe/France/Paris")
         pane.perform_search()
-        gui_count = pane.list_widget.count()
+        gui_count = pane.notes_model.rowCount()
 
         # CLI
         returncode, stdout, _ = cli_runner(
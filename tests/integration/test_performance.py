@@ -5,6 +5,7 @@ Tests system behavior with large datasets.
 
 from __future__ import annotations
 
+import threading
 import time
 import uuid
 from pathlib import Path
@@ -221,3 +222,85 @@ class TestNormalDatabasePerformance:
         assert len(notes) == 9
         assert len(tags) == 21
         assert elapsed < 0.1, f"Getting all data took {elapsed:.3f}s, should be < 0.1s"
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+class TestGilRelease:
+    """Test that long database calls do not block other Python threads."""
+
+    def test_rebuild_caches_releases_gil(
+        self,
+        large_db: Database,
+        test_config_dir: Path,
+    ) -> None:
+        """The main thread keeps running while a worker rebuilds caches."""
+        db_path = test_config_dir / "large_test.db"
+        started = threading.Event()
+        done = threading.Event()
+
+        def worker() -> None:
+            # Database handles are per-thread, so open a second one here
+            worker_db = Database(db_path)
+            try:
+                started.set()
+                for _ in range(5):
+                    worker_db.rebuild_all_database_caches()
+            finally:
+                worker_db.close()
+                done.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        started.wait(timeout=10)
+
+        ticks = 0
+        while not done.is_set():
+            ticks += 1
+            time.sleep(0)
+
+        thread.join(timeout=10)
+
+        assert ticks > 100, f"Main thread only ran {ticks} times during rebuild"
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+class TestFullTextIndexPerformance:
+    """Test the FTS5 full-text index on the large dataset."""
+
+    def test_index_build_and_query(
+        self,
+        large_db: Database,
+    ) -> None:
+        """Building the index is bounded and queries are much faster than a scan."""
+        start = time.perf_counter()
+        count = large_db.rebuild_search_index()
+        build_elapsed = time.perf_counter() - start
+
+        assert count == 1000
+        assert build_elapsed < 5.0, f"Index build took {build_elapsed:.2f}s, should be < 5s"
+
+        start = time.perf_counter()
+        for _ in range(100):
+            results = large_db.full_text_search("note*", limit=20)
+        query_elapsed = (time.perf_counter() - start) / 100
+
+        assert len(results) == 20
+        assert query_elapsed < 0.02, f"Indexed query took {query_elapsed * 1000:.1f}ms, should be < 20ms"
+
+    def test_incremental_update_is_cheap(
+        self,
+        large_db: Database,
+    ) -> None:
+        """A single edit is indexed without rebuilding the whole index."""
+        large_db.full_text_search("warmup")
+        note_id = large_db.get_all_notes()[0]["id"]
+
+        start = time.perf_counter()
+        large_db.update_note(note_id, "Incrementally indexed marmalade")
+        results = large_db.full_text_search("marmalade")
+        elapsed = time.perf_counter() - start
+
+        assert [r["note"]["id"] for r in results] == [note_id]
+        assert elapsed < 0.5, f"Incremental update took {elapsed:.2f}s, should be < 0.5s"
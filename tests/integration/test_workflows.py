@@ -47,11 +47,11 @@ class TestGUIWorkflows:
         # Step 1: Search for "Doctor"
         notes_pane.search_field.setPlainText("Doctor")
         notes_pane.perform_search()
-        assert notes_pane.list_widget.count() == 1
+        assert notes_pane.notes_model.rowCount() == 1
 
         # Step 2: Click on the result
-        item = notes_pane.list_widget.item(0)
-        notes_pane.list_widget.itemClicked.emit(item)
+        item = notes_pane.notes_model.index(0)
+        notes_pane.list_widget.clicked.emit(item)
 
         # Step 3: Verify note details are displayed (UUID hex string)
         assert selected_note_id == get_note_uuid_hex(3)
@@ -72,14 +72,14 @@ class TestGUIWorkflows:
         tags_pane.tag_selected.connect(notes_pane.filter_by_tag)
 
         # Initial state - all notes visible
-        initial_count = notes_pane.list_widget.count()
+        initial_count = notes_pane.notes_model.rowCount()
         assert initial_count == 9
 
         # Step 1: Click on Work tag (UUID hex string)
         tags_pane.tag_selected.emit(get_tag_uuid_hex("Work"))
 
         # Step 2: Verify notes are filtered
-        assert notes_pane.list_widget.count() == 2
+        assert notes_pane.notes_model.rowCount() == 2
         assert "tag:Work" in notes_pane.search_field.toPlainText()
 
     def test_clear_search_shows_all_notes_workflow(
@@ -92,19 +92,19 @@ class TestGUIWorkflows:
         notes_pane = NotesListPane(test_config, populated_db)
 
         # Initial state
-        initial_count = notes_pane.list_widget.count()
+        initial_count = notes_pane.notes_model.rowCount()
         assert initial_count == 9
 
         # Step 1: Search to filter
         notes_pane.search_field.setPlainText("tag:Work")
         notes_pane.perform_search()
-        assert notes_pane.list_widget.count() == 2
+        assert notes_pane.notes_model.rowCount() == 2
 
         # Step 2: Clear search
         notes_pane.clear_search()
 
         # Step 3: All notes visible again
-        assert notes_pane.list_widget.count() == 9
+        assert notes_pane.notes_model.rowCount() == 9
 
     def test_multiple_tag_filters_workflow(
         self,
@@ -119,12 +119,12 @@ class TestGUIWorkflows:
 
         # Step 1: Filter by Personal (UUID hex string)
         tags_pane.tag_selected.emit(get_tag_uuid_hex("Personal"))
-        assert notes_pane.list_widget.count() == 4
+        assert notes_pane.notes_model.rowCount() == 4
 
         # Step 2: Add Geography filter (AND logic) - UUID hex string
         tags_pane.tag_selected.emit(get_tag_uuid_hex("Geography"))
         # Note 4 and 5 have both Personal and Geography
-        assert notes_pane.list_widget.count() == 2
+        assert notes_pane.notes_model.rowCount() == 2
 
 
 @pytest.mark.integration
@@ -522,3 +522,77 @@ class TestSyncClientDeletes:
         notes_b = node_b.db.get_all_notes()
         note_ids_b = [n["id"] for n in notes_b]
         assert note_id not in note_ids_b
+
+
+class TestSyncClientChangeSets:
+    """Tests for the note and tag ids reported by a sync."""
+
+    def test_pull_reports_created_ids(
+        self, sync_node_a: SyncNode, running_server_b: SyncNode
+    ):
+        """Notes and tags pulled from a peer are reported as created."""
+        note_id = create_note_on_node(running_server_b, "Note from B")
+        tag_id = create_tag_on_node(running_server_b, "FromB")
+
+        sync_node_a.config.add_peer(
+            peer_id=running_server_b.device_id_hex,
+            peer_name=running_server_b.name,
+            peer_url=running_server_b.url,
+        )
+
+        set_local_device_id(sync_node_a.device_id)
+        result = SyncClient(str(sync_node_a.config_dir)).sync_with_peer(
+            running_server_b.device_id_hex
+        )
+
+        assert result.success is True
+        assert result.changes_known is True
+        assert note_id in result.created_note_ids
+        assert tag_id in result.created_tag_ids
+        assert result.updated_note_ids == []
+        assert result.deleted_note_ids == []
+
+    def test_repeat_sync_reports_nothing(
+        self, sync_node_a: SyncNode, running_server_b: SyncNode
+    ):
+        """A sync that changes nothing locally reports no ids."""
+        create_note_on_node(running_server_b, "Note from B")
+
+        sync_node_a.config.add_peer(
+            peer_id=running_server_b.device_id_hex,
+            peer_name=running_server_b.name,
+            peer_url=running_server_b.url,
+        )
+        sync_nodes(sync_node_a, running_server_b)
+
+        set_local_device_id(sync_node_a.device_id)
+        result = SyncClient(str(sync_node_a.config_dir)).sync_with_peer(
+            running_server_b.device_id_hex
+        )
+
+        assert result.changes_known is True
+        assert result.created_note_ids == []
+        assert result.updated_note_ids == []
+        assert result.deleted_note_ids == []
+        assert result.created_tag_ids == []
+
+    def test_sync_all_peers_reports_ids(
+        self, sync_node_a: SyncNode, running_server_b: SyncNode
+    ):
+        """sync_all_peers results carry the ids changed by the run."""
+        from voicecore import sync_all_peers
+
+        note_id = create_note_on_node(running_server_b, "Note from B")
+
+        sync_node_a.config.add_peer(
+            peer_id=running_server_b.device_id_hex,
+            peer_name=running_server_b.name,
+            peer_url=running_server_b.url,
+        )
+
+        set_local_device_id(sync_node_a.device_id)
+        results = sync_all_peers(str(sync_node_a.config_dir))
+
+        result = results[running_server_b.device_id_hex]
+        assert result.changes_known is True
+        assert note_id in result.created_note_ids
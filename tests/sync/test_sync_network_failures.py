@@ -10,7 +10,9 @@ Tests network failure scenarios:
 
 from __future__ import annotations
 
+import socket
 import sys
+import threading
 import time
 from pathlib import Path
 from typing import Tuple
@@ -22,7 +24,7 @@ import requests
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 from core.database import set_local_device_id
-from voicecore import SyncClient, SyncResult
+from voicecore import SyncClient, SyncResult, sync_all_peers
 
 from .conftest import (
     SyncNode,
@@ -32,6 +34,7 @@ from .conftest import (
     sync_nodes,
     start_sync_server,
     simulate_network_partition,
+    find_free_port,
     MockNetworkError,
 )
 
@@ -169,6 +172,122 @@ class TestConnectionTimeout:
         assert note["content"] == "Important data"
 
 
+class TestMultiPeerSync:
+    """Tests for syncing with several peers at once."""
+
+    def test_unresponsive_peer_times_out(self, sync_node_a: SyncNode):
+        """A peer that accepts connections but never answers is cut off by peer_timeout."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as silent:
+            silent.bind(("127.0.0.1", 0))
+            silent.listen(8)
+            port = silent.getsockname()[1]
+
+            sync_node_a.config.add_peer(
+                peer_id="00000000000070008000000000000098",
+                peer_name="SilentServer",
+                peer_url=f"http://127.0.0.1:{port}",
+            )
+
+            set_local_device_id(sync_node_a.device_id)
+            start = time.time()
+            results = sync_all_peers(str(sync_node_a.config_dir), peer_timeout=1.0)
+            elapsed = time.time() - start
+
+        result = results["00000000000070008000000000000098"]
+        assert result.success is False
+        assert any("timed out" in e.lower() for e in result.errors)
+        assert elapsed < 10
+
+    def test_offline_peers_do_not_serialise(self, sync_node_a: SyncNode):
+        """Every unreachable peer gets a result with its own timing."""
+        peer_ids = [f"0000000000007000800000000000009{i}" for i in range(3)]
+        for peer_id in peer_ids:
+            sync_node_a.config.add_peer(
+                peer_id=peer_id,
+                peer_name=f"Dead{peer_id[-1]}",
+                peer_url=f"http://127.0.0.1:{find_free_port()}",
+            )
+
+        set_local_device_id(sync_node_a.device_id)
+        results = sync_all_peers(str(sync_node_a.config_dir), max_concurrent=3)
+
+        assert set(results) == set(peer_ids)
+        for result in results.values():
+            assert result.success is False
+            assert result.duration_ms >= 0
+
+    def test_local_writes_survive_concurrent_failures(
+        self, sync_node_a: SyncNode, running_server_b: SyncNode
+    ):
+        """A reachable peer still syncs while another peer is offline."""
+        note_id = create_note_on_node(running_server_b, "Note from B")
+
+        sync_node_a.config.add_peer(
+            peer_id=running_server_b.device_id_hex,
+            peer_name=running_server_b.name,
+            peer_url=running_server_b.url,
+        )
+        sync_node_a.config.add_peer(
+            peer_id="00000000000070008000000000000099",
+            peer_name="DeadServer",
+            peer_url=f"http://127.0.0.1:{find_free_port()}",
+        )
+
+        set_local_device_id(sync_node_a.device_id)
+        results = sync_all_peers(str(sync_node_a.config_dir), peer_timeout=10.0)
+
+        assert results[running_server_b.device_id_hex].success is True
+        assert results["00000000000070008000000000000099"].success is False
+
+        sync_node_a.reload_db()
+        assert sync_node_a.db.get_note(note_id) is not None
+
+    def test_progress_called_per_peer(self, sync_node_a: SyncNode):
+        """The progress callback receives every peer's result as it finishes."""
+        peer_ids = [f"0000000000007000800000000000008{i}" for i in range(2)]
+        for peer_id in peer_ids:
+            sync_node_a.config.add_peer(
+                peer_id=peer_id,
+                peer_name=f"Dead{peer_id[-1]}",
+                peer_url=f"http://127.0.0.1:{find_free_port()}",
+            )
+
+        seen = []
+        set_local_device_id(sync_node_a.device_id)
+        results = sync_all_peers(
+            str(sync_node_a.config_dir),
+            progress=lambda peer_id, result: seen.append((peer_id, result.success)),
+        )
+
+        assert sorted(seen) == sorted((peer_id, False) for peer_id in peer_ids)
+        assert set(results) == set(peer_ids)
+
+    def test_cancel_stops_unresponsive_peer(self, sync_node_a: SyncNode):
+        """Setting the cancel event ends a sync stuck on a silent peer."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as silent:
+            silent.bind(("127.0.0.1", 0))
+            silent.listen(8)
+            port = silent.getsockname()[1]
+
+            sync_node_a.config.add_peer(
+                peer_id="00000000000070008000000000000097",
+                peer_name="SilentServer",
+                peer_url=f"http://127.0.0.1:{port}",
+            )
+
+            cancel = threading.Event()
+            threading.Timer(0.5, cancel.set).start()
+            set_local_device_id(sync_node_a.device_id)
+            start = time.time()
+            results = sync_all_peers(str(sync_node_a.config_dir), cancel=cancel)
+            elapsed = time.time() - start
+
+        result = results["00000000000070008000000000000097"]
+        assert result.success is False
+        assert any("cancelled" in e.lower() for e in result.errors)
+        assert elapsed < 10
+
+
 class TestServerCrashDuringSync:
     """Tests for server crash during sync operation."""
 
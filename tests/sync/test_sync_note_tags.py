@@ -5,7 +5,7 @@ Tests:
 - Deleting note-tag associations and syncing
 - Reactivating deleted associations
 - Tag hierarchy ordering during sync
-- Complex note-tag scenarios
+- Complex note-tag scenarios, including batch tagging
 """
 
 from __future__ import annotations
@@ -407,6 +407,41 @@ class TestComplexNoteTagScenarios:
             assert note_b is not None
             assert "CommonTag" in (note_b.get("tag_names") or "")
 
+    def test_batch_tagged_notes_sync(
+        self, two_nodes_with_servers: Tuple[SyncNode, SyncNode]
+    ):
+        """Tags added and removed in one batch reach the peer."""
+        node_a, node_b = two_nodes_with_servers
+
+        tag_id = create_tag_on_node(node_a, "Batch")
+        note_ids = [create_note_on_node(node_a, f"Batch note {i}") for i in range(5)]
+        set_local_device_id(node_a.device_id)
+        result = node_a.db.add_tags_to_notes(note_ids, [tag_id])
+        assert result["changed"] == 5
+
+        sync_nodes(node_a, node_b)
+        node_b.reload_db()
+
+        for note_id in note_ids:
+            note_b = node_b.db.get_note(note_id)
+            assert note_b is not None
+            assert "Batch" in (note_b.get("tag_names") or "")
+
+        # Wait for timestamp precision
+        time.sleep(1.1)
+
+        set_local_device_id(node_a.device_id)
+        node_a.db.remove_tags_from_notes(note_ids[:2], [tag_id])
+
+        sync_nodes(node_a, node_b)
+        node_b.reload_db()
+
+        tagged = [
+            "Batch" in (node_b.db.get_note(note_id).get("tag_names") or "")
+            for note_id in note_ids
+        ]
+        assert tagged == [False, False, True, True, True]
+
     def test_one_note_many_tags(
         self, two_nodes_with_servers: Tuple[SyncNode, SyncNode]
     ):
@@ -9,7 +9,7 @@ import pytest
 from pathlib import Path
 from textual.widgets import Tree, ListView, Static, TextArea, Button
 
-from src.tui import VoiceTUI, TagsTree, NotesList, NotesListView, NoteDetail, SearchInput
+from src.tui import NOTES_PAGE_SIZE, TUITranscriptionBox, VoiceTUI, TagsTree, NotesList, NotesListView, NoteDetail, SearchInput
 from src.core.config import Config
 from src.core.database import Database
 
@@ -111,6 +111,63 @@ class TestTagsTree:
             # Test passes if no exception
 
 
+class TestTagsTreeLazyLoading:
+    """Test that tag child nodes are added on first expand."""
+
+    @staticmethod
+    def _child(node, name: str):
+        """Return the child node with the given label, or None."""
+        return next((child for child in node.children if str(child.label) == name), None)
+
+    async def test_children_added_on_expand(self, populated_db: Database, test_config: Config) -> None:
+        """A collapsed tag has no child nodes until it is expanded."""
+        app = VoiceTUI(populated_db, test_config)
+        async with app.run_test() as pilot:
+            tree = app.query_one("#tags-tree", TagsTree)
+            geography = self._child(tree.root, "Geography")
+
+            assert geography.allow_expand
+            assert len(geography.children) == 0
+
+            geography.expand()
+            await pilot.pause()
+
+            assert self._child(geography, "Europe") is not None
+
+    async def test_right_arrow_moves_into_new_children(self, populated_db: Database, test_config: Config) -> None:
+        """Right arrow adds the children before moving the cursor to the first one."""
+        app = VoiceTUI(populated_db, test_config)
+        async with app.run_test() as pilot:
+            tree = app.query_one("#tags-tree", TagsTree)
+            tree.focus()
+            work = self._child(tree.root, "Work")
+            tree.select_node(work)
+            await pilot.press("right")
+
+            assert tree.cursor_node.parent is work
+
+    async def test_reload_keeps_expansion(self, populated_db: Database, test_config: Config) -> None:
+        """reload_tags expands the same tags again, including nested ones."""
+        app = VoiceTUI(populated_db, test_config)
+        async with app.run_test() as pilot:
+            tree = app.query_one("#tags-tree", TagsTree)
+            geography = self._child(tree.root, "Geography")
+            geography.expand()
+            await pilot.pause()
+            self._child(geography, "Europe").expand()
+            await pilot.pause()
+
+            tree.reload_tags()
+            await pilot.pause()
+
+            geography = self._child(tree.root, "Geography")
+            europe = self._child(geography, "Europe")
+            assert geography.is_expanded
+            assert europe.is_expanded
+            assert self._child(europe, "France") is not None
+            assert not self._child(tree.root, "Work").is_expanded
+
+
 class TestNotesList:
     """Test notes list widget."""
 
@@ -146,6 +203,43 @@ class TestNotesList:
             search_text = notes_list.get_search_text()
             assert search_text.startswith("tag:"), f"Expected 'tag:' prefix, got: {search_text}"
 
+    async def test_rows_use_list_display_cache(self, populated_db: Database, test_config: Config) -> None:
+        """Marked state comes from the list display cache, not per-note queries."""
+        marked_id = populated_db.get_all_notes()[0]["id"]
+        populated_db.mark_note(marked_id)
+        populated_db.rebuild_all_note_list_caches()
+        calls = []
+        original = populated_db.is_note_marked
+        populated_db.is_note_marked = lambda note_id: calls.append(note_id) or original(note_id)  # type: ignore[method-assign]
+
+        app = VoiceTUI(populated_db, test_config)
+        async with app.run_test() as pilot:
+            notes_list = app.query_one("#notes-list", NotesList)
+            marked = [n["id"] for n in notes_list.notes if n["is_marked"]]
+
+        assert marked == [marked_id]
+        assert calls == []
+
+    async def test_rows_loaded_in_pages(self, populated_db: Database, test_config: Config) -> None:
+        """Only the first page of rows is created until the list is scrolled."""
+        for i in range(NOTES_PAGE_SIZE + 5):
+            populated_db.create_note(f"Paged note {i}")
+        total = len(populated_db.get_all_notes())
+
+        app = VoiceTUI(populated_db, test_config)
+        async with app.run_test() as pilot:
+            notes_list = app.query_one("#notes-list", NotesList)
+            listview = app.query_one("#notes-listview", NotesListView)
+            assert len(notes_list.notes) == NOTES_PAGE_SIZE
+            assert notes_list.has_more()
+
+            listview.focus()
+            listview.index = NOTES_PAGE_SIZE - 1
+            await pilot.pause()
+
+            assert len(notes_list.notes) == total
+            assert len({n["id"] for n in notes_list.notes}) == total
+
 
 class TestNoteDetail:
     """Test note detail widget."""
@@ -216,6 +310,33 @@ class TestNoteDetail:
             # Now should be visible
             assert edit_area.display
 
+    async def test_load_note_uses_display_cache(self, populated_db: Database, test_config: Config) -> None:
+        """Opening a note reads attachments from the cache; full text loads on expand."""
+        note_id = populated_db.get_all_notes()[0]["id"]
+        audio_id = populated_db.create_audio_file("dictation.mp3")
+        populated_db.attach_to_note(note_id, audio_id, "audio_file")
+        full_text = "word " * 100
+        transcription_id = populated_db.create_transcription(audio_id, full_text, "whisper")
+        populated_db.rebuild_note_cache(note_id)
+
+        calls = []
+        original = populated_db.get_transcription_content
+        populated_db.get_audio_files_for_note = lambda nid: calls.append("audio") or []  # type: ignore[method-assign]
+        populated_db.get_transcription_content = lambda tid: calls.append(tid) or original(tid)  # type: ignore[method-assign]
+
+        app = VoiceTUI(populated_db, test_config)
+        async with app.run_test() as pilot:
+            detail = app.query_one("#note-detail", NoteDetail)
+            detail.load_note(note_id)
+            await pilot.pause()
+
+            box = detail.query_one(TUITranscriptionBox)
+            assert calls == []
+
+            box._load_full_content()
+            assert calls == [transcription_id]
+            assert box._transcription["content"] == full_text
+
 
 class TestKeyboardNavigation:
     """Test keyboard navigation and shortcuts."""
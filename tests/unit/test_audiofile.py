@@ -172,6 +172,59 @@ class TestGetAudioFilesForNote:
         assert audio_files[0]["filename"] == "keep.mp3"
 
 
+class TestGetAttachmentsWithAudioFiles:
+    """Test get_attachments_with_audio_files method."""
+
+    def test_returns_attachments_with_audio_files(self, empty_db: Database) -> None:
+        """Each audio attachment carries its audio file row."""
+        note_id = empty_db.create_note("Test note")
+        audio1_id = empty_db.create_audio_file("recording1.mp3")
+        audio2_id = empty_db.create_audio_file("recording2.wav")
+        empty_db.attach_to_note(note_id, audio1_id, "audio_file")
+        empty_db.attach_to_note(note_id, audio2_id, "audio_file")
+
+        attachments = empty_db.get_attachments_with_audio_files(note_id)
+
+        assert len(attachments) == 2
+        by_audio = {a["attachment_id"]: a for a in attachments}
+        assert by_audio[audio1_id]["audio_file"]["filename"] == "recording1.mp3"
+        assert by_audio[audio2_id]["audio_file"]["filename"] == "recording2.wav"
+        assert "transcriptions" not in by_audio[audio1_id]["audio_file"]
+
+    def test_includes_transcriptions_when_requested(self, empty_db: Database) -> None:
+        """Transcriptions are nested under each audio file on request."""
+        note_id = empty_db.create_note("Test note")
+        audio_id = empty_db.create_audio_file("recording.mp3")
+        empty_db.attach_to_note(note_id, audio_id, "audio_file")
+        empty_db.create_transcription(audio_id, "Hello world", "whisper")
+
+        attachments = empty_db.get_attachments_with_audio_files(
+            note_id, include_transcriptions=True
+        )
+
+        transcriptions = attachments[0]["audio_file"]["transcriptions"]
+        assert len(transcriptions) == 1
+        assert transcriptions[0]["content"] == "Hello world"
+
+    def test_excludes_detached_attachments(self, empty_db: Database) -> None:
+        """Detached audio files are not returned."""
+        note_id = empty_db.create_note("Test note")
+        audio1_id = empty_db.create_audio_file("keep.mp3")
+        audio2_id = empty_db.create_audio_file("remove.mp3")
+        empty_db.attach_to_note(note_id, audio1_id, "audio_file")
+        assoc2_id = empty_db.attach_to_note(note_id, audio2_id, "audio_file")
+        empty_db.detach_from_note(assoc2_id)
+
+        attachments = empty_db.get_attachments_with_audio_files(note_id)
+
+        assert [a["audio_file"]["filename"] for a in attachments] == ["keep.mp3"]
+
+    def test_returns_none_for_missing_note(self, empty_db: Database) -> None:
+        """A nonexistent note gives None rather than an empty list."""
+        missing = "00000000000070008000000000000000"
+        assert empty_db.get_attachments_with_audio_files(missing) is None
+
+
 class TestUpdateAudioFileSummary:
     """Test update_audio_file_summary method."""
 
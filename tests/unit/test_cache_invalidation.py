@@ -0,0 +1,195 @@
+"""Unit tests for dirty-set driven cache invalidation.
+
+Tests CacheInvalidator including:
+- Tag renames, moves and deletes marking the notes below the tag dirty
+  (only once an invalidator exists)
+- Draining the dirty set in batches, requested notes first
+- Listeners being told which notes were rebuilt
+- The background worker
+- Full rebuilds picking up dirty notes
+"""
+
+from __future__ import annotations
+
+import time
+from typing import List
+
+import pytest
+
+from core.cache_invalidation import CacheInvalidator, get_cache_invalidator, has_cache_invalidator
+from core.cache_rebuild import get_cache_fingerprints, rebuild_caches
+from core.database import Database
+from core.models import ChangeSet
+from tests.helpers import get_note_uuid_hex, get_tag_uuid_hex
+
+
+def _dirty_notes(db: Database) -> List[str]:
+    """IDs of the notes in the dirty set, sorted."""
+    return sorted(get_cache_fingerprints(db).dirty())
+
+
+@pytest.mark.unit
+class TestMarkingOnTagWrites:
+    """Test tag writes marking the caches of affected notes dirty."""
+
+    @pytest.fixture(autouse=True)
+    def _invalidator(self, populated_db: Database) -> None:
+        """Tag writes only mark notes once the database has an invalidator."""
+        get_cache_invalidator(populated_db)
+
+    def test_rename_marks_notes_below_tag(self, populated_db: Database) -> None:
+        """Renaming a tag marks notes carrying it or a descendant."""
+        populated_db.rename_tag(get_tag_uuid_hex("Europe"), "EU")
+
+        # Only note 4 carries a tag under Europe (France, Paris)
+        assert _dirty_notes(populated_db) == [get_note_uuid_hex(4)]
+
+    def test_rename_of_root_marks_whole_subtree(self, populated_db: Database) -> None:
+        """Renaming a root tag marks the notes of all its descendants."""
+        populated_db.rename_tag(get_tag_uuid_hex("Geography"), "Places")
+
+        assert _dirty_notes(populated_db) == sorted(
+            get_note_uuid_hex(n) for n in (4, 5, 9)
+        )
+
+    def test_reparent_marks_notes(self, populated_db: Database) -> None:
+        """Moving a tag marks its notes (their tag paths changed)."""
+        populated_db.reparent_tag(get_tag_uuid_hex("Meetings"), get_tag_uuid_hex("Personal"))
+
+        assert _dirty_notes(populated_db) == [get_note_uuid_hex(1)]
+
+    def test_delete_marks_notes(self, populated_db: Database) -> None:
+        """Deleting a tag marks the notes that carried it."""
+        populated_db.delete_tag(get_tag_uuid_hex("Health"))
+
+        assert _dirty_notes(populated_db) == [get_note_uuid_hex(3)]
+
+    def test_unrelated_writes_mark_nothing(self, populated_db: Database) -> None:
+        """Creating tags and tagging notes leaves the dirty set alone."""
+        tag_id = populated_db.create_tag("Archive")
+        populated_db.add_tag_to_note(get_note_uuid_hex(6), tag_id)
+
+        assert _dirty_notes(populated_db) == []
+
+    def test_incomplete_change_set_marks_all(self, populated_db: Database) -> None:
+        """A change set of unknown extent marks every note."""
+        get_cache_invalidator(populated_db).mark_changes(ChangeSet(complete=False))
+
+        assert len(_dirty_notes(populated_db)) == 9
+
+
+@pytest.mark.unit
+class TestWithoutInvalidator:
+    """Test tag writes on databases without a cache invalidator (CLI, web)."""
+
+    def test_tag_writes_mark_nothing(self, populated_db: Database) -> None:
+        """Renames, moves and deletes leave the dirty set alone."""
+        populated_db.rename_tag(get_tag_uuid_hex("Geography"), "Places")
+        populated_db.reparent_tag(get_tag_uuid_hex("Meetings"), get_tag_uuid_hex("Personal"))
+        populated_db.delete_tag(get_tag_uuid_hex("Health"))
+
+        assert not has_cache_invalidator(populated_db)
+        assert _dirty_notes(populated_db) == []
+
+
+@pytest.mark.unit
+class TestDraining:
+    """Test rebuilding the dirty set."""
+
+    def test_drain_rebuilds_and_clears(self, populated_db: Database) -> None:
+        """Draining rebuilds dirty notes and empties the set."""
+        invalidator = get_cache_invalidator(populated_db)
+        populated_db.rename_tag(get_tag_uuid_hex("Europe"), "EU")
+
+        assert invalidator.drain() == 1
+        assert invalidator.pending() == 0
+        assert not invalidator.is_dirty(get_note_uuid_hex(4))
+
+    def test_listeners_get_rebuilt_ids(self, populated_db: Database) -> None:
+        """Listeners are called with each rebuilt batch."""
+        invalidator = get_cache_invalidator(populated_db)
+        batches: List[List[str]] = []
+        invalidator.add_listener(batches.append)
+
+        populated_db.rename_tag(get_tag_uuid_hex("Health"), "Wellbeing")
+        invalidator.drain()
+        invalidator.remove_listener(batches.append)
+
+        assert batches == [[get_note_uuid_hex(3)]]
+
+    def test_requested_note_first(self, populated_db: Database) -> None:
+        """A requested note is rebuilt in the first batch."""
+        invalidator = CacheInvalidator(
+            populated_db, get_cache_fingerprints(populated_db), batch_size=1
+        )
+        invalidator.mark_notes([get_note_uuid_hex(n) for n in (1, 2, 3)])
+        batches: List[List[str]] = []
+        invalidator.add_listener(batches.append)
+
+        invalidator.request(get_note_uuid_hex(3))
+        invalidator.drain()
+
+        assert batches[0] == [get_note_uuid_hex(3)]
+        assert len(batches) == 3
+
+    def test_requested_clean_note_is_rebuilt(self, populated_db: Database) -> None:
+        """A requested note is rebuilt even if it was not marked."""
+        invalidator = get_cache_invalidator(populated_db)
+
+        invalidator.request(get_note_uuid_hex(6))
+
+        assert invalidator.drain() == 1
+
+    def test_mark_after_read_survives_clear(self, populated_db: Database) -> None:
+        """A mark made after the worker read the set is not cleared."""
+        store = get_cache_fingerprints(populated_db)
+        store.mark_dirty([get_note_uuid_hex(1)])
+        marks = store.dirty()
+
+        store.mark_dirty([get_note_uuid_hex(1)])
+        store.clear_dirty(marks)
+
+        assert store.is_dirty(get_note_uuid_hex(1))
+
+    def test_full_rebuild_clears_dirty_notes(self, populated_db: Database) -> None:
+        """rebuild_caches() treats dirty notes as stale and clears them."""
+        get_cache_invalidator(populated_db)
+        rebuild_caches(populated_db, workers=1)
+        populated_db.rename_tag(get_tag_uuid_hex("Europe"), "EU")
+
+        summary = rebuild_caches(populated_db, workers=1)
+
+        assert summary.notes_rebuilt == 1
+        assert _dirty_notes(populated_db) == []
+
+
+@pytest.mark.unit
+class TestWorker:
+    """Test the background worker."""
+
+    def test_worker_drains_marks(self, populated_db: Database) -> None:
+        """The worker rebuilds notes marked while it runs."""
+        invalidator = get_cache_invalidator(populated_db)
+        invalidator.start()
+        try:
+            populated_db.rename_tag(get_tag_uuid_hex("Geography"), "Places")
+
+            deadline = time.monotonic() + 10
+            while invalidator.pending() and time.monotonic() < deadline:
+                time.sleep(0.05)
+        finally:
+            invalidator.stop()
+
+        assert invalidator.pending() == 0
+        assert not invalidator.is_running()
+
+    def test_start_is_idempotent(self, populated_db: Database) -> None:
+        """Starting a running worker does not start another."""
+        invalidator = get_cache_invalidator(populated_db)
+        invalidator.start()
+        thread = invalidator._thread
+        try:
+            invalidator.start()
+            assert invalidator._thread is thread
+        finally:
+            invalidator.stop()
@@ -346,6 +346,104 @@ class TestGetTagRenameConflicts:
         assert conflicts[0].remote_name == "remote_tag_name"
 
 
+class TestNoteConflictLookup:
+    """Test per-note and bulk conflict type lookups."""
+
+    def _add_content_conflict(self, db: Database, note_id: str) -> str:
+        from datetime import datetime, timezone
+
+        now = datetime.now(timezone.utc).isoformat()
+        return db.create_note_content_conflict(
+            note_id=note_id,
+            local_content="Local version",
+            local_modified_at=now,
+            remote_content="Remote version",
+            remote_modified_at=now,
+            remote_device_id="00000000000070008000000000000002",
+        )
+
+    def test_no_conflicts(
+        self, conflict_manager: ConflictManager, sample_note: str
+    ) -> None:
+        """A note without conflicts has no conflict types."""
+        assert conflict_manager.get_note_conflict_types(sample_note) == []
+        assert not conflict_manager.note_has_conflicts(sample_note)
+
+    def test_content_and_delete_conflicts(
+        self,
+        conflict_manager: ConflictManager,
+        conflict_db: Database,
+        sample_note: str,
+    ) -> None:
+        """Both conflict kinds are reported, in a stable order."""
+        from datetime import datetime, timezone
+
+        now = datetime.now(timezone.utc).isoformat()
+        self._add_content_conflict(conflict_db, sample_note)
+        conflict_db.create_note_delete_conflict(
+            note_id=sample_note,
+            surviving_content="Surviving content",
+            surviving_modified_at=now,
+            surviving_device_id="00000000000070008000000000000001",
+            deleted_at=now,
+            deleting_device_id="00000000000070008000000000000002",
+        )
+
+        assert conflict_manager.get_note_conflict_types(sample_note) == ["content", "delete"]
+        assert conflict_manager.note_has_conflicts(sample_note)
+
+    def test_prefix_and_case_insensitive(
+        self,
+        conflict_manager: ConflictManager,
+        conflict_db: Database,
+        sample_note: str,
+    ) -> None:
+        """Partial and upper-case note IDs match."""
+        self._add_content_conflict(conflict_db, sample_note)
+
+        assert conflict_manager.get_note_conflict_types(sample_note[:12].upper()) == ["content"]
+        assert conflict_manager.get_note_conflict_types(sample_note[:11]) == ["content"]
+
+    def test_non_hex_prefix_matches_nothing(
+        self,
+        conflict_manager: ConflictManager,
+        conflict_db: Database,
+        sample_note: str,
+    ) -> None:
+        """A prefix that is not hex matches no note."""
+        self._add_content_conflict(conflict_db, sample_note)
+
+        assert conflict_manager.get_note_conflict_types("not-hex") == []
+
+    def test_resolving_clears_lookup(
+        self,
+        conflict_manager: ConflictManager,
+        conflict_db: Database,
+        sample_note: str,
+    ) -> None:
+        """A resolved conflict disappears from the lookup."""
+        conflict_id = self._add_content_conflict(conflict_db, sample_note)
+        assert conflict_manager.note_has_conflicts(sample_note)
+
+        conflict_db.resolve_note_content_conflict(conflict_id, "Local version")
+
+        assert not conflict_manager.note_has_conflicts(sample_note)
+
+    def test_bulk_lookup(
+        self,
+        conflict_manager: ConflictManager,
+        conflict_db: Database,
+        sample_note: str,
+    ) -> None:
+        """Bulk lookup returns an entry for every requested note."""
+        other_note = conflict_db.create_note("No conflicts here")
+        self._add_content_conflict(conflict_db, sample_note)
+
+        result = conflict_manager.get_conflict_types_for_notes([sample_note, other_note])
+
+        assert result == {sample_note: ["content"], other_note: []}
+
+
 class TestResolveNoteContentConflict:
     """Test resolving note content conflicts."""
 
@@ -9,6 +9,8 @@ Tests all methods in src/core/database.py including:
 
 from __future__ import annotations
 
+import json
+import time
 from datetime import datetime
 
 import pytest
@@ -362,6 +364,120 @@ class TestFilterNotes:
         assert len(notes) == 9  # All notes
 
 
+class TestGetTagNoteCounts:
+    """Test get_tag_note_counts method."""
+
+    def test_direct_counts_match_filter_notes(self, populated_db: Database) -> None:
+        """Each count equals the number of notes filter_notes returns."""
+        counts = populated_db.get_tag_note_counts()
+
+        for tag in populated_db.get_all_tags():
+            expected = len(populated_db.filter_notes([tag["id"]]))
+            assert counts.get(tag["id"], 0) == expected, tag["name"]
+
+    def test_descendant_rollups(self, populated_db: Database) -> None:
+        """Rollups count distinct notes across the tag's subtree."""
+        counts = populated_db.get_tag_note_counts(include_descendants=True)
+
+        for tag in populated_db.get_all_tags():
+            descendant_ids = populated_db.get_tag_descendants(tag["id"])
+            expected = len(populated_db.filter_notes(descendant_ids))
+            assert counts[tag["id"]] == expected, tag["name"]
+
+    def test_rollup_at_least_direct(self, populated_db: Database) -> None:
+        """A parent's rollup is never smaller than its direct count."""
+        work_hex = get_tag_uuid_hex("Work")
+        direct = populated_db.get_tag_note_counts()
+        rollup = populated_db.get_tag_note_counts(include_descendants=True)
+
+        assert rollup[work_hex] >= direct[work_hex] >= 2
+
+    def test_deleted_notes_and_tags_not_counted(self, populated_db: Database) -> None:
+        """Deleted notes drop out of the counts and deleted tags are left out."""
+        health_hex = get_tag_uuid_hex("Health")
+        before = populated_db.get_tag_note_counts()[health_hex]
+
+        populated_db.delete_note(get_note_uuid_hex(3))
+        assert populated_db.get_tag_note_counts()[health_hex] == before - 1
+
+        populated_db.delete_tag(health_hex)
+        assert health_hex not in populated_db.get_tag_note_counts()
+
+
+class TestBatchTagChanges:
+    """Test add_tags_to_notes and remove_tags_from_notes methods."""
+
+    def test_add_tags_to_notes(self, populated_db: Database) -> None:
+        """Every tag is added to every note."""
+        note_ids = [get_note_uuid_hex(3), get_note_uuid_hex(6)]
+        tag_ids = [get_tag_uuid_hex("Work"), get_tag_uuid_hex("Voice")]
+
+        result = populated_db.add_tags_to_notes(note_ids, tag_ids)
+
+        assert result["changed"] == 4
+        assert result["note_ids"] == note_ids
+        for note_id in note_ids:
+            note_tag_ids = {t["id"] for t in populated_db.get_note_tags(note_id)}
+            assert set(tag_ids) <= note_tag_ids
+
+    def test_existing_pairs_skipped(self, populated_db: Database) -> None:
+        """Pairs already tagged are not counted or reported."""
+        work = get_tag_uuid_hex("Work")
+
+        result = populated_db.add_tags_to_notes(
+            [get_note_uuid_hex(1), get_note_uuid_hex(3)], [work]
+        )
+
+        assert result["changed"] == 1
+        assert result["note_ids"] == [get_note_uuid_hex(3)]
+
+    def test_accepts_bytes(self, populated_db: Database) -> None:
+        """Note and tag IDs may be given as bytes."""
+        result = populated_db.add_tags_to_notes([NOTE_UUIDS[3]], [TAG_UUIDS["Work"]])
+
+        assert result["note_ids"] == [get_note_uuid_hex(3)]
+
+    def test_remove_tags_from_notes(self, populated_db: Database) -> None:
+        """Tags are removed; notes without them are left alone."""
+        projects = get_tag_uuid_hex("Projects")
+
+        result = populated_db.remove_tags_from_notes(
+            [get_note_uuid_hex(1), get_note_uuid_hex(2), get_note_uuid_hex(3)], [projects]
+        )
+
+        assert result["changed"] == 2
+        assert result["note_ids"] == [get_note_uuid_hex(1), get_note_uuid_hex(2)]
+        assert populated_db.filter_notes([projects]) == []
+
+    def test_batch_rebuilds_display_cache(self, populated_db: Database) -> None:
+        """Changed notes get their display cache rebuilt."""
+        note_id = get_note_uuid_hex(6)
+        populated_db.add_tags_to_notes([note_id], [get_tag_uuid_hex("Health")])
+
+        cache = json.loads(populated_db.get_note(note_id)["display_cache"])
+        assert len(cache["tags"]) == 2  # Personal + Health
+
+    def test_readd_removed_tag(self, populated_db: Database) -> None:
+        """A tag removed in one batch can be added back in another."""
+        note_id = get_note_uuid_hex(1)
+        projects = get_tag_uuid_hex("Projects")
+        populated_db.remove_tags_from_notes([note_id], [projects])
+
+        result = populated_db.add_tags_to_notes([note_id], [projects])
+
+        assert result["changed"] == 1
+        assert projects in {t["id"] for t in populated_db.get_note_tags(note_id)}
+
+    def test_batch_reaches_change_log(self, populated_db: Database) -> None:
+        """Pairs written by a batch are reported as changes for sync."""
+        since = int(time.time()) - 1
+
+        populated_db.add_tags_to_notes([get_note_uuid_hex(6)], [get_tag_uuid_hex("Work")])
+
+        changes = populated_db.get_changes_since(since)["changes"]
+        assert any(c["entity_type"] == "note_tag" for c in changes)
+
+
 class TestAmbiguousTagHandling:
     """Test handling of ambiguous tag names (same name, different hierarchy)."""
 
@@ -734,3 +850,215 @@ class TestMergeNotes:
         assert note_after["modified_at"] is not None
         if initial_modified:
             assert note_after["modified_at"] > initial_modified
+
+
+class TestReadPool:
+    """Test the pooled, thread-safe database handle."""
+
+    def test_pool_size_for_file_database(self, test_db_path) -> None:
+        """File-backed databases open the requested read connections."""
+        db = Database(test_db_path, pool_size=2)
+        try:
+            assert db.pool_size == 2
+        finally:
+            db.close()
+
+    def test_file_database_uses_wal(self, test_db_path) -> None:
+        """File databases with a read pool are switched to WAL journaling."""
+        import sqlite3
+
+        db = Database(test_db_path, pool_size=2)
+        try:
+            conn = sqlite3.connect(test_db_path)
+            try:
+                assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            finally:
+                conn.close()
+        finally:
+            db.close()
+
+    def test_file_database_without_pool_keeps_journal_mode(self, test_db_path) -> None:
+        """Without a read pool the journal mode of the file is left alone."""
+        import sqlite3
+
+        db = Database(test_db_path)
+        try:
+            conn = sqlite3.connect(test_db_path)
+            try:
+                assert conn.execute("PRAGMA journal_mode").fetchone()[0] != "wal"
+            finally:
+                conn.close()
+        finally:
+            db.close()
+
+    def test_change_version_persists_and_is_shared(self, test_db_path) -> None:
+        """The change counter survives a reopen and moves on other handles' writes."""
+        db = Database(test_db_path)
+        try:
+            version = db.change_version
+            db.create_note("Counted write")
+            assert db.change_version > version
+            version = db.change_version
+        finally:
+            db.close()
+
+        first = Database(test_db_path)
+        second = Database(test_db_path)
+        try:
+            assert first.change_version >= version
+            version = first.change_version
+            assert first.change_version == version
+            second.create_note("Written elsewhere")
+            assert first.change_version > version
+            assert first.get_data_version() == str(first.change_version)
+        finally:
+            second.close()
+            first.close()
+
+    def test_in_memory_database_has_no_pool(self) -> None:
+        """In-memory databases cannot share a pool and use one connection."""
+        db = Database(":memory:", pool_size=2)
+        try:
+            assert db.pool_size == 0
+        finally:
+            db.close()
+
+    def test_readers_see_committed_writes(self, test_db_path) -> None:
+        """Notes written on the writer are visible through pooled readers."""
+        db = Database(test_db_path, pool_size=2)
+        try:
+            note_id = db.create_note("Written before read")
+            for _ in range(4):
+                notes = db.get_all_notes()
+                assert note_id in [n["id"] for n in notes]
+        finally:
+            db.close()
+
+    def test_concurrent_reads_from_threads(self, populated_db: Database, test_db_path) -> None:
+        """One handle can be shared by several reader threads."""
+        import threading
+
+        db = Database(test_db_path, pool_size=3)
+        expected = len(db.get_all_notes())
+        results: list[int] = []
+        errors: list[Exception] = []
+
+        def reader() -> None:
+            try:
+                for _ in range(10):
+                    results.append(len(db.get_all_notes()))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+        db.close()
+
+        assert errors == []
+        assert results == [expected] * 40
+
+
+class TestFullTextSearch:
+    """Test the FTS5-backed full_text_search and its index maintenance."""
+
+    def test_ranked_word_search(self, empty_db: Database) -> None:
+        """Notes mentioning a word more often rank first."""
+        once = empty_db.create_note("A garden with one tomato plant")
+        twice = empty_db.create_note("Tomato soup needs a ripe tomato")
+        empty_db.create_note("Nothing relevant here")
+
+        results = empty_db.full_text_search("tomato")
+
+        assert [r["note"]["id"] for r in results] == [twice, once]
+        assert results[0]["score"] >= results[1]["score"]
+
+    def test_prefix_and_phrase_queries(self, empty_db: Database) -> None:
+        """Trailing * matches prefixes, quotes match exact phrases."""
+        phrase = empty_db.create_note("The quick brown fox")
+        scrambled = empty_db.create_note("brown and quick, the fox")
+
+        prefix_ids = {r["note"]["id"] for r in empty_db.full_text_search("qui*")}
+        phrase_ids = {r["note"]["id"] for r in empty_db.full_text_search('"quick brown"')}
+
+        assert prefix_ids == {phrase, scrambled}
+        assert phrase_ids == {phrase}
+
+    def test_snippet_highlights_match(self, empty_db: Database) -> None:
+        """Snippets wrap matched terms in the requested markers."""
+        empty_db.create_note("Remember to call the plumber tomorrow")
+
+        results = empty_db.full_text_search("plumber", highlight=("<mark>", "</mark>"))
+
+        assert "<mark>plumber</mark>" in results[0]["snippet"]
+
+    def test_operators_in_query_are_harmless(self, empty_db: Database) -> None:
+        """FTS5 syntax characters in user input do not raise."""
+        empty_db.create_note("Some note")
+
+        assert empty_db.full_text_search('NEAR( "unterminated AND -') == []
+        assert empty_db.full_text_search("   ") == []
+
+    def test_index_follows_updates_and_deletes(self, empty_db: Database) -> None:
+        """Edits and deletions are reflected without a manual rebuild."""
+        note_id = empty_db.create_note("Original wording")
+        assert empty_db.full_text_search("original")
+
+        empty_db.update_note(note_id, "Revised wording")
+        assert empty_db.full_text_search("original") == []
+        assert [r["note"]["id"] for r in empty_db.full_text_search("revised")] == [note_id]
+
+        empty_db.delete_note(note_id)
+        assert empty_db.full_text_search("revised") == []
+
+    def test_transcriptions_are_indexed(self, empty_db: Database) -> None:
+        """Transcription text is searchable and can be excluded."""
+        note_id = empty_db.create_note("Voice memo")
+        empty_db.full_text_search("memo")  # build the index first
+        audio_id = empty_db.create_audio_file("memo.mp3")
+        empty_db.attach_to_note(note_id, audio_id, "audio_file")
+        transcription_id = empty_db.create_transcription(
+            audio_id, "Pick up the dry cleaning", "whisper"
+        )
+
+        results = empty_db.full_text_search("cleaning")
+        assert [r["note"]["id"] for r in results] == [note_id]
+        assert empty_db.full_text_search("cleaning", include_transcriptions=False) == []
+
+        empty_db.update_transcription(transcription_id, "Pick up the groceries")
+        assert empty_db.full_text_search("cleaning") == []
+        assert empty_db.full_text_search("groceries")
+
+    def test_sync_applied_note_is_indexed(self, empty_db: Database) -> None:
+        """Notes applied from a peer are indexed despite old timestamps."""
+        empty_db.full_text_search("anything")  # build the index first
+        note_id = "00000000000070008000000000009999"
+
+        empty_db.apply_sync_note(note_id, 1_000_000_000, "Arrived from a peer", 1_000_000_000)
+
+        assert [r["note"]["id"] for r in empty_db.full_text_search("peer")] == [note_id]
+
+    def test_index_persists_next_to_database(self, test_db_path) -> None:
+        """A file database keeps its index in a sidecar file."""
+        db = Database(test_db_path)
+        try:
+            db.create_note("Persistent index entry")
+            assert db.full_text_search("persistent")
+        finally:
+            db.close()
+
+        assert test_db_path.with_name(test_db_path.name + ".search").exists()
+
+        db = Database(test_db_path)
+        try:
+            assert db.full_text_search("persistent")
+        finally:
+            db.close()
+
+    def test_rebuild_search_index(self, populated_db: Database) -> None:
+        """A rebuild indexes every live note."""
+        count = populated_db.rebuild_search_index()
+
+        assert count == len(populated_db.get_all_notes())
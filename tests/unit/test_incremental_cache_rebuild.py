@@ -0,0 +1,214 @@
+"""Unit tests for incremental note cache rebuilds.
+
+Tests rebuild_caches including:
+- Skipping notes whose cache inputs are unchanged
+- Rebuilding notes after content and tag path changes
+- Forced rebuilds
+- Cancelling and resuming
+- Fingerprints persisted next to file databases
+- Parallel workers contending with other writers
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from core.cache_rebuild import CacheFingerprints, get_cache_fingerprints, rebuild_caches
+from core.database import Database
+from tests.helpers import get_note_uuid_hex, get_tag_uuid_hex
+
+
+def _memory_db(note_count: int = 5) -> Database:
+    """An in-memory database with a few tagged notes."""
+    db = Database(":memory:")
+    tag_id = db.create_tag("Work")
+    for i in range(note_count):
+        note_id = db.create_note(f"note {i}")
+        db.add_tag_to_note(note_id, tag_id)
+    return db
+
+
+@pytest.mark.unit
+class TestIncrementalRebuild:
+    """Test skipping and rebuilding notes by fingerprint."""
+
+    def test_first_run_rebuilds_all(self) -> None:
+        """Without recorded fingerprints every note is rebuilt."""
+        db = _memory_db()
+
+        summary = rebuild_caches(db, workers=1)
+
+        assert summary.notes_total == 5
+        assert summary.notes_rebuilt == 5
+        assert summary.notes_skipped == 0
+        assert summary.errors == []
+
+    def test_second_run_skips_all(self) -> None:
+        """Unchanged notes are skipped on the next run."""
+        db = _memory_db()
+        rebuild_caches(db, workers=1)
+
+        summary = rebuild_caches(db, workers=1)
+
+        assert summary.notes_rebuilt == 0
+        assert summary.notes_skipped == 5
+
+    def test_edited_note_is_rebuilt(self) -> None:
+        """Only the note whose content changed is rebuilt."""
+        db = _memory_db()
+        rebuild_caches(db, workers=1)
+        note_id = db.get_all_notes()[0]["id"]
+
+        db.update_note(note_id, "edited")
+        summary = rebuild_caches(db, workers=1)
+
+        assert summary.notes_rebuilt == 1
+        assert summary.notes_skipped == 4
+
+    def test_ancestor_rename_marks_notes_stale(self, populated_db: Database) -> None:
+        """Renaming a tag makes notes tagged below it stale (their paths changed)."""
+        rebuild_caches(populated_db, workers=1)
+
+        populated_db.rename_tag(get_tag_uuid_hex("Europe"), "EU")
+        summary = rebuild_caches(populated_db, workers=1)
+
+        # Only note 4 carries a tag under Europe (Geography/Europe/France/Paris)
+        assert summary.notes_rebuilt == 1
+
+    def test_force_rebuilds_all(self) -> None:
+        """force=True ignores recorded fingerprints."""
+        db = _memory_db()
+        rebuild_caches(db, workers=1)
+
+        summary = rebuild_caches(db, force=True, workers=1)
+
+        assert summary.notes_rebuilt == 5
+
+    def test_discarded_fingerprint_is_rebuilt(self) -> None:
+        """A note whose fingerprint was discarded counts as stale."""
+        db = _memory_db()
+        rebuild_caches(db, workers=1)
+        note_id = db.get_all_notes()[0]["id"]
+
+        get_cache_fingerprints(db).discard([note_id])
+        summary = rebuild_caches(db, workers=1)
+
+        assert summary.notes_rebuilt == 1
+
+
+@pytest.mark.unit
+class TestRebuildBatches:
+    """Test batching, progress, cancelling and resuming."""
+
+    def test_progress_per_batch(self) -> None:
+        """Progress is reported before the first batch and after each batch."""
+        db = _memory_db()
+        calls: List[Tuple[int, int]] = []
+
+        rebuild_caches(db, batch_size=2, workers=1, progress=lambda done, total: calls.append((done, total)))
+
+        assert calls == [(0, 5), (2, 5), (4, 5), (5, 5)]
+
+    def test_cancel_and_resume(self) -> None:
+        """A cancelled run stops between batches; the next run does the rest."""
+        db = _memory_db()
+        cancel = threading.Event()
+
+        def on_progress(done: int, total: int) -> None:
+            if done >= 2:
+                cancel.set()
+
+        summary = rebuild_caches(db, batch_size=2, workers=1, progress=on_progress, cancel=cancel)
+
+        assert summary.cancelled
+        assert summary.notes_rebuilt == 2
+        assert summary.notes_pending == 3
+
+        resumed = rebuild_caches(db, batch_size=2, workers=1)
+
+        assert not resumed.cancelled
+        assert resumed.notes_skipped == 2
+        assert resumed.notes_rebuilt == 3
+
+
+@pytest.mark.unit
+class TestFileDatabaseRebuild:
+    """Test rebuilds of file-backed databases."""
+
+    def test_parallel_workers(self, populated_db: Database) -> None:
+        """Several worker connections rebuild every note without errors."""
+        summary = rebuild_caches(populated_db, batch_size=4, workers=3)
+
+        assert summary.notes_rebuilt == 9
+        assert summary.errors == []
+        for note in populated_db.get_all_notes():
+            assert note["display_cache"]
+            assert note["list_display_cache"]
+
+    def test_parallel_workers_wait_for_other_writer(self, test_db_path: Path, populated_db: Database) -> None:
+        """Workers retry notes while another connection holds the write lock."""
+        stop = threading.Event()
+
+        def write() -> None:
+            other = Database(test_db_path)
+            try:
+                count = 0
+                while not stop.is_set():
+                    other.create_note(f"concurrent {count}")
+                    count += 1
+            finally:
+                other.close()
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            summary = rebuild_caches(populated_db, force=True, batch_size=4, workers=3)
+        finally:
+            stop.set()
+            writer.join()
+
+        assert summary.errors == []
+        assert summary.notes_rebuilt >= 9
+
+    def test_new_transcription_marks_note_stale(self, populated_db: Database) -> None:
+        """Transcriptions, read in bulk, are part of the fingerprint."""
+        note_id = get_note_uuid_hex(1)
+        audio_id = populated_db.create_audio_file("memo.mp3")
+        populated_db.attach_to_note(note_id, audio_id, "audio_file")
+        rebuild_caches(populated_db, workers=1)
+
+        populated_db.create_transcription(audio_id, "Hello world", "whisper")
+        summary = rebuild_caches(populated_db, workers=1)
+
+        assert summary.notes_rebuilt == 1
+        assert populated_db.get_transcriptions_for_audio_files([audio_id])[audio_id][0]["content"] == "Hello world"
+
+    def test_transcriptions_of_many_audio_files(self, populated_db: Database) -> None:
+        """Lookups of more audio files than one query can bind are split up."""
+        audio_id = populated_db.create_audio_file("memo.mp3")
+        populated_db.create_transcription(audio_id, "Hello world", "whisper")
+        other_ids = [f"{n:032x}" for n in range(1, 1200)]
+
+        found = populated_db.get_transcriptions_for_audio_files(other_ids + [audio_id])
+
+        assert len(found) == 1200
+        assert [t["content"] for t in found[audio_id]] == ["Hello world"]
+        assert found[other_ids[0]] == []
+
+    def test_fingerprints_persist(self, test_db_path: Path, populated_db: Database) -> None:
+        """A new connection to the same file skips notes rebuilt earlier."""
+        rebuild_caches(populated_db, workers=1)
+        assert Path(CacheFingerprints.sidecar_path(str(test_db_path))).exists()
+
+        other = Database(test_db_path)
+        try:
+            summary = rebuild_caches(other, workers=1)
+        finally:
+            other.close()
+
+        assert summary.notes_rebuilt == 0
+        assert summary.notes_skipped == 9
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import pytest
 
-from tests.helpers import get_tag_uuid, get_tag_uuid_hex
+from tests.helpers import get_note_uuid_hex, get_tag_uuid, get_tag_uuid_hex
 
 from core.search import (
     ParsedSearch,
@@ -18,6 +18,7 @@ from core.search import (
     find_ambiguous_tags,
     execute_search,
     build_tag_search_term,
+    SearchCache,
 )
 from core.database import Database
 
@@ -202,6 +203,56 @@ class TestExecuteSearch:
         assert "tag:Paris" in result.ambiguous_tags
 
 
+def _transcribe_note(db: Database, note_num: int, text: str) -> None:
+    """Attach an audio file with a transcription to a fixture note."""
+    audio_id = db.create_audio_file("dictation.mp3")
+    db.attach_to_note(get_note_uuid_hex(note_num), audio_id, "audio_file")
+    db.create_transcription(audio_id, text, "whisper")
+
+
+@pytest.mark.unit
+class TestTranscriptSearch:
+    """Tests for the transcript: qualifier and include_transcriptions."""
+
+    def test_parse_transcript_term(self) -> None:
+        """transcript: terms are split out of the free text."""
+        result = parse_search_input("tag:Work transcript:budget notes")
+        assert result.transcript_terms == ["budget"]
+        assert result.free_text == "notes"
+        assert result.tag_terms == ["Work"]
+
+    def test_parse_quoted_transcript_phrase(self) -> None:
+        """A quoted transcript: phrase is kept as one term."""
+        result = parse_search_input('Transcript:"quarterly budget"')
+        assert result.transcript_terms == ['"quarterly budget"']
+        assert not result.is_empty()
+
+    def test_transcript_qualifier(self, populated_db: Database) -> None:
+        """transcript: matches only the transcription text."""
+        _transcribe_note(populated_db, 3, "bring the insurance card")
+        result = execute_search(populated_db, "transcript:insurance")
+        assert [n["id"] for n in result.notes] == [get_note_uuid_hex(3)]
+
+    def test_transcript_qualifier_with_tag(self, populated_db: Database) -> None:
+        """transcript: combines with tag filters."""
+        _transcribe_note(populated_db, 3, "bring the insurance card")
+        assert execute_search(populated_db, "tag:Work transcript:insurance").notes == []
+        result = execute_search(populated_db, "tag:Health transcript:insurance")
+        assert len(result.notes) == 1
+
+    def test_free_text_ignores_transcripts_by_default(self, populated_db: Database) -> None:
+        """Plain free text does not look at transcriptions unless asked."""
+        _transcribe_note(populated_db, 3, "bring the insurance card")
+        assert execute_search(populated_db, "insurance").notes == []
+        result = execute_search(populated_db, "insurance", include_transcriptions=True)
+        assert [n["id"] for n in result.notes] == [get_note_uuid_hex(3)]
+
+    def test_include_transcriptions_keeps_content_matches(self, populated_db: Database) -> None:
+        """Content matches are still returned with include_transcriptions."""
+        result = execute_search(populated_db, "Doctor", include_transcriptions=True)
+        assert len(result.notes) == 1
+
+
 @pytest.mark.unit
 class TestBuildTagSearchTerm:
     """Tests for build_tag_search_term."""
@@ -227,3 +278,70 @@ class TestBuildTagSearchTerm:
         nonexistent = uuid.UUID("00000000-0000-7000-8000-000000009999").bytes
         term = build_tag_search_term(populated_db, nonexistent)
         assert term == ""
+
+
+@pytest.mark.unit
+class TestSearchCache:
+    """Tests for SearchCache."""
+
+    def test_matches_execute_search(self, populated_db: Database) -> None:
+        """Cached searches return the same notes as execute_search."""
+        cache = SearchCache(populated_db)
+        for query in ["", "Doctor", "tag:Personal", "tag:Paris"]:
+            expected = execute_search(populated_db, query)
+            result = cache.search(query)
+            assert [n["id"] for n in result.notes] == [n["id"] for n in expected.notes]
+            assert result.ambiguous_tags == expected.ambiguous_tags
+
+    def test_repeat_search_is_cached(self, populated_db: Database) -> None:
+        """Repeating a search returns the cached result."""
+        cache = SearchCache(populated_db)
+        assert cache.search("tag:Work") is cache.search("tag:Work ")
+
+    def test_appended_text_narrows_previous_result(self, populated_db: Database) -> None:
+        """Appending to the free text filters the previous result."""
+        cache = SearchCache(populated_db)
+        cache.search("tag:Personal")
+        for query in ["tag:Personal r", "tag:Personal re", "tag:Personal reu"]:
+            result = cache.search(query)
+            expected = execute_search(populated_db, query)
+            assert [n["id"] for n in result.notes] == [n["id"] for n in expected.notes]
+        assert len(result.notes) == 1
+
+    def test_multi_word_text_matches_execute_search(self, populated_db: Database) -> None:
+        """A second free-text word is searched, not matched as a phrase."""
+        cache = SearchCache(populated_db)
+        cache.search("Paris")
+        for query in ["Paris F", "Paris Fa", "Paris Fam"]:
+            result = cache.search(query)
+            expected = execute_search(populated_db, query)
+            assert [n["id"] for n in result.notes] == [n["id"] for n in expected.notes]
+
+    def test_edited_tag_term_not_narrowed(self, populated_db: Database) -> None:
+        """Extending a tag term runs a fresh search."""
+        cache = SearchCache(populated_db)
+        assert "Per" in cache.search("tag:Per").not_found_tags
+        result = cache.search("tag:Personal")
+        assert result.not_found_tags == []
+        assert len(result.notes) == 4
+
+    def test_invalidated_by_writes(self, populated_db: Database) -> None:
+        """A database change drops cached results."""
+        cache = SearchCache(populated_db)
+        assert len(cache.search("Doctor").notes) == 1
+        populated_db.create_note("Doctor follow-up")
+        assert len(cache.search("Doctor").notes) == 2
+
+    def test_size_is_bounded(self, populated_db: Database) -> None:
+        """Only max_entries searches are kept."""
+        cache = SearchCache(populated_db, max_entries=2)
+        for query in ["tag:Work", "tag:Personal", "tag:Health"]:
+            cache.search(query)
+        assert len(cache._entries) == 2
+
+    def test_find_ambiguous_tags(self, populated_db: Database) -> None:
+        """Ambiguity checks match find_ambiguous_tags."""
+        cache = SearchCache(populated_db)
+        assert cache.find_ambiguous_tags(["Paris", "Work"]) == find_ambiguous_tags(
+            populated_db, ["Paris", "Work"]
+        )
@@ -15,8 +15,10 @@ import pytest
 from flask import Flask
 from flask.testing import FlaskClient
 
+from core.cache_invalidation import get_cache_invalidator
 from core.config import Config
 from core.database import Database, set_local_device_id
+from core.models import ChangeSet
 from core.sync import (
     SyncChange,
     SyncBatch,
@@ -374,6 +376,32 @@ class TestApplySyncChanges:
         assert note is not None
         assert note["content"] == "Remote note"
 
+        # Its caches are rebuilt in the background
+        assert get_cache_invalidator(sync_db).is_dirty(note_id)
+
+    def test_audio_file_change_marks_attached_note(self, sync_db: Database) -> None:
+        """A synced audio file marks the caches of the notes it is attached to."""
+        note_id = sync_db.create_note("Recorded note")
+        audio_id = sync_db.create_audio_file("recording.mp3")
+        sync_db.attach_to_note(note_id, audio_id, "audio_file")
+        peer_id = uuid.uuid4().hex
+        data = dict(sync_db.get_audio_file_raw(audio_id) or {})
+        data["summary"] = "Summary from peer"
+
+        changes = [
+            SyncChange(
+                entity_type="audio_file",
+                entity_id=audio_id,
+                operation="update",
+                data=data,
+                timestamp="2025-01-15 10:00:00",
+                device_id=peer_id,
+            )
+        ]
+        apply_sync_changes(sync_db, changes, peer_id, "Test Peer")
+
+        assert get_cache_invalidator(sync_db).is_dirty(note_id)
+
     def test_applies_new_tag(self, sync_db: Database) -> None:
         """Applies a new tag from remote."""
         tag_id = uuid.uuid4().hex
@@ -597,3 +625,46 @@ class TestGetFullDataset:
 
         assert len(data["notes"]) == 1
         assert len(data["tags"]) == 1
+
+
+class TestChangeSet:
+    """Test combining the change sets of writes and syncs."""
+
+    def test_merge_later_delete_wins(self) -> None:
+        """A note created and then deleted is only reported as deleted."""
+        merged = ChangeSet(created_notes=frozenset({"a"}), updated_notes=frozenset({"b"})).merge(
+            ChangeSet(deleted_notes=frozenset({"a", "b"}))
+        )
+        assert merged.created_notes == frozenset()
+        assert merged.updated_notes == frozenset()
+        assert merged.deleted_notes == frozenset({"a", "b"})
+
+    def test_merge_created_not_also_updated(self) -> None:
+        """A tag created and updated is only reported as created."""
+        merged = ChangeSet(created_tags=frozenset({"t"})).merge(
+            ChangeSet(updated_tags=frozenset({"t"}))
+        )
+        assert merged.created_tags == frozenset({"t"})
+        assert merged.updated_tags == frozenset()
+
+    def test_from_sync_results(self) -> None:
+        """Results with unknown changes make the combined set incomplete."""
+
+        class _Result:
+            def __init__(self, known: bool, created: list) -> None:
+                self.changes_known = known
+                self.created_note_ids = created
+                self.updated_note_ids = []
+                self.deleted_note_ids = []
+                self.created_tag_ids = []
+                self.updated_tag_ids = []
+                self.deleted_tag_ids = []
+
+        changes = ChangeSet.from_sync_results([_Result(True, ["n1"]), _Result(True, ["n2"])])
+        assert changes.created_notes == frozenset({"n1", "n2"})
+        assert changes.complete
+        assert not changes.has_tag_changes
+
+        changes = ChangeSet.from_sync_results([_Result(True, ["n1"]), _Result(False, [])])
+        assert not changes.complete
+        assert changes.has_note_changes
@@ -0,0 +1,255 @@
+"""Unit tests for SyncScheduler.
+
+Tests the background sync scheduler including:
+- Exponential backoff for failing peers, and its reset
+- Skipping peers that are backing off
+- Requested syncs ignoring backoff
+- Run statistics and change sets passed to on_results
+- Debounced syncs after local changes
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from core.models import ChangeSet
+from core.sync_scheduler import SyncScheduler
+
+
+def _result(
+    success: bool = True,
+    created_note_ids: Optional[List[str]] = None,
+    duration_ms: int = 250,
+) -> SimpleNamespace:
+    """A stand-in for voicecore.SyncResult."""
+    return SimpleNamespace(
+        success=success,
+        pulled=len(created_note_ids or []),
+        pushed=0,
+        conflicts=0,
+        errors=[] if success else ["connection refused"],
+        duration_ms=duration_ms,
+        changes_known=True,
+        created_note_ids=created_note_ids or [],
+        updated_note_ids=[],
+        deleted_note_ids=[],
+        created_tag_ids=[],
+        updated_tag_ids=[],
+        deleted_tag_ids=[],
+    )
+
+
+class FakeSession:
+    """A stand-in for voicecore.SyncSession with scripted peer outcomes."""
+
+    def __init__(self, peer_ids: List[str]) -> None:
+        self.peer_ids = peer_ids
+        self.failing: set = set()
+        self.created: Dict[str, List[str]] = {}
+        self.calls: List[List[str]] = []
+        self.reloads = 0
+        self.synced = threading.Event()
+
+    def reload_config(self) -> None:
+        self.reloads += 1
+
+    def sync(self, peer_ids=None, max_concurrent=4, peer_timeout=None, full=False,
+             progress=None, cancel=None) -> Dict[str, Any]:
+        peer_ids = list(self.peer_ids if peer_ids is None else peer_ids)
+        self.calls.append(peer_ids)
+        self.synced.set()
+        return {
+            peer_id: _result(
+                success=peer_id not in self.failing,
+                created_note_ids=self.created.get(peer_id),
+            )
+            for peer_id in peer_ids
+        }
+
+
+def _scheduler(session: FakeSession, **kwargs: Any) -> SyncScheduler:
+    """Create a scheduler that uses the fake session."""
+    kwargs.setdefault("interval", 0)
+    return SyncScheduler("/tmp/config", session_factory=lambda config_dir: session, **kwargs)
+
+
+@pytest.mark.unit
+class TestSyncSchedulerBackoff:
+    """Test per-peer exponential backoff."""
+
+    def test_delay_doubles_per_failure_up_to_max(self) -> None:
+        """Delays follow base * 2**(failures - 1), capped at backoff_max."""
+        session = FakeSession(["peer-a"])
+        session.failing.add("peer-a")
+        scheduler = _scheduler(session, backoff_base=10, backoff_max=35)
+
+        expected = [10, 20, 35, 35]
+        for delay in expected:
+            before = time.monotonic()
+            scheduler.run_once("requested")
+            retry_at = scheduler.peer_backoff()["peer-a"].retry_at
+            assert retry_at - before == pytest.approx(delay, abs=1)
+
+        state = scheduler.peer_backoff()["peer-a"]
+        assert state.failures == 4
+        assert state.last_error == "connection refused"
+
+    def test_success_resets_backoff(self) -> None:
+        """A successful sync clears the peer's backoff state."""
+        session = FakeSession(["peer-a"])
+        session.failing.add("peer-a")
+        scheduler = _scheduler(session)
+        scheduler.run_once("requested")
+        assert "peer-a" in scheduler.peer_backoff()
+
+        session.failing.clear()
+        scheduler.run_once("requested")
+
+        assert scheduler.peer_backoff() == {}
+
+    def test_backing_off_peer_is_skipped(self) -> None:
+        """Interval and local-change runs skip peers still backing off."""
+        session = FakeSession(["peer-a", "peer-b"])
+        session.failing.add("peer-b")
+        scheduler = _scheduler(session, backoff_base=60)
+        scheduler.run_once("interval")
+
+        scheduler.run_once("local_change")
+
+        assert session.calls == [["peer-a", "peer-b"], ["peer-a"]]
+        assert scheduler.last_run.peers_skipped == 1
+
+    def test_requested_sync_ignores_backoff(self) -> None:
+        """request_sync runs sync every peer, even ones backing off."""
+        session = FakeSession(["peer-a", "peer-b"])
+        session.failing.add("peer-b")
+        scheduler = _scheduler(session, backoff_base=60)
+        scheduler.run_once("interval")
+
+        scheduler.run_once("requested")
+
+        assert session.calls[-1] == ["peer-a", "peer-b"]
+
+    def test_retry_run_syncs_only_due_failed_peers(self) -> None:
+        """Retry runs sync failed peers whose delay has passed, and nothing else."""
+        session = FakeSession(["peer-a", "peer-b"])
+        session.failing.add("peer-b")
+        scheduler = _scheduler(session, backoff_base=0)
+        scheduler.run_once("interval")
+
+        scheduler.run_once("retry")
+
+        assert session.calls[-1] == ["peer-b"]
+
+    def test_removed_peer_backoff_dropped(self) -> None:
+        """Backoff of a peer removed from the config is dropped on reload."""
+        session = FakeSession(["peer-a", "peer-b"])
+        session.failing.add("peer-b")
+        scheduler = _scheduler(session, backoff_base=0)
+        scheduler.run_once("interval")
+        assert "peer-b" in scheduler.peer_backoff()
+
+        session.peer_ids = ["peer-a"]
+        scheduler.run_once("interval")
+
+        assert scheduler.peer_backoff() == {}
+        # No retry stays due, so the scheduler does not spin
+        assert scheduler._due(time.monotonic()) == (None, None)
+
+
+@pytest.mark.unit
+class TestSyncSchedulerRuns:
+    """Test run statistics, callbacks and the scheduler thread."""
+
+    def test_session_is_opened_once(self) -> None:
+        """The session is reused across runs; later runs reload its config."""
+        session = FakeSession(["peer-a"])
+        opened: List[str] = []
+
+        def factory(config_dir: str) -> FakeSession:
+            opened.append(config_dir)
+            return session
+
+        scheduler = SyncScheduler("/tmp/config", interval=0, session_factory=factory)
+        scheduler.run_once()
+        scheduler.run_once()
+
+        assert opened == ["/tmp/config"]
+        assert session.reloads == 1
+
+    def test_last_run_stats(self) -> None:
+        """last_run records the outcome and per-peer timing of the run."""
+        session = FakeSession(["peer-a", "peer-b"])
+        session.failing.add("peer-b")
+        scheduler = _scheduler(session)
+
+        scheduler.run_once("interval")
+
+        stats = scheduler.last_run
+        assert stats.reason == "interval"
+        assert stats.peers_synced == 1
+        assert stats.peers_failed == 1
+        assert stats.peers_skipped == 0
+        assert stats.peer_durations == {"peer-a": 0.25, "peer-b": 0.25}
+        assert stats.duration >= 0
+        assert scheduler.run_count == 1
+
+    def test_on_results_receives_change_set(self) -> None:
+        """on_results gets the results and the combined ChangeSet."""
+        session = FakeSession(["peer-a"])
+        session.created["peer-a"] = ["note-1"]
+        received: List[Any] = []
+        scheduler = _scheduler(
+            session, on_results=lambda results, changes: received.append((results, changes))
+        )
+
+        scheduler.run_once()
+
+        results, changes = received[0]
+        assert set(results) == {"peer-a"}
+        assert isinstance(changes, ChangeSet)
+        assert changes.created_notes == frozenset({"note-1"})
+
+    def test_on_results_not_called_without_peers(self) -> None:
+        """A run with nothing to sync does not call on_results."""
+        session = FakeSession([])
+        received: List[Any] = []
+        scheduler = _scheduler(session, on_results=lambda *args: received.append(args))
+
+        results = scheduler.run_once()
+
+        assert results == {}
+        assert received == []
+        assert scheduler.run_count == 1
+
+    def test_local_change_syncs_after_debounce(self) -> None:
+        """notify_local_change leads to a sync once the debounce delay passes."""
+        session = FakeSession(["peer-a"])
+        scheduler = _scheduler(session, debounce=0.05)
+        scheduler.start()
+        try:
+            scheduler.notify_local_change()
+            assert session.synced.wait(timeout=3)
+        finally:
+            scheduler.stop()
+
+        assert not scheduler.is_running()
+        assert scheduler.last_run.reason == "local_change"
+
+    def test_request_sync_runs_immediately(self) -> None:
+        """request_sync wakes the scheduler thread right away."""
+        session = FakeSession(["peer-a"])
+        scheduler = _scheduler(session, interval=3600)
+        scheduler.start()
+        try:
+            scheduler.request_sync()
+            assert session.synced.wait(timeout=3)
+        finally:
+            scheduler.stop()
+
+        assert scheduler.last_run.reason == "requested"
@@ -0,0 +1,231 @@
+"""Unit tests for the shared tag hierarchy index.
+
+Tests TagIndex including:
+- Full paths, names and children
+- Descendants from Euler tour intervals
+- Resolving tag search terms
+- Parity of term resolution with the Rust resolver used by searches
+- Sharing and rebuilding the index per database version
+"""
+
+from __future__ import annotations
+
+import pytest
+from voicecore import resolve_tag_term as rust_resolve_tag_term
+
+from core.database import Database
+from core.search import execute_search, find_ambiguous_tags
+from core.tag_index import TagIndex, get_tag_index
+from tests.helpers import get_tag_uuid, get_tag_uuid_hex
+
+
+@pytest.mark.unit
+class TestTagIndexLookups:
+    """Test paths, names and hierarchy lookups."""
+
+    def test_full_path(self, populated_db: Database) -> None:
+        """Full paths run from the root tag down."""
+        index = get_tag_index(populated_db)
+        assert index.full_path(get_tag_uuid_hex("Paris_France")) == "Geography/Europe/France/Paris"
+        assert index.full_path(get_tag_uuid_hex("Work")) == "Work"
+        assert index.full_path(get_tag_uuid_hex("Voice"), " > ") == "Work > Projects > Voice"
+
+    def test_full_path_accepts_bytes(self, populated_db: Database) -> None:
+        """Tag IDs may be given as bytes."""
+        index = get_tag_index(populated_db)
+        assert index.full_path(get_tag_uuid("France")) == "Geography/Europe/France"
+
+    def test_unknown_tag(self, populated_db: Database) -> None:
+        """Unknown tags have no path and no descendants."""
+        index = get_tag_index(populated_db)
+        assert index.get("0" * 32) is None
+        assert index.full_path("0" * 32) == ""
+        assert index.descendants("0" * 32) == []
+
+    def test_ids_by_name_ignores_case(self, populated_db: Database) -> None:
+        """Name lookup is case-insensitive and returns every match."""
+        index = get_tag_index(populated_db)
+        assert set(index.ids_by_name("PARIS")) == {
+            get_tag_uuid_hex("Paris_France"),
+            get_tag_uuid_hex("Paris_Texas"),
+        }
+
+    def test_id_by_path(self, populated_db: Database) -> None:
+        """Full paths map to a single tag."""
+        index = get_tag_index(populated_db)
+        assert index.id_by_path("geography/us/texas") == get_tag_uuid_hex("Texas")
+        assert index.id_by_path("Texas") is None
+
+    def test_children(self, populated_db: Database) -> None:
+        """children() lists direct children, or the root tags."""
+        index = get_tag_index(populated_db)
+        assert {node.name for node in index.children(get_tag_uuid_hex("Work"))} == {"Projects", "Meetings"}
+        assert {"Work", "Personal", "Geography"} <= {node.name for node in index.children()}
+
+
+@pytest.mark.unit
+class TestTagIndexDescendants:
+    """Test descendant intervals."""
+
+    def test_descendants_include_self_first(self, populated_db: Database) -> None:
+        """A tag's subtree starts with the tag itself."""
+        index = get_tag_index(populated_db)
+        descendants = index.descendants(get_tag_uuid_hex("Work"))
+        assert descendants[0] == get_tag_uuid_hex("Work")
+        assert set(descendants) == {
+            get_tag_uuid_hex(name) for name in ("Work", "Projects", "Voice", "Meetings")
+        }
+
+    def test_descendants_without_self(self, populated_db: Database) -> None:
+        """include_self=False leaves the tag out."""
+        index = get_tag_index(populated_db)
+        assert index.descendants(get_tag_uuid_hex("France"), include_self=False) == [
+            get_tag_uuid_hex("Paris_France")
+        ]
+
+    def test_matches_database_descendants(self, populated_db: Database) -> None:
+        """Descendants match Database.get_tag_descendants for every tag."""
+        index = get_tag_index(populated_db)
+        for tag in populated_db.get_all_tags():
+            expected = {
+                tag_id.hex() for tag_id in populated_db.get_tag_descendants(tag["id"])
+            }
+            assert set(index.descendants(tag["id"])) | {tag["id"]} == expected | {tag["id"]}
+
+    def test_is_descendant(self, populated_db: Database) -> None:
+        """is_descendant compares subtree intervals."""
+        index = get_tag_index(populated_db)
+        geography = get_tag_uuid_hex("Geography")
+        assert index.is_descendant(get_tag_uuid_hex("Paris_Texas"), geography)
+        assert index.is_descendant(geography, geography)
+        assert not index.is_descendant(geography, get_tag_uuid_hex("Paris_Texas"))
+        assert not index.is_descendant(get_tag_uuid_hex("Work"), geography)
+
+    def test_parent_cycle_does_not_hang(self) -> None:
+        """Tags whose parents form a cycle are still indexed."""
+        index = TagIndex([
+            {"id": "a", "name": "A", "parent_id": "b"},
+            {"id": "b", "name": "B", "parent_id": "a"},
+            {"id": "c", "name": "C", "parent_id": None},
+        ])
+        assert len(index) == 3
+        assert set(index.descendants("a")) | set(index.descendants("b")) == {"a", "b"}
+
+
+@pytest.mark.unit
+class TestTagIndexResolve:
+    """Test resolving search terms."""
+
+    def test_resolve_name(self, populated_db: Database) -> None:
+        """A name resolves to the tag and its descendants."""
+        tag_ids, is_ambiguous, not_found = get_tag_index(populated_db).resolve("Projects")
+        assert set(tag_ids) == {get_tag_uuid_hex("Projects"), get_tag_uuid_hex("Voice")}
+        assert not is_ambiguous
+        assert not not_found
+
+    def test_resolve_partial_path(self, populated_db: Database) -> None:
+        """A path may start below the root."""
+        tag_ids, is_ambiguous, not_found = get_tag_index(populated_db).resolve("Texas/Paris")
+        assert tag_ids == [get_tag_uuid_hex("Paris_Texas")]
+        assert not is_ambiguous
+
+    def test_resolve_ambiguous(self, populated_db: Database) -> None:
+        """An ambiguous term covers all matching tags."""
+        tag_ids, is_ambiguous, not_found = get_tag_index(populated_db).resolve("bar")
+        assert set(tag_ids) == {get_tag_uuid_hex("bar_Foo"), get_tag_uuid_hex("bar_Boom")}
+        assert is_ambiguous
+
+    def test_resolve_not_found(self, populated_db: Database) -> None:
+        """Unknown terms and paths that do not line up are not found."""
+        index = get_tag_index(populated_db)
+        assert index.resolve("Nonexistent") == ([], False, True)
+        assert index.resolve("Work/Paris") == ([], False, True)
+        assert index.resolve("") == ([], False, True)
+
+
+# Names, partial and full paths, ambiguous terms, case variants and
+# terms that match nothing
+PARITY_TERMS = [
+    "Paris",
+    "paris",
+    "PARIS",
+    "France/Paris",
+    "texas/PARIS",
+    "Geography/Europe/France/Paris",
+    "geography/us/texas/paris",
+    "bar",
+    "BAR",
+    "Foo/bar",
+    "boom/Bar",
+    "Work",
+    "work/projects",
+    "Work/Projects/Voice",
+    "Europe",
+    "Nonexistent",
+    "Work/Paris",
+]
+
+
+@pytest.mark.unit
+class TestTagIndexRustParity:
+    """Test that the index resolves terms exactly as the Rust resolver does.
+
+    Searches (execute_search, find_ambiguous_tags) resolve tag terms in
+    Rust, while the UI resolves them through the index; both must agree.
+    """
+
+    @pytest.mark.parametrize("term", PARITY_TERMS)
+    def test_resolve_matches_rust(self, populated_db: Database, term: str) -> None:
+        """The same tags, ambiguity and not-found flag as the Rust resolver."""
+        tag_ids, is_ambiguous, not_found = get_tag_index(populated_db).resolve(term)
+        rust_ids, rust_ambiguous, rust_not_found = rust_resolve_tag_term(populated_db._rust_db, term)
+
+        assert sorted(tag_ids) == sorted(rust_ids)
+        assert is_ambiguous == rust_ambiguous
+        assert not_found == rust_not_found
+
+    @pytest.mark.parametrize("term", PARITY_TERMS)
+    def test_ambiguity_matches_find_ambiguous_tags(self, populated_db: Database, term: str) -> None:
+        """find() matches several tags exactly when the term is reported ambiguous."""
+        matches = get_tag_index(populated_db).find(term)
+
+        assert bool(find_ambiguous_tags(populated_db, [term])) == (len(matches) > 1)
+
+    @pytest.mark.parametrize("term", PARITY_TERMS)
+    def test_search_matches_resolved_tags(self, populated_db: Database, term: str) -> None:
+        """A tag search finds the notes carrying the tags the index resolves."""
+        tag_ids, is_ambiguous, not_found = get_tag_index(populated_db).resolve(term)
+        result = execute_search(populated_db, f"tag:{term}")
+
+        assert bool(result.ambiguous_tags) == is_ambiguous
+        assert bool(result.not_found_tags) == not_found
+        if not not_found:
+            expected = populated_db.search_notes(tag_id_groups=[tag_ids])
+            assert {note["id"] for note in result.notes} == {note["id"] for note in expected}
+
+
+@pytest.mark.unit
+class TestSharedTagIndex:
+    """Test sharing and invalidation of get_tag_index."""
+
+    def test_shared_while_unchanged(self, populated_db: Database) -> None:
+        """The same index is returned until the database changes."""
+        assert get_tag_index(populated_db) is get_tag_index(populated_db)
+
+    def test_rebuilt_after_tag_write(self, populated_db: Database) -> None:
+        """Creating or renaming a tag rebuilds the index."""
+        before = get_tag_index(populated_db)
+        tag_id = populated_db.create_tag("Reviews", get_tag_uuid_hex("Work"))
+
+        after = get_tag_index(populated_db)
+        assert after is not before
+        assert after.full_path(tag_id) == "Work/Reviews"
+        assert tag_id in after.descendants(get_tag_uuid_hex("Work"))
+
+        populated_db.rename_tag(tag_id, "Audits")
+        assert get_tag_index(populated_db).full_path(tag_id) == "Work/Audits"
+
+    def test_separate_per_database(self, populated_db: Database, empty_db: Database) -> None:
+        """Each database has its own index."""
+        assert len(get_tag_index(empty_db)) == 0
+        assert len(get_tag_index(populated_db)) > 0
@@ -0,0 +1,143 @@
+"""Web API tests for the change feed.
+
+Tests GET /api/events in long-poll and server-sent events modes.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+import pytest
+from flask.testing import FlaskClient
+
+from src import web
+
+
+class _SameSecondLog:
+    """Change log stand-in whose changes all share one timestamp."""
+
+    def __init__(self, count: int, timestamp: int) -> None:
+        self.changes = [
+            {"entity_type": "note", "entity_id": f"{i:032x}", "operation": "create", "timestamp": timestamp}
+            for i in range(count)
+        ]
+        self.queries = 0
+
+    def get_data_version(self) -> str:
+        return "1"
+
+    def get_changes_since(self, since: Optional[int], limit: int) -> Dict[str, Any]:
+        self.queries += 1
+        changes: List[Dict[str, Any]] = [
+            c for c in self.changes if since is None or c["timestamp"] > since
+        ][:limit]
+        return {"changes": changes, "latest_timestamp": changes[-1]["timestamp"] if changes else None}
+
+
+@pytest.mark.web
+class TestEventsLongPoll:
+    """Test GET /api/events?poll=1."""
+
+    def test_reports_new_note(self, client: FlaskClient) -> None:
+        """A note created after `since` is reported."""
+        since = int(time.time()) - 1
+        response = client.post("/api/notes", json={"content": "Event note"})
+        note_id = json.loads(response.data)["id"]
+
+        response = client.get(f"/api/events?poll=1&since={since}&timeout=2")
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert any(
+            c["entity_type"] == "note" and c["entity_id"] == note_id
+            for c in data["changes"]
+        )
+        assert data["cursor"] >= since
+
+    def test_times_out_without_changes(self, client: FlaskClient) -> None:
+        """With nothing new the long-poll returns an empty list."""
+        since = int(time.time()) + 60
+
+        start = time.monotonic()
+        response = client.get(f"/api/events?poll=1&since={since}&timeout=0.5")
+        elapsed = time.monotonic() - start
+
+        assert response.status_code == 200
+        assert json.loads(response.data)["changes"] == []
+        assert elapsed >= 0.5
+
+    def test_types_filter(self, client: FlaskClient) -> None:
+        """Only the requested entity types are reported."""
+        since = int(time.time()) - 1
+        client.post("/api/notes", json={"content": "Filtered out"})
+
+        response = client.get(f"/api/events?poll=1&since={since}&types=tag&timeout=0.5")
+
+        changes = json.loads(response.data)["changes"]
+        assert all(c["entity_type"] == "tag" for c in changes)
+
+    def test_invalid_since_rejected(self, client: FlaskClient) -> None:
+        """A non-numeric since returns 400."""
+        response = client.get("/api/events?poll=1&since=yesterday")
+
+        assert response.status_code == 400
+
+
+@pytest.mark.web
+class TestEventsStream:
+    """Test GET /api/events as a server-sent events stream."""
+
+    def test_streams_change_events(self, client: FlaskClient) -> None:
+        """The stream carries SSE-formatted change events."""
+        since = int(time.time()) - 1
+        client.post("/api/notes", json={"content": "Streamed note"})
+
+        response = client.get(f"/api/events?since={since}&timeout=0.5")
+
+        assert response.status_code == 200
+        assert response.mimetype == "text/event-stream"
+        body = response.get_data(as_text=True)
+        assert "event: change" in body
+        data_lines = [line[len("data: "):] for line in body.splitlines() if line.startswith("data: ")]
+        assert any(json.loads(line)["entity_type"] == "note" for line in data_lines)
+
+    def test_last_event_id_resumes(self, client: FlaskClient) -> None:
+        """Last-Event-ID is used as the starting point on reconnect."""
+        future = str(int(time.time()) + 60)
+
+        response = client.get("/api/events?timeout=0.3", headers={"Last-Event-ID": future})
+
+        assert "event: change" not in response.get_data(as_text=True)
+
+    def test_stream_length_capped(self, client: FlaskClient, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without a timeout the stream still ends, leaving its cursor as event id."""
+        monkeypatch.setattr(web, "EVENTS_MAX_STREAM_DURATION", 0.3)
+        since = int(time.time()) + 60
+
+        started = time.monotonic()
+        response = client.get(f"/api/events?since={since}")
+        body = response.get_data(as_text=True)
+
+        assert time.monotonic() - started < 5
+        assert body.rstrip().splitlines()[-1] == f"id: {since}"
+
+
+@pytest.mark.web
+class TestChangeFeed:
+    """Test paging through the change log."""
+
+    def test_more_changes_than_batch_in_one_second(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Changes beyond one batch within the same second are all reported once."""
+        timestamp = int(time.time())
+        log = _SameSecondLog(web.EVENTS_BATCH_LIMIT * 2 + 100, timestamp)
+        monkeypatch.setattr(web, "db", log)
+
+        feed = web._ChangeFeed(timestamp, None)
+        events = feed.poll()
+
+        assert len(events) == len(log.changes)
+        assert len({e["entity_id"] for e in events}) == len(log.changes)
+        assert log.queries < 10
+        assert feed.poll() == []
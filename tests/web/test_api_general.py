@@ -170,3 +170,72 @@ class TestJSONResponses:
 
         assert len(notes) > 0
         assert "שלום עולם" in notes[0]["content"]
+
+
+@pytest.mark.web
+class TestConcurrentRequests:
+    """Test that the API serves requests from several threads at once."""
+
+    def test_parallel_note_listing(self, web_app) -> None:
+        """Concurrent GET /api/notes requests all succeed."""
+        import threading
+
+        statuses: list[int] = []
+
+        def fetch() -> None:
+            with web_app.test_client() as thread_client:
+                for _ in range(5):
+                    statuses.append(thread_client.get("/api/notes").status_code)
+
+        threads = [threading.Thread(target=fetch) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        assert statuses == [200] * 20
+
+
+@pytest.mark.web
+class TestServerOptions:
+    """Test `web` command-line server options."""
+
+    def _parse(self, *argv: str):
+        import argparse
+
+        from src.web import add_web_subparser
+
+        parser = argparse.ArgumentParser()
+        subparsers = parser.add_subparsers(dest="interface")
+        add_web_subparser(subparsers)
+        return parser.parse_args(["web", *argv])
+
+    def test_defaults_to_dev_server(self) -> None:
+        """Without options the development server is used."""
+        args = self._parse()
+
+        assert args.server == "dev"
+        assert args.workers == 1
+        assert args.threads == 8
+
+    def test_production_server_options(self) -> None:
+        """Server, workers and timeout are parsed."""
+        args = self._parse("--server", "gunicorn", "--workers", "4", "--timeout", "10", "--threads", "16")
+
+        assert args.server == "gunicorn"
+        assert args.workers == 4
+        assert args.timeout == 10
+        assert args.threads == 16
+
+    def test_rejects_unknown_server(self) -> None:
+        """Unsupported servers are rejected by argparse."""
+        with pytest.raises(SystemExit):
+            self._parse("--server", "tornado")
+
+    def test_rejects_zero_workers(self, tmp_path) -> None:
+        """run() refuses to start without any workers."""
+        from src.web import run
+
+        args = self._parse("--workers", "0")
+
+        assert run(tmp_path, args) == 1
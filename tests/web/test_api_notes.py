@@ -61,6 +61,122 @@ class TestGetNotes:
             assert notes[i]["created_at"] >= notes[i + 1]["created_at"]
 
 
+@pytest.mark.web
+class TestNotesPagination:
+    """Test limit/cursor/fields on GET /api/notes."""
+
+    def _next_url(self, response) -> str | None:
+        link = response.headers.get("Link")
+        if not link:
+            return None
+        assert link.endswith('rel="next"')
+        url = link[link.index("<") + 1:link.index(">")]
+        return url[url.index("/api/"):]
+
+    def test_pages_cover_all_notes_in_order(self, client: FlaskClient) -> None:
+        """Following Link headers returns every note exactly once, in order."""
+        all_ids = [n["id"] for n in json.loads(client.get("/api/notes").data)]
+
+        paged_ids = []
+        url: str | None = "/api/notes?limit=4"
+        pages = 0
+        while url:
+            response = client.get(url)
+            assert response.status_code == 200
+            page = json.loads(response.data)
+            assert len(page) <= 4
+            paged_ids.extend(n["id"] for n in page)
+            url = self._next_url(response)
+            pages += 1
+
+        assert paged_ids == all_ids
+        assert pages == 3  # 9 notes in pages of 4
+
+    def test_last_page_has_no_link(self, client: FlaskClient) -> None:
+        """A page that holds the remaining notes has no next link."""
+        response = client.get("/api/notes?limit=100")
+
+        assert len(json.loads(response.data)) == 9
+        assert "Link" not in response.headers
+
+    def test_fields_projection(self, client: FlaskClient) -> None:
+        """Only the requested fields are returned."""
+        response = client.get("/api/notes?limit=2&fields=id,created_at,preview")
+        notes = json.loads(response.data)
+
+        assert len(notes) == 2
+        for note in notes:
+            assert set(note) == {"id", "created_at", "preview"}
+
+    def test_fields_without_limit(self, client: FlaskClient) -> None:
+        """Projection also applies to the unpaginated listing."""
+        notes = json.loads(client.get("/api/notes?fields=id").data)
+
+        assert len(notes) == 9
+        assert all(set(n) == {"id"} for n in notes)
+
+    def test_unknown_field_rejected(self, client: FlaskClient) -> None:
+        """Unknown fields return 400."""
+        response = client.get("/api/notes?fields=id,bogus")
+
+        assert response.status_code == 400
+        assert "fields" in json.loads(response.data)["error"]
+
+    @pytest.mark.parametrize("limit", ["0", "-1", "abc", "100000"])
+    def test_invalid_limit_rejected(self, client: FlaskClient, limit: str) -> None:
+        """Out-of-range or non-numeric limits return 400."""
+        response = client.get(f"/api/notes?limit={limit}")
+
+        assert response.status_code == 400
+
+    def test_malformed_cursor_rejected(self, client: FlaskClient) -> None:
+        """A cursor that was not issued by the server returns 400."""
+        response = client.get("/api/notes?cursor=not-a-cursor")
+
+        assert response.status_code == 400
+
+
+@pytest.mark.web
+class TestNotesConditionalGet:
+    """Test ETag validation on GET /api/notes."""
+
+    def test_response_has_etag_and_version(self, client: FlaskClient) -> None:
+        """Note listings carry an ETag and the change counter."""
+        response = client.get("/api/notes")
+
+        assert response.headers.get("ETag")
+        assert response.headers["X-Change-Version"].isdigit()
+
+    def test_unchanged_notes_return_304(self, client: FlaskClient) -> None:
+        """If-None-Match with the current ETag returns 304 and no body."""
+        etag = client.get("/api/notes").headers["ETag"]
+
+        response = client.get("/api/notes", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.data == b""
+
+    def test_write_invalidates_etag(self, client: FlaskClient) -> None:
+        """Creating a note makes the old ETag stale."""
+        first = client.get("/api/notes")
+        etag = first.headers["ETag"]
+        version = int(first.headers["X-Change-Version"])
+
+        client.post("/api/notes", json={"content": "Fresh note"})
+        response = client.get("/api/notes", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert int(response.headers["X-Change-Version"]) > version
+        assert len(json.loads(response.data)) == 10
+
+    def test_etag_depends_on_query(self, client: FlaskClient) -> None:
+        """Different pages or projections have different ETags."""
+        full = client.get("/api/notes").headers["ETag"]
+        paged = client.get("/api/notes?limit=2").headers["ETag"]
+
+        assert full != paged
+
+
 @pytest.mark.web
 class TestGetNote:
     """Test GET /api/notes/<id> endpoint."""
@@ -11,6 +11,9 @@ from urllib.parse import urlencode
 import pytest
 from flask.testing import FlaskClient
 
+from core.database import Database
+from tests.helpers import get_note_uuid_hex
+
 
 @pytest.mark.web
 class TestSearchText:
@@ -184,6 +187,42 @@ class TestSearchResponseFormat:
         assert isinstance(json.loads(response2.data), list)
 
 
+@pytest.mark.web
+class TestSearchPagination:
+    """Test limit/cursor/fields on GET /api/search."""
+
+    def test_paged_search_matches_full_search(self, client: FlaskClient) -> None:
+        """Paging through a tag search yields the same notes as one request."""
+        full_ids = [n["id"] for n in json.loads(client.get("/api/search?tag=Work").data)]
+
+        paged_ids = []
+        url = "/api/search?tag=Work&limit=1"
+        while url:
+            response = client.get(url)
+            assert response.status_code == 200
+            paged_ids.extend(n["id"] for n in json.loads(response.data))
+            link = response.headers.get("Link")
+            url = link[link.index("/api/"):link.index(">")] if link else None
+
+        assert paged_ids == full_ids
+
+    def test_next_link_keeps_search_parameters(self, client: FlaskClient) -> None:
+        """The next link repeats the original query."""
+        response = client.get("/api/search?tag=Work&fields=id&limit=1")
+
+        link = response.headers["Link"]
+        assert "tag=Work" in link
+        assert "fields=id" in link
+        assert "cursor=" in link
+
+    def test_fields_projection_on_search(self, client: FlaskClient) -> None:
+        """Search results honour ?fields=."""
+        notes = json.loads(client.get("/api/search?tag=Work&fields=id,preview").data)
+
+        assert notes
+        assert all(set(n) == {"id", "preview"} for n in notes)
+
+
 @pytest.mark.web
 class TestAmbiguousTagAPISearch:
     """Test API search with ambiguous tag names (multiple tags with same name)."""
@@ -235,3 +274,32 @@ class TestAmbiguousTagAPISearch:
         contents = [n["content"] for n in notes]
         assert any("Testing ambiguous tag with Foo/bar" in content for content in contents)
         assert any("Another note with Boom/bar" in content for content in contents)
+
+
+@pytest.mark.web
+class TestTranscriptAPISearch:
+    """Test transcript search through GET /api/search."""
+
+    @pytest.fixture(autouse=True)
+    def transcribed_note(self, populated_db: Database) -> None:
+        """Give note 3 a transcription mentioning an insurance card."""
+        audio_id = populated_db.create_audio_file("dictation.mp3")
+        populated_db.attach_to_note(get_note_uuid_hex(3), audio_id, "audio_file")
+        populated_db.create_transcription(audio_id, "bring the insurance card", "whisper")
+
+    def test_transcript_param(self, client: FlaskClient) -> None:
+        """transcript= matches transcription text."""
+        response = client.get("/api/search?transcript=insurance")
+
+        assert response.status_code == 200
+        notes = json.loads(response.data)
+        assert [n["id"] for n in notes] == [get_note_uuid_hex(3)]
+
+    def test_free_text_with_include_transcriptions(self, client: FlaskClient) -> None:
+        """q= only reaches transcriptions with include_transcriptions=1."""
+        response = client.get("/api/search?q=insurance")
+        assert json.loads(response.data) == []
+
+        response = client.get("/api/search?q=insurance&include_transcriptions=1")
+        notes = json.loads(response.data)
+        assert [n["id"] for n in notes] == [get_note_uuid_hex(3)]
@@ -1,6 +1,6 @@
 """Web API tests for tags endpoints.
 
-Tests GET /api/tags endpoint.
+Tests GET /api/tags and POST/DELETE /api/tags/<id>/notes endpoints.
 """
 
 from __future__ import annotations
@@ -10,7 +10,7 @@ import json
 import pytest
 from flask.testing import FlaskClient
 
-from tests.helpers import get_tag_uuid_hex
+from tests.helpers import get_note_uuid_hex, get_tag_uuid_hex
 
 
 @pytest.mark.web
@@ -79,3 +79,120 @@ class TestGetTags:
         json_str = json.dumps(tags)
         assert isinstance(json_str, str)
         assert len(json_str) > 0
+
+
+@pytest.mark.web
+class TestTagsConditionalGet:
+    """Test ETag validation on GET /api/tags."""
+
+    def test_unchanged_tags_return_304(self, client: FlaskClient) -> None:
+        """If-None-Match with the current ETag returns 304 and no body."""
+        first = client.get("/api/tags")
+        etag = first.headers["ETag"]
+
+        second = client.get("/api/tags", headers={"If-None-Match": etag})
+
+        assert second.status_code == 304
+        assert second.data == b""
+        assert second.headers["ETag"] == etag
+
+    def test_tag_write_changes_etag(self, client: FlaskClient) -> None:
+        """Creating a tag invalidates the previous ETag."""
+        from src.web import db
+
+        etag = client.get("/api/tags").headers["ETag"]
+        db.create_tag("BrandNewTag")
+
+        response = client.get("/api/tags", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert any(t["name"] == "BrandNewTag" for t in json.loads(response.data))
+
+
+@pytest.mark.web
+class TestTagsWithCounts:
+    """Test GET /api/tags?with_counts=..."""
+
+    def test_counts_absent_by_default(self, client: FlaskClient) -> None:
+        """Plain listing has no note counts."""
+        tags = json.loads(client.get("/api/tags").data)
+
+        assert all("note_count" not in t for t in tags)
+
+    def test_with_counts(self, client: FlaskClient) -> None:
+        """with_counts=1 adds direct note counts."""
+        tags = json.loads(client.get("/api/tags?with_counts=1").data)
+
+        assert all(isinstance(t["note_count"], int) for t in tags)
+        work = next(t for t in tags if t["id"] == get_tag_uuid_hex("Work"))
+        assert work["note_count"] >= 2
+
+    def test_with_descendant_counts(self, client: FlaskClient) -> None:
+        """with_counts=descendants rolls up child tags."""
+        direct = {t["id"]: t["note_count"] for t in json.loads(client.get("/api/tags?with_counts=1").data)}
+        rollup = json.loads(client.get("/api/tags?with_counts=descendants").data)
+
+        for tag in rollup:
+            assert tag["note_count"] >= direct[tag["id"]]
+
+
+@pytest.mark.web
+class TestTagNotes:
+    """Test POST and DELETE /api/tags/<id>/notes."""
+
+    def test_add_tag_to_notes(self, client: FlaskClient) -> None:
+        """POST adds the tag to every listed note."""
+        from src.web import db
+
+        health = get_tag_uuid_hex("Health")
+        note_ids = [get_note_uuid_hex(1), get_note_uuid_hex(2)]
+
+        response = client.post(f"/api/tags/{health}/notes", json={"note_ids": note_ids})
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data["changed"] == 2
+        assert set(data["note_ids"]) == set(note_ids)
+        for note_id in note_ids:
+            assert health in {t["id"] for t in db.get_note_tags(note_id)}
+
+    def test_add_tag_to_search_results(self, client: FlaskClient) -> None:
+        """POST with a search tags every matching note."""
+        health = get_tag_uuid_hex("Health")
+
+        response = client.post(f"/api/tags/{health}/notes", json={"search": "tag:Projects"})
+
+        data = json.loads(response.data)
+        assert data["matched"] == 2
+        assert data["changed"] == 2
+
+    def test_remove_tag_from_notes(self, client: FlaskClient) -> None:
+        """DELETE removes the tag; notes without it are unchanged."""
+        from src.web import db
+
+        projects = get_tag_uuid_hex("Projects")
+        note_ids = [get_note_uuid_hex(1), get_note_uuid_hex(3)]
+
+        response = client.delete(f"/api/tags/{projects}/notes", json={"note_ids": note_ids})
+
+        data = json.loads(response.data)
+        assert data["changed"] == 1
+        assert data["note_ids"] == [get_note_uuid_hex(1)]
+        assert projects not in {t["id"] for t in db.get_note_tags(get_note_uuid_hex(1))}
+
+    def test_unknown_tag(self, client: FlaskClient) -> None:
+        """An unknown tag returns 404."""
+        # Valid UUID format but nonexistent
+        nonexistent_id = "00000000000070008000000000009999"
+        response = client.post(f"/api/tags/{nonexistent_id}/notes", json={"note_ids": []})
+
+        assert response.status_code == 404
+
+    def test_invalid_body(self, client: FlaskClient) -> None:
+        """A missing or malformed body returns 400."""
+        health = get_tag_uuid_hex("Health")
+
+        assert client.post(f"/api/tags/{health}/notes", json={}).status_code == 400
+        assert client.post(f"/api/tags/{health}/notes", json={"note_ids": "abc"}).status_code == 400
+        assert client.post(f"/api/tags/{health}/notes", json={"note_ids": ["xyz"]}).status_code == 400